@@ -26,53 +26,137 @@ __all__ = [
     "VolumeMount",
 ]
 
+import importlib
+import typing
 from os import environ, path
 from typing import Optional
 
 import dotenv
 
 from .config import config as mlconf
-from .datastore import DataItem, store_manager
-from .db import get_run_db
 from .errors import MLRunInvalidArgumentError, MLRunNotFoundError
-from .execution import MLClientCtx
-from .model import RunObject, RunTemplate, new_task
-from .package import ArtifactType, DefaultPackager, Packager, handler
-from .projects import (
-    MlrunProject,
-    ProjectMetadata,
-    build_function,
-    deploy_function,
-    get_or_create_project,
-    load_project,
-    new_project,
-    pipeline_context,
-    run_function,
-)
-from .projects.project import _add_username_to_project_name_if_needed
-from .run import (
-    _run_pipeline,
-    code_to_function,
-    function_to_module,
-    get_dataitem,
-    get_object,
-    get_or_create_ctx,
-    get_pipeline,
-    import_function,
-    new_function,
-    retry_pipeline,
-    wait_for_pipeline_completion,
-)
-from .runtimes import mounts, new_model_server
 from .secrets import get_secret_or_env
 from .utils.version import Version
 
-__version__ = Version().get()["version"]
+if typing.TYPE_CHECKING:
+    from .datastore import DataItem, store_manager
+    from .db import get_run_db
+    from .execution import MLClientCtx
+    from .model import RunObject, RunTemplate, new_task
+    from .package import ArtifactType, DefaultPackager, Packager, handler
+    from .projects import (
+        MlrunProject,
+        ProjectMetadata,
+        build_function,
+        deploy_function,
+        get_or_create_project,
+        load_project,
+        new_project,
+        pipeline_context,
+        run_function,
+    )
+    from .projects.project import _add_username_to_project_name_if_needed
+    from .run import (
+        _run_pipeline,
+        code_to_function,
+        function_to_module,
+        get_dataitem,
+        get_object,
+        get_or_create_ctx,
+        get_pipeline,
+        import_function,
+        new_function,
+        retry_pipeline,
+        wait_for_pipeline_completion,
+    )
+    from .runtimes import mounts, new_model_server
+    from .runtimes.mounts import VolumeMount, auto_mount, mount_v3io, v3io_cred
+
+# the heavy subpackages (and their dependencies, e.g. pandas, kubernetes and nuclio) are imported on first access
+# (PEP 562) instead of on `import mlrun`, which runs on every CLI invocation, job pod and Nuclio worker start
+_lazy_attributes = {
+    "DataItem": ".datastore",
+    "store_manager": ".datastore",
+    "get_run_db": ".db",
+    "MLClientCtx": ".execution",
+    "RunObject": ".model",
+    "RunTemplate": ".model",
+    "new_task": ".model",
+    "ArtifactType": ".package",
+    "DefaultPackager": ".package",
+    "Packager": ".package",
+    "handler": ".package",
+    "MlrunProject": ".projects",
+    "ProjectMetadata": ".projects",
+    "build_function": ".projects",
+    "deploy_function": ".projects",
+    "get_or_create_project": ".projects",
+    "load_project": ".projects",
+    "new_project": ".projects",
+    "pipeline_context": ".projects",
+    "run_function": ".projects",
+    "_add_username_to_project_name_if_needed": ".projects.project",
+    "_run_pipeline": ".run",
+    "code_to_function": ".run",
+    "function_to_module": ".run",
+    "get_dataitem": ".run",
+    "get_object": ".run",
+    "get_or_create_ctx": ".run",
+    "get_pipeline": ".run",
+    "import_function": ".run",
+    "new_function": ".run",
+    "retry_pipeline": ".run",
+    "wait_for_pipeline_completion": ".run",
+    "mounts": ".runtimes",
+    "new_model_server": ".runtimes",
+    "VolumeMount": ".runtimes.mounts",
+    "mount_v3io": ".runtimes.mounts",
+    "v3io_cred": ".runtimes.mounts",
+    "auto_mount": ".runtimes.mounts",
+}
+_lazy_submodules = {
+    "alerts",
+    "artifacts",
+    "data_types",
+    "datastore",
+    "db",
+    "execution",
+    "feature_store",
+    "features",
+    "frameworks",
+    "k8s_utils",
+    "launcher",
+    "lists",
+    "model",
+    "model_monitoring",
+    "package",
+    "platforms",
+    "projects",
+    "render",
+    "run",
+    "runtimes",
+    "serving",
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy_attributes:
+        module = importlib.import_module(_lazy_attributes[name], __name__)
+        value = getattr(module, name)
+    elif name in _lazy_submodules:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache the attribute, so the next accesses don't go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes) | _lazy_submodules)
 
-VolumeMount = mounts.VolumeMount
-mount_v3io = mounts.mount_v3io
-v3io_cred = mounts.v3io_cred
-auto_mount = mounts.auto_mount
+
+__version__ = Version().get()["version"]
 
 
 def get_version():
@@ -137,6 +221,8 @@ def set_environment(
         raise ValueError("DB/API path was not detected, please specify its address")
 
     # check connectivity and load remote defaults
+    from .db import get_run_db
+
     get_run_db()
     if api_path:
         environ["MLRUN_DBPATH"] = mlconf.dbpath
@@ -164,7 +250,9 @@ def set_environment(
     return mlconf.default_project, mlconf.artifact_path
 
 
-def get_current_project(silent: bool = False) -> Optional[MlrunProject]:
+def get_current_project(silent: bool = False) -> Optional["MlrunProject"]:
+    from .projects import pipeline_context
+
     if not pipeline_context.project and not silent:
         raise MLRunInvalidArgumentError(
             "No current project is initialized. Use new, get or load project functions first."
@@ -25,7 +25,6 @@ from pprint import pprint
 
 import click
 import dotenv
-import pandas as pd
 import yaml
 from tabulate import tabulate
 
@@ -34,21 +33,9 @@ import mlrun.common.constants as mlrun_constants
 import mlrun.common.schemas
 import mlrun.utils.helpers
 from mlrun.common.helpers import parse_versioned_object_uri
-from mlrun.runtimes.mounts import auto_mount as auto_mount_modifier
 
 from .config import config as mlconf
-from .db import get_run_db
 from .errors import err_to_str
-from .model import RunTemplate
-from .projects import load_project
-from .run import (
-    get_object,
-    import_function,
-    import_function_to_dict,
-    load_func_code,
-    new_function,
-)
-from .runtimes import RemoteRuntime, RunError, RuntimeKinds, ServingRuntime
 from .secrets import SecretsStore
 from .utils import (
     RunKeys,
@@ -61,8 +48,6 @@ from .utils import (
 )
 from .utils.version import Version
 
-pd.set_option("mode.chained_assignment", None)
-
 
 def validate_base_argument(ctx, param, value):
     if value and value.startswith("-"):
@@ -79,7 +64,10 @@ def validate_base_argument(ctx, param, value):
 
 @click.group()
 def main():
-    pass
+    # imported here and not on the module import, so `mlrun --help` doesn't pay for importing pandas
+    import pandas as pd
+
+    pd.set_option("mode.chained_assignment", None)
 
 
 @main.command(context_settings=dict(ignore_unknown_options=True))
@@ -242,13 +230,13 @@ def run(
     config = environ.get("MLRUN_EXEC_CONFIG")
     if from_env and config:
         config = json.loads(config)
-        runobj = RunTemplate.from_dict(config)
+        runobj = mlrun.model.RunTemplate.from_dict(config)
     elif task:
-        obj = get_object(task)
+        obj = mlrun.run.get_object(task)
         task = yaml.load(obj, Loader=yaml.FullLoader)
-        runobj = RunTemplate.from_dict(task)
+        runobj = mlrun.model.RunTemplate.from_dict(task)
     else:
-        runobj = RunTemplate()
+        runobj = mlrun.model.RunTemplate()
 
     set_item(runobj.metadata, uid, "uid")
     set_item(runobj.metadata, name, "name")
@@ -408,11 +396,11 @@ def run(
         pprint(runobj.to_dict())
 
     try:
-        fn = new_function(runtime=runtime, kfp=kfp, mode=mode, source=source)
+        fn = mlrun.run.new_function(runtime=runtime, kfp=kfp, mode=mode, source=source)
         if workdir:
             fn.spec.workdir = workdir
         if auto_mount:
-            fn.apply(auto_mount_modifier())
+            fn.apply(mlrun.runtimes.mounts.auto_mount())
         fn.is_child = from_env and not kfp
         if kfp:
             # if pod is running inside kfp pod, we don't really need the run logs to be printed actively, we can just
@@ -431,7 +419,7 @@ def run(
         )
         if resp and dump:
             print(resp.to_yaml())
-    except RunError as err:
+    except mlrun.runtimes.RunError as err:
         print(f"Runtime error: {err_to_str(err)}")
         exit(1)
 
@@ -526,14 +514,14 @@ def build(
             pprint(runtime)
         # use kind = "job" by default if not specified
         runtime.setdefault("kind", "job")
-        func = new_function(runtime=runtime)
+        func = mlrun.run.new_function(runtime=runtime)
 
     elif func_url:
         if func_url.startswith("db://"):
             func_url = func_url[5:]
         elif func_url == ".":
             func_url = "function.yaml"
-        func = import_function(func_url)
+        func = mlrun.run.import_function(func_url)
 
     else:
         print("Error: Function path or url are required")
@@ -676,16 +664,16 @@ def deploy(
         pprint(model)
 
     # support both v1 & v2+ model struct for backwards compatibility
-    if runtime and runtime["kind"] == RuntimeKinds.serving:
+    if runtime and runtime["kind"] == mlrun.runtimes.RuntimeKinds.serving:
         print("Deploying V2 model server")
-        function = ServingRuntime.from_dict(runtime)
+        function = mlrun.runtimes.ServingRuntime.from_dict(runtime)
         if model:
             # v2+ model struct (list of json obj)
             for _model in model:
                 args = json.loads(_model)
                 function.add_model(**args)
     else:
-        function = RemoteRuntime.from_dict(runtime)
+        function = mlrun.runtimes.RemoteRuntime.from_dict(runtime)
         if kind:
             function.spec.function_kind = kind
         if model:
@@ -747,7 +735,7 @@ def get(kind, name, selector, namespace, uid, project, tag, db, extra_args):
         return
 
     elif kind.startswith("runtime"):
-        run_db = get_run_db(db or mlconf.dbpath)
+        run_db = mlrun.db.get_run_db(db or mlconf.dbpath)
         # the name field is used as function kind, set to None if empty
         name = name if name else None
         runtimes = run_db.list_runtime_resources(
@@ -764,7 +752,7 @@ def get(kind, name, selector, namespace, uid, project, tag, db, extra_args):
             )
             return
 
-        run_db = get_run_db()
+        run_db = mlrun.db.get_run_db()
         if name:
             run = run_db.read_run(name, project=project)
             print(dict_to_yaml(run))
@@ -781,7 +769,7 @@ def get(kind, name, selector, namespace, uid, project, tag, db, extra_args):
         print(tabulate(df, headers="keys"))
 
     elif kind.startswith("art"):
-        run_db = get_run_db()
+        run_db = mlrun.db.get_run_db()
         artifacts = run_db.list_artifacts(
             name, project=project, tag=tag, labels=selector
         )
@@ -795,7 +783,7 @@ def get(kind, name, selector, namespace, uid, project, tag, db, extra_args):
         print(tabulate(df, headers="keys"))
 
     elif kind.startswith("func"):
-        run_db = get_run_db()
+        run_db = mlrun.db.get_run_db()
         if name:
             f = run_db.get_function(name, project=project, tag=tag)
             print(dict_to_yaml(f))
@@ -817,7 +805,7 @@ def get(kind, name, selector, namespace, uid, project, tag, db, extra_args):
         print(tabulate(lines, headers=headers))
 
     elif kind.startswith("workflow"):
-        run_db = get_run_db()
+        run_db = mlrun.db.get_run_db()
         if project == "*":
             print("Warning, reading workflows for all projects may take a long time !")
             pipelines = run_db.list_pipelines(project=project, page_size=200)
@@ -871,7 +859,7 @@ def logs(uid, project, offset, db, watch):
             "'--watch' is deprecated in 1.6.0, and will be removed in 1.8.0, "
             # TODO: Remove in 1.8.0
         )
-    mldb = get_run_db(db or mlconf.dbpath)
+    mldb = mlrun.db.get_run_db(db or mlconf.dbpath)
     if mldb.kind == "http":
         state, _ = mldb.watch_log(uid, project, watch=False, offset=offset)
     else:
@@ -1011,7 +999,7 @@ def project(
     if commit and not parameters.get("commit_id"):
         parameters["commit_id"] = commit
 
-    proj = load_project(
+    proj = mlrun.projects.load_project(
         context,
         url,
         name,
@@ -1092,7 +1080,7 @@ def project(
 
 
 def validate_runtime_kind(ctx, param, value):
-    possible_kinds = RuntimeKinds.runtime_with_handlers()
+    possible_kinds = mlrun.runtimes.RuntimeKinds.runtime_with_handlers()
     if value is not None and value not in possible_kinds:
         raise click.BadParameter(
             f"kind must be one of {possible_kinds}", ctx=ctx, param=param
@@ -1138,7 +1126,7 @@ def clean(kind, object_id, api, label_selector, force, grace_period):
         # Clean resources for specific job (by uid)
         mlrun clean mpijob 15d04c19c2194c0a8efb26ea3017254b
     """
-    mldb = get_run_db(api or mlconf.dbpath)
+    mldb = mlrun.db.get_run_db(api or mlconf.dbpath)
     mldb.delete_runtime_resources(
         kind=kind,
         object_id=object_id,
@@ -1337,16 +1325,16 @@ def func_url_to_runtime(func_url, ensure_project: bool = False):
         if func_url.startswith("db://"):
             func_url = func_url[5:]
             project_instance, name, tag, hash_key = parse_versioned_object_uri(func_url)
-            run_db = get_run_db(mlconf.dbpath)
+            run_db = mlrun.db.get_run_db(mlconf.dbpath)
             runtime = run_db.get_function(name, project_instance, tag, hash_key)
         elif func_url == "." or func_url.endswith(".yaml"):
             func_url = "function.yaml" if func_url == "." else func_url
-            runtime = import_function_to_dict(func_url, {})
+            runtime = mlrun.run.import_function_to_dict(func_url, {})
         else:
-            mlrun_project = load_project(".", save=ensure_project)
+            mlrun_project = mlrun.projects.load_project(".", save=ensure_project)
             function = mlrun_project.get_function(func_url, enrich=True)
             if function.kind == "local":
-                command, function = load_func_code(function)
+                command, function = mlrun.run.load_func_code(function)
                 function.spec.command = command
             runtime = function.to_dict()
     except Exception as exc:
@@ -1360,7 +1348,7 @@ def func_url_to_runtime(func_url, ensure_project: bool = False):
     return runtime
 
 
-def load_notification(notifications: str, project: mlrun.projects.MlrunProject):
+def load_notification(notifications: str, project: "mlrun.projects.MlrunProject"):
     """
     A dictionary or json file containing notification dictionaries can be used by the user to set notifications.
     Each notification is stored in a tuple called notifications.
@@ -1383,7 +1371,7 @@ def load_notification(notifications: str, project: mlrun.projects.MlrunProject):
 
 
 def add_notification_to_project(
-    notification: str, project: mlrun.projects.MlrunProject
+    notification: str, project: "mlrun.projects.MlrunProject"
 ):
     for notification_type, notification_params in notification.items():
         project.notifiers.add_notification(
@@ -1392,7 +1380,7 @@ def add_notification_to_project(
 
 
 def send_workflow_error_notification(
-    run_id: str, mlproject: mlrun.projects.MlrunProject, error: Exception
+    run_id: str, mlproject: "mlrun.projects.MlrunProject", error: Exception
 ):
     message = (
         f":x: Failed to run scheduled workflow {run_id} in Project {mlproject.name} !\n"
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import concurrent.futures
 import hashlib
 import os
 import pathlib
@@ -443,13 +444,18 @@ class Artifact(ModelObj):
             file_hash, self.spec.target_path = self.resolve_file_target_hash_path(
                 source_path, artifact_path
             )
-        if mlrun.mlconf.artifacts.calculate_hash:
-            self.metadata.hash = file_hash or calculate_local_file_hash(source_path)
         self.spec.size = os.stat(source_path).st_size
 
-        mlrun.datastore.store_manager.object(
+        data_item = mlrun.datastore.store_manager.object(
             url=target_path or self.spec.target_path
-        ).upload(source_path)
+        )
+        if mlrun.mlconf.artifacts.calculate_hash and not file_hash:
+            # hash the file while uploading it
+            self.metadata.hash = data_item.upload_and_hash(source_path)
+        else:
+            if mlrun.mlconf.artifacts.calculate_hash:
+                self.metadata.hash = file_hash
+            data_item.upload(source_path)
 
     def resolve_body_target_hash_path(
         self, body: typing.Union[bytes, str], artifact_path: str
@@ -708,20 +714,33 @@ class DirArtifact(Artifact):
                     f"file {file_path} not found, cant upload"
                 )
 
+        if (
+            not self.spec.target_path
+            and not mlrun.mlconf.artifacts.generate_target_path_from_artifact_hash
+        ):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "target path is not specified and mlrun.mlconf.artifacts.generate_target_path_from_artifact_hash "
+                "set to False"
+            )
+
+        def upload_file(file_name):
+            file_path = os.path.join(self.spec.src_path, file_name)
             if self.spec.target_path:
                 target_path = os.path.join(self.spec.target_path, file_name)
-            elif mlrun.mlconf.artifacts.generate_target_path_from_artifact_hash:
+            else:
                 _, target_path = self.resolve_file_target_hash_path(
                     source_path=file_path, artifact_path=artifact_path
                 )
-            else:
-                raise mlrun.errors.MLRunInvalidArgumentError(
-                    "target path is not specified and mlrun.mlconf.artifacts.generate_target_path_from_artifact_hash "
-                    "set to False"
-                )
-
             mlrun.datastore.store_manager.object(url=target_path).upload(file_path)
-            # add files of the directory to the extra data of the artifact with value of the target path
+            return target_path
+
+        # upload the files concurrently, large files are also transferred in concurrent chunks by the datastores
+        max_workers = max(1, min(mlrun.mlconf.storage.transfer.max_files, len(files)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            target_paths = list(executor.map(upload_file, files))
+
+        # add files of the directory to the extra data of the artifact with value of the target path
+        for file_name, target_path in zip(files, target_paths):
             self.spec.extra_data[file_name] = target_path
 
 
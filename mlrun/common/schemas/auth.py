@@ -15,8 +15,6 @@
 import typing
 
 import pydantic.v1
-from nuclio.auth import AuthInfo as NuclioAuthInfo
-from nuclio.auth import AuthKinds as NuclioAuthKinds
 
 import mlrun.common.types
 
@@ -131,6 +129,10 @@ class AuthInfo(pydantic.v1.BaseModel):
     planes: list[str] = []
 
     def to_nuclio_auth_info(self):
+        # imported here since importing nuclio is slow and the schemas are imported by `import mlrun`
+        from nuclio.auth import AuthInfo as NuclioAuthInfo
+        from nuclio.auth import AuthKinds as NuclioAuthKinds
+
         if self.session != "":
             return NuclioAuthInfo(password=self.session, mode=NuclioAuthKinds.iguazio)
         return None
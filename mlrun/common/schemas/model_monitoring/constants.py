@@ -165,6 +165,7 @@ class ApplicationEvent:
     ENDPOINT_ID = "endpoint_id"
     ENDPOINT_NAME = "endpoint_name"
     OUTPUT_STREAM_URI = "output_stream_uri"
+    SAMPLE_DATA_URI = "sample_data_uri"
 
 
 class WriterEvent(MonitoringStrEnum):
@@ -299,6 +300,7 @@ class FileTargetKind:
     MONITORING_APPLICATION = "monitoring_application"
     ERRORS = "errors"
     STATS = "stats"
+    WINDOW_SNAPSHOTS = "window_snapshots"
 
 
 class ModelMonitoringMode(StrEnum):
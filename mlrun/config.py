@@ -24,13 +24,13 @@ mapped to config.httpdb.port. Values should be in JSON format.
 import base64
 import binascii
 import copy
+import itertools
 import json
 import os
 import typing
 import warnings
 from collections.abc import Mapping
 from datetime import timedelta
-from distutils.util import strtobool
 from os.path import expanduser
 from threading import Lock
 
@@ -119,10 +119,25 @@ default_config = {
             # max number of parallel abort run jobs in runs monitoring
             "concurrent_abort_stale_runs_workers": 10,
             "list_runs_time_period_in_days": 7,  # days
+            "informer": {
+                # keep a local cache of the runtime resources fed by a k8s watch, and monitor only the resources
+                # that changed since the previous monitoring cycle
+                "enabled": False,
+                # interval in seconds of the full (list all resources and runs) monitoring, as a safety net
+                "resync_interval": "300",
+                # server side timeout in seconds of a single watch request (the watch is then resumed)
+                "watch_timeout": "300",
+            },
         },
         "projects": {
             "summaries": {
                 "cache_interval": "30",
+                # only the summaries of projects whose resources changed are recalculated on every cache interval,
+                # the summaries of all the projects are recalculated on this (lower frequency) interval to correct
+                # drift, e.g. of the time based counters (recent runs, pending schedules, etc.)
+                "full_refresh_interval": "3600",
+                # max number of projects to mark as changed in a single db statement
+                "changes_batch_size": "500",
             },
         },
     },
@@ -178,9 +193,36 @@ default_config = {
     "redis": {
         "url": "",
         "type": "standalone",  # deprecated.
+        # max connections per redis (standalone) connection pool, pools are shared per endpoint and requests wait up
+        # to pool timeout seconds for a free connection
+        "max_connections": 50,
+        "pool_timeout": 20,
+        # number of keys requested per SCAN iteration
+        "scan_count": 1000,
+        # number of commands sent per pipeline round trip in bulk operations
+        "batch_size": 500,
+    },
+    "datastore": {
+        # stores that are created with explicit secrets (or on the API, where every request carries its own
+        # credentials) are cached per credential set, bounded by max_size and evicted after idle_timeout seconds of
+        # no use (0 max size disables the caching)
+        "credentials_stores_cache": {
+            "max_size": 128,
+            "idle_timeout": 600,
+        },
+    },
+    "datastore_profiles": {
+        # resolved public datastore profiles are cached per (project, profile name) for ttl seconds, profiles that were
+        # not found are cached for negative_ttl seconds (0 disables the caching)
+        "cache": {
+            "ttl": 60,
+            "negative_ttl": 10,
+        },
     },
     "sql": {
         "url": "",
+        # number of rows written per batch by the SQL target bulk writes
+        "write_chunksize": 10_000,
     },
     "v3io_framesd": "http://framesd:8080",
     # default node selector to be applied to all functions - json string base64 encoded format
@@ -449,6 +491,16 @@ default_config = {
             "pull_logs_default_interval": 3,  # seconds
             "pull_logs_backoff_no_logs_default_interval": 10,  # seconds
             "pull_logs_default_size_limit": 1024 * 1024,  # 1 MB
+            "streaming": {
+                # enabled - watching the logs of a run consumes a server side stream that pushes new logs as they
+                # are written (falls back to polling if the server doesn't support it)
+                # disabled - poll the logs every "pull_logs_default_interval" seconds
+                "mode": "enabled",
+                # seconds a single log stream is kept open before the client resumes it from its last offset
+                "timeout": 60,
+                # seconds between server side checks for new logs
+                "poll_interval": 1,
+            },
         },
         "authorization": {
             "mode": "none",  # one of none, opa
@@ -611,6 +663,12 @@ default_config = {
                 "min_replicas": 1,
                 "max_replicas": 1,
             },
+            # The stream trigger delivers the events in batches of up to batch size events (or what arrived within
+            # the timeout), so the controller processes the endpoints of a batch concurrently
+            "batching": {
+                "batch_size": 32,
+                "timeout": "1s",
+            },
         },
         # Store prefixes are used to handle model monitoring storing policies based on project and kind, such as events,
         # stream, and endpoints.
@@ -624,10 +682,52 @@ default_config = {
         "offline_storage_path": "model-endpoints/{kind}",
         "parquet_batching_max_events": 10_000,
         "parquet_batching_timeout_secs": timedelta(minutes=1).total_seconds(),
+        # The controller reads every batch window of an endpoint once and persists it as a parquet snapshot (under the
+        # offline storage path), which the monitoring applications load as their sample data instead of re-reading it.
+        # The snapshots of windows that ended more than the retention seconds ago are deleted by the controller.
+        "controller_window_snapshots": False,
+        "controller_window_snapshots_retention_secs": timedelta(days=1).total_seconds(),
+        # Max number of endpoints the controller worker processes concurrently (the events of an endpoint are always
+        # processed in order)
+        "controller_max_workers": 8,
+        # The monitoring writer buffers the applications results and metrics and writes them to the TSDB in batches,
+        # once the buffer holds max events or its oldest event waited for timeout seconds (1 disables the batching)
+        "writer_batching_max_events": 100,
+        "writer_batching_timeout_secs": 5,
+        # Max number of events the writer keeps buffered while the TSDB writes fail, the oldest events are dropped
+        # past it
+        "writer_batching_max_buffered_events": 10000,
         "tdengine": {
             "timeout": 10,
             "retries": 1,
         },
+        # The monitoring stream processor keeps the model endpoints records of its project in a bounded cache, which
+        # is prefetched on start and refreshed in the background once the records are older than ttl seconds
+        "stream_endpoints_cache": {
+            "max_size": 10_000,
+            "ttl": 300,
+        },
+        # When enabled, the monitoring stream processor maps the events of each endpoint in batches (of up to
+        # max_events events, or the events received within flush_after_seconds) instead of one by one
+        "stream_batching": {
+            "enabled": False,
+            "max_events": 1000,
+            "flush_after_seconds": 1,
+        },
+    },
+    "serving": {
+        # Max number of threads running the branches of sync engine flows in parallel, shared by all the flows of the
+        # process (the first branch of each fork runs on the calling thread, and the branches nested in a branch which
+        # runs on the pool run on that branch thread)
+        "sync_flow_max_workers": 32,
+        # Per step latency histograms and sampled event traces of the serving graph, available through the server
+        # context (context.stats) and the /__stats__ path of the serving function
+        "stats": {
+            "enabled": False,
+            # Fraction of the events whose full trace (steps timeline) is kept, and the max number of kept traces
+            "trace_sample_rate": 0.0,
+            "max_traces": 100,
+        },
     },
     "secret_stores": {
         # Use only in testing scenarios (such as integration tests) to avoid using k8s for secrets (will use in-memory
@@ -702,6 +802,17 @@ default_config = {
         # e.g. Windows client (on host) and Linux container (Jupyter, Nuclio..) need to access the same files/artifacts
         # need to map container path to host windows paths, e.g. "\data::c:\\mlrun_data" ("::" used as splitter)
         "item_to_real_path": "",
+        # max number of files read concurrently when reading a directory (e.g. a directory of csv files)
+        "multi_file_read_workers": 8,
+        "transfer": {
+            # files larger than the threshold are uploaded/downloaded in concurrent chunks (multipart)
+            "multipart_threshold": 1024 * 1024 * 32,  # 32MB
+            "chunk_size": 1024 * 1024 * 32,  # 32MB
+            # max number of chunks transferred concurrently per file
+            "max_concurrency": 10,
+            # max number of files transferred concurrently (e.g. files of a directory artifact)
+            "max_files": 8,
+        },
     },
     "default_function_pod_resources": {
         "requests": {"cpu": None, "memory": None, "gpu": None},
@@ -794,6 +905,19 @@ default_config = {
         #       number to the artifact / result key (like "<key>-rank<#>". Results can have reduce operation in the
         #       log hint to average / min / max them across all the workers (default operation should be average).
     },
+    # Configurations for the deep learning frameworks (PyTorch and tf.keras) MLRun logging callbacks:
+    "frameworks": {
+        "mlrun_logger": {
+            # Whether to log the epochs results and artifacts in a background thread, so the training loop doesn't
+            # wait for the run updates and the artifacts uploads (the context must not be used by the training code
+            # meanwhile).
+            "asynchronous": False,
+            # Log the metrics results chart artifacts every this number of epochs (they are always logged at the end).
+            "charts_logging_frequency": 1,
+            # The max number of epochs waiting to be logged, when reached, the training waits for the logging.
+            "max_pending_epochs": 2,
+        },
+    },
     # Events are currently (and only) used to audit changes and record access to MLRun entities (such as secrets)
     "events": {
         # supported modes "enabled", "disabled".
@@ -835,7 +959,19 @@ default_config = {
         "smtp": {
             "config_secret_name": "mlrun-smtp-config",
             "refresh_interval": "30",
-        }
+        },
+        # The API notifications dispatcher, pushing the run notifications with a shared HTTP session
+        "dispatcher": {
+            "max_concurrent_pushes": 50,
+            # Max number of connections of the shared HTTP session
+            "connections_limit": 100,
+            # Per destination (webhook url, slack webhook, git server) token bucket - pushes per second and burst size
+            "destination_rate_limit": 5,
+            "destination_burst": 10,
+            # Failed pushes (connection errors, 429 and 5xx responses) are retried with exponential backoff and jitter
+            "max_retries": 3,
+            "retry_backoff": 1,
+        },
     },
     "system_id": "",
 }
@@ -852,6 +988,62 @@ def is_running_as_api():
     return _is_running_as_api
 
 
+# bumped on every config change, compiled snapshots and memoized values of older generations are stale
+_config_generations = itertools.count()
+_config_generation = next(_config_generations)
+# id of a config tree dict -> (config tree dict, generation, snapshot, memoized values by dotted key)
+_compiled_configs: dict[int, tuple[dict, int, "ConfigSnapshot", dict]] = {}
+_compiled_configs_lock = Lock()
+
+
+def _invalidate_compiled_configs():
+    global _config_generation
+    _config_generation = next(_config_generations)
+
+
+class ConfigSnapshot:
+    """
+    Read only, compiled view of a config tree. Nested mappings are compiled once into nested snapshots, so attribute
+    reads are plain attribute lookups instead of wrapping every nested mapping in a new Config object.
+    Use Config.snapshot() to get the (cached) snapshot of the current configuration.
+    """
+
+    def __init__(self, cfg: Mapping):
+        for key, value in cfg.items():
+            if isinstance(value, Config):
+                value = value._cfg
+            if isinstance(value, Mapping):
+                value = ConfigSnapshot(value)
+            elif isinstance(value, (list, dict, set)):
+                value = copy.deepcopy(value)
+            object.__setattr__(self, key, value)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError(
+            f"Config snapshot is read only, set `{attr}` on mlrun.mlconf instead"
+        )
+
+    def __delattr__(self, attr):
+        raise AttributeError(f"Config snapshot is read only, can not delete `{attr}`")
+
+    def __iter__(self):
+        return iter(self.__dict__)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+    def get(self, key, default=None):
+        return self.__dict__.get(key, default)
+
+    def to_dict(self) -> dict:
+        return {
+            key: value.to_dict()
+            if isinstance(value, ConfigSnapshot)
+            else copy.deepcopy(value)
+            for key, value in self.__dict__.items()
+        }
+
+
 class Config:
     _missing = object()
 
@@ -861,6 +1053,46 @@ class Config:
         # Can't use self._cfg = cfg → infinite recursion
         object.__setattr__(self, "_cfg", cfg)
 
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Get a compiled, read only snapshot of the config, for hot path reads (e.g.
+        `mlconf.snapshot().model_endpoint_monitoring.store_prefixes.default`).
+        The snapshot is compiled once and reused until the config is changed (set, update or reload), so don't keep
+        a reference to it, call snapshot() on every use to see the latest configuration.
+        """
+        return self._get_compiled()[2]
+
+    def get_cached(self, key: str, default=_missing):
+        """
+        Get a config value by its dotted key (e.g. "httpdb.logs.decode.errors"), the resolved value is memoized until
+        the config is changed (set, update or reload). Nested configs are returned as read only snapshots.
+
+        :param key:     Dotted config key.
+        :param default: Value to return when the key does not exist, if not given an AttributeError is raised.
+        """
+        _, _, snapshot, memoized_values = self._get_compiled()
+        value = memoized_values.get(key, self._missing)
+        if value is self._missing:
+            value = snapshot
+            for attr in key.split("."):
+                value = getattr(value, attr, self._missing)
+                if value is self._missing:
+                    if default is self._missing:
+                        raise AttributeError(key)
+                    return default
+            memoized_values[key] = value
+        return value
+
+    def _get_compiled(self) -> tuple[dict, int, ConfigSnapshot, dict]:
+        generation = _config_generation
+        compiled = _compiled_configs.get(id(self._cfg))
+        if compiled and compiled[0] is self._cfg and compiled[1] == generation:
+            return compiled
+        with _compiled_configs_lock:
+            compiled = (self._cfg, generation, ConfigSnapshot(self._cfg), {})
+            _compiled_configs[id(self._cfg)] = compiled
+        return compiled
+
     def __getattr__(self, attr):
         val = self._cfg.get(attr, self._missing)
         if val is self._missing:
@@ -871,6 +1103,7 @@ class Config:
         return val
 
     def __setattr__(self, attr, value):
+        _invalidate_compiled_configs()
         # in order for the dbpath setter to work
         if attr == "dbpath":
             super().__setattr__(attr, value)
@@ -1287,12 +1520,10 @@ class Config:
         """
 
         if target != "offline":
-            store_prefix_dict = (
-                mlrun.mlconf.model_endpoint_monitoring.store_prefixes.to_dict()
-            )
-            if store_prefix_dict.get(kind):
+            store_prefixes = self.get_cached("model_endpoint_monitoring.store_prefixes")
+            if store_prefixes.get(kind):
                 # Target exist in store prefix and has a valid string value
-                return store_prefix_dict[kind].format(project=project, **kwargs)
+                return store_prefixes.get(kind).format(project=project, **kwargs)
             if (
                 function_name
                 and function_name
@@ -1300,7 +1531,7 @@ class Config:
                 and function_name
                 != mlrun.common.schemas.model_monitoring.constants.MonitoringFunctionNames.APPLICATION_CONTROLLER
             ):
-                return mlrun.mlconf.model_endpoint_monitoring.store_prefixes.user_space.format(
+                return store_prefixes.user_space.format(
                     project=project,
                     kind=kind
                     if function_name is None
@@ -1311,7 +1542,7 @@ class Config:
                 and function_name
                 != mlrun.common.schemas.model_monitoring.constants.MonitoringFunctionNames.APPLICATION_CONTROLLER
             ):
-                return mlrun.mlconf.model_endpoint_monitoring.store_prefixes.user_space.format(
+                return store_prefixes.user_space.format(
                     project=project,
                     kind=kind,
                 )
@@ -1321,15 +1552,15 @@ class Config:
                     == mlrun.common.schemas.model_monitoring.constants.MonitoringFunctionNames.APPLICATION_CONTROLLER
                 ):
                     kind = function_name
-                return mlrun.mlconf.model_endpoint_monitoring.store_prefixes.default.format(
+                return store_prefixes.default.format(
                     project=project,
                     kind=kind,
                 )
 
         # Get the current offline path from the configuration
-        file_path = mlrun.mlconf.model_endpoint_monitoring.offline_storage_path.format(
-            project=project, kind=kind
-        )
+        file_path = self.get_cached(
+            "model_endpoint_monitoring.offline_storage_path"
+        ).format(project=project, kind=kind)
 
         # Absolute path
         if any(value in file_path for value in ["://", ":///"]) or os.path.isabs(
@@ -1445,6 +1676,7 @@ def _do_populate(env=None, skip_errors=False):
 
     _configure_ssl_verification(config.httpdb.http.verify)
     _validate_config(config)
+    _invalidate_compiled_configs()
 
 
 def _validate_config(config):
@@ -1495,12 +1727,22 @@ def _convert_resources_to_str(config: typing.Optional[dict] = None):
             resource_requirement[resource_type] = str(value)
 
 
+def _strtobool(value: str) -> int:
+    # same as distutils.util.strtobool, without paying for importing distutils (deprecated and removed in python 3.12)
+    value = value.lower()
+    if value in ("y", "yes", "t", "true", "on", "1"):
+        return 1
+    if value in ("n", "no", "f", "false", "off", "0"):
+        return 0
+    raise ValueError(f"invalid truth value {value!r}")
+
+
 def _convert_str(value, typ):
     if typ in (str, _none_type):
         return value
 
     if typ is bool:
-        return strtobool(value)
+        return _strtobool(value)
 
     # e.g. int('8080') → 8080
     return typ(value)
@@ -180,6 +180,15 @@ class AzureBlobStore(DataStore):
                 max_concurrency=self.max_concurrency,
             )
 
+    def download(self, key, target_path):
+        remote_path = self._convert_key_to_remote_path(key)
+        container, remote_path = remote_path.split("/", 1)
+        container_client = self.service_client.get_container_client(container=container)
+        with open(target_path, "wb") as fp:
+            container_client.download_blob(
+                blob=remote_path, max_concurrency=self.max_concurrency
+            ).readinto(fp)
+
     def get(self, key, size=None, offset=0):
         remote_path = self._convert_key_to_remote_path(key)
         end = offset + size if size else None
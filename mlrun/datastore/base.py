@@ -29,10 +29,20 @@ from deprecated import deprecated
 import mlrun.config
 import mlrun.errors
 from mlrun.errors import err_to_str
-from mlrun.utils import StorePrefix, is_jupyter, logger
+from mlrun.utils import (
+    StorePrefix,
+    calculate_local_file_hash,
+    is_jupyter,
+    logger,
+)
 
 from .store_resources import is_store_uri, parse_store_uri
-from .utils import filter_df_start_end_time, select_columns_from_df
+from .utils import (
+    drop_columns_generator,
+    filter_df_start_end_time,
+    read_files_concurrently,
+    select_columns_from_df,
+)
 
 
 class FileStats:
@@ -186,6 +196,12 @@ class DataStore:
     def upload(self, key, src_path):
         pass
 
+    def upload_and_hash(self, key, src_path) -> str:
+        """upload the source file and return its SHA1 hash, stores that upload from a file stream
+        override it to calculate the hash while uploading (instead of reading the file twice)"""
+        self.upload(key, src_path)
+        return calculate_local_file_hash(src_path)
+
     def get_spark_options(self):
         return {}
 
@@ -277,6 +293,54 @@ class DataStore:
 
         return reader
 
+    @staticmethod
+    def _list_csv_files(file_system, base_path) -> list[str]:
+        filenames = []
+        for file_entry in file_system.listdir(base_path):
+            if (
+                file_entry["name"].endswith(".csv")
+                and file_entry["size"] > 0
+                and file_entry["type"] == "file"
+            ):
+                filenames.append(file_entry["name"].split("/")[-1])
+        return filenames
+
+    def _csv_dir_reader(self, df_module, file_system):
+        """
+        return a reader for a directory of csv files. with pandas, the files are read concurrently
+        (see mlrun.mlconf.storage.multi_file_read_workers), and when `chunksize` is given a generator
+        is returned that yields the frames of each file (in chunks of up to `chunksize` rows)
+        instead of concatenating all the files into a single frame.
+        """
+
+        def reader(*args, **kwargs):
+            base_path = args[0]
+            filenames = self._list_csv_files(file_system, base_path)
+            if df_module is not pd:
+                dfs = []
+                for filename in filenames:
+                    updated_args = [f"{base_path}/{filename}"]
+                    updated_args.extend(args[1:])
+                    dfs.append(df_module.read_csv(*updated_args, **kwargs))
+                return df_module.concat(dfs)
+
+            kwargs.pop("filesystem", None)
+            kwargs.pop("storage_options", None)
+            chunksize = kwargs.pop("chunksize", None)
+
+            def read_file(filename):
+                with file_system.open(f"{base_path}/{filename}") as fhandle:
+                    updated_args = [fhandle]
+                    updated_args.extend(args[1:])
+                    return pd.read_csv(*updated_args, **kwargs)
+
+            dfs = read_files_concurrently(read_file, filenames)
+            if chunksize:
+                return _split_to_chunks(dfs, chunksize)
+            return pd.concat(list(dfs))
+
+        return reader
+
     def as_df(
         self,
         url,
@@ -310,38 +374,7 @@ class DataStore:
             reader = df_module.read_csv
             if file_system:
                 if file_system.isdir(file_url):
-
-                    def reader(*args, **kwargs):
-                        base_path = args[0]
-                        file_entries = file_system.listdir(base_path)
-                        filenames = []
-                        for file_entry in file_entries:
-                            if (
-                                file_entry["name"].endswith(".csv")
-                                and file_entry["size"] > 0
-                                and file_entry["type"] == "file"
-                            ):
-                                filename = file_entry["name"]
-                                filename = filename.split("/")[-1]
-                                filenames.append(filename)
-                        dfs = []
-                        if df_module is pd:
-                            kwargs.pop("filesystem", None)
-                            kwargs.pop("storage_options", None)
-                            for filename in filenames:
-                                fullpath = f"{base_path}/{filename}"
-                                with file_system.open(fullpath) as fhandle:
-                                    updated_args = [fhandle]
-                                    updated_args.extend(args[1:])
-                                    dfs.append(
-                                        df_module.read_csv(*updated_args, **kwargs)
-                                    )
-                        else:
-                            for filename in filenames:
-                                updated_args = [f"{base_path}/{filename}"]
-                                updated_args.extend(args[1:])
-                                dfs.append(df_module.read_csv(*updated_args, **kwargs))
-                        return df_module.concat(dfs)
+                    reader = self._csv_dir_reader(df_module, file_system)
 
         elif mlrun.utils.helpers.is_parquet_file(file_url, format):
             if columns:
@@ -391,7 +424,10 @@ class DataStore:
                 end_time=end_time,
             )
             if drop_time_column:
-                df.drop(columns=[time_column], inplace=True)
+                if isinstance(df, pd.DataFrame):
+                    df.drop(columns=[time_column], inplace=True)
+                else:
+                    df = drop_columns_generator(df, [time_column])
         if is_json:
             # for csv and parquet files the columns select is executed in `reader`.
             df = select_columns_from_df(df, columns=columns)
@@ -421,6 +457,12 @@ class DataStore:
             return False
 
 
+def _split_to_chunks(dfs, chunksize):
+    for df in dfs:
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start : start + chunksize]
+
+
 class DataItem:
     """Data input/output class abstracting access to various local/remote data sources
 
@@ -544,6 +586,13 @@ class DataItem:
         """
         self._store.upload(self._path, src_path)
 
+    def upload_and_hash(self, src_path) -> str:
+        """upload the source file (src_path) and return its SHA1 hash
+
+        :param src_path: source file path to read from and upload
+        """
+        return self._store.upload_and_hash(self._path, src_path)
+
     def stat(self):
         """return FileStats class (size, modified, content_type)"""
         return self._store.stat(self._path)
@@ -610,6 +659,10 @@ class DataItem:
                                     Example: [("Product", "=", "Computer")]
                                     For all supported filters, please see:
                                     https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetDataset.html
+        :param kwargs:      additional reader (csv, parquet, ..) args. e.g. engine="pyarrow" to parse csv files
+                            with the multi-threaded pyarrow parser. When reading a directory of csv files,
+                            the files are read concurrently and chunksize=<rows> returns a generator of frames
+                            (per file, in chunks of up to <rows> rows) instead of a single concatenated frame.
         """
         df = self._store.as_df(
             self._url,
@@ -11,6 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import collections
+import hashlib
+import json
+import threading
+import time
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -20,6 +25,7 @@ import mlrun
 import mlrun.errors
 from mlrun.datastore.datastore_profile import datastore_profile_read
 from mlrun.errors import err_to_str
+from mlrun.utils import logger
 from mlrun.utils.helpers import get_local_file_schema
 
 from ..utils import DB_SCHEMA, RunKeys
@@ -116,9 +122,93 @@ def uri_to_ipython(link):
     return schema_to_store(schema).uri_to_ipython(endpoint, parsed_url.path)
 
 
+class _CredentialsStoresCache:
+    """
+    Bounded LRU cache of the stores that were created with explicit credentials, keyed by the store schema,
+    endpoint and a digest of the credentials, so stores (and their clients) are never shared between credential sets.
+    Stores that were not used for the idle timeout are evicted.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (schema, endpoint, credentials digest) -> (store, last use time)
+        self._stores: collections.OrderedDict[tuple, tuple[DataStore, float]] = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(schema: str, endpoint: str, secrets: Optional[dict]) -> Optional[tuple]:
+        try:
+            serialized_secrets = json.dumps(secrets or {}, sort_keys=True)
+        except TypeError:
+            # not a plain secrets dict, can't tell whether two requests share the credentials
+            return None
+        digest = hashlib.sha256(serialized_secrets.encode()).hexdigest()
+        return schema, endpoint, digest
+
+    def get(self, key: tuple) -> Optional[DataStore]:
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            cached = self._stores.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._stores[key] = (cached[0], now)
+            self._stores.move_to_end(key)
+            return cached[0]
+
+    def add(self, key: tuple, store: DataStore):
+        max_size = int(mlrun.mlconf.datastore.credentials_stores_cache.max_size)
+        if max_size <= 0:
+            return
+        with self._lock:
+            self._stores[key] = (store, time.monotonic())
+            self._stores.move_to_end(key)
+            while len(self._stores) > max_size:
+                self._stores.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._stores.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "live_stores": len(self._stores),
+            }
+
+    def _evict_idle(self, now: float):
+        idle_timeout = float(
+            mlrun.mlconf.datastore.credentials_stores_cache.idle_timeout
+        )
+        evicted = 0
+        # the stores are ordered by their last use, the idle ones are first
+        while self._stores:
+            _, (_, last_used) = next(iter(self._stores.items()))
+            if now - last_used < idle_timeout:
+                break
+            self._stores.popitem(last=False)
+            evicted += 1
+        if evicted:
+            logger.debug(
+                "Evicted idle credentials stores",
+                evicted=evicted,
+                live_stores=len(self._stores),
+            )
+
+
 class StoreManager:
     def __init__(self, secrets=None, db=None):
         self._stores = {}
+        self._credentials_stores = _CredentialsStoresCache()
         self._secrets = secrets or {}
         self._db = db
 
@@ -128,8 +218,14 @@ class StoreManager:
         if secrets:
             for key, val in secrets.items():
                 self._secrets[key] = val
+            # the cached stores may have resolved their credentials from the previous secrets
+            self._credentials_stores.clear()
         return self
 
+    def credentials_stores_cache_stats(self) -> dict:
+        """hits, misses, hit rate and number of live stores of the credentials stores cache"""
+        return self._credentials_stores.stats()
+
     def _get_db(self):
         if not self._db:
             self._db = mlrun.get_run_db(secrets=self._secrets)
@@ -242,19 +338,32 @@ class StoreManager:
             else:
                 raise ValueError(f"no such store ({endpoint})")
 
-        if not secrets and not mlrun.config.is_running_as_api():
+        shared_store = not secrets and not mlrun.config.is_running_as_api()
+        credentials_store_key = None
+        if shared_store:
             if store_key in self._stores.keys():
                 return self._stores[store_key], subpath, url
+        else:
+            # when running on server there are multiple users, and when secrets are passed they may differ between
+            # calls, so stores are cached per credential set and never shared between them
+            credentials_store_key = self._credentials_stores.key(
+                schema, parsed_url.netloc, secrets
+            )
+            if credentials_store_key:
+                store = self._credentials_stores.get(credentials_store_key)
+                if store is not None:
+                    return store, subpath, url
 
         # support u/p embedding in url (as done in redis) by setting netloc as the "endpoint" parameter
-        # when running on server we don't cache the datastore, because there are multiple users and we don't want to
-        # cache the credentials, so for each new request we create a new store
         store = schema_to_store(schema)(
             self, schema, store_key, parsed_url.netloc, secrets=secrets
         )
-        if not secrets and not mlrun.config.is_running_as_api():
+        if shared_store:
             self._stores[store_key] = store
+        elif credentials_store_key:
+            self._credentials_stores.add(credentials_store_key, store)
         return store, subpath, url
 
     def reset_secrets(self):
         self._secrets = {}
+        self._credentials_stores.clear()
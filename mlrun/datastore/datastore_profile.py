@@ -15,6 +15,8 @@
 import ast
 import base64
 import json
+import threading
+import time
 import typing
 import warnings
 from urllib.parse import ParseResult, urlparse
@@ -74,6 +76,83 @@ class TemporaryClientDatastoreProfiles(metaclass=mlrun.utils.singleton.Singleton
         self._data.pop(key, None)
 
 
+class _ProfileLoad:
+    """an in-flight fetch of a profile, concurrent resolvers of the same profile wait for it instead of fetching"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.profile: typing.Optional[DatastoreProfile] = None
+        self.error: typing.Optional[Exception] = None
+
+
+class DatastoreProfilesCache(metaclass=mlrun.utils.singleton.Singleton):
+    """
+    Process wide TTL cache of the public datastore profiles, keyed by (project, profile name).
+    Missing profiles are cached as well (for a shorter TTL), and concurrent resolvers of the same profile share a
+    single fetch. The private part of the profiles is never cached.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (project, profile name) -> (expiration time, profile or None when the profile was not found)
+        self._profiles: dict[
+            tuple[str, str], tuple[float, typing.Optional[DatastoreProfile]]
+        ] = {}
+        self._loads: dict[tuple[str, str], _ProfileLoad] = {}
+
+    def get(
+        self,
+        project: str,
+        profile_name: str,
+        loader: typing.Callable[[], typing.Optional[DatastoreProfile]],
+    ) -> typing.Optional[DatastoreProfile]:
+        cache_config = mlrun.mlconf.datastore_profiles.cache
+        ttl, negative_ttl = float(cache_config.ttl), float(cache_config.negative_ttl)
+        key = (project, profile_name)
+        with self._lock:
+            cached = self._profiles.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            load = self._loads.get(key)
+            is_loader = load is None
+            if is_loader:
+                load = self._loads[key] = _ProfileLoad()
+
+        if not is_loader:
+            load.done.wait()
+            if load.error:
+                raise load.error
+            return load.profile
+
+        try:
+            load.profile = loader()
+        except Exception as exc:
+            load.error = exc
+            raise
+        finally:
+            with self._lock:
+                # a profile that was invalidated while loading is not cached, it may be stale
+                if self._loads.pop(key, None) is load and not load.error:
+                    profile_ttl = ttl if load.profile else negative_ttl
+                    if profile_ttl > 0:
+                        self._profiles[key] = (
+                            time.monotonic() + profile_ttl,
+                            load.profile,
+                        )
+            load.done.set()
+        return load.profile
+
+    def invalidate(self, project: str, profile_name: str):
+        with self._lock:
+            self._profiles.pop((project, profile_name), None)
+            self._loads.pop((project, profile_name), None)
+
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
+            self._loads.clear()
+
+
 class DatastoreProfileBasic(DatastoreProfile):
     type: str = pydantic.v1.Field("basic")
     _private_attributes = "private"
@@ -631,21 +710,11 @@ def datastore_profile_read(url, project_name="", secrets: typing.Optional[dict]
     datastore = TemporaryClientDatastoreProfiles().get(profile_name)
     if datastore:
         return datastore
-    public_profile = mlrun.db.get_run_db().get_datastore_profile(
-        profile_name, project_name
+    public_profile = DatastoreProfilesCache().get(
+        project_name,
+        profile_name,
+        lambda: _get_public_datastore_profile(profile_name, project_name),
     )
-    # The mlrun.db.get_run_db().get_datastore_profile() function is capable of returning
-    # two distinct types of objects based on its execution context.
-    # If it operates from the client or within the pod (which is the common scenario),
-    # it yields an instance of `mlrun.datastore.DatastoreProfile`. Conversely,
-    # when executed on the server with a direct call to `sqldb`, it produces an instance of
-    # mlrun.common.schemas.DatastoreProfile.
-    # In the latter scenario, an extra conversion step is required to transform the object
-    # into mlrun.datastore.DatastoreProfile.
-    if isinstance(public_profile, mlrun.common.schemas.DatastoreProfile):
-        public_profile = DatastoreProfile2Json.create_from_json(
-            public_json=public_profile.object
-        )
     project_ds_name_private = DatastoreProfile.generate_secret_key(
         profile_name, project_name
     )
@@ -664,6 +733,37 @@ def datastore_profile_read(url, project_name="", secrets: typing.Optional[dict]
     return datastore
 
 
+def _get_public_datastore_profile(
+    profile_name: str, project_name: str
+) -> typing.Optional[DatastoreProfile]:
+    try:
+        public_profile = mlrun.db.get_run_db().get_datastore_profile(
+            profile_name, project_name
+        )
+    except mlrun.errors.MLRunNotFoundError:
+        return None
+    # The mlrun.db.get_run_db().get_datastore_profile() function is capable of returning
+    # two distinct types of objects based on its execution context.
+    # If it operates from the client or within the pod (which is the common scenario),
+    # it yields an instance of `mlrun.datastore.DatastoreProfile`. Conversely,
+    # when executed on the server with a direct call to `sqldb`, it produces an instance of
+    # mlrun.common.schemas.DatastoreProfile.
+    # In the latter scenario, an extra conversion step is required to transform the object
+    # into mlrun.datastore.DatastoreProfile.
+    if isinstance(public_profile, mlrun.common.schemas.DatastoreProfile):
+        public_profile = DatastoreProfile2Json.create_from_json(
+            public_json=public_profile.object
+        )
+    return public_profile
+
+
+def invalidate_datastore_profile_cache(profile_name: str, project_name: str = ""):
+    """Drop the cached datastore profile, so the next resolution fetches it again"""
+    DatastoreProfilesCache().invalidate(
+        project_name or mlrun.mlconf.default_project, profile_name
+    )
+
+
 def register_temporary_client_datastore_profile(profile: DatastoreProfile):
     """Register the datastore profile.
     This profile is temporary and remains valid only for the duration of the caller's session.
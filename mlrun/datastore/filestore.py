@@ -13,14 +13,16 @@
 # limitations under the License.
 import time
 from os import listdir, makedirs, path, stat
-from shutil import copyfile
+from shutil import copyfile, copyfileobj
 from typing import Optional
 
 import fsspec
 
 import mlrun
 
+from ..utils import calculate_local_file_hash
 from .base import DataStore, FileStats
+from .utils import HashingReader
 
 
 class FileStore(DataStore):
@@ -89,6 +91,19 @@ class FileStore(DataStore):
             makedirs(dir, exist_ok=True)
         copyfile(src_path, fullpath)
 
+    def upload_and_hash(self, key, src_path):
+        fullpath = self._join(key)
+        if path.realpath(src_path) == path.realpath(fullpath):
+            return calculate_local_file_hash(src_path)
+        dir = path.dirname(fullpath)
+        if dir:
+            makedirs(dir, exist_ok=True)
+        # copy and hash in the same read
+        with open(src_path, "rb") as src, open(fullpath, "wb") as dst:
+            reader = HashingReader(src)
+            copyfileobj(reader, dst)
+        return reader.hexdigest()
+
     def stat(self, key):
         s = stat(self._join(key))
         return FileStats(size=s.st_size, modified=s.st_mtime)
@@ -31,8 +31,6 @@ from .base import DataStore, FileStats, make_datastore_schema_sanitizer
 
 class GoogleCloudStorageStore(DataStore):
     using_bucket = True
-    workers = 8
-    chunk_size = 32 * 1024 * 1024
 
     def __init__(
         self, parent, schema, name, endpoint="", secrets: Optional[dict] = None
@@ -145,7 +143,8 @@ class GoogleCloudStorageStore(DataStore):
         # Multiple upload limitation recommendations as described in
         # https://cloud.google.com/storage/docs/multipart-uploads#storage-upload-object-chunks-python
 
-        if file_size <= self.chunk_size:
+        transfer_config = mlrun.mlconf.storage.transfer
+        if file_size <= transfer_config.multipart_threshold:
             self.filesystem.put_file(src_path, united_path, overwrite=True)
             return
 
@@ -154,7 +153,10 @@ class GoogleCloudStorageStore(DataStore):
 
         try:
             transfer_manager.upload_chunks_concurrently(
-                src_path, blob, chunk_size=self.chunk_size, max_workers=self.workers
+                src_path,
+                blob,
+                chunk_size=transfer_config.chunk_size,
+                max_workers=transfer_config.max_concurrency,
             )
         except Exception as upload_chunks_concurrently_exception:
             logger.warning(
@@ -163,6 +165,30 @@ class GoogleCloudStorageStore(DataStore):
             )
             self.filesystem.put_file(src_path, united_path, overwrite=True)
 
+    def download(self, key, target_path):
+        united_path = self._make_path(key)
+        transfer_config = mlrun.mlconf.storage.transfer
+        if self.filesystem.size(united_path) <= transfer_config.multipart_threshold:
+            self.filesystem.get_file(united_path, target_path)
+            return
+
+        bucket = self.storage_client.bucket(self.endpoint)
+        blob = bucket.blob(key.strip("/"))
+
+        try:
+            transfer_manager.download_chunks_concurrently(
+                blob,
+                target_path,
+                chunk_size=transfer_config.chunk_size,
+                max_workers=transfer_config.max_concurrency,
+            )
+        except Exception as download_chunks_concurrently_exception:
+            logger.warning(
+                f"gcs: failed to concurrently download {united_path},"
+                f" exception: {download_chunks_concurrently_exception}. Retrying with single part download."
+            )
+            self.filesystem.get_file(united_path, target_path)
+
     def stat(self, key):
         path = self._make_path(key)
 
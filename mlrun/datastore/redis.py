@@ -12,16 +12,83 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+from collections.abc import Iterable, Iterator
 from typing import Optional
 from urllib.parse import urlparse
 
 import redis
+import redis.asyncio
+import redis.asyncio.cluster
 import redis.cluster
+import storey.redis_driver
 
 import mlrun
 
 from .base import DataStore
 
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_redis_client(url: str):
+    """
+    Return a redis client for the given url, clients (and their connection pools) are shared per url
+
+    :param url: redis url (including credentials)
+    :return: `redis.cluster.RedisCluster` when the server runs in cluster mode, `redis.Redis` otherwise
+    """
+    client = _clients.get(url)
+    if client is not None:
+        return client
+    with _clients_lock:
+        client = _clients.get(url)
+        if client is None:
+            try:
+                client = redis.cluster.RedisCluster.from_url(url, decode_responses=True)
+            except redis.cluster.RedisClusterException:
+                client = redis.Redis(
+                    connection_pool=_get_blocking_pool(
+                        redis.BlockingConnectionPool, url
+                    )
+                )
+            _clients[url] = client
+    return client
+
+
+def _get_blocking_pool(pool_class, url: str):
+    """
+    Return a connection pool bounded by `mlconf.redis.max_connections`, requests wait for a free connection (up to
+    `mlconf.redis.pool_timeout` seconds) instead of failing once the pool is exhausted
+    """
+    return pool_class.from_url(
+        url,
+        decode_responses=True,
+        max_connections=mlrun.mlconf.redis.max_connections,
+        timeout=mlrun.mlconf.redis.pool_timeout,
+    )
+
+
+class PooledRedisDriver(storey.redis_driver.RedisDriver):
+    """storey redis driver that uses the shared (pooled) client of its endpoint"""
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            self._redis = get_redis_client(self._redis_url)
+        return self._redis
+
+
+def _batches(items: Iterable, batch_size: int) -> Iterator[list]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
 
 class RedisStore(DataStore):
     """
@@ -61,20 +128,33 @@ class RedisStore(DataStore):
         self._redis_url = endpoint
 
         self._redis = None
+        self._async_redis = None
 
     @property
     def redis(self):
         if self._redis is None:
-            try:
-                self._redis = redis.cluster.RedisCluster.from_url(
+            self._redis = get_redis_client(self._redis_url)
+
+        return self._redis
+
+    @property
+    def async_redis(self):
+        """asyncio redis client, created on first use (async clients are bound to the running event loop)"""
+        if self._async_redis is None:
+            if isinstance(self.redis, redis.cluster.RedisCluster):
+                self._async_redis = redis.asyncio.cluster.RedisCluster.from_url(
                     self._redis_url, decode_responses=True
                 )
-            except redis.cluster.RedisClusterException:
-                self._redis = redis.Redis.from_url(
-                    self._redis_url, decode_responses=True
+            else:
+                self._async_redis = redis.asyncio.Redis(
+                    connection_pool=_get_blocking_pool(
+                        redis.asyncio.BlockingConnectionPool, self._redis_url
+                    )
                 )
+        return self._async_redis
 
-        return self._redis
+    def _pipeline(self):
+        return self.redis.pipeline(transaction=False)
 
     @property
     def filesystem(self):
@@ -111,8 +191,8 @@ class RedisStore(DataStore):
                     break
                 self.redis.append(key, data)
 
-    def get(self, key, size=None, offset=0):
-        key = RedisStore.build_redis_key(key)
+    @staticmethod
+    def _get_range(size=None, offset=0):
         if offset < 0:
             raise mlrun.errors.MLRunInvalidArgumentError(
                 "offset argument should be >= 0"
@@ -124,9 +204,20 @@ class RedisStore(DataStore):
             raise mlrun.errors.MLRunInvalidArgumentError("size argument should be > 0")
         else:
             end_offset = start_offset + size - 1
+        return start_offset, end_offset
+
+    def get(self, key, size=None, offset=0):
+        key = RedisStore.build_redis_key(key)
+        start_offset, end_offset = self._get_range(size, offset)
 
         return self.redis.getrange(key, start_offset, end_offset)
 
+    async def get_async(self, key, size=None, offset=0):
+        key = RedisStore.build_redis_key(key)
+        start_offset, end_offset = self._get_range(size, offset)
+
+        return await self.async_redis.getrange(key, start_offset, end_offset)
+
     def put(self, key, data, append=False):
         key = RedisStore.build_redis_key(key)
         data, _ = self._prepare_put_data(data, append)
@@ -135,6 +226,22 @@ class RedisStore(DataStore):
         else:
             self.redis.set(key, data)
 
+    async def put_async(self, key, data, append=False):
+        key = RedisStore.build_redis_key(key)
+        data, _ = self._prepare_put_data(data, append)
+        if append:
+            await self.async_redis.append(key, data)
+        else:
+            await self.async_redis.set(key, data)
+
+    def _delete_keys(self, keys: Iterable):
+        for batch in _batches(keys, mlrun.mlconf.redis.batch_size):
+            pipeline = self._pipeline()
+            for key in batch:
+                # keys may belong to different cluster slots, unlink each key
+                pipeline.unlink(key)
+            pipeline.execute()
+
     def stat(self, key):
         raise NotImplementedError()
 
@@ -142,12 +249,30 @@ class RedisStore(DataStore):
         """
         list all keys with prefix key
         """
-        response = []
+        return [RedisStore.build_mlrun_key(key) for key in self._scan(key)]
+
+    async def listdir_async(self, key):
+        """
+        list all keys with prefix key
+        """
+        pattern = self._get_scan_pattern(key)
+        return [
+            RedisStore.build_mlrun_key(key)
+            async for key in self.async_redis.scan_iter(
+                match=pattern, count=mlrun.mlconf.redis.scan_count
+            )
+        ]
+
+    @staticmethod
+    def _get_scan_pattern(key):
         key = RedisStore.build_redis_key(key, prefix_only=True)
-        key += "*" if key.endswith("/") else "/*"
-        for key in self.redis.scan_iter(key):
-            response.append(RedisStore.build_mlrun_key(key))
-        return response
+        return key + ("*" if key.endswith("/") else "/*")
+
+    def _scan(self, key, prefix=""):
+        return self.redis.scan_iter(
+            match=prefix + self._get_scan_pattern(key),
+            count=mlrun.mlconf.redis.scan_count,
+        )
 
     def rm(self, key, recursive=False, maxdepth=None):
         """
@@ -156,17 +281,11 @@ class RedisStore(DataStore):
         if maxdepth is not None:
             raise NotImplementedError("maxdepth is not supported")
 
-        key = RedisStore.build_redis_key(key, prefix_only=recursive)
-
         if recursive:
-            key += "*" if key.endswith("/") else "/*"
-            for k in self.redis.scan_iter(key):
-                self.redis.delete(k)
-            key = f"_spark:{key}"
-            for k in self.redis.scan_iter(key):
-                self.redis.delete(k)
+            self._delete_keys(self._scan(key))
+            self._delete_keys(self._scan(key, prefix="_spark:"))
         else:
-            self.redis.delete(key)
+            self.redis.delete(RedisStore.build_redis_key(key))
 
     @property
     def spark_url(self):
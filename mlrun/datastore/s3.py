@@ -21,7 +21,9 @@ from fsspec.registry import get_filesystem_class
 
 import mlrun.errors
 
+from ..utils import calculate_local_file_hash
 from .base import DataStore, FileStats, get_range, make_datastore_schema_sanitizer
+from .utils import HashingReader, parse_s3_bucket_and_key  # noqa: F401
 
 
 class S3Store(DataStore):
@@ -45,10 +47,11 @@ class S3Store(DataStore):
         profile_name = self._get_secret_or_env("AWS_PROFILE")
         assume_role_arn = self._get_secret_or_env("MLRUN_AWS_ROLE_ARN")
 
+        transfer_config = mlrun.mlconf.storage.transfer
         self.config = TransferConfig(
-            multipart_threshold=1024 * 1024 * 25,
-            max_concurrency=10,
-            multipart_chunksize=1024 * 1024 * 25,
+            multipart_threshold=transfer_config.multipart_threshold,
+            max_concurrency=transfer_config.max_concurrency,
+            multipart_chunksize=transfer_config.chunk_size,
         )
 
         # If user asks to assume a role, this needs to go through the STS client and retrieve temporary creds
@@ -181,6 +184,18 @@ class S3Store(DataStore):
         bucket, key = self.get_bucket_and_key(key)
         self.s3.Bucket(bucket).upload_file(src_path, key, Config=self.config)
 
+    def upload_and_hash(self, key, src_path):
+        bucket, key = self.get_bucket_and_key(key)
+        with open(src_path, "rb") as fp:
+            reader = HashingReader(fp)
+            self.s3.Bucket(bucket).upload_fileobj(reader, key, Config=self.config)
+        return reader.hexdigest() or calculate_local_file_hash(src_path)
+
+    def download(self, key, target_path):
+        bucket, key = self.get_bucket_and_key(key)
+        # multipart (concurrent ranged GET) download of large objects
+        self.s3.Bucket(bucket).download_file(key, target_path, Config=self.config)
+
     def get(self, key, size=None, offset=0):
         bucket, key = self.get_bucket_and_key(key)
         obj = self.s3.Object(bucket, key)
@@ -218,16 +233,3 @@ class S3Store(DataStore):
         #  In order to raise an error if there is connection error, ML-7056.
         self.filesystem.exists(path=path)
         self.filesystem.rm(path=path, recursive=recursive, maxdepth=maxdepth)
-
-
-def parse_s3_bucket_and_key(s3_path):
-    try:
-        path_parts = s3_path.replace("s3://", "").split("/")
-        bucket = path_parts.pop(0)
-        key = "/".join(path_parts)
-    except Exception as exc:
-        raise mlrun.errors.MLRunInvalidArgumentError(
-            "failed to parse s3 bucket and key"
-        ) from exc
-
-    return bucket, key
@@ -24,8 +24,6 @@ import pandas as pd
 import semver
 import v3io
 import v3io.dataplane
-from nuclio import KafkaTrigger
-from nuclio.config import split_path
 
 import mlrun
 from mlrun.config import config
@@ -41,6 +39,8 @@ from .datastore_profile import datastore_profile_read
 from .spark_utils import spark_session_update_hadoop_options
 from .utils import (
     _generate_sql_query_with_time_filter,
+    _get_sql_engine,
+    _read_sql_chunks,
     filter_df_start_end_time,
     select_columns_from_df,
 )
@@ -1019,6 +1019,9 @@ class StreamSource(OnlineSource):
         access_key = storage_options.get("v3io_access_key")
         endpoint, stream_path = parse_path(url)
         v3io_client = v3io.dataplane.Client(endpoint=endpoint, access_key=access_key)
+        # nuclio is imported on use since importing it is slow (it imports IPython)
+        from nuclio.config import split_path
+
         container, stream_path = split_path(stream_path)
         res = v3io_client.stream.create(
             container=container,
@@ -1138,6 +1141,8 @@ class KafkaSource(OnlineSource):
         if "max_workers" in extra_attributes:
             trigger_kwargs = {"max_workers": extra_attributes.pop("max_workers")}
 
+        from nuclio import KafkaTrigger
+
         trigger = KafkaTrigger(
             brokers=extra_attributes.pop("brokers"),
             topics=extra_attributes.pop("topics"),
@@ -1307,19 +1312,23 @@ class SQLSource(BaseSourceDriver):
         time_field=None,
         additional_filters=None,
     ):
-        import sqlalchemy as sqlalchemy
-
         mlrun.utils.helpers.additional_filters_warning(
             additional_filters, self.__class__
         )
         db_path = self.attributes.get("db_path")
         table_name = self.attributes.get("table_name")
         parse_dates = self.attributes.get("parse_dates")
+        chunksize = self.attributes.get("chunksize")
         time_field = time_field or self.time_field
         start_time = start_time or self.start_time
         end_time = end_time or self.end_time
+        if columns and entities:
+            # the entities are needed for indexing the results, make sure they are not projected out
+            columns = list(entities) + [
+                column for column in columns if column not in entities
+            ]
         if table_name and db_path:
-            engine = sqlalchemy.create_engine(db_path)
+            engine = _get_sql_engine(db_path)
             query, parse_dates = _generate_sql_query_with_time_filter(
                 table_name=table_name,
                 engine=engine,
@@ -1327,15 +1336,14 @@ class SQLSource(BaseSourceDriver):
                 parse_dates=parse_dates,
                 start_time=start_time,
                 end_time=end_time,
+                columns=columns,
             )
-            with engine.connect() as con:
-                return pd.read_sql(
-                    query,
-                    con=con,
-                    chunksize=self.attributes.get("chunksize"),
-                    parse_dates=parse_dates,
-                    columns=columns,
+            if chunksize:
+                return _read_sql_chunks(
+                    engine, query, chunksize=chunksize, parse_dates=parse_dates
                 )
+            with engine.connect() as con:
+                return pd.read_sql(query, con=con, parse_dates=parse_dates)
         else:
             raise mlrun.errors.MLRunInvalidArgumentError(
                 "table_name and db_name args must be specified"
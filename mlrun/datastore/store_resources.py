@@ -85,13 +85,13 @@ class ResourceCache:
             return self._tabels[uri]
 
         if uri.startswith("redis://") or uri.startswith("rediss://"):
-            from storey.redis_driver import RedisDriver
+            from .redis import PooledRedisDriver
 
             endpoint, uri = parse_path(uri)
             endpoint = endpoint or mlrun.mlconf.redis.url
             self._tabels[uri] = Table(
                 uri,
-                RedisDriver(redis_url=endpoint, key_prefix="/"),
+                PooledRedisDriver(redis_url=endpoint, key_prefix="/"),
                 flush_interval_secs=mlrun.mlconf.feature_store.flush_interval,
             )
             return self._tabels[uri]
@@ -21,6 +21,7 @@ from mlrun.datastore.base import DataStore
 
 from ..platforms.iguazio import parse_path
 from .utils import (
+    _get_sql_engine,
     parse_kafka_url,
 )
 
@@ -149,3 +150,23 @@ class RedisNoSqlStoreyTarget(storey.NoSqlTarget):
 
 class TSDBStoreyTarget(storey.TSDBTarget):
     pass
+
+
+class PooledSQLDriver(storey.SQLDriver):
+    """storey SQL driver that uses the shared (pooled) engine of its database url and caches the reflected tables"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tables = {}
+
+    def _lazy_init(self):
+        if not self._sql_connection:
+            self._engine = _get_sql_engine(self._db_path)
+            self._sql_connection = self._engine.connect()
+
+    def _table(self, table_path):
+        table = self._tables.get(table_path)
+        if table is None:
+            table = super()._table(table_path)
+            self._tables[table_path] = table
+        return table
@@ -46,6 +46,8 @@ from .datastore_profile import datastore_profile_read
 from .spark_utils import spark_session_update_hadoop_options
 from .utils import (
     _generate_sql_query_with_time_filter,
+    _get_sql_engine,
+    _write_sql_dataframe,
     filter_df_start_end_time,
     select_columns_from_df,
 )
@@ -1524,7 +1526,8 @@ class RedisNoSqlTarget(NoSqlBaseTarget):
 
     def get_table_object(self):
         from storey import Table
-        from storey.redis_driver import RedisDriver
+
+        from .redis import PooledRedisDriver
 
         endpoint, uri = self.get_server_endpoint(
             self.get_target_path(), self.credentials_prefix
@@ -1532,7 +1535,7 @@ class RedisNoSqlTarget(NoSqlBaseTarget):
 
         return Table(
             uri,
-            RedisDriver(redis_url=endpoint, key_prefix="/"),
+            PooledRedisDriver(redis_url=endpoint, key_prefix="/"),
             flush_interval_secs=mlrun.mlconf.feature_store.flush_interval,
         )
 
@@ -1922,6 +1925,8 @@ class SQLTarget(BaseStoreTarget):
         # create_according_to_data: bool = False,
         varchar_len: int = 50,
         parse_dates: Optional[list[str]] = None,
+        chunksize: Optional[int] = None,
+        upsert: bool = False,
     ):
         """
         Write to SqlDB as output target for a flow.
@@ -1959,6 +1964,10 @@ class SQLTarget(BaseStoreTarget):
         :param create_according_to_data:    (not valid)
         :param varchar_len :    the defalut len of the all the varchar column (using if needed to create the table).
         :param parse_dates :    all the field to be parsed as timestamp.
+        :param chunksize:       number of rows per batch when writing dataframes
+                                (default: mlrun.mlconf.sql.write_chunksize).
+        :param upsert:          pass True to update the existing rows with the same primary key instead of
+                                failing on them when writing dataframes (the table must already exist).
         """
 
         create_according_to_data = False  # TODO: open for user
@@ -1976,6 +1985,8 @@ class SQLTarget(BaseStoreTarget):
                 "if_exists": if_exists,
                 "parse_dates": parse_dates,
                 "varchar_len": varchar_len,
+                "chunksize": chunksize,
+                "upsert": upsert,
             }
             path = (
                 f"mlrunSql://@{db_url}//@{table_name}"
@@ -2004,7 +2015,9 @@ class SQLTarget(BaseStoreTarget):
         )
 
     def get_table_object(self):
-        from storey import SQLDriver, Table
+        from storey import Table
+
+        from .storeytargets import PooledSQLDriver
 
         (db_path, table_name, _, _, primary_key, _) = self._parse_url()
         try:
@@ -2013,7 +2026,7 @@ class SQLTarget(BaseStoreTarget):
             pass
         return Table(
             f"{db_path}/{table_name}",
-            SQLDriver(db_path=db_path, primary_key=primary_key),
+            PooledSQLDriver(db_path=db_path, primary_key=primary_key),
             flush_interval_secs=mlrun.mlconf.feature_store.flush_interval,
         )
 
@@ -2060,18 +2073,12 @@ class SQLTarget(BaseStoreTarget):
         additional_filters=None,
         **kwargs,
     ):
-        try:
-            import sqlalchemy
-
-        except (ModuleNotFoundError, ImportError) as exc:
-            self._raise_sqlalchemy_import_error(exc)
-
         mlrun.utils.helpers.additional_filters_warning(
             additional_filters, self.__class__
         )
 
         db_path, table_name, _, _, _, _ = self._parse_url()
-        engine = sqlalchemy.create_engine(db_path)
+        engine = _get_sql_engine(db_path)
         parse_dates: Optional[list[str]] = self.attributes.get("parse_dates")
         with engine.connect() as conn:
             query, parse_dates = _generate_sql_query_with_time_filter(
@@ -2095,12 +2102,6 @@ class SQLTarget(BaseStoreTarget):
     def write_dataframe(
         self, df, key_column=None, timestamp_key=None, chunk_id=0, **kwargs
     ):
-        try:
-            import sqlalchemy
-
-        except (ModuleNotFoundError, ImportError) as exc:
-            self._raise_sqlalchemy_import_error(exc)
-
         self._create_sql_table()
 
         if hasattr(df, "rdd"):
@@ -2114,15 +2115,24 @@ class SQLTarget(BaseStoreTarget):
                 primary_key,
                 _,
             ) = self._parse_url()
-            create_according_to_data = bool(create_according_to_data)
-            engine = sqlalchemy.create_engine(
-                db_path,
+            upsert_keys = None
+            if self.attributes.get("upsert"):
+                try:
+                    upsert_keys = ast.literal_eval(primary_key)
+                except Exception:
+                    upsert_keys = [primary_key]
+                if not upsert_keys or not all(upsert_keys):
+                    raise mlrun.errors.MLRunInvalidArgumentError(
+                        "primary_key_column must be set when upsert is enabled"
+                    )
+            _write_sql_dataframe(
+                df,
+                table_name=table_name,
+                engine=_get_sql_engine(db_path),
+                if_exists=if_exists,
+                chunksize=self.attributes.get("chunksize"),
+                upsert_keys=upsert_keys,
             )
-            connection = engine.connect()
-            if create_according_to_data:
-                # todo : create according to first row.
-                pass
-            df.to_sql(table_name, connection, if_exists=if_exists)
 
     def _parse_url(self):
         path = self.path[len("mlrunSql:///") :]
@@ -2142,6 +2152,7 @@ class SQLTarget(BaseStoreTarget):
         ) = self._parse_url()
         try:
             import sqlalchemy
+            import sqlalchemy.dialects.mysql
 
         except (ModuleNotFoundError, ImportError) as exc:
             self._raise_sqlalchemy_import_error(exc)
@@ -2151,7 +2162,7 @@ class SQLTarget(BaseStoreTarget):
             primary_key_for_check = primary_key
         except Exception:
             primary_key_for_check = [primary_key]
-        engine = sqlalchemy.create_engine(db_path)
+        engine = _get_sql_engine(db_path)
         with engine.connect() as conn:
             metadata = sqlalchemy.MetaData()
             table_exists = engine.dialect.has_table(conn, table_name)
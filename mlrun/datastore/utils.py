@@ -12,9 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import collections
+import concurrent.futures
+import hashlib
 import math
+import os
 import tarfile
 import tempfile
+import threading
 import typing
 import warnings
 from urllib.parse import parse_qs, urlparse
@@ -24,6 +29,13 @@ import semver
 
 import mlrun.datastore
 
+_sql_engines = {}
+_sql_engines_lock = threading.Lock()
+# bounds of a multi-row insert statement, below the common databases limits (e.g. MSSQL allows 2100 parameters and
+# 1000 rows per statement)
+_sql_multi_insert_max_parameters = 2000
+_sql_multi_insert_max_rows = 1000
+
 
 def parse_kafka_url(
     url: str, brokers: typing.Optional[typing.Union[list, str]] = None
@@ -133,14 +145,139 @@ def select_columns_generator(
         yield df[columns]
 
 
-def _generate_sql_query_with_time_filter(
-    table_name: str,
-    engine: "sqlalchemy.engine.Engine",  # noqa: F821,
-    time_column: str,
-    parse_dates: list[str],
-    start_time: pd.Timestamp,
-    end_time: pd.Timestamp,
+def drop_columns_generator(
+    dfs: typing.Iterator[pd.DataFrame],
+    columns: list[str],
+) -> typing.Iterator[pd.DataFrame]:
+    for df in dfs:
+        yield df.drop(columns=columns)
+
+
+def read_files_concurrently(
+    read_file: typing.Callable[[str], typing.Any],
+    paths: list[str],
+    max_workers: typing.Optional[int] = None,
+) -> typing.Iterator:
+    """Read files on a bounded thread pool and yield the results in the order of `paths`.
+
+    At most `max_workers` files are read (and held in memory) ahead of the consumer.
+
+    :param read_file:   function that reads a single file path
+    :param paths:       list of file paths to read
+    :param max_workers: maximal number of files read concurrently,
+                        defaults to mlrun.mlconf.storage.multi_file_read_workers
+    """
+    max_workers = max(
+        1,
+        min(
+            max_workers or mlrun.mlconf.storage.multi_file_read_workers,
+            len(paths) or 1,
+        ),
+    )
+    if max_workers == 1:
+        for path in paths:
+            yield read_file(path)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = collections.deque()
+        try:
+            for path in paths:
+                pending.append(executor.submit(read_file, path))
+                if len(pending) >= max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class HashingReader:
+    """Read-only file object wrapper that calculates the SHA1 hash of the file while it is being read.
+
+    Lets an upload hash the file in the same pass instead of reading it twice. Data that is read again
+    (e.g. after a retry) is hashed once, if part of the file is skipped the hash is not available.
+    """
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self._size = os.fstat(fileobj.fileno()).st_size
+        self._sha1 = hashlib.sha1()
+        self._hashed_bytes = 0
+        self._complete = True
+
+    def read(self, size=-1):
+        start = self._fileobj.tell()
+        data = self._fileobj.read(size)
+        self._update(start, data)
+        return data
+
+    def readinto(self, buffer):
+        start = self._fileobj.tell()
+        size = self._fileobj.readinto(buffer)
+        self._update(start, memoryview(buffer)[:size])
+        return size
+
+    def _update(self, start, data):
+        if start > self._hashed_bytes:
+            self._complete = False
+        elif self._complete and start + len(data) > self._hashed_bytes:
+            self._sha1.update(data[self._hashed_bytes - start :])
+            self._hashed_bytes = start + len(data)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self._fileobj.seek(offset, whence)
+
+    def tell(self):
+        return self._fileobj.tell()
+
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def hexdigest(self) -> typing.Optional[str]:
+        """the SHA1 hash of the file, or None if the file was not fully read"""
+        if not self._complete or self._hashed_bytes != self._size:
+            return None
+        return self._sha1.hexdigest()
+
+
+def download_in_chunks(
+    read_chunk: typing.Callable[[int, int], bytes],
+    size: int,
+    target_path: str,
+    chunk_size: typing.Optional[int] = None,
+    max_concurrency: typing.Optional[int] = None,
 ):
+    """Download an object of a known size by reading byte ranges concurrently and writing them in place.
+
+    :param read_chunk:      function that reads `size` bytes from `offset` of the object, read_chunk(offset, size)
+    :param size:            size of the object in bytes
+    :param target_path:     local target file path
+    :param chunk_size:      size of each range, defaults to mlrun.mlconf.storage.transfer.chunk_size
+    :param max_concurrency: max number of ranges read concurrently,
+                            defaults to mlrun.mlconf.storage.transfer.max_concurrency
+    """
+    chunk_size = chunk_size or mlrun.mlconf.storage.transfer.chunk_size
+    max_concurrency = max_concurrency or mlrun.mlconf.storage.transfer.max_concurrency
+    with open(target_path, "wb") as fp:
+        fp.truncate(size)
+
+    def download_chunk(offset):
+        data = read_chunk(offset, min(chunk_size, size - offset))
+        with open(target_path, "r+b") as chunk_fp:
+            chunk_fp.seek(offset)
+            chunk_fp.write(data)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        # consume the results to raise the first download error
+        list(executor.map(download_chunk, range(0, size, chunk_size)))
+
+
+def _import_sqlalchemy():
     # Validate sqlalchemy (not installed by default):
     try:
         import sqlalchemy
@@ -148,13 +285,48 @@ def _generate_sql_query_with_time_filter(
         raise mlrun.errors.MLRunMissingDependencyError(
             "Using 'SQLTarget' requires sqlalchemy package. Use pip install mlrun[sqlalchemy] to install it."
         ) from exc
+    return sqlalchemy
+
+
+def _get_sql_engine(db_path: str) -> "sqlalchemy.engine.Engine":  # noqa: F821
+    """return the SQLAlchemy engine of the given db url, engines (and their connection pools) are shared per url"""
+    engine = _sql_engines.get(db_path)
+    if engine is not None:
+        return engine
+    sqlalchemy = _import_sqlalchemy()
+    with _sql_engines_lock:
+        engine = _sql_engines.get(db_path)
+        if engine is None:
+            engine = sqlalchemy.create_engine(db_path, pool_pre_ping=True)
+            _sql_engines[db_path] = engine
+    return engine
+
+
+def _generate_sql_query_with_time_filter(
+    table_name: str,
+    engine: "sqlalchemy.engine.Engine",  # noqa: F821,
+    time_column: str,
+    parse_dates: list[str],
+    start_time: pd.Timestamp,
+    end_time: pd.Timestamp,
+    columns: typing.Optional[list[str]] = None,
+):
+    sqlalchemy = _import_sqlalchemy()
     table = sqlalchemy.Table(
         table_name,
         sqlalchemy.MetaData(),
         autoload=True,
         autoload_with=engine,
     )
-    query = sqlalchemy.select(table)
+    if columns:
+        missing_columns = [column for column in columns if column not in table.c]
+        if missing_columns:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"Columns {missing_columns} do not exist in table '{table_name}'"
+            )
+        query = sqlalchemy.select(*[table.c[column] for column in columns])
+    else:
+        query = sqlalchemy.select(table)
     if time_column:
         if parse_dates and time_column not in parse_dates:
             parse_dates.append(time_column)
@@ -168,6 +340,145 @@ def _generate_sql_query_with_time_filter(
     return query, parse_dates
 
 
+def _read_sql_chunks(
+    engine: "sqlalchemy.engine.Engine",  # noqa: F821
+    query,
+    chunksize: int,
+    parse_dates: typing.Optional[list[str]] = None,
+) -> typing.Iterator[pd.DataFrame]:
+    """
+    Read the query results in chunks through a server side cursor. The connection (and cursor) stays open for the
+    lifetime of the generator, so only a single chunk is held in memory at a time.
+    """
+    with engine.connect() as connection:
+        connection = connection.execution_options(stream_results=True)
+        yield from pd.read_sql(
+            query, con=connection, chunksize=chunksize, parse_dates=parse_dates
+        )
+
+
+def _postgres_copy_insert(table, conn, keys, data_iter):
+    """pandas `to_sql` insert method that loads the rows with PostgreSQL COPY FROM STDIN"""
+    import csv
+    import io
+
+    dbapi_connection = conn.connection
+    with dbapi_connection.cursor() as cursor:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(data_iter)
+        buffer.seek(0)
+        columns = ", ".join(f'"{key}"' for key in keys)
+        table_name = (
+            f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+        )
+        cursor.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN WITH CSV", buffer)
+
+
+def _get_sql_upsert_statement(table, dialect: str, primary_keys: list[str]):
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+
+        statement = insert(table)
+        return statement.on_duplicate_key_update(
+            {
+                column.name: statement.inserted[column.name]
+                for column in table.columns
+                if column.name not in primary_keys
+            }
+        )
+    else:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"Upsert is not supported for the '{dialect}' SQL dialect"
+        )
+    statement = insert(table)
+    update_columns = {
+        column.name: statement.excluded[column.name]
+        for column in table.columns
+        if column.name not in primary_keys
+    }
+    if not update_columns:
+        return statement.on_conflict_do_nothing(index_elements=primary_keys)
+    return statement.on_conflict_do_update(
+        index_elements=primary_keys, set_=update_columns
+    )
+
+
+def _write_sql_dataframe(
+    df: pd.DataFrame,
+    table_name: str,
+    engine: "sqlalchemy.engine.Engine",  # noqa: F821
+    if_exists: str = "append",
+    chunksize: typing.Optional[int] = None,
+    upsert_keys: typing.Optional[list[str]] = None,
+    index: bool = True,
+) -> None:
+    """
+    Bulk write a dataframe to a SQL table in a single transaction, in batches of `chunksize` rows.
+
+    Rows are loaded with COPY on PostgreSQL, with batched executemany on SQLite and on databases without multi-row
+    inserts, and with multi-row inserts (with a bounded number of bound parameters) on other databases. When
+    `upsert_keys` are given, existing rows with the same keys are updated instead (the table must already exist and
+    have a unique constraint on these keys).
+    """
+    sqlalchemy = _import_sqlalchemy()
+    chunksize = chunksize or mlrun.mlconf.sql.write_chunksize
+    dialect = engine.dialect.name
+
+    with engine.begin() as connection:
+        if upsert_keys:
+            if index and any(name is not None for name in df.index.names):
+                df = df.reset_index()
+            table = sqlalchemy.Table(
+                table_name,
+                sqlalchemy.MetaData(),
+                autoload=True,
+                autoload_with=connection,
+            )
+            statement = _get_sql_upsert_statement(
+                table, dialect=dialect, primary_keys=upsert_keys
+            )
+            records = df.astype(object).where(df.notna(), None).to_dict("records")
+            for start in range(0, len(records), chunksize):
+                connection.execute(statement, records[start : start + chunksize])
+            return
+
+        if dialect == "postgresql":
+            method = _postgres_copy_insert
+        elif dialect == "sqlite" or not engine.dialect.supports_multivalues_insert:
+            # SQLite limits the number of bound parameters per statement, executemany in a transaction is the fastest
+            method = None
+        else:
+            method = "multi"
+            chunksize = _get_sql_multi_insert_chunksize(df, chunksize, index)
+        df.to_sql(
+            table_name,
+            connection,
+            if_exists=if_exists,
+            index=index,
+            chunksize=chunksize,
+            method=method,
+        )
+
+
+def _get_sql_multi_insert_chunksize(
+    df: pd.DataFrame, chunksize: int, index: bool
+) -> int:
+    """the rows per multi-row insert statement, so a statement binds up to `_sql_multi_insert_max_parameters`"""
+    columns = len(df.columns) + (df.index.nlevels if index else 0)
+    return max(
+        min(
+            chunksize,
+            _sql_multi_insert_max_rows,
+            _sql_multi_insert_max_parameters // max(columns, 1),
+        ),
+        1,
+    )
+
+
 def get_kafka_brokers_from_dict(options: dict, pop=False) -> typing.Optional[str]:
     get_or_pop = options.pop if pop else options.get
     kafka_brokers = get_or_pop("kafka_brokers", None)
@@ -222,3 +533,16 @@ def validate_additional_filters(additional_filters):
             for sub_value in value:
                 if isinstance(sub_value, float) and math.isnan(sub_value):
                     raise mlrun.errors.MLRunInvalidArgumentError(nan_error_message)
+
+
+def parse_s3_bucket_and_key(s3_path):
+    try:
+        path_parts = s3_path.replace("s3://", "").split("/")
+        bucket = path_parts.pop(0)
+        key = "/".join(path_parts)
+    except Exception as exc:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            "failed to parse s3 bucket and key"
+        ) from exc
+
+    return bucket, key
@@ -28,6 +28,7 @@ from .base import (
     FileStats,
     basic_auth_header,
 )
+from .utils import HashingReader, download_in_chunks
 
 V3IO_LOCAL_ROOT = "v3io"
 V3IO_DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024 * 10
@@ -105,9 +106,12 @@ class V3ioStore(DataStore):
         src_path: str,
         max_chunk_size: int = V3IO_DEFAULT_UPLOAD_CHUNK_SIZE,
     ):
-        """helper function for upload method, allows for controlling max_chunk_size in testing"""
+        """helper function for upload method, allows for controlling max_chunk_size in testing,
+        returns the SHA1 hash of the uploaded file"""
         container, path = split_path(self._join(key))
         with open(src_path, "rb") as file_obj:
+            # v3io objects are written sequentially (append), hash the file in the same pass
+            file_obj = HashingReader(file_obj)
             append = False
             while True:
                 data = memoryview(file_obj.read(max_chunk_size))
@@ -121,10 +125,24 @@ class V3ioStore(DataStore):
                     append=append,
                 )
                 append = True
+            return file_obj.hexdigest()
 
     def upload(self, key, src_path):
+        self._upload(key, src_path)
+
+    def upload_and_hash(self, key, src_path):
         return self._upload(key, src_path)
 
+    def download(self, key, target_path):
+        size = self.stat(key).size
+        if size <= mlrun.mlconf.storage.transfer.multipart_threshold:
+            return super().download(key, target_path)
+        download_in_chunks(
+            lambda offset, chunk_size: self.get(key, size=chunk_size, offset=offset),
+            size,
+            target_path,
+        )
+
     def get(self, key, size=None, offset=0):
         container, path = split_path(self._join(key))
         return self._do_object_request(
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import codecs
 import enum
 import http
 import re
@@ -203,6 +204,7 @@ class HTTPRunDB(RunDBInterface):
         headers=None,
         timeout=45,
         version=None,
+        stream=False,
     ) -> requests.Response:
         """Perform a direct REST API call on the :py:mod:`mlrun` API server.
 
@@ -220,6 +222,7 @@ class HTTPRunDB(RunDBInterface):
         :param timeout: API call timeout
         :param version: API version to use, None (the default) will mean to use the default value from config,
          for un-versioned api set an empty string.
+        :param stream: Whether to stream the response content instead of downloading it immediately
 
         :returns: `requests.Response` HTTP response object
         """
@@ -280,6 +283,7 @@ class HTTPRunDB(RunDBInterface):
                 url,
                 timeout=timeout,
                 verify=config.httpdb.http.verify,
+                stream=stream,
                 **kw,
             )
         except requests.RequestException as exc:
@@ -652,8 +656,10 @@ class HTTPRunDB(RunDBInterface):
 
     def watch_log(self, uid, project="", watch=True, offset=0):
         """Retrieve logs of a running process by chunks of 1MB, and watch the progress of the execution until it
-        completes. This method will print out the logs and continue to periodically poll for, and print,
-        new logs as long as the state of the runtime which generates this log is either ``pending`` or ``running``.
+        completes. This method will print out the logs and continue to track, and print, new logs as long as the
+        state of the runtime which generates this log is either ``pending`` or ``running``.
+        When supported by the server, new logs are pushed by the server as they are written, otherwise they are
+        periodically polled.
 
         :param uid: The uid of the log object to watch.
         :param project: Project that the log belongs to.
@@ -662,7 +668,78 @@ class HTTPRunDB(RunDBInterface):
         :param offset: Minimal offset in the log to watch.
         :returns: The final state of the log being watched and the final offset.
         """
+        if watch and self._is_log_streaming_enabled():
+            state, offset, watched = self._watch_log_stream(uid, project, offset)
+            if watched:
+                return state, offset
 
+        return self._watch_log_polling(uid, project, watch, offset)
+
+    def _is_log_streaming_enabled(self) -> bool:
+        # the server (and therefore whether it supports log streaming) is known only once connected
+        return bool(self.server_version) and (
+            mlrun.mlconf.httpdb.logs.streaming.mode == "enabled"
+        )
+
+    def _watch_log_stream(self, uid, project, offset) -> tuple[str, int, bool]:
+        """Watch the log of a run by consuming the server side log stream, resuming it from the last offset until
+        the run reaches a terminal state and its whole log was retrieved.
+
+        :returns: The final state, the final offset and whether the log was fully watched (``False`` if the stream
+            isn't supported by the server or was interrupted, the caller should continue by polling).
+        """
+        path = self._path_of("logs", project, uid) + "/watch"
+        error = f"watch log {project}/{uid}"
+        stream_timeout = int(mlrun.mlconf.httpdb.logs.streaming.timeout)
+        # the log is decoded incrementally, since a multi-byte character may be split between chunks (and streams)
+        decoder = codecs.getincrementaldecoder("utf-8")(
+            errors=mlrun.mlconf.httpdb.logs.decode.errors
+        )
+        while True:
+            try:
+                resp = self.api_call(
+                    "GET",
+                    path,
+                    error,
+                    params={"offset": offset},
+                    # the server closes the stream after its timeout, leave some slack for in-flight logs
+                    timeout=stream_timeout + 30,
+                    stream=True,
+                )
+                with resp:
+                    for chunk in resp.iter_content(chunk_size=None):
+                        offset += len(chunk)
+                        print(decoder.decode(chunk), end="")
+            except mlrun.errors.MLRunNotFoundError:
+                # older servers without the log stream endpoint
+                logger.debug("Log streaming is not supported, polling logs", uid=uid)
+                return "unknown", self._undecoded_offset(decoder, offset), False
+            except (requests.RequestException, mlrun.errors.MLRunRuntimeError) as exc:
+                logger.debug(
+                    "Log stream was interrupted, polling logs",
+                    uid=uid,
+                    offset=offset,
+                    exc=err_to_str(exc),
+                )
+                return "unknown", self._undecoded_offset(decoder, offset), False
+
+            # the stream ends either when the run finished and the whole log was sent, or on the stream timeout
+            state, text = self.get_log(uid, project, offset=offset)
+            if text:
+                offset += len(text)
+                print(decoder.decode(text), end="")
+            elif not self._is_log_watched_state(state):
+                print(decoder.decode(b"", final=True), end="")
+                return state, offset, True
+
+    @staticmethod
+    def _undecoded_offset(decoder: codecs.IncrementalDecoder, offset: int) -> int:
+        """the offset of the bytes the decoder is still holding (the start of a split character), so the caller
+        resumes from them"""
+        pending, _ = decoder.getstate()
+        return offset - len(pending)
+
+    def _watch_log_polling(self, uid, project="", watch=True, offset=0):
         state, text = self.get_log(uid, project, offset=offset)
         if text:
             print(text.decode(errors=mlrun.mlconf.httpdb.logs.decode.errors))
@@ -689,12 +766,7 @@ class HTTPRunDB(RunDBInterface):
             else:
                 nil_resp += 1
 
-            if watch and state in [
-                mlrun.common.runtimes.constants.RunStates.pending,
-                mlrun.common.runtimes.constants.RunStates.running,
-                mlrun.common.runtimes.constants.RunStates.created,
-                mlrun.common.runtimes.constants.RunStates.aborting,
-            ]:
+            if watch and self._is_log_watched_state(state):
                 continue
             else:
                 # the whole log was retrieved
@@ -703,6 +775,16 @@ class HTTPRunDB(RunDBInterface):
 
         return state, offset
 
+    @staticmethod
+    def _is_log_watched_state(state: str) -> bool:
+        # the states in which the run may still write logs
+        return state in [
+            mlrun.common.runtimes.constants.RunStates.pending,
+            mlrun.common.runtimes.constants.RunStates.running,
+            mlrun.common.runtimes.constants.RunStates.created,
+            mlrun.common.runtimes.constants.RunStates.aborting,
+        ]
+
     def store_run(self, struct, uid, project="", iter=0):
         """Store run details in the DB. This method is usually called from within other :py:mod:`mlrun` flows
         and not called directly by the user."""
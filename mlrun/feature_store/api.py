@@ -165,7 +165,7 @@ def get_offline_features(
                                     (default False)
     :param update_stats:            update features statistics from the requested feature sets on the vector.
                                     (default False).
-    :param engine:                  processing engine kind ("local", "dask", or "spark")
+    :param engine:                  processing engine kind ("local", "dask", "spark" or "arrow")
     :param engine_args:             kwargs for the processing engine
     :param query:                   The query string used to filter rows on the output
     :param spark_service:           Name of the spark service to be used (when using a remote-spark runtime)
@@ -225,6 +225,8 @@ def _get_offline_features(
     spark_service: Optional[str] = None,
     timestamp_for_filtering: Optional[Union[str, dict[str, str]]] = None,
     additional_filters=None,
+    incremental: bool = False,
+    lookback: Optional[str] = None,
 ) -> Union[OfflineVectorResponse, RemoteVectorResponse]:
     if entity_rows is None and entity_timestamp_column is not None:
         raise mlrun.errors.MLRunInvalidArgumentError(
@@ -269,6 +271,8 @@ def _get_offline_features(
             end_time=end_time,
             timestamp_for_filtering=timestamp_for_filtering,
             additional_filters=additional_filters,
+            incremental=incremental,
+            lookback=lookback,
         )
 
     merger = merger_engine(feature_vector, **(engine_args or {}))
@@ -285,6 +289,8 @@ def _get_offline_features(
         query=query,
         order_by=order_by,
         additional_filters=additional_filters,
+        incremental=incremental,
+        lookback=lookback,
     )
 
 
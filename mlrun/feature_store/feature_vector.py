@@ -165,6 +165,7 @@ class FeatureVectorStatus(ModelObj):
         run_uri=None,
         index_keys=None,
         timestamp_key=None,
+        watermarks=None,
     ):
         self._targets: ObjectList = None
         self._features: ObjectList = None
@@ -178,6 +179,8 @@ class FeatureVectorStatus(ModelObj):
         self.features: list[Feature] = features or []
         self.run_uri = run_uri
         self.timestamp_key = timestamp_key
+        # {<feature set name>: <time until which its data was materialized into the vector offline target>}
+        self.watermarks = watermarks or {}
 
     @property
     def targets(self) -> list[DataTarget]:
@@ -745,6 +748,8 @@ class FeatureVector(ModelObj):
         spark_service: typing.Optional[str] = None,
         timestamp_for_filtering: typing.Optional[Union[str, dict[str, str]]] = None,
         additional_filters: typing.Optional[list] = None,
+        incremental: bool = False,
+        lookback: typing.Optional[str] = None,
     ):
         """retrieve offline feature vector results
 
@@ -789,7 +794,7 @@ class FeatureVector(ModelObj):
                                         (default False)
         :param update_stats:            update features statistics from the requested feature sets on the vector.
                                         (default False).
-        :param engine:                  processing engine kind ("local", "dask", or "spark")
+        :param engine:                  processing engine kind ("local", "dask", "spark" or "arrow")
         :param engine_args:             kwargs for the processing engine
         :param query:                   The query string used to filter rows on the output
         :param spark_service:           Name of the spark service to be used (when using a remote-spark runtime)
@@ -807,6 +812,15 @@ class FeatureVector(ModelObj):
                             Example: [("Product", "=", "Computer")]
                             For all supported filters, please see:
                             https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetDataset.html
+        :param incremental:     materialize only the data that was added since the previous materialization into
+                                `target` and append it to the target. The time until which the data was
+                                materialized is recorded in the vector status (status.watermarks). Requires a
+                                partitioned ParquetTarget directory, no entity_rows and the "local" or "arrow"
+                                engine. The first incremental run (or any non incremental run) materializes the
+                                whole requested time range. Default False.
+        :param lookback:        when incremental, how far before the new time range to read the other
+                                (as-of joined) feature sets, as a pandas Timedelta string (e.g. "7d").
+                                By default, their whole history is read.
 
         """
 
@@ -828,6 +842,8 @@ class FeatureVector(ModelObj):
             spark_service,
             timestamp_for_filtering,
             additional_filters,
+            incremental,
+            lookback,
         )
 
     def get_online_feature_service(
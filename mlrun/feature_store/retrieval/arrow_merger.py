@@ -0,0 +1,303 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pandas as pd
+import pyarrow
+import pyarrow.parquet
+
+import mlrun
+from mlrun.datastore.targets import ParquetTarget, get_offline_target
+from mlrun.datastore.utils import transform_list_filters_to_tuple
+
+from .base import BaseMerger
+
+# pandas `how` -> arrow `join_type`
+_join_types = {
+    "inner": "inner",
+    "left": "left outer",
+    "right": "right outer",
+    "outer": "full outer",
+}
+
+# unlimited lookback (same as pandas merge_asof without tolerance)
+_asof_tolerance = -(2**63 - 1)
+
+_row_id_column = "__mlrun_row_id__"
+_asof_on_column = "__mlrun_asof_on__"
+_key_column_prefix = "__mlrun_key_"
+
+# `Table.join_asof` was added in pyarrow 16
+_min_pyarrow_major_version = 16
+
+
+class _ArrowParquetReader:
+    """df_module like adapter for `DataStore._parquet_reader`, reads parquet into a `pyarrow.Table`"""
+
+    @staticmethod
+    def read_parquet(path, columns=None, filters=None, filesystem=None, **kwargs):
+        if filesystem is not None:
+            path = filesystem._strip_protocol(path)
+        return pyarrow.parquet.read_table(
+            path,
+            columns=columns,
+            filters=filters or None,
+            filesystem=filesystem,
+            use_threads=True,
+        )
+
+
+def _drop_columns(table: pyarrow.Table, columns: list[str]) -> pyarrow.Table:
+    # `Table.drop` is deprecated in favor of `Table.drop_columns` since pyarrow 14
+    if hasattr(table, "drop_columns"):
+        return table.drop_columns(columns)
+    return table.drop(columns)
+
+
+class ArrowFeatureMerger(BaseMerger):
+    """multi-threaded offline merger, reads the parquet targets and joins them as arrow tables"""
+
+    engine = "arrow"
+    support_offline = True
+    support_incremental = True
+
+    def __init__(self, vector, **engine_args):
+        pyarrow_major_version = int(pyarrow.__version__.split(".")[0])
+        if pyarrow_major_version < _min_pyarrow_major_version:
+            raise mlrun.errors.MLRunMissingDependencyError(
+                f"The '{self.engine}' merger engine requires pyarrow>={_min_pyarrow_major_version} "
+                f"(installed version is {pyarrow.__version__}), use another engine or upgrade pyarrow"
+            )
+        super().__init__(vector, **engine_args)
+
+    def _asof_join(
+        self,
+        entity_df,
+        entity_timestamp_column: str,
+        featureset_name,
+        featureset_timestamp,
+        featureset_df,
+        left_keys: list,
+        right_keys: list,
+    ):
+        entity_df = self._to_timestamp(entity_df, entity_timestamp_column)
+        featureset_df = self._to_timestamp(featureset_df, featureset_timestamp)
+        entity_df = entity_df.sort_by(entity_timestamp_column)
+
+        # arrow drops the right "on"/"by" columns from the result, join on copies of them
+        # so the original feature set columns are kept (as in pandas merge_asof)
+        featureset_df = featureset_df.append_column(
+            _asof_on_column,
+            featureset_df[featureset_timestamp].cast(
+                entity_df.schema.field(entity_timestamp_column).type
+            ),
+        )
+        featureset_df, right_by = self._add_key_columns(
+            entity_df, featureset_df, left_keys, right_keys
+        )
+        featureset_df = self._suffix_conflicting_columns(
+            entity_df,
+            featureset_df,
+            featureset_name,
+            exclude=right_by + [_asof_on_column],
+        )
+        featureset_df = featureset_df.sort_by(_asof_on_column)
+
+        merged_df = entity_df.join_asof(
+            featureset_df,
+            on=entity_timestamp_column,
+            by=left_keys or [],
+            tolerance=_asof_tolerance,
+            right_on=_asof_on_column,
+            right_by=right_by,
+        )
+        return self._drop_internal_columns(merged_df)
+
+    def _join(
+        self,
+        entity_df,
+        entity_timestamp_column: str,
+        featureset_name,
+        featureset_timestamp,
+        featureset_df,
+        left_keys: list,
+        right_keys: list,
+    ):
+        featureset_df, right_join_keys = self._add_key_columns(
+            entity_df, featureset_df, left_keys, right_keys, keep_same_name=True
+        )
+        featureset_df = self._suffix_conflicting_columns(
+            entity_df, featureset_df, featureset_name, exclude=right_join_keys
+        )
+        # hash joins do not preserve the input order, restore the entity order after the join
+        entity_df = entity_df.append_column(
+            _row_id_column, pyarrow.array(range(entity_df.num_rows), pyarrow.int64())
+        )
+        merged_df = entity_df.join(
+            featureset_df,
+            keys=left_keys,
+            right_keys=right_join_keys,
+            join_type=_join_types.get(self._join_type, self._join_type),
+            coalesce_keys=True,
+            use_threads=True,
+        )
+        merged_df = merged_df.sort_by(_row_id_column)
+        return self._drop_internal_columns(merged_df)
+
+    @staticmethod
+    def _to_timestamp(table, column):
+        if pyarrow.types.is_timestamp(table.schema.field(column).type):
+            return table
+        index = table.schema.get_field_index(column)
+        return table.set_column(
+            index, column, table[column].cast(pyarrow.timestamp("ns"))
+        )
+
+    @staticmethod
+    def _add_key_columns(
+        entity_df, featureset_df, left_keys, right_keys, keep_same_name=False
+    ):
+        """add copies of the right join keys casted to the left key types, return the new right keys"""
+        join_keys = []
+        for i, (left_key, right_key) in enumerate(zip(left_keys, right_keys)):
+            if keep_same_name and left_key == right_key:
+                join_keys.append(right_key)
+                continue
+            key_column = f"{_key_column_prefix}{i}__"
+            featureset_df = featureset_df.append_column(
+                key_column,
+                featureset_df[right_key].cast(entity_df.schema.field(left_key).type),
+            )
+            join_keys.append(key_column)
+        return featureset_df, join_keys
+
+    def _suffix_conflicting_columns(
+        self, entity_df, featureset_df, featureset_name, exclude
+    ):
+        # same as the pandas merge suffixes ("", f"_{featureset_name}_"), the suffixed columns are dropped
+        entity_columns = set(entity_df.column_names)
+        new_names = []
+        for column in featureset_df.column_names:
+            if column in entity_columns and column not in exclude:
+                column = f"{column}_{featureset_name}_"
+                self._append_drop_column(column)
+            new_names.append(column)
+        return featureset_df.rename_columns(new_names)
+
+    @staticmethod
+    def _drop_internal_columns(df):
+        internal_columns = [
+            column
+            for column in df.column_names
+            if column in (_row_id_column, _asof_on_column)
+            or column.startswith(_key_column_prefix)
+        ]
+        return _drop_columns(df, internal_columns)
+
+    def _create_engine_env(self):
+        pass
+
+    def _get_engine_df(
+        self,
+        feature_set,
+        feature_set_name,
+        column_names=None,
+        start_time=None,
+        end_time=None,
+        time_column=None,
+        additional_filters=None,
+    ):
+        target = None
+        if not feature_set.spec.passthrough:
+            target = get_offline_target(feature_set)
+        if not isinstance(target, ParquetTarget):
+            # passthrough and non parquet sources are read through the regular (pandas) readers
+            df = feature_set.to_dataframe(
+                columns=column_names,
+                start_time=start_time,
+                end_time=end_time,
+                time_column=time_column,
+                additional_filters=additional_filters,
+            )
+            if df.index.names[0]:
+                df.reset_index(inplace=True)
+            return pyarrow.Table.from_pandas(df, preserve_index=False)
+
+        columns = list(feature_set.spec.entities.keys())
+        if feature_set.spec.timestamp_key:
+            columns.append(feature_set.spec.timestamp_key)
+        for column in column_names or []:
+            if column not in columns:
+                columns.append(column)
+
+        store, _, url = mlrun.store_manager.get_or_create_store(
+            target.get_target_path()
+        )
+        reader = store._parquet_reader(
+            _ArrowParquetReader,
+            url,
+            store.filesystem,
+            time_column,
+            start_time,
+            end_time,
+            transform_list_filters_to_tuple(additional_filters),
+        )
+        return reader(url, columns=columns, filesystem=store.filesystem)
+
+    def _rename_columns_and_select(self, df, rename_col_dict, columns=None):
+        return df.rename_columns(
+            [rename_col_dict.get(column) or column for column in df.column_names]
+        )
+
+    def _drop_columns_from_result(self):
+        return _drop_columns(
+            self._result_df,
+            [
+                column
+                for column in self._drop_columns
+                if column in self._result_df.column_names
+            ],
+        )
+
+    def _drop_rows_with_missing_values(self, columns):
+        for column in columns:
+            self._result_df = self._result_df.filter(self._result_df[column].is_valid())
+
+    def _get_df_columns(self, df):
+        return df.column_names
+
+    def _filter(self, query):
+        # pandas query expressions have no arrow equivalent, evaluate them with pandas
+        df = self._result_df.to_pandas()
+        df.query(query, inplace=True)
+        self._result_df = pyarrow.Table.from_pandas(df, preserve_index=False)
+
+    def _order_by(self, order_by_active):
+        self._result_df = self._result_df.sort_by(
+            [(column, "ascending") for column in order_by_active]
+        )
+
+    def _convert_entity_rows_to_engine_df(self, entity_rows):
+        if entity_rows is not None and isinstance(entity_rows, pd.DataFrame):
+            return pyarrow.Table.from_pandas(entity_rows, preserve_index=False)
+        return entity_rows
+
+    def _get_target_df(self):
+        return self._result_df.to_pandas()
+
+    def get_df(self, to_pandas=True):
+        if not to_pandas:
+            return self._result_df
+        df = self._result_df.to_pandas()
+        self._set_indexes(df)
+        return df
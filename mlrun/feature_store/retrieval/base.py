@@ -36,6 +36,10 @@ class BaseMerger(abc.ABC):
     # In order to be an offline merger, the merger should implement
     # `_order_by`, `_filter`, `_drop_columns_from_result`, `_rename_columns_and_select`, `_get_engine_df` functions.
     support_offline = False
+
+    # In order to support incremental materialization, writing the result to a partitioned parquet target
+    # should add files to it instead of overwriting it.
+    support_incremental = False
     engine = None
 
     def __init__(self, vector, **engine_args):
@@ -49,6 +53,8 @@ class BaseMerger(abc.ABC):
         self._index_columns = []
         self._drop_indexes = True
         self._target = None
+        self._incremental = False
+        self._watermark = None
         self._alias = dict()
         self._origin_alias = dict()
         self._entity_rows_node_name = "__mlrun__$entity_rows$"
@@ -94,6 +100,8 @@ class BaseMerger(abc.ABC):
         query=None,
         order_by=None,
         additional_filters=None,
+        incremental=False,
+        lookback=None,
     ):
         self._target = target
 
@@ -126,10 +134,35 @@ class BaseMerger(abc.ABC):
 
         start_time = str_to_timestamp(start_time)
         end_time = str_to_timestamp(end_time)
-        if start_time and not end_time:
+        if (start_time or incremental) and not end_time:
             # if end_time is not specified set it to now()
             end_time = pd.Timestamp.now()
 
+        related_start_time = start_time
+        self._incremental = incremental
+        if incremental:
+            self._validate_incremental(entity_rows)
+            watermark = self._get_watermark(feature_set_objects)
+            if watermark is not None:
+                if watermark >= end_time:
+                    raise mlrun.errors.MLRunInvalidArgumentError(
+                        f"The feature vector is already materialized until {watermark}, "
+                        f"nothing to compute until {end_time}"
+                    )
+                start_time = max(start_time, watermark) if start_time else watermark
+                # as-of joins need the related feature sets rows before the new time range
+                related_start_time = (
+                    start_time - pd.Timedelta(lookback) if lookback else None
+                )
+                logger.info(
+                    "Computing feature vector increment",
+                    vector=self.vector.metadata.name,
+                    start_time=start_time,
+                    end_time=end_time,
+                    related_start_time=related_start_time,
+                )
+        self._watermark = end_time or pd.Timestamp.now()
+
         return self._generate_offline_vector(
             entity_rows,
             entity_timestamp_column,
@@ -141,9 +174,70 @@ class BaseMerger(abc.ABC):
             query=query,
             order_by=order_by,
             additional_filters=additional_filters,
+            related_start_time=related_start_time,
         )
 
-    def _write_to_offline_target(self, timestamp_key=None):
+    def _validate_incremental(self, entity_rows):
+        if not self.support_incremental:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"Incremental materialization is not supported by the {self.engine} engine"
+            )
+        if entity_rows is not None:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Incremental materialization can not be used with entity_rows"
+            )
+        target = self._target
+        if (
+            target is None
+            or target.kind != ParquetTarget.kind
+            or not target.path
+            or target.is_single_file()
+            or not (
+                target.partition_cols
+                or (
+                    (target.partitioned or target.time_partitioning_granularity)
+                    and not self._drop_indexes
+                )
+            )
+        ):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Incremental materialization requires a partitioned parquet target directory "
+                "(time partitioning also requires with_indexes=True)"
+            )
+
+    def _get_watermark(self, feature_set_objects) -> typing.Optional[pd.Timestamp]:
+        """return the time until which the vector is materialized (None if it was not materialized yet)"""
+        watermarks = self.vector.status.watermarks or {}
+        names = [
+            name
+            for name, feature_set in feature_set_objects.items()
+            if feature_set.spec.timestamp_key
+        ]
+        if not names:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Incremental materialization requires feature sets with a timestamp_key"
+            )
+        missing = [name for name in names if name not in watermarks]
+        if len(missing) == len(names):
+            return None
+        if missing:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"Feature sets {missing} were not materialized into the vector target yet, "
+                "run a full (non incremental) materialization first"
+            )
+        return min(pd.Timestamp(watermarks[name]) for name in names)
+
+    def _update_watermarks(self, feature_set_names):
+        if self._incremental:
+            watermarks = self.vector.status.watermarks or {}
+        else:
+            # a full materialization overwrites the previous watermarks
+            watermarks = {}
+        for name in feature_set_names:
+            watermarks[name] = self._watermark.isoformat()
+        self.vector.status.watermarks = watermarks
+
+    def _write_to_offline_target(self, timestamp_key=None, feature_set_names=None):
         save_vector = False
         if not self._drop_indexes and timestamp_key not in self._drop_columns:
             self.vector.status.timestamp_key = timestamp_key
@@ -155,9 +249,14 @@ class BaseMerger(abc.ABC):
                     "target path was not specified"
                 )
             self._target.set_resource(self.vector)
-            size = self._target.write_dataframe(
-                self._result_df, timestamp_key=self.vector.status.timestamp_key
-            )
+            target_df = self._get_target_df()
+            size = None
+            if not self._incremental or len(target_df):
+                # partitioned targets add the new files to the existing partitions
+                size = self._target.write_dataframe(
+                    target_df, timestamp_key=self.vector.status.timestamp_key
+                )
+            self._update_watermarks(feature_set_names or [])
             if is_persistent_vector:
                 target_status = self._target.update_resource_status("ready", size=size)
                 logger.info(f"wrote target: {target_status}")
@@ -194,6 +293,7 @@ class BaseMerger(abc.ABC):
         query=None,
         order_by=None,
         additional_filters=None,
+        related_start_time=None,
     ):
         self._create_engine_env()
 
@@ -260,11 +360,17 @@ class BaseMerger(abc.ABC):
             if (start_time or end_time) and time_column:
                 timestamp_filtered = True
 
+            # the first feature set drives the result rows, the others may be needed from an earlier time
+            step_start_time = (
+                start_time
+                if step is join_graph.steps[0] and entity_rows is None
+                else related_start_time
+            )
             df = self._get_engine_df(
                 feature_set,
                 name,
                 column_names,
-                start_time if time_column else None,
+                step_start_time if time_column else None,
                 end_time if time_column else None,
                 time_column,
                 additional_filters,
@@ -346,9 +452,7 @@ class BaseMerger(abc.ABC):
             del df_temp
 
         if self.vector.status.label_column:
-            self._result_df = self._result_df.dropna(
-                subset=[self.vector.status.label_column]
-            )
+            self._drop_rows_with_missing_values([self.vector.status.label_column])
         # filter joined data frame by the query param
         if query:
             self._filter(query)
@@ -356,20 +460,28 @@ class BaseMerger(abc.ABC):
         if order_by:
             if isinstance(order_by, str):
                 order_by = [order_by]
+            result_columns = self._get_df_columns(self._result_df)
             order_by_active = [
                 order_col
-                if order_col in self._result_df.columns
+                if order_col in result_columns
                 else self._origin_alias.get(order_col, None)
                 for order_col in order_by
             ]
             if None in order_by_active:
                 raise mlrun.errors.MLRunInvalidArgumentError(
-                    f"Result dataframe contains {self._result_df.columns} "
+                    f"Result dataframe contains {result_columns} "
                     f"columns and can't order by {order_by}"
                 )
             self._order_by(order_by_active)
 
-        self._write_to_offline_target(timestamp_key=result_timestamp)
+        self._write_to_offline_target(
+            timestamp_key=result_timestamp,
+            feature_set_names=[
+                name
+                for name, feature_set in feature_set_objects.items()
+                if feature_set.spec.timestamp_key
+            ],
+        )
         return OfflineVectorResponse(self)
 
     def init_online_vector_service(
@@ -509,12 +621,14 @@ class BaseMerger(abc.ABC):
 
     def to_parquet(self, target_path, **kw):
         """return results as parquet file"""
-        size = ParquetTarget(path=target_path).write_dataframe(self._result_df, **kw)
+        size = ParquetTarget(path=target_path).write_dataframe(
+            self._get_target_df(), **kw
+        )
         return size
 
     def to_csv(self, target_path, **kw):
         """return results as csv file"""
-        size = CSVTarget(path=target_path).write_dataframe(self._result_df, **kw)
+        size = CSVTarget(path=target_path).write_dataframe(self._get_target_df(), **kw)
         return size
 
     def _get_graph(
@@ -821,3 +935,19 @@ class BaseMerger(abc.ABC):
 
     def _convert_entity_rows_to_engine_df(self, entity_rows):
         raise NotImplementedError
+
+    def _drop_rows_with_missing_values(self, columns: list[str]):
+        """
+        drop the rows of `self._result_df` with missing values in `columns`
+
+        :param columns: list of column names to check for missing values
+        """
+        self._result_df = self._result_df.dropna(subset=columns)
+
+    def _get_df_columns(self, df) -> list[str]:
+        """return the column names of an engine data frame"""
+        return list(df.columns)
+
+    def _get_target_df(self):
+        """return the result in the form written by the targets"""
+        return self._result_df
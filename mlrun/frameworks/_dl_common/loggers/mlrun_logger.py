@@ -12,14 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import atexit
 import itertools
-from typing import Optional, Union
+import queue
+import threading
+from typing import Callable, Optional, Union
 
 import numpy as np
 import plotly.graph_objects as go
 
 import mlrun
 from mlrun.artifacts import Artifact, PlotlyArtifact
+from mlrun.errors import err_to_str
+from mlrun.utils import logger
 
 from ..._common import LoggingMode
 from ..model_handler import DLModelHandler
@@ -27,6 +32,83 @@ from ..utils import DLTypes
 from .logger import Logger
 
 
+class _TrackingWorker:
+    """
+    A background thread running the logging tasks of a logger in order, so the training loop is not waiting for the
+    run DB updates and the artifacts uploads. The tasks queue is bounded, so when the logging falls behind the training
+    the training loop waits for it (instead of piling up epochs in memory). A failed task fails the next submit or
+    flush (the tasks after it are skipped), and the pending tasks are flushed on the interpreter exit as well.
+    """
+
+    def __init__(self, max_pending_tasks: int):
+        """
+        Initialize the worker. The thread is started on the first submitted task.
+
+        :param max_pending_tasks: The max number of tasks waiting to run. Submitting a task to a full queue waits for
+                                  a pending task to complete.
+        """
+        self._queue = queue.Queue(maxsize=max(max_pending_tasks, 1))
+        self._thread = None  # type: threading.Thread
+        self._error = None  # type: Exception
+
+    def submit(self, task: Callable[[], None]):
+        """
+        Submit a task to run in the background.
+
+        :param task: The task to run.
+
+        :raise Exception: The error of a previously submitted task that failed.
+        """
+        self._raise_error()
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="mlrun-logger", daemon=True
+            )
+            self._thread.start()
+            # The thread is a daemon, so the pending tasks are flushed when the training is interrupted or fails:
+            atexit.register(self._stop)
+        self._queue.put(task)
+
+    def flush(self):
+        """
+        Wait for all the submitted tasks to complete and stop the thread (it will be restarted on the next submit).
+
+        :raise Exception: The error of a submitted task that failed.
+        """
+        self._stop()
+        self._raise_error()
+
+    def _stop(self):
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        atexit.unregister(self._stop)
+
+    def _raise_error(self):
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _run(self):
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            if self._error is not None:
+                # Skip the tasks following a failed task, the error is raised to the training loop:
+                continue
+            try:
+                task()
+            except Exception as exc:
+                logger.warning(
+                    "Failed to log the training results to MLRun",
+                    error=err_to_str(exc),
+                )
+                self._error = exc
+
+
 class MLRunLogger(Logger):
     """
     MLRun logger is logging the information collected during training / evaluation of the base logger and logging it to
@@ -56,15 +138,52 @@ class MLRunLogger(Logger):
     def __init__(
         self,
         context: mlrun.MLClientCtx,
+        asynchronous: Optional[bool] = None,
+        charts_logging_frequency: Optional[int] = None,
+        max_pending_epochs: Optional[int] = None,
     ):
         """
         Initialize the MLRun logging interface to work with the given context.
 
-        :param context:              MLRun context to log to. The context parameters can be logged as static
-                                     hyperparameters.
+        :param context:                  MLRun context to log to. The context parameters can be logged as static
+                                         hyperparameters.
+        :param asynchronous:             Whether to log the epochs in a background thread, so the training loop
+                                         continues while the results and artifacts are logged. The context should
+                                         not be used by the training until the logger is flushed, and a logging
+                                         failure is raised by the next epoch logging or flush. Default is taken from
+                                         `mlrun.mlconf.frameworks.mlrun_logger.asynchronous`.
+        :param charts_logging_frequency: Log the metrics results chart artifacts every this number of epochs (the
+                                         charts are always logged at the end of the run). Default is taken from
+                                         `mlrun.mlconf.frameworks.mlrun_logger.charts_logging_frequency`.
+        :param max_pending_epochs:       The max number of epochs waiting to be logged in asynchronous mode, when
+                                         reached, the training waits for the logging. Default is taken from
+                                         `mlrun.mlconf.frameworks.mlrun_logger.max_pending_epochs`.
         """
         super().__init__(context=context)
 
+        # Read the tracking configuration:
+        logger_config = mlrun.mlconf.frameworks.mlrun_logger
+        if asynchronous is None:
+            asynchronous = logger_config.asynchronous
+        self._charts_logging_frequency = max(
+            int(charts_logging_frequency or logger_config.charts_logging_frequency), 1
+        )
+        self._worker = (
+            _TrackingWorker(
+                max_pending_tasks=int(
+                    max_pending_epochs or logger_config.max_pending_epochs
+                )
+            )
+            if asynchronous
+            else None
+        )
+
+        # The metrics results to draw as charts by the next logging task (only the latest results are drawn) and
+        # whether the last logged epoch results are not drawn yet:
+        self._pending_charts = None  # type: List[Tuple[str, str, List[List[float]]]]
+        self._pending_charts_lock = threading.Lock()
+        self._charts_outdated = False
+
         # Prepare the artifacts collection:
         self._artifacts = {}  # type: Dict[str, Artifact]
 
@@ -91,54 +210,35 @@ class MLRunLogger(Logger):
 
         :param epoch: The epoch number that has just ended.
         """
-        # Log the collected hyperparameters and values as results (the most recent value collected (-1 index)):
-        for static_parameter, value in self._static_hyperparameters.items():
-            self._context.log_result(static_parameter, value)
-        if self._mode == LoggingMode.TRAINING:
-            for dynamic_parameter, values in self._dynamic_hyperparameters.items():
-                self._context.log_result(dynamic_parameter, values[-1])
-            for metric, results in self._training_summaries.items():
-                self._context.log_result(
-                    f"{self._Loops.TRAINING}_{metric}", results[-1]
-                )
-        for metric, results in self._validation_summaries.items():
-            self._context.log_result(
-                f"{self._Loops.EVALUATION}_{metric}"
-                if self._mode == LoggingMode.EVALUATION
-                else f"{self._Loops.VALIDATION}_{metric}",
-                results[-1],
-            )
+        # Collect the epoch results on the training thread, they are all logged together in a single run update:
+        results = self._get_epoch_results()
+
+        # Snapshot the metrics results for the charts according to the charts logging frequency:
+        if (
+            self._mode == LoggingMode.EVALUATION
+            or self._epochs % self._charts_logging_frequency == 0
+        ):
+            self._set_pending_charts()
+        else:
+            self._charts_outdated = True
 
-        # Log the epochs metrics results as chart artifacts:
-        loops = (
-            [self._Loops.EVALUATION]
-            if self._mode == LoggingMode.EVALUATION
-            else [self._Loops.TRAINING, self._Loops.VALIDATION]
-        )
-        metrics_dictionaries = (
-            [self._validation_results]
-            if self._mode == LoggingMode.EVALUATION
-            else [self._training_results, self._validation_results]
-        )
-        for loop, metrics_dictionary in zip(loops, metrics_dictionaries):
-            for metric_name in metrics_dictionary:
-                # Create the plotly artifact:
-                artifact = self._generate_metric_results_artifact(
-                    loop=loop,
-                    name=metric_name,
-                    epochs_results=metrics_dictionary[metric_name],
-                )
-                # Log the artifact:
-                self._context.log_artifact(
-                    artifact,
-                    local_path=artifact.key,
-                    artifact_path=self._context.artifact_path,
-                )
-                # Collect it for later adding it to the model logging as extra data:
-                self._artifacts[artifact.key.split(".")[0]] = artifact
+        # Log the epoch:
+        if self._worker is None:
+            self._log_epoch(results=results)
+        else:
+            self._worker.submit(lambda: self._log_epoch(results=results))
 
-        # Commit and commit children for MLRun flag bug:
-        self._context.commit(completed=False)
+    def flush(self):
+        """
+        Wait for all the epochs logged so far to be logged to the context, drawing the charts of the last epoch if they
+        were skipped due to the charts logging frequency.
+        """
+        if self._charts_outdated:
+            self._set_pending_charts()
+        if self._worker is not None:
+            self._worker.flush()
+        # Draw the remaining charts (if the last task didn't draw them):
+        self._log_pending_charts()
 
     def log_run(
         self,
@@ -167,6 +267,9 @@ class MLRunLogger(Logger):
         :param parameters:    Parameters to log with the model.
         :param extra_data:    Extra data to log with the model.
         """
+        # Wait for the epochs logging to complete:
+        self.flush()
+
         # If in training mode, log the summaries and hyperparameters artifacts:
         if self._mode == LoggingMode.TRAINING:
             # Create chart artifacts for summaries:
@@ -227,6 +330,95 @@ class MLRunLogger(Logger):
         # Commit to update the changes, so they will be available in the MLRun UI:
         self._context.commit(completed=False)
 
+    def _get_epoch_results(self) -> dict[str, DLTypes.TrackableType]:
+        """
+        Get the results to log for the last epoch: the static hyperparameters, the dynamic hyperparameters and the
+        training results (in training mode) and the validation summaries (the most recent value collected (-1 index)).
+
+        :return: The epoch results.
+        """
+        results = dict(self._static_hyperparameters)
+        if self._mode == LoggingMode.TRAINING:
+            for dynamic_parameter, values in self._dynamic_hyperparameters.items():
+                results[dynamic_parameter] = values[-1]
+            for metric, metric_results in self._training_summaries.items():
+                results[f"{self._Loops.TRAINING}_{metric}"] = metric_results[-1]
+        for metric, metric_results in self._validation_summaries.items():
+            results[
+                f"{self._Loops.EVALUATION}_{metric}"
+                if self._mode == LoggingMode.EVALUATION
+                else f"{self._Loops.VALIDATION}_{metric}"
+            ] = metric_results[-1]
+        return results
+
+    def _set_pending_charts(self):
+        """
+        Copy the current metrics results to be drawn by the next logging task (replacing older results that were not
+        drawn yet, so the charts are drawn only once for the latest results).
+        """
+        loops = (
+            [self._Loops.EVALUATION]
+            if self._mode == LoggingMode.EVALUATION
+            else [self._Loops.TRAINING, self._Loops.VALIDATION]
+        )
+        metrics_dictionaries = (
+            [self._validation_results]
+            if self._mode == LoggingMode.EVALUATION
+            else [self._training_results, self._validation_results]
+        )
+        charts = [
+            (
+                loop,
+                metric_name,
+                [list(epoch_results) for epoch_results in epochs_results],
+            )
+            for loop, metrics_dictionary in zip(loops, metrics_dictionaries)
+            for metric_name, epochs_results in metrics_dictionary.items()
+        ]
+        with self._pending_charts_lock:
+            self._pending_charts = charts
+        self._charts_outdated = False
+
+    def _log_epoch(self, results: dict[str, DLTypes.TrackableType]):
+        """
+        Log the epoch results and the pending charts to the context and commit them in a single run update.
+
+        :param results: The epoch results to log.
+        """
+        self._context.log_results(results)
+        self._log_pending_charts(commit=False)
+
+        # Commit and commit children for MLRun flag bug:
+        self._context.commit(completed=False)
+
+    def _log_pending_charts(self, commit: bool = True):
+        """
+        Draw and log the pending metrics results charts as artifacts.
+
+        :param commit: Whether to commit the context after logging the charts.
+        """
+        with self._pending_charts_lock:
+            charts, self._pending_charts = self._pending_charts, None
+        if not charts:
+            return
+        for loop, metric_name, epochs_results in charts:
+            # Create the plotly artifact:
+            artifact = self._generate_metric_results_artifact(
+                loop=loop,
+                name=metric_name,
+                epochs_results=epochs_results,
+            )
+            # Log the artifact:
+            self._context.log_artifact(
+                artifact,
+                local_path=artifact.key,
+                artifact_path=self._context.artifact_path,
+            )
+            # Collect it for later adding it to the model logging as extra data:
+            self._artifacts[artifact.key.split(".")[0]] = artifact
+        if commit:
+            self._context.commit(completed=False)
+
     def _generate_metrics_summary(self) -> dict[str, float]:
         """
         Generate a metrics summary to log along the model.
@@ -12,7 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from typing import Any, Optional, Union
+import concurrent.futures
+import hashlib
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional, Union
 
 import numpy as np
 import onnx
@@ -23,6 +29,223 @@ from mlrun.serving.v2_serving import V2ModelServer
 
 from .model_handler import ONNXModelHandler
 
+# ONNX tensor element types to numpy data types (for converting the requests inputs and allocating the outputs):
+_TENSOR_TYPES = {
+    "tensor(float)": np.float32,
+    "tensor(double)": np.float64,
+    "tensor(float16)": np.float16,
+    "tensor(int8)": np.int8,
+    "tensor(int16)": np.int16,
+    "tensor(int32)": np.int32,
+    "tensor(int64)": np.int64,
+    "tensor(uint8)": np.uint8,
+    "tensor(uint16)": np.uint16,
+    "tensor(uint32)": np.uint32,
+    "tensor(uint64)": np.uint64,
+    "tensor(bool)": np.bool_,
+}
+
+
+def create_inference_session(
+    model: onnx.ModelProto,
+    execution_providers: list[Union[str, tuple[str, dict[str, Any]]]],
+    intra_op_num_threads: Optional[int] = None,
+    inter_op_num_threads: Optional[int] = None,
+    graph_optimization_level: Optional[str] = None,
+    execution_mode: Optional[str] = None,
+    optimized_model_cache_dir: Optional[str] = None,
+) -> onnxruntime.InferenceSession:
+    """
+    Create an ONNX run time inference session for the given model with the given session options.
+
+    :param model:                     The model to create the session for.
+    :param execution_providers:       List of the execution providers, see `ONNXModelServer`.
+    :param intra_op_num_threads:      Number of threads used to parallelize the execution within nodes. Default: None -
+                                      ONNX run time default (number of physical cores).
+    :param inter_op_num_threads:      Number of threads used to parallelize the execution of the graph (across nodes),
+                                      used only in the "parallel" execution mode.
+    :param graph_optimization_level:  Graph optimization level, one of "disable", "basic", "extended" and "all".
+                                      Default: None - ONNX run time default ("all").
+    :param execution_mode:            Graph execution mode, one of "sequential" and "parallel". Default: None - ONNX
+                                      run time default ("sequential").
+    :param optimized_model_cache_dir: Directory to save the optimized model at, so next sessions of the same model and
+                                      options load the optimized model without optimizing it again. The optimized
+                                      model is written to a temporary file and renamed, so concurrent workers never
+                                      load a partially written model.
+
+    :return: The inference session.
+
+    :raise MLRunInvalidArgumentError: If the graph optimization level or execution mode are not supported.
+    """
+    session_options = onnxruntime.SessionOptions()
+    if intra_op_num_threads is not None:
+        session_options.intra_op_num_threads = intra_op_num_threads
+    if inter_op_num_threads is not None:
+        session_options.inter_op_num_threads = inter_op_num_threads
+    if graph_optimization_level is not None:
+        session_options.graph_optimization_level = _get_session_option(
+            onnxruntime.GraphOptimizationLevel,
+            "ORT_DISABLE_ALL"
+            if graph_optimization_level == "disable"
+            else f"ORT_ENABLE_{graph_optimization_level}",
+            "graph optimization level",
+            graph_optimization_level,
+        )
+    if execution_mode is not None:
+        session_options.execution_mode = _get_session_option(
+            onnxruntime.ExecutionMode,
+            f"ORT_{execution_mode}",
+            "execution mode",
+            execution_mode,
+        )
+
+    serialized_model = model.SerializeToString()
+    if optimized_model_cache_dir:
+        # The cached model is identified by the original model and the options affecting the optimization:
+        cache_key = hashlib.sha256(serialized_model)
+        cache_key.update(
+            f"{graph_optimization_level}:{execution_providers}:{onnxruntime.__version__}".encode()
+        )
+        optimized_model_path = os.path.join(
+            optimized_model_cache_dir, f"{cache_key.hexdigest()}.onnx"
+        )
+        if os.path.exists(optimized_model_path):
+            # The model is already optimized:
+            session_options.graph_optimization_level = (
+                onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+            )
+            return onnxruntime.InferenceSession(
+                optimized_model_path,
+                sess_options=session_options,
+                providers=execution_providers,
+            )
+        os.makedirs(optimized_model_cache_dir, exist_ok=True)
+        # The optimized model is written by the session creation, to a path unique to this process and thread:
+        temporary_model_path = (
+            f"{optimized_model_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        )
+        session_options.optimized_model_filepath = temporary_model_path
+        inference_session = onnxruntime.InferenceSession(
+            serialized_model,
+            sess_options=session_options,
+            providers=execution_providers,
+        )
+        if os.path.exists(temporary_model_path):
+            os.replace(temporary_model_path, optimized_model_path)
+        return inference_session
+
+    return onnxruntime.InferenceSession(
+        serialized_model,
+        sess_options=session_options,
+        providers=execution_providers,
+    )
+
+
+def _get_session_option(options_enum, option: str, option_type: str, value: str):
+    try:
+        return getattr(options_enum, option.upper())
+    except AttributeError:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"Unsupported ONNX run time {option_type} '{value}'"
+        )
+
+
+class _RequestsBatcher:
+    """
+    Batching the inputs of concurrent requests along the batch dimension (the first dimension), so the model runs once
+    per batch instead of once per request. A batch is run when it reaches the max batch size, when the batch timeout
+    has passed since its first request arrived, or when no other request is in flight (so a request which is served
+    alone, for example by a worker handling one event at a time, never waits for the batch timeout).
+    """
+
+    def __init__(
+        self,
+        run: Callable[[list[np.ndarray]], list[np.ndarray]],
+        max_batch_size: int,
+        batch_timeout: float,
+    ):
+        """
+        Initialize the batcher and start its thread.
+
+        :param run:            The function running the model on a list of inputs, returning a list of outputs.
+        :param max_batch_size: The max number of samples (the sum of the requests batch sizes) in a batch.
+        :param batch_timeout:  The max time (in seconds) to wait for a batch to fill.
+        """
+        self._run = run
+        self._max_batch_size = max_batch_size
+        self._batch_timeout = batch_timeout
+        self._requests = queue.Queue()
+        # The number of submitted requests which didn't return yet (batched, queued or about to be queued):
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run_batches, name="onnx-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, inputs: list[np.ndarray]) -> list[np.ndarray]:
+        """
+        Run the inputs through the model as part of a batch and return their outputs.
+
+        :param inputs: The request inputs, a numpy array per input layer (all with the same batch size).
+
+        :return: The request outputs.
+        """
+        future = concurrent.futures.Future()
+        with self._in_flight_lock:
+            self._in_flight += 1
+        try:
+            self._requests.put((inputs, future))
+            return future.result()
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
+
+    def _run_batches(self):
+        while True:
+            requests = [self._requests.get()]
+            batch_size = len(requests[0][0][0])
+            deadline = time.monotonic() + self._batch_timeout
+            # Wait for more requests only while other requests are in flight:
+            while batch_size < self._max_batch_size and self._in_flight > len(requests):
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self._requests.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                requests.append(request)
+                batch_size += len(request[0][0])
+            self._run_batch(requests)
+
+    def _run_batch(
+        self, requests: list[tuple[list[np.ndarray], concurrent.futures.Future]]
+    ):
+        try:
+            if len(requests) == 1:
+                inputs, future = requests[0]
+                future.set_result(self._run(inputs))
+                return
+            # Concatenate each input layer of all the requests:
+            outputs = self._run(
+                [
+                    np.concatenate([inputs[layer] for inputs, _ in requests])
+                    for layer in range(len(requests[0][0]))
+                ]
+            )
+        except Exception as exc:
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        # Split the outputs back to the requests:
+        split_indices = np.cumsum([len(inputs[0]) for inputs, _ in requests])[:-1]
+        requests_outputs = zip(*[np.split(output, split_indices) for output in outputs])
+        for (_, future), request_outputs in zip(requests, requests_outputs):
+            future.set_result(list(request_outputs))
+
 
 class ONNXModelServer(V2ModelServer):
     """
@@ -41,6 +264,14 @@ class ONNXModelServer(V2ModelServer):
             list[Union[str, tuple[str, dict[str, Any]]]]
         ] = None,
         protocol: Optional[str] = None,
+        intra_op_num_threads: Optional[int] = None,
+        inter_op_num_threads: Optional[int] = None,
+        graph_optimization_level: Optional[str] = None,
+        execution_mode: Optional[str] = None,
+        optimized_model_cache_dir: Optional[str] = None,
+        max_batch_size: Optional[int] = None,
+        batch_timeout: float = 0.005,
+        io_binding: bool = False,
         **class_args,
     ):
         """
@@ -76,6 +307,26 @@ class ONNXModelServer(V2ModelServer):
                                     ]
                                     Default: None - will prefer CUDA Execution Provider over CPU Execution Provider.
         :param protocol:            -
+        :param intra_op_num_threads:      Number of threads used to parallelize the execution within nodes. Default:
+                                          None - ONNX run time default (number of physical cores).
+        :param inter_op_num_threads:      Number of threads used to parallelize the execution of the graph (across
+                                          nodes), used only in the "parallel" execution mode.
+        :param graph_optimization_level:  Graph optimization level, one of "disable", "basic", "extended" and "all".
+                                          Default: None - ONNX run time default ("all").
+        :param execution_mode:            Graph execution mode, one of "sequential" and "parallel". Default: None -
+                                          ONNX run time default ("sequential").
+        :param optimized_model_cache_dir: Directory to save the optimized model at, so next loads of the model (for
+                                          example, by other workers or after a restart) skip the graph optimization.
+        :param max_batch_size:            Batch the inputs of concurrent requests along the batch dimension (the first
+                                          dimension) up to this number of samples and run the model once per batch.
+                                          Only requests served concurrently by the same process are batched (a Nuclio
+                                          worker handles one event at a time, so it batches nothing and its requests
+                                          run immediately). Default: None - no batching, the model runs once per
+                                          request.
+        :param batch_timeout:             The max time (in seconds) to wait for more concurrent requests to fill a
+                                          batch.
+        :param io_binding:                Whether to bind the outputs to pre-allocated buffers, used only when the model
+                                          outputs shapes are fixed.
         :param class_args:          -
         """
         super().__init__(
@@ -97,11 +348,28 @@ class ONNXModelServer(V2ModelServer):
             else execution_providers
         )
 
+        # Store the session options:
+        self.intra_op_num_threads = intra_op_num_threads
+        self.inter_op_num_threads = inter_op_num_threads
+        self.graph_optimization_level = graph_optimization_level
+        self.execution_mode = execution_mode
+        self.optimized_model_cache_dir = optimized_model_cache_dir
+
+        # Store the inference options:
+        self.max_batch_size = max_batch_size
+        self.batch_timeout = batch_timeout
+        self.io_binding = io_binding
+
         # Prepare inference parameters:
         self._model_handler: ONNXModelHandler = None
         self._inference_session: onnxruntime.InferenceSession = None
         self._input_layers: list[str] = None
+        self._input_types: list[type] = None
         self._output_layers: list[str] = None
+        self._output_shapes: list[tuple[int, ...]] = None
+        self._output_types: list[type] = None
+        self._io_bindings = threading.local()
+        self._batcher: _RequestsBatcher = None
 
     def load(self):
         """
@@ -121,20 +389,50 @@ class ONNXModelServer(V2ModelServer):
         self.model = self._model_handler.model
 
         # initialize the onnx run time session:
-        self._inference_session = onnxruntime.InferenceSession(
-            onnx._serialize(self._model_handler.model),
-            providers=self.execution_providers,
+        self._inference_session = create_inference_session(
+            model=self._model_handler.model,
+            execution_providers=self.execution_providers,
+            intra_op_num_threads=self.intra_op_num_threads,
+            inter_op_num_threads=self.inter_op_num_threads,
+            graph_optimization_level=self.graph_optimization_level,
+            execution_mode=self.execution_mode,
+            optimized_model_cache_dir=self.optimized_model_cache_dir,
         )
 
-        # Get the input layers names:
-        self._input_layers = [
-            input_layer.name for input_layer in self._inference_session.get_inputs()
+        # Get the input layers names and types:
+        inputs = self._inference_session.get_inputs()
+        self._input_layers = [input_layer.name for input_layer in inputs]
+        self._input_types = [
+            _TENSOR_TYPES.get(input_layer.type) for input_layer in inputs
         ]
 
-        # Get the outputs layers names:
-        self._output_layers = [
-            output_layer.name for output_layer in self._inference_session.get_outputs()
+        # Get the outputs layers names, types and shapes (the shape is fixed only if all its dimensions are known):
+        outputs = self._inference_session.get_outputs()
+        self._output_layers = [output_layer.name for output_layer in outputs]
+        self._output_types = [
+            _TENSOR_TYPES.get(output_layer.type) for output_layer in outputs
         ]
+        self._output_shapes = [
+            tuple(output_layer.shape)
+            if all(isinstance(dimension, int) for dimension in output_layer.shape)
+            else None
+            for output_layer in outputs
+        ]
+
+        # Start the requests batching (only if the batch dimension of the inputs is dynamic):
+        if self.max_batch_size and any(
+            input_layer.shape and isinstance(input_layer.shape[0], int)
+            for input_layer in inputs
+        ):
+            self.context.logger.warning(
+                f"model {self.name} inputs have a fixed batch size, requests batching is disabled"
+            )
+        elif self.max_batch_size:
+            self._batcher = _RequestsBatcher(
+                run=self._run,
+                max_batch_size=self.max_batch_size,
+                batch_timeout=self.batch_timeout,
+            )
 
     def predict(self, request: dict[str, Any]) -> np.ndarray:
         """
@@ -145,10 +443,30 @@ class ONNXModelServer(V2ModelServer):
 
         :return: The ONNXRunTime session returned output on the given inputs.
         """
-        # Read the inputs from the request:
-        inputs = request["inputs"]
+        # Read the inputs from the request and convert them to the input layers types:
+        inputs = [
+            np.asarray(data, dtype=input_type)
+            for data, input_type in zip(request["inputs"], self._input_types)
+        ]
 
         # Infer the inputs through the model:
+        if self._batcher is not None:
+            return self._batcher.submit(inputs)
+        return self._run(inputs)
+
+    def _run(self, inputs: list[np.ndarray]) -> list[np.ndarray]:
+        """
+        Run the inputs through the inference session.
+
+        :param inputs: The inputs, a numpy array per input layer.
+
+        :return: The outputs, a numpy array per output layer.
+        """
+        if self.io_binding and all(
+            shape is not None and dtype is not None
+            for shape, dtype in zip(self._output_shapes, self._output_types)
+        ):
+            return self._run_with_io_binding(inputs)
         return self._inference_session.run(
             output_names=self._output_layers,
             input_feed={
@@ -157,6 +475,40 @@ class ONNXModelServer(V2ModelServer):
             },
         )
 
+    def _run_with_io_binding(self, inputs: list[np.ndarray]) -> list[np.ndarray]:
+        """
+        Run the inputs through the inference session, writing the outputs to pre-allocated buffers (of the fixed output
+        shapes). The binding and buffers are allocated once per thread and reused by the next runs.
+
+        :param inputs: The inputs, a numpy array per input layer.
+
+        :return: The outputs, a numpy array per output layer (copied from the buffers).
+        """
+        io_binding = getattr(self._io_bindings, "io_binding", None)
+        if io_binding is None:
+            io_binding = self._inference_session.io_binding()
+            buffers = [
+                np.empty(shape, dtype=dtype)
+                for shape, dtype in zip(self._output_shapes, self._output_types)
+            ]
+            for output_layer, buffer in zip(self._output_layers, buffers):
+                io_binding.bind_output(
+                    name=output_layer,
+                    device_type="cpu",
+                    device_id=0,
+                    element_type=buffer.dtype,
+                    shape=buffer.shape,
+                    buffer_ptr=buffer.ctypes.data,
+                )
+            self._io_bindings.io_binding = io_binding
+            self._io_bindings.buffers = buffers
+        # Keep the contiguous inputs referenced until the run is done (the binding only holds their memory):
+        inputs = [np.ascontiguousarray(data) for data in inputs]
+        for input_layer, data in zip(self._input_layers, inputs):
+            io_binding.bind_cpu_input(input_layer, data)
+        self._inference_session.run_with_iobinding(io_binding)
+        return [buffer.copy() for buffer in self._io_bindings.buffers]
+
     def explain(self, request: dict[str, Any]) -> str:
         """
         Return a string explaining what model is being serve in this serving function and the function name.
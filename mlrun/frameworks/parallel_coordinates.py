@@ -18,7 +18,6 @@ from typing import Optional, Union
 
 import numpy as np
 import pandas as pd
-from IPython.display import HTML, display
 from pandas.api.types import is_numeric_dtype, is_string_dtype
 
 import mlrun
@@ -216,6 +215,9 @@ def _show_and_export_html(html: str, show=None, filename=None, runs_list=None):
             else:
                 fp.write(html)
     if show or (show is None and mlrun.utils.is_jupyter):
+        # imported on use, the runtimes import this module and IPython is slow to import
+        from IPython.display import HTML, display
+
         display(HTML(html))
         if runs_list and len(runs_list) <= max_table_rows:
             display(HTML(html_table))
@@ -43,6 +43,38 @@ from .utils import (
 RUN_ID_PLACE_HOLDER = "{run_id}"  # IMPORTANT: shouldn't be changed.
 
 
+class _FieldsPlan:
+    """
+    Per class resolution of the ModelObj serialization fields, so to_dict doesn't re-derive them (and inspect the
+    __init__ signature) on every call
+    """
+
+    def __init__(self, model_obj: "ModelObj"):
+        self.source = model_obj._get_fields_plan_source()
+        self.fields = tuple(model_obj._resolve_initial_to_dict_fields())
+        self.fields_to_serialize = tuple(dict.fromkeys(model_obj._fields_to_serialize))
+        self.fields_to_enrich = tuple(dict.fromkeys(model_obj._fields_to_enrich))
+        self.fields_to_skip_validation = frozenset(model_obj._fields_to_skip_validation)
+        self.default_fields_to_strip = tuple(model_obj._default_fields_to_strip)
+        # fields that are saved as is (or by their own to_dict), the ones that require serialization and enrichment
+        # are added later to the struct
+        self.fields_to_save = self.resolve_fields_to_save(self.fields)
+
+    def resolve_fields_to_save(self, fields, fields_to_exclude=()) -> tuple:
+        excluded = (
+            set(fields_to_exclude)
+            | set(self.fields_to_serialize)
+            | set(self.fields_to_enrich)
+        )
+        return tuple(field for field in dict.fromkeys(fields) if field not in excluded)
+
+
+# immutable values that are serialized and copied as is
+_immutable_types = frozenset(
+    (str, int, float, bool, bytes, type(None), datetime, complex)
+)
+
+
 class ModelObj:
     _dict_fields = []
     # Bellow attributes are used in to_dict method
@@ -91,61 +123,109 @@ class ModelObj:
 
         :return: A dictionary representation of the object.
         """
-        struct = {}
+        return self._to_dict(fields=fields, exclude=exclude, strip=strip)
 
-        fields = self._resolve_initial_to_dict_fields(fields)
-        fields_to_exclude = exclude or []
+    def _to_dict(
+        self,
+        fields: Optional[list] = None,
+        exclude: Optional[list] = None,
+        strip: bool = False,
+    ) -> dict:
+        struct = {}
+        plan = self._get_fields_plan()
+        fields_to_exclude = list(exclude or [])
         if strip:
-            fields_to_exclude += self._default_fields_to_strip
+            fields_to_exclude += plan.default_fields_to_strip
 
         # fields_to_save is built from the fields list minus the fields to exclude minus the fields that requires
         # serialization and enrichment (because they will be added later to the struct)
-        fields_to_save = (
-            set(fields)
-            - set(fields_to_exclude)
-            - set(self._fields_to_serialize)
-            - set(self._fields_to_enrich)
-        )
+        if fields or fields_to_exclude:
+            fields_to_save = plan.resolve_fields_to_save(
+                fields or plan.fields, fields_to_exclude
+            )
+        else:
+            fields_to_save = plan.fields_to_save
+        skip_validation = plan.fields_to_skip_validation
 
         # Iterating over the fields to save and adding them to the struct
         for field_name in fields_to_save:
             field_value = getattr(self, field_name, None)
-            if self._is_valid_field_value_for_serialization(
-                field_name, field_value, strip
+            if type(field_value) in _immutable_types:
+                if field_value is not None or field_name in skip_validation:
+                    struct[field_name] = field_value
+                continue
+            if field_name not in skip_validation and (
+                field_value is None
+                or (isinstance(field_value, (dict, list)) and not field_value)
             ):
-                # If the field value has attribute to_dict, we call it.
-                # If one of the attributes is a third party object that has to_dict method (such as k8s objects), then
-                # add it to the object's _fields_to_serialize attribute and handle it in the _serialize_field method.
-                if hasattr(field_value, "to_dict"):
-                    # TODO: Allow passing fields to exclude from the parent object to the child object
-                    #  e.g.: run.to_dict(exclude=["status.artifacts"])
-                    field_value = field_value.to_dict(strip=strip)
-                    if self._is_valid_field_value_for_serialization(
-                        field_name, field_value, strip
-                    ):
-                        struct[field_name] = field_value
+                continue
+            # If the field value has attribute to_dict, we call it.
+            # If one of the attributes is a third party object that has to_dict method (such as k8s objects), then
+            # add it to the object's _fields_to_serialize attribute and handle it in the _serialize_field method.
+            if type(field_value) not in (dict, list) and hasattr(
+                field_value, "to_dict"
+            ):
+                # TODO: Allow passing fields to exclude from the parent object to the child object
+                #  e.g.: run.to_dict(exclude=["status.artifacts"])
+                if type(field_value).to_dict is ModelObj.to_dict:
+                    # already in the warnings filter context of the parent object, skip it
+                    field_value = field_value._to_dict(strip=strip)
                 else:
+                    field_value = field_value.to_dict(strip=strip)
+                if self._is_valid_field_value_for_serialization(
+                    field_name, field_value, strip
+                ):
                     struct[field_name] = field_value
+            else:
+                struct[field_name] = field_value
 
         # Subtracting the fields_to_exclude from the fields_to_serialize because if we want to exclude a field there
         # is no need to serialize it.
-        fields_to_serialize = list(
-            set(self._fields_to_serialize) - set(fields_to_exclude)
-        )
-        self._resolve_field_value_by_method(
-            struct, self._serialize_field, fields_to_serialize, strip
-        )
+        if plan.fields_to_serialize:
+            fields_to_serialize = [
+                field
+                for field in plan.fields_to_serialize
+                if field not in fields_to_exclude
+            ]
+            self._resolve_field_value_by_method(
+                struct, self._serialize_field, fields_to_serialize, strip
+            )
 
         # Subtracting the fields_to_exclude from the fields_to_enrich because if we want to exclude a field there
         # is no need to enrich it.
-        fields_to_enrich = list(set(self._fields_to_enrich) - set(fields_to_exclude))
-        self._resolve_field_value_by_method(
-            struct, self._enrich_field, fields_to_enrich, strip
-        )
+        if plan.fields_to_enrich:
+            fields_to_enrich = [
+                field
+                for field in plan.fields_to_enrich
+                if field not in fields_to_exclude
+            ]
+            self._resolve_field_value_by_method(
+                struct, self._enrich_field, fields_to_enrich, strip
+            )
 
         self._apply_enrichment_before_to_dict_completion(struct, strip=strip)
         return struct
 
+    @classmethod
+    def _get_fields_plan_source(cls) -> tuple:
+        return (
+            cls._dict_fields,
+            cls._fields_to_serialize,
+            cls._fields_to_enrich,
+            cls._fields_to_skip_validation,
+            cls._default_fields_to_strip,
+        )
+
+    def _get_fields_plan(self) -> _FieldsPlan:
+        plan = _fields_plans.get(type(self))
+        if plan is None or any(
+            cached is not current
+            for cached, current in zip(plan.source, self._get_fields_plan_source())
+        ):
+            plan = _FieldsPlan(self)
+            _fields_plans[type(self)] = plan
+        return plan
+
     def _resolve_initial_to_dict_fields(self, fields: Optional[list] = None) -> list:
         """
         Resolve fields to be used in to_dict method.
@@ -272,7 +352,63 @@ class ModelObj:
 
     def copy(self):
         """create a copy of the object"""
-        return deepcopy(self)
+        return _copy_value(self, {})
+
+
+_fields_plans: dict[type, _FieldsPlan] = {}
+_fast_copy_classes: dict[type, bool] = {}
+
+
+def _supports_fast_copy(value_type: type) -> bool:
+    supported = _fast_copy_classes.get(value_type)
+    if supported is None:
+        # model objects with a custom pickling / copy protocol are copied with deepcopy
+        supported = _fast_copy_classes[value_type] = (
+            issubclass(value_type, (ModelObj, ObjectList, ObjectDict))
+            and not hasattr(value_type, "__slots__")
+            and all(
+                getattr(value_type, method, None) is getattr(object, method, None)
+                for method in (
+                    "__deepcopy__",
+                    "__reduce__",
+                    "__reduce_ex__",
+                    "__getstate__",
+                    "__setstate__",
+                )
+            )
+        )
+    return supported
+
+
+def _copy_value(value, memo: dict):
+    """
+    deepcopy equivalent which copies model objects (and the plain dicts and lists they hold) directly instead of going
+    through the generic pickling protocol of deepcopy, other values are copied with deepcopy (sharing the memo)
+    """
+    value_type = type(value)
+    if value_type in _immutable_types:
+        return value
+    copied = memo.get(id(value))
+    if copied is not None:
+        return copied
+
+    if value_type is dict or value_type is OrderedDict:
+        copied = memo[id(value)] = value_type()
+        for key, item in value.items():
+            copied[_copy_value(key, memo)] = _copy_value(item, memo)
+    elif value_type is list:
+        copied = memo[id(value)] = []
+        copied.extend(_copy_value(item, memo) for item in value)
+    elif _supports_fast_copy(value_type):
+        copied = memo[id(value)] = value_type.__new__(value_type)
+        copied.__dict__.update(
+            {key: _copy_value(item, memo) for key, item in value.__dict__.items()}
+        )
+    else:
+        return deepcopy(value, memo)
+    # keep the original alive for the memo ids to be valid (as deepcopy does)
+    memo.setdefault(id(memo), []).append(value)
+    return copied
 
 
 # model class for building ModelObj dictionaries
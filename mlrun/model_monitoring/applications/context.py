@@ -21,6 +21,7 @@ import pandas as pd
 
 import mlrun.common.constants as mlrun_constants
 import mlrun.common.schemas.model_monitoring.constants as mm_constants
+import mlrun.datastore
 import mlrun.errors
 import mlrun.feature_store as fstore
 import mlrun.features
@@ -114,6 +115,10 @@ class MonitoringApplicationContext:
         self.output_stream_uri = cast(
             str, event.get(mm_constants.ApplicationEvent.OUTPUT_STREAM_URI)
         )
+        # snapshot of the window data, persisted by the controller
+        self._sample_data_uri: Optional[str] = event.get(
+            mm_constants.ApplicationEvent.SAMPLE_DATA_URI
+        )
 
         self._feature_stats: Optional[FeatureStats] = feature_stats
         self._sample_df_stats: Optional[FeatureStats] = None
@@ -204,6 +209,19 @@ class MonitoringApplicationContext:
 
     @property
     def sample_df(self) -> pd.DataFrame:
+        if self._sample_df is None and self._sample_data_uri:
+            try:
+                self._sample_df = (
+                    mlrun.datastore.store_manager.object(url=self._sample_data_uri)
+                    .as_df(format="parquet")
+                    .reset_index(drop=True)
+                )
+            except Exception as exc:
+                self.logger.warning(
+                    "Failed to load the window snapshot, reading the window data",
+                    sample_data_uri=self._sample_data_uri,
+                    exc=mlrun.errors.err_to_str(exc),
+                )
         if self._sample_df is None:
             feature_set = fstore.get_feature_set(
                 self.model_endpoint.spec.monitoring_feature_set_uri
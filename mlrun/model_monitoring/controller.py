@@ -12,15 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import concurrent.futures
 import datetime
+import hashlib
+import io
 import json
 import os
+import threading
+import zlib
 from collections.abc import Iterator
 from contextlib import AbstractContextManager
 from types import TracebackType
-from typing import Any, NamedTuple, Optional, cast
+from typing import Any, Callable, NamedTuple, Optional, Union, cast
 
+import fsspec
 import nuclio_sdk
+import pandas as pd
 
 import mlrun
 import mlrun.common.schemas.model_monitoring.constants as mm_constants
@@ -34,7 +42,11 @@ from mlrun.common.schemas.model_monitoring.constants import (
 from mlrun.datastore import get_stream_pusher
 from mlrun.errors import err_to_str
 from mlrun.model_monitoring.db._schedules import ModelMonitoringSchedulesFile
-from mlrun.model_monitoring.helpers import batch_dict2timedelta, get_stream_path
+from mlrun.model_monitoring.helpers import (
+    batch_dict2timedelta,
+    get_monitoring_parquet_path,
+    get_stream_path,
+)
 from mlrun.utils import datetime_now, logger
 
 _SECONDS_IN_DAY = int(datetime.timedelta(days=1).total_seconds())
@@ -213,6 +225,170 @@ class _BatchWindowGenerator(AbstractContextManager):
         yield from self.batch_window.get_intervals()
 
 
+class _WindowSnapshots:
+    def __init__(
+        self,
+        feature_set: "mlrun.feature_store.FeatureSet",
+        snapshots_path: Optional[str] = None,
+        storage_options: Optional[dict] = None,
+    ) -> None:
+        """
+        Read every batch window of an endpoint once for all the monitoring applications that analyze it.
+        Windows with data are persisted as content-addressed parquet snapshots (prefixed by the window end time) under
+        `snapshots_path` (when given), which the applications load as their sample data instead of re-reading the
+        window. The window is read and its snapshot is written with the given storage options.
+        """
+        self._feature_set = feature_set
+        self._snapshots_path = snapshots_path
+        self._storage_options = storage_options
+        # window -> snapshot URI ("" if the window was not persisted), None for windows without data
+        self._windows: dict[_Interval, Optional[str]] = {}
+        self._persisted = False
+
+    def get_window(self, interval: _Interval) -> tuple[bool, Optional[str]]:
+        """
+        :returns: Whether the window has data, and the URI of its snapshot (None if it was not persisted).
+        """
+        if interval not in self._windows:
+            df = self._feature_set.to_dataframe(
+                start_time=interval.start,
+                end_time=interval.end,
+                time_column=mm_constants.EventFieldType.TIMESTAMP,
+                storage_options=self._storage_options,
+            )
+            self._windows[interval] = self._persist(interval, df) if len(df) else None
+        snapshot_uri = self._windows[interval]
+        return snapshot_uri is not None, snapshot_uri or None
+
+    def cleanup(self, retention_secs: float) -> None:
+        """
+        Delete the snapshots of the windows that ended more than `retention_secs` seconds ago (the applications load
+        the snapshots once they get the windows, and read the window data if the snapshot is missing). Runs only
+        when new snapshots were written, so once per window.
+        """
+        if not self._persisted:
+            return
+        oldest_window_end = datetime_now().timestamp() - retention_secs
+        try:
+            filesystem, path = self._get_filesystem()
+            expired = []
+            for snapshot_path in filesystem.ls(path, detail=False):
+                window_end, _, _ = snapshot_path.rsplit("/", 1)[-1].partition("-")
+                if window_end.isdigit() and int(window_end) < oldest_window_end:
+                    expired.append(snapshot_path)
+            if expired:
+                filesystem.rm(expired)
+        except Exception as exc:
+            logger.warning(
+                "Failed to delete the expired window snapshots",
+                snapshots_path=self._snapshots_path,
+                exc=err_to_str(exc),
+            )
+
+    def _get_filesystem(self) -> tuple[fsspec.AbstractFileSystem, str]:
+        """the filesystem of the snapshots (with the given storage options, or the datastore ones) and their path"""
+        store, _, url = mlrun.datastore.store_manager.get_or_create_store(
+            self._snapshots_path
+        )
+        storage_options = self._storage_options or store.get_storage_options()
+        return fsspec.core.url_to_fs(url, **storage_options)
+
+    def _persist(self, interval: _Interval, df: pd.DataFrame) -> str:
+        if not self._snapshots_path:
+            return ""
+        try:
+            buffer = io.BytesIO()
+            df.to_parquet(buffer)
+            content = buffer.getvalue()
+            # the same window content is always stored in the same file
+            snapshot_name = (
+                f"{int(interval.end.timestamp())}-"
+                f"{hashlib.sha256(content).hexdigest()}.parquet"
+            )
+            filesystem, path = self._get_filesystem()
+            filesystem.makedirs(path, exist_ok=True)
+            filesystem.pipe_file(f"{path}/{snapshot_name}", content)
+        except Exception as exc:
+            logger.warning(
+                "Failed to persist the window snapshot, the applications will read the window",
+                exc=err_to_str(exc),
+            )
+            return ""
+        self._persisted = True
+        return f"{self._snapshots_path.rstrip('/')}/{snapshot_name}"
+
+
+# stream URI and access key -> stream pusher, shared by all the endpoints processed in this process
+_stream_pushers: dict[tuple[str, Optional[str]], Any] = {}
+_stream_pushers_lock = threading.Lock()
+
+
+def _get_stream_pusher(stream_uri: str, access_key: Optional[str]) -> Any:
+    with _stream_pushers_lock:
+        stream_pusher = _stream_pushers.get((stream_uri, access_key))
+        if stream_pusher is None:
+            stream_pusher = _stream_pushers[(stream_uri, access_key)] = (
+                get_stream_pusher(stream_uri, access_key=access_key)
+            )
+        return stream_pusher
+
+
+# the bounded thread pool processing the endpoints, shared by the controller invocations of this process
+_endpoints_processing_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_endpoints_processing_pool_lock = threading.Lock()
+
+
+def _get_endpoints_processing_pool() -> concurrent.futures.ThreadPoolExecutor:
+    global _endpoints_processing_pool
+    with _endpoints_processing_pool_lock:
+        if _endpoints_processing_pool is None:
+            _endpoints_processing_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(
+                    int(mlrun.mlconf.model_endpoint_monitoring.controller_max_workers),
+                    1,
+                ),
+                thread_name_prefix="endpoints-processor",
+            )
+        return _endpoints_processing_pool
+
+
+class _EndpointEventsProcessor:
+    def __init__(self, process_event: Callable[[dict], None], max_workers: int) -> None:
+        """
+        Process the controller events of independent endpoints concurrently, in up to `max_workers` shards (on the
+        process endpoints processing pool). The events are sharded by their endpoint ID, so the events of an endpoint
+        are processed in order by a single worker.
+        """
+        self._process_event = process_event
+        self._max_workers = max(int(max_workers), 1)
+
+    def process(self, events: list[dict]) -> None:
+        shards: dict[int, list[dict]] = collections.defaultdict(list)
+        for event in events:
+            shards[self._get_shard(event)].append(event)
+        if len(shards) <= 1:
+            for shard_events in shards.values():
+                self._process_shard(shard_events)
+            return
+        pool = _get_endpoints_processing_pool()
+        futures = [
+            pool.submit(self._process_shard, shard_events)
+            for shard_events in shards.values()
+        ]
+        # wait for all the shards before raising the first error
+        concurrent.futures.wait(futures)
+        for future in futures:
+            future.result()
+
+    def _get_shard(self, event: dict) -> int:
+        endpoint_id = str(event.get(ControllerEvent.ENDPOINT_ID, ""))
+        return zlib.crc32(endpoint_id.encode()) % self._max_workers
+
+    def _process_shard(self, events: list[dict]) -> None:
+        for event in events:
+            self._process_event(event)
+
+
 def _get_window_length() -> int:
     """Get the timedelta in seconds from the batch dictionary"""
     return int(
@@ -267,9 +443,10 @@ class MonitoringApplicationController:
             != mm_constants.EndpointType.ROUTER.value
         )
 
-    def run(self, event: nuclio_sdk.Event) -> None:
+    def run(self, event: Union[nuclio_sdk.Event, list[nuclio_sdk.Event]]) -> None:
         """
-        Main method for controller chief, runs all the relevant monitoring applications for a single endpoint.
+        Main method for controller worker, runs all the relevant monitoring applications for the endpoints of the
+        event (or batch of events). Independent endpoints are processed concurrently.
         Handles nop events logic.
         This method handles the following:
         1. Read applications from the event (endpoint_policy)
@@ -278,16 +455,19 @@ class MonitoringApplicationController:
         4. Pushes nop event to main stream if needed
         """
         logger.info("Start running monitoring controller worker")
-        try:
-            body = json.loads(event.body.decode("utf-8"))
-        except Exception as e:
-            logger.error(
-                "Failed to decode event",
-                exc=err_to_str(e),
-            )
-            return
-        # Run single endpoint process
-        self.model_endpoint_process(event=body)
+        bodies = []
+        for nuclio_event in event if isinstance(event, list) else [event]:
+            try:
+                bodies.append(json.loads(nuclio_event.body.decode("utf-8")))
+            except Exception as e:
+                logger.error(
+                    "Failed to decode event",
+                    exc=err_to_str(e),
+                )
+        _EndpointEventsProcessor(
+            self.model_endpoint_process,
+            max_workers=mlrun.mlconf.model_endpoint_monitoring.controller_max_workers,
+        ).process(bodies)
 
     def model_endpoint_process(
         self,
@@ -322,28 +502,30 @@ class MonitoringApplicationController:
             first_request = datetime.datetime.fromisoformat(
                 event[ControllerEvent.FIRST_REQUEST]
             )
+            # windows that are analyzed by several applications are read once
+            window_snapshots = _WindowSnapshots(
+                feature_set=m_fs,
+                snapshots_path=self._get_window_snapshots_path(endpoint_id),
+                storage_options=self.storage_options,
+            )
             with _BatchWindowGenerator(
                 project=project_name,
                 endpoint_id=endpoint_id,
                 window_length=self._window_length,
             ) as batch_window_generator:
                 for application in applications_names:
-                    for (
-                        start_infer_time,
-                        end_infer_time,
-                    ) in batch_window_generator.get_intervals(
+                    windows: list[tuple[_Interval, Optional[str]]] = []
+                    for interval in batch_window_generator.get_intervals(
                         application=application,
                         not_batch_endpoint=not_batch_endpoint,
                         first_request=first_request,
                         last_request=last_stream_timestamp,
                     ):
-                        df = m_fs.to_dataframe(
-                            start_time=start_infer_time,
-                            end_time=end_infer_time,
-                            time_column=mm_constants.EventFieldType.TIMESTAMP,
-                            storage_options=self.storage_options,
+                        start_infer_time, end_infer_time = interval
+                        has_data, sample_data_uri = window_snapshots.get_window(
+                            interval
                         )
-                        if len(df) == 0:
+                        if not has_data:
                             logger.info(
                                 "No data found for the given interval",
                                 start=start_infer_time,
@@ -357,15 +539,30 @@ class MonitoringApplicationController:
                                 end=end_infer_time,
                                 endpoint_id=endpoint_id,
                             )
-                            self._push_to_applications(
-                                start_infer_time=start_infer_time,
-                                end_infer_time=end_infer_time,
-                                endpoint_id=endpoint_id,
-                                endpoint_name=endpoint_name,
-                                project=project_name,
-                                applications_names=[application],
-                                model_monitoring_access_key=self.model_monitoring_access_key,
-                            )
+                            windows.append((interval, sample_data_uri))
+                    if not windows:
+                        continue
+                    # all the windows of the application are pushed at once
+                    try:
+                        self._push_to_applications(
+                            windows=windows,
+                            endpoint_id=endpoint_id,
+                            endpoint_name=endpoint_name,
+                            project=project_name,
+                            applications_names=[application],
+                            model_monitoring_access_key=self.model_monitoring_access_key,
+                        )
+                    except Exception:
+                        # the windows were not sent, analyze them again on the next event
+                        batch_window_generator.batch_window._update_last_analyzed(
+                            int(windows[0][0].start.timestamp())
+                        )
+                        raise
+                window_snapshots.cleanup(
+                    retention_secs=float(
+                        mlrun.mlconf.model_endpoint_monitoring.controller_window_snapshots_retention_secs
+                    )
+                )
                 base_period = event[ControllerEvent.ENDPOINT_POLICY]["base_period"]
                 current_time = mlrun.utils.datetime_now()
                 if (
@@ -406,10 +603,17 @@ class MonitoringApplicationController:
                 endpoint_id=event[ControllerEvent.ENDPOINT_ID],
             )
 
+    def _get_window_snapshots_path(self, endpoint_id: str) -> Optional[str]:
+        if not mlrun.mlconf.model_endpoint_monitoring.controller_window_snapshots:
+            return None
+        snapshots_path = get_monitoring_parquet_path(
+            self.project_obj, kind=mm_constants.FileTargetKind.WINDOW_SNAPSHOTS
+        )
+        return f"{snapshots_path.rstrip('/')}/{endpoint_id}"
+
     @staticmethod
     def _push_to_applications(
-        start_infer_time: datetime.datetime,
-        end_infer_time: datetime.datetime,
+        windows: list[tuple[_Interval, Optional[str]]],
         endpoint_id: str,
         endpoint_name: str,
         project: str,
@@ -417,43 +621,50 @@ class MonitoringApplicationController:
         model_monitoring_access_key: str,
     ):
         """
-        Pushes data to multiple stream applications.
+        Pushes data to multiple stream applications, all the windows are pushed to each application stream at once.
 
-        :param start_infer_time:            The beginning of the infer interval window.
-        :param end_infer_time:              The end of the infer interval window.
+        :param windows:                     The infer interval windows and the URIs of their snapshots, loaded by
+                                            the applications as their sample data.
         :param endpoint_id:                 Identifier for the model endpoint.
         :param project: mlrun               Project name.
         :param applications_names:          List of application names to which data will be pushed.
         :param model_monitoring_access_key: Access key to apply the model monitoring process.
 
         """
-        data = {
-            mm_constants.ApplicationEvent.START_INFER_TIME: start_infer_time.isoformat(
-                sep=" ", timespec="microseconds"
-            ),
-            mm_constants.ApplicationEvent.END_INFER_TIME: end_infer_time.isoformat(
-                sep=" ", timespec="microseconds"
-            ),
-            mm_constants.ApplicationEvent.ENDPOINT_ID: endpoint_id,
-            mm_constants.ApplicationEvent.ENDPOINT_NAME: endpoint_name,
-            mm_constants.ApplicationEvent.OUTPUT_STREAM_URI: get_stream_path(
-                project=project,
-                function_name=mm_constants.MonitoringFunctionNames.WRITER,
-            ),
-        }
+        output_stream_uri = get_stream_path(
+            project=project,
+            function_name=mm_constants.MonitoringFunctionNames.WRITER,
+        )
         for app_name in applications_names:
-            data.update({mm_constants.ApplicationEvent.APPLICATION_NAME: app_name})
             stream_uri = get_stream_path(project=project, function_name=app_name)
+            records = []
+            for (start_infer_time, end_infer_time), sample_data_uri in windows:
+                data = {
+                    mm_constants.ApplicationEvent.START_INFER_TIME: start_infer_time.isoformat(
+                        sep=" ", timespec="microseconds"
+                    ),
+                    mm_constants.ApplicationEvent.END_INFER_TIME: end_infer_time.isoformat(
+                        sep=" ", timespec="microseconds"
+                    ),
+                    mm_constants.ApplicationEvent.ENDPOINT_ID: endpoint_id,
+                    mm_constants.ApplicationEvent.ENDPOINT_NAME: endpoint_name,
+                    mm_constants.ApplicationEvent.OUTPUT_STREAM_URI: output_stream_uri,
+                    mm_constants.ApplicationEvent.APPLICATION_NAME: app_name,
+                }
+                if sample_data_uri:
+                    data[mm_constants.ApplicationEvent.SAMPLE_DATA_URI] = (
+                        sample_data_uri
+                    )
+                records.append(data)
 
             logger.info(
                 "Pushing data to application stream",
                 endpoint_id=endpoint_id,
                 app_name=app_name,
                 stream_uri=stream_uri,
+                windows=len(records),
             )
-            get_stream_pusher(stream_uri, access_key=model_monitoring_access_key).push(
-                [data]
-            )
+            _get_stream_pusher(stream_uri, model_monitoring_access_key).push(records)
 
     def push_regular_event_to_controller_stream(self, event: nuclio_sdk.Event) -> None:
         """
@@ -595,7 +806,7 @@ class MonitoringApplicationController:
             endpoint_id=endpoint_id,
             stream_uri=stream_uri,
         )
-        get_stream_pusher(stream_uri, access_key=stream_access_key).push(
+        _get_stream_pusher(stream_uri, stream_access_key).push(
             [event], partition_key=endpoint_id
         )
 
@@ -613,7 +824,7 @@ class MonitoringApplicationController:
             endpoint_id=endpoint_id,
             stream_uri=stream_uri,
         )
-        get_stream_pusher(stream_uri, access_key=self.model_monitoring_access_key).push(
+        _get_stream_pusher(stream_uri, self.model_monitoring_access_key).push(
             [event], partition_key=endpoint_id
         )
 
@@ -625,13 +836,15 @@ def handler(context: nuclio_sdk.Context, event: nuclio_sdk.Event) -> None:
     :param context: the Nuclio context
     :param event:   trigger event
     """
+    # stream triggers may deliver a batch of events
+    trigger = (event[0] if isinstance(event, list) else event).trigger
     logger.info(
         "Controller got event",
-        trigger=event.trigger,
-        trigger_kind=event.trigger.kind,
+        trigger=trigger,
+        trigger_kind=trigger.kind,
     )
 
-    if event.trigger.kind == "http":
+    if trigger.kind == "http":
         # Runs controller chief:
         MonitoringApplicationController().push_regular_event_to_controller_stream(event)
     else:
@@ -79,6 +79,20 @@ class TSDBConnector(ABC):
         :raise mlrun.errors.MLRunRuntimeError: If an error occurred while writing the event.
         """
 
+    def write_application_events(
+        self,
+        events: list[dict],
+        kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
+    ) -> None:
+        """
+        Write a batch of application results or metrics of the same kind to TSDB. Connectors that support multi-row
+        writes override this method, the default implementation writes the events one by one.
+
+        :raise mlrun.errors.MLRunRuntimeError: If an error occurred while writing the events.
+        """
+        for event in events:
+            self.write_application_event(event=event, kind=kind)
+
     @abstractmethod
     def delete_tsdb_resources(self):
         """
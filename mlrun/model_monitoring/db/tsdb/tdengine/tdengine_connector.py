@@ -20,6 +20,7 @@ import taosws
 from taoswswrap.tdengine_connection import (
     Statement,
     TDEngineConnection,
+    values_to_column,
 )
 
 import mlrun.common.schemas.model_monitoring as mm_schemas
@@ -30,6 +31,36 @@ from mlrun.model_monitoring.helpers import get_invocations_fqn
 from mlrun.utils import logger
 
 
+class _MultiRowStatement(Statement):
+    """A prepared insert statement that binds multiple rows of the same subtable at once"""
+
+    def __init__(
+        self,
+        columns: dict[str, str],
+        subtable: str,
+        rows: list[dict[str, typing.Any]],
+    ) -> None:
+        super().__init__(columns=columns, subtable=subtable, values={})
+        self.rows = rows
+
+    def prepare(self, statement: taosws.TaosStmt) -> taosws.TaosStmt:
+        question_marks = ", ".join("?" * len(self.columns))
+        statement.prepare(f"INSERT INTO ? VALUES ({question_marks});")
+        statement.set_tbname(self.subtable)
+        statement.bind_param(
+            [
+                values_to_column(
+                    [row[col_name] for row in self.rows],
+                    col_type,
+                    timestamp_precision=self.timestamp_precision,
+                )
+                for col_name, col_type in self.columns.items()
+            ]
+        )
+        statement.add_batch()
+        return statement
+
+
 class TDEngineConnector(TSDBConnector):
     """
     Handles the TSDB operations when the TSDB connector is of type TDEngine.
@@ -52,6 +83,8 @@ class TDEngineConnector(TSDBConnector):
         self.database = database
 
         self._connection = None
+        # subtables that were already created by this connector, their creation statement is not issued again
+        self._created_subtables: set[str] = set()
         self._init_super_tables()
 
         self._timeout = mlrun.mlconf.model_endpoint_monitoring.tdengine.timeout
@@ -111,57 +144,77 @@ class TDEngineConnector(TSDBConnector):
         """
         Write a single result or metric to TSDB.
         """
+        self.write_application_events(events=[event], kind=kind)
 
-        table_name = (
-            f"{event[mm_schemas.WriterEvent.ENDPOINT_ID]}_"
-            f"{event[mm_schemas.WriterEvent.APPLICATION_NAME]}"
-        )
+    def write_application_events(
+        self,
+        events: list[dict],
+        kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
+    ) -> None:
+        """
+        Write a batch of results or metrics of the same kind to TSDB. The events are grouped by their subtable and
+        written with a single multi-row insert per subtable, and the subtables creation statements are issued only
+        for subtables that were not created by this connector yet.
+        """
+        if not events:
+            return
 
         if kind == mm_schemas.WriterEventKind.RESULT:
-            # Write a new result
             table = self.tables[mm_schemas.TDEngineSuperTables.APP_RESULTS]
-            table_name = (
-                f"{table_name}_{event[mm_schemas.ResultData.RESULT_NAME]}"
-            ).replace("-", "_")
-
+            name_key = mm_schemas.ResultData.RESULT_NAME
         else:
-            # Write a new metric
             table = self.tables[mm_schemas.TDEngineSuperTables.METRICS]
-            table_name = (
-                f"{table_name}_{event[mm_schemas.MetricData.METRIC_NAME]}"
-            ).replace("-", "_")
-
-        # Escape the table name for case-sensitivity (ML-7908)
-        # https://github.com/taosdata/taos-connector-python/issues/260
-        table_name = f"`{table_name}`"
-
-        # Convert the datetime strings to datetime objects
-        event[mm_schemas.WriterEvent.END_INFER_TIME] = self._convert_to_datetime(
-            val=event[mm_schemas.WriterEvent.END_INFER_TIME]
-        )
-        event[mm_schemas.WriterEvent.START_INFER_TIME] = self._convert_to_datetime(
-            val=event[mm_schemas.WriterEvent.START_INFER_TIME]
-        )
-
-        create_table_sql = table._create_subtable_sql(subtable=table_name, values=event)
+            name_key = mm_schemas.MetricData.METRIC_NAME
 
         # we need the string values to be sent to the connection, not the enum
         columns = {str(key): str(val) for key, val in table.columns.items()}
 
-        insert_statement = Statement(
-            columns=columns,
-            subtable=table_name,
-            values=event,
+        subtables_events: dict[str, list[dict]] = {}
+        for event in events:
+            table_name = (
+                f"{event[mm_schemas.WriterEvent.ENDPOINT_ID]}_"
+                f"{event[mm_schemas.WriterEvent.APPLICATION_NAME]}_"
+                f"{event[name_key]}"
+            ).replace("-", "_")
+            # Escape the table name for case-sensitivity (ML-7908)
+            # https://github.com/taosdata/taos-connector-python/issues/260
+            table_name = f"`{table_name}`"
+
+            # Convert the datetime strings to datetime objects
+            event[mm_schemas.WriterEvent.END_INFER_TIME] = self._convert_to_datetime(
+                val=event[mm_schemas.WriterEvent.END_INFER_TIME]
+            )
+            event[mm_schemas.WriterEvent.START_INFER_TIME] = self._convert_to_datetime(
+                val=event[mm_schemas.WriterEvent.START_INFER_TIME]
+            )
+            subtables_events.setdefault(table_name, []).append(event)
+
+        new_subtables = [
+            table_name
+            for table_name in subtables_events
+            if table_name not in self._created_subtables
+        ]
+        statements = [
+            table._create_subtable_sql(
+                subtable=table_name, values=subtables_events[table_name][0]
+            )
+            for table_name in new_subtables
+        ]
+        statements.extend(
+            _MultiRowStatement(
+                columns=columns,
+                subtable=table_name,
+                rows=subtable_events,
+            )
+            for table_name, subtable_events in subtables_events.items()
         )
 
         self.connection.run(
-            statements=[
-                create_table_sql,
-                insert_statement,
-            ],
+            statements=statements,
             timeout=self._timeout,
             retries=self._retries,
         )
+        self._created_subtables.update(new_subtables)
 
     @staticmethod
     def _convert_to_datetime(val: typing.Union[str, datetime]) -> datetime:
@@ -268,6 +321,7 @@ class TDEngineConnector(TSDBConnector):
         drop_statements = []
         for table in self.tables:
             drop_statements.append(self.tables[table].drop_supertable_query())
+        self._created_subtables.clear()
 
         try:
             self.connection.run(
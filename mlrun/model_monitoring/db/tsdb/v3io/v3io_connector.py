@@ -367,10 +367,22 @@ class V3IOTSDBConnector(TSDBConnector):
         kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
     ) -> None:
         """Write a single result or metric to TSDB"""
+        self.write_application_events(events=[event], kind=kind)
 
-        event[mm_schemas.WriterEvent.END_INFER_TIME] = datetime.fromisoformat(
-            event[mm_schemas.WriterEvent.END_INFER_TIME]
-        )
+    def write_application_events(
+        self,
+        events: list[dict],
+        kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
+    ) -> None:
+        """Write a batch of results or metrics of the same kind to TSDB in a single frames write"""
+        if not events:
+            return
+
+        for event in events:
+            if isinstance(event[mm_schemas.WriterEvent.END_INFER_TIME], str):
+                event[mm_schemas.WriterEvent.END_INFER_TIME] = datetime.fromisoformat(
+                    event[mm_schemas.WriterEvent.END_INFER_TIME]
+                )
         index_cols_base = [
             mm_schemas.WriterEvent.END_INFER_TIME,
             mm_schemas.WriterEvent.ENDPOINT_ID,
@@ -390,16 +402,18 @@ class V3IOTSDBConnector(TSDBConnector):
             self.frames_client.write(
                 backend=_TSDB_BE,
                 table=table,
-                dfs=pd.DataFrame.from_records([event]),
+                dfs=pd.DataFrame.from_records(events),
                 index_cols=index_cols,
             )
-            logger.info("Updated V3IO TSDB successfully", table=table)
+            logger.info(
+                "Updated V3IO TSDB successfully", table=table, events=len(events)
+            )
         except v3io_frames.Error as err:
             logger.exception(
                 "Could not write drift measures to TSDB",
                 err=err,
                 table=table,
-                event=event,
+                events=events,
             )
             raise mlrun.errors.MLRunRuntimeError(
                 f"Failed to write application result to TSDB: {err}"
@@ -12,10 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import concurrent.futures
 import datetime
 import os
+import threading
+import time
 import typing
 
+import numpy as np
 import storey
 
 import mlrun
@@ -36,6 +41,7 @@ from mlrun.common.schemas.model_monitoring.constants import (
     ProjectSecretKeys,
 )
 from mlrun.datastore import parse_kafka_url
+from mlrun.errors import err_to_str
 from mlrun.model_monitoring.db import TSDBConnector
 from mlrun.utils import logger
 
@@ -215,18 +221,50 @@ class EventStreamProcessor:
                 after="flatten_events",
             )
 
-        apply_map_feature_names()
+        # Batch the events of each endpoint, map them per batch and flatten the mapped events
+        def apply_map_feature_names_batch():
+            graph.add_step(
+                "storey.Batch",
+                "batch_events",
+                max_events=stream_batching.max_events,
+                flush_after_seconds=stream_batching.flush_after_seconds,
+                key_field="$key",
+                after="flatten_events",
+            )
+            graph.add_step(
+                "MapFeatureNamesBatch",
+                name="MapFeatureNames",
+                full_event=True,
+                infer_columns_from_data=True,
+                project=self.project,
+                after="batch_events",
+            )
+            graph.add_step(
+                "storey.FlatMap",
+                "flatten_mapped_events",
+                _fn="(event)",
+                after="MapFeatureNames",
+            )
+
+        stream_batching = mlrun.mlconf.model_endpoint_monitoring.stream_batching
+        if stream_batching.enabled:
+            apply_map_feature_names_batch()
+            mapped_events_step = "flatten_mapped_events"
+        else:
+            apply_map_feature_names()
+            mapped_events_step = "MapFeatureNames"
+
         # split the graph between event with error vs valid event
         graph.add_step(
             "storey.Filter",
             "FilterNOP",
-            after="MapFeatureNames",
+            after=mapped_events_step,
             _fn="(event.get('kind', " ") != 'nop_event')",
         )
         graph.add_step(
             "storey.Filter",
             "ForwardNOP",
-            after="MapFeatureNames",
+            after=mapped_events_step,
             _fn="(event.get('kind', " ") == 'nop_event')",
         )
 
@@ -246,14 +284,33 @@ class EventStreamProcessor:
                 _fn="(event)",
             )
 
-        apply_process_before_parquet()
+        # Filter the mapped batches (including the nop events) and flatten them before the Parquet target
+        def apply_process_before_parquet_batch():
+            graph.add_step(
+                "ProcessBeforeParquetBatch",
+                name="ProcessBeforeParquet",
+                after="MapFeatureNames",
+            )
+            graph.add_step(
+                "storey.FlatMap",
+                "flatten_parquet_events",
+                _fn="(event)",
+                after="ProcessBeforeParquet",
+            )
+
+        if stream_batching.enabled:
+            apply_process_before_parquet_batch()
+            parquet_events_step = "flatten_parquet_events"
+        else:
+            apply_process_before_parquet()
+            parquet_events_step = "ProcessBeforeParquet"
 
         # Write the Parquet target file, partitioned by key (endpoint_id) and time.
         def apply_parquet_target():
             graph.add_step(
                 "storey.ParquetTarget",
                 name="ParquetTarget",
-                after="ProcessBeforeParquet",
+                after=parquet_events_step,
                 graph_shape="cylinder",
                 path=self.parquet_path,
                 storage_options=self.storage_options,
@@ -321,6 +378,12 @@ class ProcessBeforeParquet(mlrun.feature_store.steps.MapClass):
 
     def do(self, event):
         logger.info("ProcessBeforeParquet1", event=event)
+        event = self._filter_event(event)
+        logger.info("ProcessBeforeParquet2", event=event)
+        return event
+
+    @staticmethod
+    def _filter_event(event: dict) -> dict:
         # Remove the following keys from the event
         for key in [
             EventFieldType.FEATURES,
@@ -343,10 +406,201 @@ class ProcessBeforeParquet(mlrun.feature_store.steps.MapClass):
         ]:
             if not event.get(key):
                 event[key] = None
-        logger.info("ProcessBeforeParquet2", event=event)
         return event
 
 
+class ProcessBeforeParquetBatch(ProcessBeforeParquet):
+    def __init__(self, **kwargs):
+        """
+        Batched variant of ProcessBeforeParquet, which gets the list of events emitted by MapFeatureNamesBatch.
+        Nop events are dropped from the batch.
+
+        :returns: List of event dictionaries with filtered data for the Parquet target.
+        """
+        super().__init__(**kwargs)
+
+    def do(self, events: list[dict]) -> list[dict]:
+        return [
+            self._filter_event(event)
+            for event in events
+            if event.get(ControllerEvent.KIND, "") != ControllerEventKind.NOP_EVENT
+        ]
+
+
+class _BoundedDict(collections.OrderedDict):
+    """dict that drops its oldest keys once it holds more than max_size keys"""
+
+    def __init__(self, max_size: int):
+        super().__init__()
+        self._max_size = max_size
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if len(self) > self._max_size:
+            self.popitem(last=False)
+
+
+class EndpointsMetadataCache:
+    def __init__(self, project: str, max_size: int, ttl: float):
+        """
+        Bounded (LRU) cache of the model endpoints records (flat dicts) of a project, shared by the monitoring stream
+        steps of the process.
+        The records are prefetched with a single list call, and records older than `ttl` seconds are refreshed in the
+        background while the cached record keeps serving the events. The records are updated in place when the stream
+        processor updates an endpoint.
+
+        :param project:  Project name.
+        :param max_size: Max number of cached endpoints.
+        :param ttl:      Seconds after which a cached record is refreshed.
+        """
+        self._project = project
+        self._max_size = max_size
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # endpoint ID -> (endpoint record, fetch time)
+        self._records: collections.OrderedDict[str, tuple[dict, float]] = (
+            collections.OrderedDict()
+        )
+        self._refreshing: set[str] = set()
+        self._refresher = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="endpoints-metadata-refresher"
+        )
+        self._closed = False
+        self._prefetch_lock = threading.Lock()
+        self._prefetched = False
+
+    def prefetch_once(self) -> None:
+        """prefetch the endpoints on the first call, the next calls wait for it (without blocking other projects)"""
+        with self._prefetch_lock:
+            if not self._prefetched:
+                self.prefetch()
+                self._prefetched = True
+
+    def close(self) -> None:
+        """stop refreshing the records (the cached records keep serving)"""
+        with self._lock:
+            self._closed = True
+        self._refresher.shutdown(wait=False, cancel_futures=True)
+
+    def prefetch(self) -> None:
+        try:
+            endpoints = (
+                mlrun.db.get_run_db()
+                .list_model_endpoints(project=self._project)
+                .endpoints
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to prefetch the model endpoints, they will be fetched on their first event",
+                project=self._project,
+                exc=err_to_str(exc),
+            )
+            return
+        fetch_time = time.monotonic()
+        with self._lock:
+            for endpoint in endpoints:
+                self._set(endpoint.metadata.uid, endpoint.flat_dict(), fetch_time)
+        logger.info(
+            "Prefetched the model endpoints",
+            project=self._project,
+            endpoints=len(endpoints),
+        )
+
+    def get(self, endpoint_id: str, endpoint_name: str) -> dict[str, typing.Any]:
+        """get the endpoint record, it is fetched synchronously only if it is not cached"""
+        with self._lock:
+            cached = self._records.get(endpoint_id)
+            if cached is not None:
+                self._records.move_to_end(endpoint_id)
+                record, fetch_time = cached
+                if (
+                    time.monotonic() - fetch_time >= self._ttl
+                    and endpoint_id not in self._refreshing
+                    and not self._closed
+                ):
+                    self._refreshing.add(endpoint_id)
+                    self._refresher.submit(self._refresh, endpoint_id, endpoint_name)
+                return record
+
+        record = self._fetch(endpoint_id, endpoint_name)
+        with self._lock:
+            self._set(endpoint_id, record, time.monotonic())
+        return record
+
+    def update(self, endpoint_id: str, attributes: dict[str, typing.Any]) -> None:
+        with self._lock:
+            cached = self._records.get(endpoint_id)
+            if cached is not None:
+                cached[0].update(attributes)
+
+    def invalidate(self, endpoint_id: str) -> None:
+        with self._lock:
+            self._records.pop(endpoint_id, None)
+
+    def _fetch(self, endpoint_id: str, endpoint_name: str) -> dict[str, typing.Any]:
+        return (
+            mlrun.db.get_run_db()
+            .get_model_endpoint(
+                project=self._project,
+                endpoint_id=endpoint_id,
+                name=endpoint_name,
+            )
+            .flat_dict()
+        )
+
+    def _refresh(self, endpoint_id: str, endpoint_name: str) -> None:
+        try:
+            record = self._fetch(endpoint_id, endpoint_name)
+            with self._lock:
+                # refresh only endpoints that are still cached
+                if endpoint_id in self._records:
+                    self._records[endpoint_id] = (record, time.monotonic())
+        except Exception as exc:
+            logger.warning(
+                "Failed to refresh the model endpoint record",
+                endpoint_id=endpoint_id,
+                exc=err_to_str(exc),
+            )
+        finally:
+            with self._lock:
+                self._refreshing.discard(endpoint_id)
+
+    def _set(self, endpoint_id: str, record: dict, fetch_time: float) -> None:
+        self._records[endpoint_id] = (record, fetch_time)
+        self._records.move_to_end(endpoint_id)
+        while len(self._records) > self._max_size:
+            self._records.popitem(last=False)
+
+
+_endpoints_metadata_caches: dict[str, EndpointsMetadataCache] = {}
+_endpoints_metadata_caches_lock = threading.Lock()
+
+
+def get_endpoints_metadata_cache(project: str) -> EndpointsMetadataCache:
+    """get the (prefetched) endpoints metadata cache of the project, shared by the stream steps of the process"""
+    with _endpoints_metadata_caches_lock:
+        cache = _endpoints_metadata_caches.get(project)
+        if cache is None:
+            cache_config = mlrun.mlconf.model_endpoint_monitoring.stream_endpoints_cache
+            cache = _endpoints_metadata_caches[project] = EndpointsMetadataCache(
+                project=project,
+                max_size=int(cache_config.max_size),
+                ttl=float(cache_config.ttl),
+            )
+    # the prefetch (a DB call) doesn't hold the global lock, so it doesn't block the steps of other projects
+    cache.prefetch_once()
+    return cache
+
+
+def close_endpoints_metadata_caches() -> None:
+    """close and drop the endpoints metadata caches of the process, called when the stream graph is terminated"""
+    with _endpoints_metadata_caches_lock:
+        caches = list(_endpoints_metadata_caches.values())
+        _endpoints_metadata_caches.clear()
+    for cache in caches:
+        cache.close()
+
+
 class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
     def __init__(
         self,
@@ -375,6 +629,12 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         # Set of endpoints in the current events
         self.endpoints: set[str] = set()
 
+        self._endpoints_cache = get_endpoints_metadata_cache(project)
+
+    def terminate(self) -> None:
+        """close the endpoints metadata caches (and their refreshers) when the stream graph is terminated"""
+        close_endpoints_metadata_caches()
+
     def do(self, full_event):
         event = full_event.body
         if event.get(ControllerEvent.KIND, "") == ControllerEventKind.NOP_EVENT:
@@ -525,14 +785,8 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         # left them
         if endpoint_id not in self.endpoints:
             logger.info("Trying to resume state", endpoint_id=endpoint_id)
-            endpoint_record = (
-                mlrun.db.get_run_db()
-                .get_model_endpoint(
-                    project=self.project,
-                    endpoint_id=endpoint_id,
-                    name=endpoint_name,
-                )
-                .flat_dict()
+            endpoint_record = self._endpoints_cache.get(
+                endpoint_id=endpoint_id, endpoint_name=endpoint_name
             )
 
             # If model endpoint found, get first_request & last_request values
@@ -575,6 +829,14 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         return effective_sample_count, estimated_prediction_count
 
 
+def _coerce_feature_values(feature_values: list) -> None:
+    """Convert the int feature values to floats, in place"""
+    for index in range(len(feature_values)):
+        feature_value = feature_values[index]
+        if isinstance(feature_value, int):
+            feature_values[index] = float(feature_value)
+
+
 def is_not_none(field: typing.Any, dict_path: list[str]):
     if field is not None:
         return True
@@ -611,13 +873,22 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
         self.project = project
 
         # Dictionaries that will be used in case features names
-        # and labels columns were not found in the current event
-        self.feature_names = {}
-        self.label_columns = {}
-        self.first_request = {}
+        # and labels columns were not found in the current event, bounded as the endpoints cache (evicted endpoints
+        # are resolved again from their cached record)
+        self._endpoints_cache = get_endpoints_metadata_cache(project)
+        max_endpoints = int(
+            mlrun.mlconf.model_endpoint_monitoring.stream_endpoints_cache.max_size
+        )
+        self.feature_names = _BoundedDict(max_endpoints)
+        self.label_columns = _BoundedDict(max_endpoints)
+        self.first_request = _BoundedDict(max_endpoints)
 
         # Dictionary to manage the model endpoint types - important for the V3IO TSDB
-        self.endpoint_type = {}
+        self.endpoint_type = _BoundedDict(max_endpoints)
+
+    def terminate(self) -> None:
+        """close the endpoints metadata caches (and their refreshers) when the stream graph is terminated"""
+        close_endpoints_metadata_caches()
 
     def _infer_feature_names_from_data(self, event):
         for endpoint_id in self.feature_names:
@@ -642,25 +913,50 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
         endpoint_id = event[EventFieldType.ENDPOINT_ID]
 
         feature_values = event[EventFieldType.FEATURES]
-        label_values = event[EventFieldType.PREDICTION]
+        _coerce_feature_values(feature_values)
 
-        for index in range(len(feature_values)):
-            feature_value = feature_values[index]
-            if isinstance(feature_value, int):
-                feature_values[index] = float(feature_value)
+        self._resolve_endpoint(event)
+
+        # Add feature_name:value pairs along with a mapping dictionary of all of these pairs
+        feature_names = self.feature_names[endpoint_id]
+        self._map_dictionary_values(
+            event=event,
+            named_iters=feature_names,
+            values_iters=feature_values,
+            mapping_dictionary=EventFieldType.NAMED_FEATURES,
+        )
+
+        # Add label_name:value pairs along with a mapping dictionary of all of these pairs
+        label_names = self.label_columns[endpoint_id]
+        self._map_dictionary_values(
+            event=event,
+            named_iters=label_names,
+            values_iters=event[EventFieldType.PREDICTION],
+            mapping_dictionary=EventFieldType.NAMED_PREDICTIONS,
+        )
+
+        # Add endpoint type to the event
+        event[EventFieldType.ENDPOINT_TYPE] = self.endpoint_type[endpoint_id]
+
+        logger.info("Mapped event", event=event)
+        return event
+
+    def _resolve_endpoint(self, event: dict) -> None:
+        """
+        Resolve the feature names, label columns and endpoint type of the event's endpoint (once per endpoint in the
+        current process), and update the endpoint record with generated names and the first request time.
+        """
+        endpoint_id = event[EventFieldType.ENDPOINT_ID]
+        feature_values = event[EventFieldType.FEATURES]
+        label_values = event[EventFieldType.PREDICTION]
 
         attributes_to_update = {}
         endpoint_record = None
         # Get feature names and label columns
         if endpoint_id not in self.feature_names:
-            endpoint_record = (
-                mlrun.db.get_run_db()
-                .get_model_endpoint(
-                    project=self.project,
-                    endpoint_id=endpoint_id,
-                    name=event[EventFieldType.ENDPOINT_NAME],
-                )
-                .flat_dict()
+            endpoint_record = self._endpoints_cache.get(
+                endpoint_id=endpoint_id,
+                endpoint_name=event[EventFieldType.ENDPOINT_NAME],
             )
             feature_names = endpoint_record.get(EventFieldType.FEATURE_NAMES)
 
@@ -726,14 +1022,9 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
 
         # Update the first request time in the endpoint record
         if endpoint_id not in self.first_request:
-            endpoint_record = endpoint_record or (
-                mlrun.db.get_run_db()
-                .get_model_endpoint(
-                    project=self.project,
-                    endpoint_id=endpoint_id,
-                    name=event[EventFieldType.ENDPOINT_NAME],
-                )
-                .flat_dict()
+            endpoint_record = endpoint_record or self._endpoints_cache.get(
+                endpoint_id=endpoint_id,
+                endpoint_name=event[EventFieldType.ENDPOINT_NAME],
             )
             if not endpoint_record.get(EventFieldType.FIRST_REQUEST):
                 attributes_to_update[EventFieldType.FIRST_REQUEST] = (
@@ -755,30 +1046,7 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
                 attributes=attributes_to_update,
                 endpoint_name=event[EventFieldType.ENDPOINT_NAME],
             )
-
-        # Add feature_name:value pairs along with a mapping dictionary of all of these pairs
-        feature_names = self.feature_names[endpoint_id]
-        self._map_dictionary_values(
-            event=event,
-            named_iters=feature_names,
-            values_iters=feature_values,
-            mapping_dictionary=EventFieldType.NAMED_FEATURES,
-        )
-
-        # Add label_name:value pairs along with a mapping dictionary of all of these pairs
-        label_names = self.label_columns[endpoint_id]
-        self._map_dictionary_values(
-            event=event,
-            named_iters=label_names,
-            values_iters=label_values,
-            mapping_dictionary=EventFieldType.NAMED_PREDICTIONS,
-        )
-
-        # Add endpoint type to the event
-        event[EventFieldType.ENDPOINT_TYPE] = self.endpoint_type[endpoint_id]
-
-        logger.info("Mapped event", event=event)
-        return event
+            self._endpoints_cache.update(endpoint_id, attributes_to_update)
 
     @staticmethod
     def _map_dictionary_values(
@@ -806,6 +1074,108 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
             event[mapping_dictionary][name] = value
 
 
+class MapFeatureNamesBatch(MapFeatureNames):
+    def __init__(
+        self,
+        project: str,
+        infer_columns_from_data: bool = False,
+        **kwargs,
+    ):
+        """
+        Batched variant of MapFeatureNames, which gets a batch of events of a single endpoint (as emitted by
+        storey.Batch keyed by the endpoint id) as a full event. The endpoint is resolved once per batch, the feature
+        values of the batch are converted to floats at once as a single numeric matrix, and each event gets one
+        name-value dictionary for its features and one for its predictions.
+
+        :param project:                 Project name.
+        :param infer_columns_from_data: See MapFeatureNames.
+
+        :returns: A Storey event whose body is the list of the mapped events, keyed by the endpoint id so the events
+                  keep their key once they are flattened.
+        """
+        super().__init__(
+            project=project, infer_columns_from_data=infer_columns_from_data, **kwargs
+        )
+
+    def do(self, event: storey.Event) -> storey.Event:
+        endpoints_events: dict[str, list[dict]] = collections.defaultdict(list)
+        for endpoint_event in event.body:
+            if (
+                endpoint_event.get(ControllerEvent.KIND, "")
+                == ControllerEventKind.NOP_EVENT
+            ):
+                logger.info(
+                    "Skipped nop event inside of MapFeatureNamesBatch",
+                    event=endpoint_event,
+                )
+                continue
+            endpoints_events[endpoint_event[EventFieldType.ENDPOINT_ID]].append(
+                endpoint_event
+            )
+
+        for endpoint_id, endpoint_events in endpoints_events.items():
+            self._map_endpoint_events(endpoint_id, endpoint_events)
+
+        # storey.Batch does not key the batches it emits, nop events included since they are flattened as well
+        endpoint_ids = {
+            endpoint_event.get(EventFieldType.ENDPOINT_ID)
+            for endpoint_event in event.body
+        }
+        if len(endpoint_ids) == 1 and None not in endpoint_ids:
+            (event.key,) = endpoint_ids
+        logger.debug(
+            "Mapped events batch",
+            endpoints=list(endpoints_events),
+            events=len(event.body),
+        )
+        return event
+
+    def _map_endpoint_events(self, endpoint_id: str, events: list[dict]) -> None:
+        features = self._coerce_features_matrix(
+            [event[EventFieldType.FEATURES] for event in events]
+        )
+        for event, feature_values in zip(events, features):
+            event[EventFieldType.FEATURES] = feature_values
+
+        self._resolve_endpoint(events[0])
+        feature_names = self.feature_names[endpoint_id]
+        label_names = self.label_columns[endpoint_id]
+        endpoint_type = self.endpoint_type[endpoint_id]
+
+        for event in events:
+            named_features = dict(zip(feature_names, event[EventFieldType.FEATURES]))
+            event[EventFieldType.NAMED_FEATURES] = named_features
+            event.update(named_features)
+
+            named_predictions = dict(zip(label_names, event[EventFieldType.PREDICTION]))
+            event[EventFieldType.NAMED_PREDICTIONS] = named_predictions
+            event.update(named_predictions)
+
+            event[EventFieldType.ENDPOINT_TYPE] = endpoint_type
+
+    @staticmethod
+    def _coerce_features_matrix(features: list[list]) -> list[list]:
+        """
+        Convert the int feature values of the events to floats. Features of the same length and of numeric (or bool)
+        values are converted at once as a matrix, otherwise (e.g. strings or missing values) the values of each event
+        are converted as in MapFeatureNames.
+        """
+        try:
+            features_matrix = np.asarray(features)
+        except ValueError:
+            # Features of different lengths
+            features_matrix = None
+        if (
+            features_matrix is not None
+            and features_matrix.ndim == 2
+            and features_matrix.dtype.kind in "biuf"
+        ):
+            return features_matrix.astype(float).tolist()
+        for feature_values in features:
+            _coerce_feature_values(feature_values)
+        return features
+
+
 class InferSchema(mlrun.feature_store.steps.MapClass):
     def __init__(
         self,
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import json
+import threading
+import time
 from datetime import datetime, timezone
 from typing import Any, Callable, NewType, Optional
 
@@ -31,6 +33,7 @@ from mlrun.common.schemas.model_monitoring.constants import (
     WriterEvent,
     WriterEventKind,
 )
+from mlrun.model_monitoring.db import TSDBConnector
 from mlrun.model_monitoring.db._stats import (
     ModelMonitoringCurrentStatsFile,
     ModelMonitoringDriftMeasuresFile,
@@ -55,6 +58,172 @@ class _WriterEventTypeError(_WriterEventError, TypeError):
     pass
 
 
+class _TSDBEventsBuffer:
+    """
+    Buffer the applications results and metrics and write them to the TSDB in batches (one batch per event kind).
+    The buffer is flushed once it holds `max_events` events, or by a background thread once its oldest event waited
+    for `timeout_secs` seconds, and on the graph termination. Events which fail to be written are kept in the buffer
+    for the next flush (up to `max_buffered_events` events, the oldest events are dropped past it), and the buffer is
+    not flushed again before `timeout_secs` seconds passed since the failure.
+    """
+
+    def __init__(
+        self,
+        tsdb_connector: TSDBConnector,
+        max_events: int,
+        timeout_secs: float,
+        max_buffered_events: int,
+    ) -> None:
+        self._tsdb_connector = tsdb_connector
+        self._max_events = max_events
+        self._timeout_secs = timeout_secs
+        self._max_buffered_events = max(max_buffered_events, max_events)
+
+        self._lock = threading.Lock()
+        # serializes the flushes, so batches are written in order
+        self._flush_lock = threading.Lock()
+        self._events: dict[WriterEventKind, list[_AppResultEvent]] = {}
+        self._events_count = 0
+        self._first_event_time: Optional[float] = None
+        # no size triggered flushes before this (monotonic) time, after a failed flush
+        self._retry_time = 0.0
+        self._flush_thread: Optional[threading.Thread] = None
+
+    def add(self, event: _AppResultEvent, kind: WriterEventKind) -> None:
+        if self._max_events <= 1:
+            self._tsdb_connector.write_application_event(event=event, kind=kind)
+            return
+
+        with self._lock:
+            self._events.setdefault(kind, []).append(event)
+            self._events_count += 1
+            if self._first_event_time is None:
+                self._first_event_time = time.monotonic()
+            self._drop_excess_events()
+            should_flush = (
+                self._events_count >= self._max_events
+                and time.monotonic() >= self._retry_time
+            )
+
+        if should_flush:
+            try:
+                self.flush()
+            except Exception as exc:
+                # the events are kept in the buffer, and the background thread retries writing them
+                logger.warning(
+                    "Failed to flush the buffered events to the TSDB, retrying later",
+                    exc=mlrun.errors.err_to_str(exc),
+                )
+        self._ensure_flush_thread()
+
+    def flush(self) -> None:
+        """write the buffered events, on failure the unwritten events are put back in the buffer and the error is
+        raised"""
+        with self._flush_lock:
+            with self._lock:
+                events, self._events = self._events, {}
+                self._events_count = 0
+                first_event_time, self._first_event_time = self._first_event_time, None
+            unwritten_kinds = list(events)
+            try:
+                for kind, kind_events in events.items():
+                    self._tsdb_connector.write_application_events(
+                        events=kind_events, kind=kind
+                    )
+                    unwritten_kinds.remove(kind)
+                    logger.debug(
+                        "Flushed events to the TSDB", kind=kind, events=len(kind_events)
+                    )
+            except Exception:
+                self._requeue(
+                    {kind: events[kind] for kind in unwritten_kinds}, first_event_time
+                )
+                self._retry_time = time.monotonic() + self._timeout_secs
+                raise
+            self._retry_time = 0.0
+
+    def close(self) -> None:
+        """flush the buffered events, on the graph termination"""
+        with self._lock:
+            if not self._events_count:
+                return
+        try:
+            self.flush()
+        except Exception as exc:
+            logger.error(
+                "Failed to flush the buffered events to the TSDB on termination, the events are lost",
+                events=self._events_count,
+                exc=mlrun.errors.err_to_str(exc),
+            )
+
+    def _requeue(
+        self,
+        events: dict[WriterEventKind, list[_AppResultEvent]],
+        first_event_time: Optional[float],
+    ) -> None:
+        """put the unwritten events back in the buffer, before the events which were added since they were taken"""
+        with self._lock:
+            for kind, kind_events in self._events.items():
+                events.setdefault(kind, []).extend(kind_events)
+            self._events = events
+            self._events_count = sum(
+                len(kind_events) for kind_events in events.values()
+            )
+            if self._first_event_time is not None:
+                first_event_time = min(first_event_time, self._first_event_time)
+            self._first_event_time = first_event_time
+            self._drop_excess_events()
+
+    def _drop_excess_events(self) -> None:
+        """drop the oldest events past `max_buffered_events`, called with the lock held"""
+        excess = self._events_count - self._max_buffered_events
+        if excess <= 0:
+            return
+        for kind in list(self._events):
+            dropped = min(excess, len(self._events[kind]))
+            del self._events[kind][:dropped]
+            if not self._events[kind]:
+                del self._events[kind]
+            excess -= dropped
+            if not excess:
+                break
+        logger.error(
+            "The TSDB events buffer is full, dropping the oldest events",
+            dropped=self._events_count - self._max_buffered_events,
+            max_buffered_events=self._max_buffered_events,
+        )
+        self._events_count = self._max_buffered_events
+
+    def _ensure_flush_thread(self) -> None:
+        if self._flush_thread and self._flush_thread.is_alive():
+            return
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically, name="tsdb-events-flusher", daemon=True
+        )
+        self._flush_thread.start()
+
+    def _flush_periodically(self) -> None:
+        while True:
+            with self._lock:
+                first_event_time = self._first_event_time
+            if first_event_time is None:
+                wait = self._timeout_secs
+            else:
+                wait = first_event_time + self._timeout_secs - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+                continue
+            try:
+                self.flush()
+            except Exception as exc:
+                logger.error(
+                    "Failed to flush the buffered events to the TSDB",
+                    exc=mlrun.errors.err_to_str(exc),
+                )
+                # the events were put back in the buffer, retry after the timeout
+                time.sleep(self._timeout_secs)
+
+
 class ModelMonitoringWriter(StepToDict):
     """
     Write monitoring application results to the target databases
@@ -74,6 +243,12 @@ class ModelMonitoringWriter(StepToDict):
             project=self.project, secret_provider=secret_provider
         )
         self._endpoints_records = {}
+        self._tsdb_events_buffer = _TSDBEventsBuffer(
+            tsdb_connector=self._tsdb_connector,
+            max_events=mlrun.mlconf.model_endpoint_monitoring.writer_batching_max_events,
+            timeout_secs=mlrun.mlconf.model_endpoint_monitoring.writer_batching_timeout_secs,
+            max_buffered_events=mlrun.mlconf.model_endpoint_monitoring.writer_batching_max_buffered_events,
+        )
 
     def _generate_event_on_drift(
         self,
@@ -185,6 +360,10 @@ class ModelMonitoringWriter(StepToDict):
             stats_kind=stat_kind,
         )
 
+    def terminate(self) -> None:
+        """flush the buffered results and metrics when the graph is terminated"""
+        self._tsdb_events_buffer.close()
+
     def do(self, event: _RawEvent) -> None:
         event, kind = self._reconstruct_event(event)
         logger.info("Starting to write event", event=event)
@@ -196,9 +375,9 @@ class ModelMonitoringWriter(StepToDict):
             self.write_stats(event)
             logger.info("Model monitoring writer finished handling event")
             return
-        self._tsdb_connector.write_application_event(event=event.copy(), kind=kind)
+        self._tsdb_events_buffer.add(event=event.copy(), kind=kind)
 
-        logger.info("Completed event DB writes")
+        logger.info("Added the event to the TSDB writes buffer")
 
         if (
             mlrun.mlconf.alerts.mode == mlrun.common.schemas.alert.AlertsModes.enabled
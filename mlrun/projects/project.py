@@ -4802,6 +4802,9 @@ class MlrunProject(ModelObj):
         mlrun.db.get_run_db(secrets=self._secrets).store_datastore_profile(
             profile, self.name
         )
+        mlrun.datastore.datastore_profile.invalidate_datastore_profile_cache(
+            profile.name, self.name
+        )
 
     def get_config_profile_attributes(self, name: str) -> dict:
         """
@@ -4826,6 +4829,9 @@ class MlrunProject(ModelObj):
         mlrun.db.get_run_db(secrets=self._secrets).delete_datastore_profile(
             profile, self.name
         )
+        mlrun.datastore.datastore_profile.invalidate_datastore_profile_cache(
+            profile, self.name
+        )
 
     def get_datastore_profile(self, profile: str) -> DatastoreProfile:
         return mlrun.db.get_run_db(secrets=self._secrets).get_datastore_profile(
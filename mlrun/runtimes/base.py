@@ -30,7 +30,6 @@ import mlrun.common.runtimes
 import mlrun.common.schemas
 import mlrun.common.schemas.model_monitoring.constants as mm_constants
 import mlrun.errors
-import mlrun.launcher.factory
 import mlrun.utils.helpers
 import mlrun.utils.notifications
 import mlrun.utils.regex
@@ -398,6 +397,9 @@ class BaseRuntime(ModelObj):
                              conjunction with the local=True argument.
         :return: Run context object (RunObject) with run metadata, results and status
         """
+        # imported here since the launchers import mlrun.run, which imports the runtimes
+        import mlrun.launcher.factory
+
         launcher = mlrun.launcher.factory.LauncherFactory().create_launcher(
             self._is_remote, local=local, **launcher_kwargs
         )
@@ -873,6 +875,8 @@ class BaseRuntime(ModelObj):
         but because we allow the user to set 'spec.image' for usability purposes,
         we need to check whether this is a built image or it requires to be built on top.
         """
+        import mlrun.launcher.factory
+
         launcher = mlrun.launcher.factory.LauncherFactory().create_launcher(
             is_remote=self._is_remote
         )
@@ -907,6 +911,8 @@ class BaseRuntime(ModelObj):
         return self
 
     def save(self, tag="", versioned=False, refresh=False) -> str:
+        import mlrun.launcher.factory
+
         launcher = mlrun.launcher.factory.LauncherFactory().create_launcher(
             is_remote=self._is_remote
         )
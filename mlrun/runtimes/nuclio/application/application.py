@@ -19,7 +19,6 @@ import nuclio.auth
 
 import mlrun.common.schemas as schemas
 import mlrun.errors
-import mlrun.run
 from mlrun.common.runtimes.constants import NuclioIngressAddTemplatedIngressModes
 from mlrun.runtimes import RemoteRuntime
 from mlrun.runtimes.nuclio import min_nuclio_versions
@@ -598,6 +597,9 @@ class ApplicationRuntime(RemoteRuntime):
 
         :param use_cache:   Use the cache when building the image
         """
+        # imported here since mlrun.run imports the runtimes
+        import mlrun.run
+
         # create a function that includes only the reverse proxy, without the application
 
         reverse_proxy_func = mlrun.run.new_function(
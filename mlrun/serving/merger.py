@@ -13,10 +13,12 @@
 # limitations under the License.
 #
 
-from typing import Optional
+from typing import Callable, Optional, Union
 
 import storey
 
+import mlrun.utils
+
 
 class CacheEntry:
     def __init__(self, sequence, event):
@@ -36,6 +38,19 @@ class CacheEntry:
         self.events.append(event)
 
 
+def _update_bodies(bodies: list[dict]) -> dict:
+    merged = {}
+    for body in bodies:
+        merged.update(body)
+    return merged
+
+
+_combine_functions = {
+    "list": list,
+    "update": _update_bodies,
+}
+
+
 class Merge(storey.Flow):
     def __init__(
         self,
@@ -43,23 +58,39 @@ class Merge(storey.Flow):
         key_path: Optional[str] = None,
         max_behind: Optional[int] = None,
         expected_num_events: Optional[int] = None,
+        combine: Optional[Union[str, Callable[[list], object]]] = None,
+        timeout: Optional[float] = None,
+        branch_timeouts: Optional[dict[str, float]] = None,
         **kwargs,
     ):
         """Merge multiple events based on event id or provided key path
 
         Users can subclass and overwrite the `get_join_key()` and `merge_function()` with custom logic
 
+        In the sync engine the merge step joins the branches of the flow: the branches run in parallel and the merge
+        step gets their results (ordered as its `after` steps) once all of them complete.
+
         :param key_path:   path to the event join key e.g. 'event["doc_id"]', default is the unique event id
         :param max_behind: max queue size to hold unmerged events,
                            oldest events will be dropped is queued longer (default=64)
         :param expected_num_events:  manually set the expected number of events per key
                                      (keep blank to auto detect from the graph)
+        :param combine:    how to combine the bodies of the merged events: "list" (default) for a list of the bodies,
+                           "update" to merge the (dict) bodies into one dict, or a function (or function path) which
+                           gets the list of bodies and returns the merged body
+        :param timeout:    sync engine only, max seconds to wait for each branch (default is no timeout), the first
+                           branch runs on the calling thread so its timeout is checked only when it completes
+        :param branch_timeouts: sync engine only, max seconds to wait per branch, by the name of the branch last step
+                                (the steps this step is after), overrides `timeout`
         :param full_event: this step accepts the full Event object (body + metadata), not just body
         :param kwargs:     reserved for system use
         """
         self.key_path = key_path
         self.max_behind = max_behind
         self.expected_num_events = expected_num_events
+        self.combine = combine
+        self.timeout = timeout
+        self.branch_timeouts = branch_timeouts
 
         # use event.id (require full event) by default
         if full_event is None and not key_path:
@@ -73,6 +104,12 @@ class Merge(storey.Flow):
         self._get_join_key = None
         self._queue_len = max_behind or 64  # default queue is 64 entries
         self._keys_queue = []
+        if combine is None or callable(combine):
+            self._combine = combine or list
+        else:
+            self._combine = _combine_functions.get(combine) or mlrun.utils.get_function(
+                combine, []
+            )
 
     def post_init(self, mode="sync", **kwargs):
         # auto detect number of uplinks or use user specified value
@@ -152,7 +189,11 @@ class Merge(storey.Flow):
         :return: event
         """
         if self._full_event:
-            last_event.body = [event.body for event in events]
+            last_event.body = self._combine([event.body for event in events])
             return last_event
         else:
-            return events
+            return self._combine(events)
+
+    def get_branch_timeout(self, branch: str) -> Optional[float]:
+        """max seconds to wait for the given branch (by its last step name) in the sync engine"""
+        return (self.branch_timeouts or {}).get(branch, self.timeout)
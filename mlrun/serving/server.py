@@ -42,6 +42,7 @@ from ..errors import MLRunInvalidArgumentError
 from ..model import ModelObj
 from ..utils import get_caller_globals
 from .states import RootFlowStep, RouterStep, get_function, graph_root_setter
+from .stats import GraphStats, stats_path
 from .utils import event_id_key, event_path_key
 
 DUMMY_STREAM = "dummy://"
@@ -193,6 +194,11 @@ class GraphServer(ModelObj):
         )
         context.get_table = self.resource_cache.get_table
         context.verbose = self.verbose
+        if config.serving.stats.enabled:
+            context.stats = GraphStats(
+                trace_sample_rate=float(config.serving.stats.trace_sample_rate),
+                max_traces=int(config.serving.stats.max_traces),
+            )
         self.context = context
 
         if self.graph_initializer:
@@ -266,6 +272,13 @@ class GraphServer(ModelObj):
     def run(self, event, context=None, get_body=False, extra_args=None):
         server_context = self.context
         context = context or server_context
+        stats = server_context.stats
+        if stats is not None:
+            if event.path == stats_path:
+                return self._process_response(
+                    context, MockEvent(body=stats.to_dict()), get_body
+                )
+            stats_start = stats.start_event(event)
         event.content_type = event.content_type or self.default_content_type or ""
         if event.headers:
             if event_id_key in event.headers:
@@ -302,12 +315,24 @@ class GraphServer(ModelObj):
             )
 
         if asyncio.iscoroutine(response):
-            return self._process_async_response(context, response, get_body)
-        else:
-            return self._process_response(context, response, get_body)
+            return self._process_async_response(
+                context,
+                response,
+                get_body,
+                event,
+                stats_start if stats is not None else None,
+            )
+        if stats is not None:
+            stats.end_event(event, stats_start)
+        return self._process_response(context, response, get_body)
 
-    async def _process_async_response(self, context, response, get_body):
-        return self._process_response(context, await response, get_body)
+    async def _process_async_response(
+        self, context, response, get_body, event=None, stats_start=None
+    ):
+        response = await response
+        if stats_start is not None:
+            self.context.stats.end_event(event, stats_start)
+        return self._process_response(context, response, get_body)
 
     def _process_response(self, context, response, get_body):
         body = response.body
@@ -525,6 +550,7 @@ class GraphContext:
         self.verbose = False
         self.stream = None
         self.root = None
+        self.stats: Optional[GraphStats] = None
 
         if nuclio_context:
             self.logger: NuclioLogger = nuclio_context.logger
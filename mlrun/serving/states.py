@@ -20,8 +20,12 @@ __all__ = [
     "MonitoringApplicationStep",
 ]
 
+import asyncio
+import concurrent.futures
 import os
 import pathlib
+import threading
+import time
 import traceback
 from copy import copy, deepcopy
 from inspect import getfullargspec, signature
@@ -39,10 +43,11 @@ from ..datastore.utils import (
     get_kafka_brokers_from_dict,
     parse_kafka_url,
 )
-from ..errors import MLRunInvalidArgumentError, err_to_str
+from ..errors import MLRunInvalidArgumentError, MLRunTimeoutError, err_to_str
 from ..model import ModelObj, ObjectDict
 from ..platforms.iguazio import parse_path
 from ..utils import get_class, get_function, is_explicit_ack_supported
+from .merger import Merge
 from .utils import StepToDict, _extract_input_data, _update_result_body
 
 callable_prefix = "_"
@@ -52,6 +57,33 @@ queue_class_names = [">>", "$queue"]
 
 MAX_MODELS_PER_ROUTER = 5000
 
+# thread pool which runs the branches of sync flows, shared by all the flows of the process
+_sync_flow_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_sync_flow_executor_lock = threading.Lock()
+# marks the threads of the sync flow executor, which must never wait for other tasks of the executor
+_sync_flow_thread = threading.local()
+
+
+def _mark_sync_flow_worker():
+    _sync_flow_thread.is_worker = True
+
+
+def _is_sync_flow_worker() -> bool:
+    return getattr(_sync_flow_thread, "is_worker", False)
+
+
+def _get_sync_flow_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _sync_flow_executor
+    if _sync_flow_executor is None:
+        with _sync_flow_executor_lock:
+            if _sync_flow_executor is None:
+                _sync_flow_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=int(config.serving.sync_flow_max_workers),
+                    thread_name_prefix="sync-flow",
+                    initializer=_mark_sync_flow_worker,
+                )
+    return _sync_flow_executor
+
 
 class GraphError(Exception):
     """error in graph topology or configuration"""
@@ -276,6 +308,11 @@ class BaseStep(ModelObj):
     def _post_init(self, mode="sync"):
         pass
 
+    def _terminate_objects(self):
+        """call the terminate hook of the child steps classes, once the flow is terminated"""
+        for step in self.get_children():
+            step._terminate_objects()
+
     def _set_error_handler(self):
         """init/link the error handler for this step"""
         if self.on_error:
@@ -600,6 +637,11 @@ class TaskStep(BaseStep):
             if hasattr(self._object, "name"):
                 self.endpoint_name = self._object.name
 
+    def _terminate_objects(self):
+        super()._terminate_objects()
+        if self._object and hasattr(self._object, "terminate"):
+            self._object.terminate()
+
     def respond(self):
         """mark this step as the responder.
 
@@ -610,6 +652,12 @@ class TaskStep(BaseStep):
 
     def run(self, event, *args, **kwargs):
         """run this step, in async flows the run is done through storey"""
+        stats = getattr(self.context, "stats", None)
+        if stats is not None:
+            return stats.run_step(self.fullname, self._run, event, *args, **kwargs)
+        return self._run(event, *args, **kwargs)
+
+    def _run(self, event, *args, **kwargs):
         if not self._is_local_function(self.context):
             # todo invoke remote via REST call
             return event
@@ -1117,6 +1165,7 @@ class FlowStep(BaseStep):
         self._wait_for_result = False
         self._source = None
         self._start_steps = []
+        self._sync_joins = {}
 
     def get_children(self):
         return self._steps.values()
@@ -1275,6 +1324,13 @@ class FlowStep(BaseStep):
         for step in self._steps.values():
             step.set_parent(self)
             step.init_object(context, namespace, mode, reset=reset)
+        for join, _ in self._sync_joins.values():
+            if self[join]._is_local_function(context) and not isinstance(
+                self[join].async_object, Merge
+            ):
+                raise GraphError(
+                    f"sync engine can only join branches with a Merge step, step={join}"
+                )
         self._set_error_handler()
         self._post_init(mode)
 
@@ -1374,6 +1430,11 @@ class FlowStep(BaseStep):
             raise GraphError(
                 "sync engine can only have one starting step (without .after)"
             )
+        self._sync_joins = {}
+        if self.engine == "sync":
+            for step in self._steps.values():
+                if step.next and len(step.next) > 1:
+                    self._sync_joins[step.name] = self._get_branches_join(step)
 
         default_final_step = None
         if self.final_step:
@@ -1395,6 +1456,41 @@ class FlowStep(BaseStep):
 
         return self._start_steps, default_final_step, responders
 
+    def _get_join_after(self, step) -> list[str]:
+        """the previous steps of the step, without the error handlers that continue to it"""
+        return [name for name in step.after if self[name].kind != StepKinds.error_step]
+
+    def _get_branches_join(self, fork_step) -> tuple[str, list[str]]:
+        """return the merge step which joins the branches of the step (sync engine), and the last step of each
+        branch (the step itself for a branch which goes directly to the merge step)"""
+        branches = []
+        for name in fork_step.next:
+            if len(self._get_join_after(self[name])) > 1:
+                branches.append((name, fork_step.name))
+            else:
+                branches.append(self._get_branch_join(self[name]))
+        joins = {join for join, _ in branches}
+        if len(joins) != 1 or None in joins:
+            raise GraphError(
+                f"sync engine branches must be joined by a single Merge step, step={fork_step.name}"
+            )
+        return joins.pop(), [last_step for _, last_step in branches]
+
+    def _get_branch_join(self, step) -> tuple[Optional[str], str]:
+        """follow a branch to the merge step which joins it, return the merge step and the branch last step"""
+        while True:
+            next_steps = step.next or []
+            while len(next_steps) > 1:
+                # nested branches, the branch continues after their merge step
+                step = self[self._get_branches_join(step)[0]]
+                next_steps = step.next or []
+            if not next_steps:
+                return None, step.name
+            next_step = self[next_steps[0]]
+            if len(self._get_join_after(next_step)) > 1:
+                return next_step.name, step.name
+            step = next_step
+
     def set_flow_source(self, source):
         """set the async flow (storey) source"""
         self._source = source
@@ -1513,18 +1609,15 @@ class FlowStep(BaseStep):
 
         if len(self._start_steps) == 0:
             return event
-        next_obj = self._start_steps[0]
-        while next_obj:
+        return self._run_sync_steps(self._start_steps[0], event, args, kwargs)
+
+    def _run_sync_steps(self, next_obj, event, args, kwargs, until=None):
+        """run the steps from next_obj (sync engine) until the end of the flow or until the `until` step"""
+        while next_obj and next_obj.name != until:
             try:
                 event = next_obj.run(event, *args, **kwargs)
             except Exception as exc:
-                if self._on_error_handler:
-                    self._log_error(event, exc, failed_step=next_obj.name)
-                    event.body = self._call_error_handler(event, exc)
-                    event.terminated = True
-                    return event
-                else:
-                    raise exc
+                return self._handle_sync_error(event, exc, next_obj.name)
 
             if hasattr(event, "terminated") and event.terminated:
                 return event
@@ -1535,21 +1628,142 @@ class FlowStep(BaseStep):
             ):
                 next_obj = self._steps[next_obj.on_error]
             next = next_obj.next
-            if next and len(next) > 1:
-                raise GraphError(
-                    f"synchronous flow engine doesnt support branches use async, step={next_obj.name}"
-                )
+            while next and len(next) > 1:
+                if next_obj.name not in self._sync_joins:
+                    raise GraphError(
+                        f"synchronous flow engine doesnt support branches use async, step={next_obj.name}"
+                    )
+                join = self._sync_joins[next_obj.name][0]
+                try:
+                    event = self._run_sync_branches(next_obj, event, args, kwargs)
+                except Exception as exc:
+                    return self._handle_sync_error(event, exc, join)
+                if hasattr(event, "terminated") and event.terminated:
+                    return event
+                next_obj = self[join]
+                next = next_obj.next
             next_obj = self[next[0]] if next else None
         return event
 
+    def _run_sync_branch(self, step, event, args, kwargs, join, submitted):
+        stats = getattr(self.context, "stats", None)
+        if stats is not None:
+            # the time the branch waited for a free worker of the sync flow executor
+            stats.record_queue_wait(
+                step.fullname, (time.perf_counter_ns() - submitted) // 1000
+            )
+        return self._run_sync_steps(step, event, args, kwargs, join)
+
+    def _run_sync_branches(self, fork_step, event, args, kwargs):
+        """run the branches of the step in parallel (sync engine) and merge their results with the merge step
+
+        the first branch runs on the calling thread and the others on the sync flow executor. a branch which already
+        runs on the executor runs its nested branches on its own thread one after the other, since waiting for other
+        tasks of the executor while holding one of its workers can deadlock the executor
+        """
+        join, branches = self._sync_joins[fork_step.name]
+        merge: Merge = self[join].async_object
+        start = time.monotonic()
+        # every branch (except the first) gets its own copy of the event, as in the async engine, the copies are
+        # made before the branches start so the first branch can't change them
+        branch_events = [event]
+        for _ in fork_step.next[1:]:
+            branch_event = copy(event)
+            branch_event.body = deepcopy(event.body)
+            branch_events.append(branch_event)
+        runs = list(zip(branches, fork_step.next, branch_events))
+
+        futures = {}
+        if not _is_sync_flow_worker():
+            executor = _get_sync_flow_executor()
+            for branch, name, branch_event in runs[1:]:
+                futures[branch] = executor.submit(
+                    self._run_sync_branch,
+                    self[name],
+                    branch_event,
+                    args,
+                    kwargs,
+                    join,
+                    time.perf_counter_ns(),
+                )
+
+        branch_events = {}
+        try:
+            for branch, name, branch_event in runs:
+                timeout = merge.get_branch_timeout(branch)
+                if branch in futures:
+                    if timeout is not None:
+                        timeout = max(start + timeout - time.monotonic(), 0)
+                    try:
+                        branch_event = futures[branch].result(timeout=timeout)
+                    except concurrent.futures.TimeoutError:
+                        self._raise_sync_branch_timeout(merge, branch, join)
+                else:
+                    # a branch on the current thread can't be interrupted, its timeout is checked when it completes
+                    branch_event = self._run_sync_branch(
+                        self[name],
+                        branch_event,
+                        args,
+                        kwargs,
+                        join,
+                        time.perf_counter_ns(),
+                    )
+                    if timeout is not None and time.monotonic() - start > timeout:
+                        self._raise_sync_branch_timeout(merge, branch, join)
+                if hasattr(branch_event, "terminated") and branch_event.terminated:
+                    return branch_event
+                branch_events[branch] = branch_event
+        finally:
+            # don't start the branches whose results are no longer needed (running branches can't be stopped, and
+            # release their worker when they complete)
+            for future in futures.values():
+                future.cancel()
+
+        events = [
+            branch_events[name]
+            for name in self._get_join_after(self[join])
+            if name in branch_events
+        ]
+        if merge._full_event:
+            return merge.merge_function(events[-1], events)
+        merged_event = events[-1]
+        merged_event.body = merge.merge_function(
+            merged_event.body, [event.body for event in events]
+        )
+        return merged_event
+
+    @staticmethod
+    def _raise_sync_branch_timeout(merge: Merge, branch: str, join: str):
+        raise MLRunTimeoutError(
+            f"branch {branch} of step {join} did not complete within "
+            f"{merge.get_branch_timeout(branch)} seconds"
+        )
+
+    def _handle_sync_error(self, event, exc, failed_step):
+        if self._on_error_handler:
+            self._log_error(event, exc, failed_step=failed_step)
+            event.body = self._call_error_handler(event, exc)
+            event.terminated = True
+            return event
+        raise exc
+
     def wait_for_completion(self):
-        """wait for completion of run in async flows"""
+        """wait for completion of run in async flows, then call the terminate hook of the steps classes"""
 
         if self._controller:
             if hasattr(self._controller, "terminate"):
-                return self._controller.terminate(wait=True)
+                termination = self._controller.terminate(wait=True)
             else:
-                return self._controller.await_termination()
+                termination = self._controller.await_termination()
+            if asyncio.iscoroutine(termination):
+                return self._terminate_objects_after(termination)
+            self._terminate_objects()
+            return termination
+
+    async def _terminate_objects_after(self, termination):
+        result = await termination
+        self._terminate_objects()
+        return result
 
     def plot(self, filename=None, format=None, source=None, targets=None, **kw):
         """plot/save graph using graphviz
@@ -1907,9 +2121,17 @@ def _init_async_objects(context, steps):
                     step._async_object = storey.Map(lambda x: x)
 
             elif not step.async_object or not hasattr(step.async_object, "_outlets"):
+                handler = step._handler
+                stats = getattr(context, "stats", None)
+                if (
+                    stats is not None
+                    and handler is not None
+                    and not asyncio.iscoroutinefunction(handler)
+                ):
+                    handler = stats.wrap_handler(step.fullname, handler)
                 # if regular class, wrap with storey Map
                 step._async_object = storey.Map(
-                    step._handler,
+                    handler,
                     full_event=step.full_event or step._call_with_event,
                     input_path=step.input_path,
                     result_path=step.result_path,
@@ -0,0 +1,204 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import random
+import threading
+import time
+from typing import Any, Callable
+
+stats_path = "/__stats__"
+
+# number of sub buckets bits per power of 2, the histogram values are recorded with a relative error of up to 2^-5
+_sub_bucket_bits = 6
+_percentiles = [50, 90, 99]
+
+
+def _bucket_index(value: int) -> int:
+    shift = value.bit_length() - _sub_bucket_bits
+    if shift <= 0:
+        return value
+    return (shift << _sub_bucket_bits) + (value >> shift)
+
+
+def _bucket_value(index: int) -> int:
+    """the lowest value of the bucket"""
+    shift = index >> _sub_bucket_bits
+    if not shift:
+        return index
+    return (index - (shift << _sub_bucket_bits)) << shift
+
+
+class LatencyHistogram:
+    """
+    HDR style histogram of latencies (in microseconds), values are counted in logarithmic buckets which are linearly
+    divided to sub buckets, so recording is O(1) and the percentiles are accurate up to ~3%
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+        self._buckets: dict[int, int] = collections.defaultdict(int)
+
+    def record(self, value: int):
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self._buckets[_bucket_index(value)] += 1
+
+    def percentile(self, percentile: float) -> int:
+        if not self.count:
+            return 0
+        threshold = self.count * percentile / 100
+        counted = 0
+        for index in sorted(self._buckets):
+            counted += self._buckets[index]
+            if counted >= threshold:
+                return min(max(_bucket_value(index), self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        result = {
+            "count": self.count,
+            "mean_us": round(self.total / self.count, 1) if self.count else 0,
+            "min_us": self.min or 0,
+            "max_us": self.max,
+        }
+        for percentile in _percentiles:
+            result[f"p{percentile}_us"] = self.percentile(percentile)
+        return result
+
+
+class _StepStats:
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.queue_wait = LatencyHistogram()
+        self.errors = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        result = {"latency": self.latency.to_dict(), "errors": self.errors}
+        if self.queue_wait.count:
+            result["queue_wait"] = self.queue_wait.to_dict()
+        return result
+
+
+class GraphStats:
+    """
+    Per step latency histograms and sampled event traces of a serving graph, enabled by mlconf.serving.stats.enabled
+    and available through the server context (context.stats) and the /__stats__ path of the serving function
+    """
+
+    def __init__(self, trace_sample_rate: float = 0.0, max_traces: int = 100):
+        self.trace_sample_rate = trace_sample_rate
+        self._lock = threading.Lock()
+        self._graph = LatencyHistogram()
+        self._steps: dict[str, _StepStats] = collections.defaultdict(_StepStats)
+        self._traces = collections.deque(maxlen=max_traces)
+
+    def run_step(self, name: str, handler: Callable, event, *args, **kwargs):
+        """run the step handler with the event and record its latency (and event trace)"""
+        trace = getattr(event, "_stats_trace", None)
+        start = time.perf_counter_ns()
+        error = False
+        try:
+            return handler(event, *args, **kwargs)
+        except Exception:
+            error = True
+            raise
+        finally:
+            end = time.perf_counter_ns()
+            self.record_step(name, (end - start) // 1000, error)
+            if trace is not None:
+                trace.append(
+                    {
+                        "step": name,
+                        "start_us": (start - trace[0]) // 1000,
+                        "latency_us": (end - start) // 1000,
+                        "error": error,
+                    }
+                )
+
+    def wrap_handler(self, name: str, handler: Callable) -> Callable:
+        """return the (sync) handler which records its latency, for the async (storey) engine steps"""
+
+        def handler_with_stats(*args, **kwargs):
+            start = time.perf_counter_ns()
+            error = False
+            try:
+                return handler(*args, **kwargs)
+            except Exception:
+                error = True
+                raise
+            finally:
+                self.record_step(name, (time.perf_counter_ns() - start) // 1000, error)
+
+        return handler_with_stats
+
+    def record_step(self, name: str, latency: int, error: bool = False):
+        with self._lock:
+            step_stats = self._steps[name]
+            step_stats.latency.record(latency)
+            if error:
+                step_stats.errors += 1
+
+    def record_queue_wait(self, name: str, queue_wait: int):
+        with self._lock:
+            self._steps[name].queue_wait.record(queue_wait)
+
+    def start_event(self, event) -> int:
+        """start recording the event, the event trace is sampled by the trace sample rate"""
+        start = time.perf_counter_ns()
+        if self.trace_sample_rate and random.random() < self.trace_sample_rate:
+            # the trace starts with the event start time, the steps append their records to it
+            event._stats_trace = [start]
+        return start
+
+    def end_event(self, event, start: int):
+        end = time.perf_counter_ns()
+        latency = (end - start) // 1000
+        with self._lock:
+            self._graph.record(latency)
+        trace = getattr(event, "_stats_trace", None)
+        if trace is not None:
+            event._stats_trace = None
+            self._traces.append(
+                {
+                    "id": getattr(event, "id", None),
+                    "path": getattr(event, "path", None),
+                    "latency_us": latency,
+                    "steps": trace[1:],
+                }
+            )
+
+    def reset(self):
+        with self._lock:
+            self._graph = LatencyHistogram()
+            self._steps.clear()
+            self._traces.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "graph": self._graph.to_dict(),
+                "steps": {
+                    name: step_stats.to_dict()
+                    for name, step_stats in self._steps.items()
+                },
+                "traces": list(self._traces),
+            }
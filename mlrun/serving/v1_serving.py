@@ -26,7 +26,6 @@ import nuclio
 import mlrun
 from mlrun.errors import err_to_str
 from mlrun.platforms.iguazio import OutputStream
-from mlrun.runtimes.nuclio.function import RemoteRuntime
 
 serving_handler = "handler"
 
@@ -42,6 +41,9 @@ def new_v1_model_server(
     workers=8,
     canary=None,
 ):
+    # imported here since the runtimes import this module (for the nuclio init hook)
+    from mlrun.runtimes.nuclio.function import RemoteRuntime
+
     f = RemoteRuntime()
     if not image:
         name, spec, code = nuclio.build_file(
@@ -39,11 +39,9 @@ import git
 import inflection
 import numpy as np
 import packaging.version
-import pandas
 import semver
 import yaml
 from dateutil import parser
-from pandas import Timedelta, Timestamp
 from yaml.representer import RepresenterError
 
 import mlrun
@@ -55,11 +53,8 @@ import mlrun.errors
 import mlrun.utils.regex
 import mlrun.utils.version.version
 import mlrun_pipelines.common.constants
-import mlrun_pipelines.models
-import mlrun_pipelines.utils
 from mlrun.common.constants import MYSQL_MEDIUMBLOB_SIZE_BYTES
 from mlrun.config import config
-from mlrun_pipelines.models import PipelineRun
 
 from .logger import create_logger
 from .retryer import (  # noqa: F401
@@ -70,6 +65,11 @@ from .retryer import (  # noqa: F401
     create_step_backoff,
 )
 
+if typing.TYPE_CHECKING:
+    import pandas
+
+    import mlrun_pipelines.models
+
 yaml.Dumper.ignore_aliases = lambda *args: True
 _missing = object()
 
@@ -158,7 +158,8 @@ missing = object()
 
 is_ipython = False  # is IPython terminal, including Jupyter
 is_jupyter = False  # is Jupyter notebook/lab terminal
-try:
+# when running in IPython it is already imported, so there's no need to pay for importing it otherwise
+if "IPython" in sys.modules:
     import IPython.core.getipython
 
     ipy = IPython.core.getipython.get_ipython()
@@ -171,8 +172,6 @@ try:
     )
 
     del ipy
-except ModuleNotFoundError:
-    pass
 
 if is_jupyter and config.nest_asyncio_enabled in ["1", "True"]:
     # bypass Jupyter asyncio bug
@@ -679,7 +678,8 @@ yaml.add_representer(np.float64, float_representer, Dumper=yaml.SafeDumper)
 yaml.add_representer(np.floating, float_representer, Dumper=yaml.SafeDumper)
 yaml.add_representer(np.ndarray, numpy_representer_seq, Dumper=yaml.SafeDumper)
 yaml.add_representer(np.datetime64, date_representer, Dumper=yaml.SafeDumper)
-yaml.add_representer(Timestamp, date_representer, Dumper=yaml.SafeDumper)
+# datetime subclasses (e.g. pandas.Timestamp), registered by the base class so pandas isn't imported with mlrun
+yaml.add_multi_representer(datetime, date_representer, Dumper=yaml.SafeDumper)
 yaml.add_multi_representer(enum.Enum, enum_representer, Dumper=yaml.SafeDumper)
 
 
@@ -1381,7 +1381,9 @@ def calculate_local_file_hash(filename):
     return h.hexdigest()
 
 
-def calculate_dataframe_hash(dataframe: pandas.DataFrame):
+def calculate_dataframe_hash(dataframe: "pandas.DataFrame"):
+    import pandas
+
     # https://stackoverflow.com/questions/49883236/how-to-generate-a-hash-or-checksum-value-on-python-dataframe-created-from-a-fix/62754084#62754084
     return hashlib.sha1(pandas.util.hash_pandas_object(dataframe).values).hexdigest()
 
@@ -1420,7 +1422,7 @@ def to_non_empty_values_dict(input_dict: dict) -> dict:
     return {key: value for key, value in input_dict.items() if value}
 
 
-def str_to_timestamp(time_str: str, now_time: Timestamp = None):
+def str_to_timestamp(time_str: str, now_time: "pandas.Timestamp" = None):
     """convert fixed/relative time string to Pandas Timestamp
 
     can use relative times using the "now" verb, and align to floor using the "floor" verb
@@ -1435,6 +1437,8 @@ def str_to_timestamp(time_str: str, now_time: Timestamp = None):
     if not isinstance(time_str, str):
         return time_str
 
+    from pandas import Timedelta, Timestamp
+
     time_str = time_str.strip()
     if time_str.lower().startswith("now"):
         # handle now +/- timedelta
@@ -1467,7 +1471,7 @@ def is_link_artifact(artifact):
         return artifact.kind == mlrun.common.schemas.ArtifactCategories.link.value
 
 
-def format_run(run: PipelineRun, with_project=False) -> dict:
+def format_run(run: "mlrun_pipelines.models.PipelineRun", with_project=False) -> dict:
     fields = [
         "id",
         "name",
@@ -1687,6 +1691,8 @@ def is_explicit_ack_supported(context):
 
 
 def line_terminator_kwargs():
+    import pandas
+
     # pandas 1.5.0 renames line_terminator to lineterminator
     line_terminator_parameter = (
         "lineterminator"
@@ -1987,7 +1993,7 @@ class Workflow:
         steps = []
         db = mlrun.get_run_db()
 
-        def _add_run_step(_step: mlrun_pipelines.models.PipelineStep):
+        def _add_run_step(_step: "mlrun_pipelines.models.PipelineStep"):
             try:
                 _run = db.list_runs(
                     project=project,
@@ -2007,7 +2013,7 @@ class Workflow:
                 )
             steps.append(_run)
 
-        def _add_deploy_function_step(_step: mlrun_pipelines.models.PipelineStep):
+        def _add_deploy_function_step(_step: "mlrun_pipelines.models.PipelineStep"):
             project, name, hash_key = Workflow._extract_function_uri(
                 _step.get_annotation("mlrun/function-uri")
             )
@@ -2110,7 +2116,11 @@ class Workflow:
     @staticmethod
     def _get_workflow_manifest(
         workflow_id: str,
-    ) -> typing.Optional[mlrun_pipelines.models.PipelineManifest]:
+    ) -> typing.Optional["mlrun_pipelines.models.PipelineManifest"]:
+        # imported here since the pipelines models import the kubernetes client, which is slow to import
+        import mlrun_pipelines.models
+        import mlrun_pipelines.utils
+
         kfp_client = mlrun_pipelines.utils.get_client(mlrun.mlconf.kfp_url)
 
         # arbitrary timeout of 5 seconds, the workflow should be done by now
@@ -13,12 +13,45 @@
 # limitations under the License.
 
 import asyncio
+import contextlib
+import contextvars
 import typing
 from copy import deepcopy
 
+import aiohttp
+
 import mlrun.common.schemas
 import mlrun.lists
 
+# A long-lived HTTP session shared by the notifications pushed in the current context (set by the notifications
+# dispatcher of the API), when not set, each notification push uses its own session
+_shared_http_session: contextvars.ContextVar[typing.Optional[aiohttp.ClientSession]] = (
+    contextvars.ContextVar("notifications_http_session", default=None)
+)
+
+
+def set_shared_http_session(session: typing.Optional[aiohttp.ClientSession]):
+    """
+    Set the HTTP session shared by the notifications pushed in the current context (and the tasks created from it).
+
+    :param session: The shared session, None to use a new session per push.
+    """
+    _shared_http_session.set(session)
+
+
+@contextlib.asynccontextmanager
+async def http_session() -> typing.AsyncIterator[aiohttp.ClientSession]:
+    """
+    Get the HTTP session to push a notification with, the shared session if set and open, otherwise a new session
+    which is closed on exit.
+    """
+    session = _shared_http_session.get()
+    if session is not None and not session.closed:
+        yield session
+        return
+    async with aiohttp.ClientSession() as session:
+        yield session
+
 
 class NotificationBase:
     def __init__(
@@ -50,6 +83,14 @@ class NotificationBase:
     def is_async(self) -> bool:
         return asyncio.iscoroutinefunction(self.push)
 
+    @property
+    def destination(self) -> typing.Optional[str]:
+        """
+        The destination the notification is pushed to, notifications pushed to the same destination share its rate
+        limit. None for notifications without a destination to protect, which are not rate limited.
+        """
+        return None
+
     def push(
         self,
         message: str,
@@ -16,13 +16,11 @@ import json
 import os
 import typing
 
-import aiohttp
-
 import mlrun.common.schemas
 import mlrun.errors
 import mlrun.lists
 
-from .base import NotificationBase
+from .base import NotificationBase, http_session
 
 
 class GitNotification(NotificationBase):
@@ -51,6 +49,12 @@ class GitNotification(NotificationBase):
                 "At least one of 'issue' or 'merge_request' is required for GitNotification"
             )
 
+    @property
+    def destination(self) -> str:
+        return self.params.get("server") or (
+            "gitlab.com" if self.params.get("gitlab") else "api.github.com"
+        )
+
     async def push(
         self,
         message: str,
@@ -148,7 +152,7 @@ class GitNotification(NotificationBase):
             }
             url = f"https://{server}/repos/{repo}/issues/{issue}/comments"
 
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             resp = await session.post(url, headers=headers, json={"body": message})
             if not resp.ok:
                 resp_text = await resp.text()
@@ -59,6 +59,14 @@ class MailNotification(base.NotificationBase):
 
         cls._validate_emails(params)
 
+    @property
+    def destination(self) -> typing.Optional[str]:
+        # the SMTP server and the recipients, so mails of different recipients don't share a rate limit
+        server_host = self.params.get("server_host")
+        if not server_host:
+            return super().destination
+        return f"smtp://{server_host}/{self.params.get('email_addresses', '')}"
+
     async def push(
         self,
         message: str,
@@ -14,13 +14,11 @@
 
 import typing
 
-import aiohttp
-
 import mlrun.common.schemas
 import mlrun.lists
 import mlrun.utils.helpers
 
-from .base import NotificationBase
+from .base import NotificationBase, http_session
 
 
 class SlackNotification(NotificationBase):
@@ -43,6 +41,10 @@ class SlackNotification(NotificationBase):
         if not webhook:
             raise ValueError("Parameter 'webhook' is required for SlackNotification")
 
+    @property
+    def destination(self) -> typing.Optional[str]:
+        return self.params.get("webhook") or super().destination
+
     async def push(
         self,
         message: str,
@@ -66,7 +68,7 @@ class SlackNotification(NotificationBase):
 
         data = self._generate_slack_data(message, severity, runs, alert, event_data)
 
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.post(webhook, json=data) as response:
                 response.raise_for_status()
 
@@ -15,13 +15,11 @@
 import re
 import typing
 
-import aiohttp
-
 import mlrun.common.schemas
 import mlrun.lists
 import mlrun.utils.helpers
 
-from .base import NotificationBase
+from .base import NotificationBase, http_session
 
 
 class WebhookNotification(NotificationBase):
@@ -35,6 +33,10 @@ class WebhookNotification(NotificationBase):
         if not url:
             raise ValueError("Parameter 'url' is required for WebhookNotification")
 
+    @property
+    def destination(self) -> typing.Optional[str]:
+        return self.params.get("url") or super().destination
+
     async def push(
         self,
         message: str,
@@ -86,7 +88,7 @@ class WebhookNotification(NotificationBase):
         # we automatically handle it as `ssl=None` for their convenience.
         verify_ssl = verify_ssl and None if url.startswith("https") else None
 
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             response = await getattr(session, method)(
                 url, headers=headers, json=request_body, ssl=verify_ssl
             )
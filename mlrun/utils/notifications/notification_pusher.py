@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import asyncio
+import collections
 import datetime
 import os
 import traceback
@@ -412,6 +413,70 @@ class NotificationPusher(_NotificationPusherBase):
         sent_time: typing.Optional[datetime.datetime] = None,
         reason: typing.Optional[str] = None,
     ):
+        if not NotificationPusher._set_notification_status(
+            run_uid, notification, run_state, status, sent_time, reason
+        ):
+            return
+
+        db = mlrun.get_run_db()
+
+        # There is no need to mask the secret_params as the secrets are already loaded
+        db.store_run_notifications(
+            [notification],
+            run_uid,
+            project,
+            mask_params=False,
+        )
+
+    @staticmethod
+    def _update_notifications_statuses(statuses: list[dict]):
+        """
+        Update the statuses of multiple pushed notifications, storing the notifications of each run in a single DB
+        write.
+
+        :param statuses: The `_update_notification_status` keyword arguments of each pushed notification.
+        """
+        runs_notifications = collections.defaultdict(list)
+        for status in statuses:
+            status = dict(status)
+            run_uid, project = status.pop("run_uid"), status.pop("project")
+            if NotificationPusher._set_notification_status(run_uid, **status):
+                runs_notifications[(run_uid, project)].append(status["notification"])
+        if not runs_notifications:
+            return
+
+        db = mlrun.get_run_db()
+        for (run_uid, project), notifications in runs_notifications.items():
+            try:
+                # There is no need to mask the secret_params as the secrets are already loaded
+                db.store_run_notifications(
+                    notifications,
+                    run_uid,
+                    project,
+                    mask_params=False,
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Failed to update notifications statuses",
+                    run_uid=run_uid,
+                    project=project,
+                    error=mlrun.errors.err_to_str(exc),
+                )
+
+    @staticmethod
+    def _set_notification_status(
+        run_uid: str,
+        notification: mlrun.model.Notification,
+        run_state: runtimes_constants.RunStates,
+        status: typing.Optional[str] = None,
+        sent_time: typing.Optional[datetime.datetime] = None,
+        reason: typing.Optional[str] = None,
+    ) -> bool:
+        """
+        Set the push status of the notification object.
+
+        :return: Whether the notification status should be stored.
+        """
         # Skip update the notification state if the following conditions are met:
         # 1. the run is not in a terminal state
         # 2. the when contains only one state (which is the current state)
@@ -428,9 +493,8 @@ class NotificationPusher(_NotificationPusherBase):
                 run_uid=run_uid,
                 state=run_state,
             )
-            return
+            return False
 
-        db = mlrun.get_run_db()
         notification.status = status or notification.status
         notification.sent_time = sent_time or notification.sent_time
 
@@ -445,14 +509,7 @@ class NotificationPusher(_NotificationPusherBase):
             # empty out the reason if the notification is in a non-error state
             # in case a retry would kick in (when such mechanism would be implemented)
             notification.reason = None
-
-        # There is no need to mask the secret_params as the secrets are already loaded
-        db.store_run_notifications(
-            [notification],
-            run_uid,
-            project,
-            mask_params=False,
-        )
+        return True
 
 
 class CustomNotificationPusher(_NotificationPusherBase):
@@ -516,6 +516,7 @@ class DBInterface(ABC):
     async def get_project_resources_counters(
         self,
         projects_with_creation_time: list[tuple[str, datetime]],
+        filter_projects: bool = False,
     ) -> tuple[
         dict[str, int],
         dict[str, int],
@@ -577,10 +578,19 @@ class DBInterface(ABC):
         pass
 
     def refresh_project_summaries(
-        self, session, project_summaries: list[mlrun.common.schemas.ProjectSummary]
+        self,
+        session,
+        project_summaries: list[mlrun.common.schemas.ProjectSummary],
+        updated: Optional[datetime] = None,
     ):
         pass
 
+    def flush_project_summaries_changes(self, session):
+        pass
+
+    def list_changed_project_summaries(self, session) -> list[str]:
+        pass
+
     @abstractmethod
     def create_feature_set(
         self,
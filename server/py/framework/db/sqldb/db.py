@@ -124,6 +124,10 @@ from framework.db.sqldb.models import (
     _tagged,
     _with_notifications,
 )
+from framework.db.sqldb.project_summaries import (
+    ProjectSummariesChangesTracker,
+    project_summaries_changes,
+)
 
 NULL = None  # Avoid flake8 issuing warnings when comparing in filter
 unversioned_tagged_object_uid_prefix = "unversioned-"
@@ -2743,6 +2747,11 @@ class SQLDB(DBInterface):
 
         query = session.query(main_table).filter(where_clause)
         deletions_count = query.delete(synchronize_session=False)
+        if deletions_count and issubclass(
+            main_table, ProjectSummariesChangesTracker.tracked_models
+        ):
+            # bulk deletions are not tracked by the session flush
+            project_summaries_changes.mark_changed(project)
         log_kwargs = {
             "deletions_count": deletions_count,
             "main_table": main_table,
@@ -3029,11 +3038,16 @@ class SQLDB(DBInterface):
         self,
         session: Session,
         project_summaries: list[mlrun.common.schemas.ProjectSummary],
+        updated: typing.Optional[datetime] = None,
     ):
         """
         This method updates the summaries of projects that have associated projects in the database
         and removes project summaries that no longer have associated projects.
+
+        :param updated: the time the summaries were calculated from, changes flushed after it are picked up by the
+                        next refresh. Defaults to now.
         """
+        updated = updated or datetime.now(timezone.utc)
 
         summary_dicts = {summary.name: summary.dict() for summary in project_summaries}
 
@@ -3053,7 +3067,7 @@ class SQLDB(DBInterface):
         # Update the summaries of projects that have associated projects
         for project_summary in associated_summaries:
             project_summary.summary = summary_dicts.get(project_summary.project)
-            project_summary.updated = datetime.now(timezone.utc)
+            project_summary.updated = updated
             session.add(project_summary)
 
         # To avoid race conditions where a project might be deleted after its summary is queried
@@ -3071,6 +3085,44 @@ class SQLDB(DBInterface):
 
         self._commit(session, associated_summaries + orphaned_summaries)
 
+    def flush_project_summaries_changes(self, session: Session):
+        """
+        Mark the summaries of the projects changed by mutations in this process (since the last flush) as changed,
+        in batched updates, so the next project summaries refresh recomputes them.
+        """
+        changed_projects = sorted(project_summaries_changes.pop_changed_projects())
+        if not changed_projects:
+            return
+
+        changed = datetime.now(timezone.utc)
+        batch_size = int(config.monitoring.projects.summaries.changes_batch_size)
+        try:
+            for index in range(0, len(changed_projects), batch_size):
+                session.query(ProjectSummary).filter(
+                    ProjectSummary.project.in_(
+                        changed_projects[index : index + batch_size]
+                    )
+                ).update({ProjectSummary.changed: changed}, synchronize_session=False)
+            session.commit()
+        except SQLAlchemyError:
+            session.rollback()
+            # keep the changes for the next flush
+            project_summaries_changes.mark_changed(*changed_projects)
+            raise
+
+    def list_changed_project_summaries(self, session: Session) -> list[str]:
+        """
+        List the projects whose resources changed since their summary was last calculated.
+        """
+        query = session.query(ProjectSummary.project).filter(
+            ProjectSummary.changed.is_not(None),
+            or_(
+                ProjectSummary.updated.is_(None),
+                ProjectSummary.changed >= ProjectSummary.updated,
+            ),
+        )
+        return [project for (project,) in query.all()]
+
     def _delete_project_summary(
         self,
         session: Session,
@@ -3082,6 +3134,7 @@ class SQLDB(DBInterface):
     async def get_project_resources_counters(
         self,
         projects_with_creation_time: list[tuple[str, datetime]],
+        filter_projects: bool = False,
     ) -> tuple[
         dict[str, int],
         dict[str, int],
@@ -3096,22 +3149,37 @@ class SQLDB(DBInterface):
         dict[str, int],
         dict[str, int],
     ]:
+        """
+        :param projects_with_creation_time: the projects (name and creation time) to calculate the counters for
+        :param filter_projects:             whether to only aggregate the resources of the given projects, otherwise
+                                            the resources of all the projects are aggregated (cheaper than filtering
+                                            when calculating the counters of all the projects)
+        """
+        projects = (
+            [project for project, _ in projects_with_creation_time]
+            if filter_projects
+            else None
+        )
         results = await asyncio.gather(
             fastapi.concurrency.run_in_threadpool(
                 framework.db.session.run_function_with_new_db_session,
                 self._calculate_artifact_counters_by_category,
+                projects,
             ),
             fastapi.concurrency.run_in_threadpool(
                 framework.db.session.run_function_with_new_db_session,
                 self._calculate_schedules_counters,
+                projects,
             ),
             fastapi.concurrency.run_in_threadpool(
                 framework.db.session.run_function_with_new_db_session,
                 self._calculate_feature_sets_counters,
+                projects,
             ),
             fastapi.concurrency.run_in_threadpool(
                 framework.db.session.run_function_with_new_db_session,
                 self._calculate_runs_counters,
+                projects,
             ),
             fastapi.concurrency.run_in_threadpool(
                 framework.db.session.run_function_with_new_db_session,
@@ -3188,9 +3256,14 @@ class SQLDB(DBInterface):
     @staticmethod
     def _calculate_schedules_counters(
         session,
+        projects: typing.Optional[list[str]] = None,
     ) -> [dict[str, int], dict[str, int], dict[str, int]]:
         schedules_count_per_project = (
-            session.query(Schedule.project, func.count(distinct(Schedule.name)))
+            SQLDB._filter_query_by_resource_project(
+                session.query(Schedule.project, func.count(distinct(Schedule.name))),
+                Schedule,
+                projects,
+            )
             .group_by(Schedule.project)
             .all()
         )
@@ -3213,12 +3286,16 @@ class SQLDB(DBInterface):
         )
 
         query = (
-            session.query(
-                Schedule.project.label("project_name"),
-                Schedule.name.label("schedule_name"),
-                case([(workflow_label_exists, True)], else_=False).label(
-                    "has_workflow_label"
+            SQLDB._filter_query_by_resource_project(
+                session.query(
+                    Schedule.project.label("project_name"),
+                    Schedule.name.label("schedule_name"),
+                    case([(workflow_label_exists, True)], else_=False).label(
+                        "has_workflow_label"
+                    ),
                 ),
+                Schedule,
+                projects,
             )
             .filter(Schedule.next_run_time < next_day)
             .filter(Schedule.next_run_time >= datetime.now(timezone.utc))
@@ -3242,9 +3319,17 @@ class SQLDB(DBInterface):
         )
 
     @staticmethod
-    def _calculate_feature_sets_counters(session) -> dict[str, int]:
+    def _calculate_feature_sets_counters(
+        session, projects: typing.Optional[list[str]] = None
+    ) -> dict[str, int]:
         feature_sets_count_per_project = (
-            session.query(FeatureSet.project, func.count(distinct(FeatureSet.name)))
+            SQLDB._filter_query_by_resource_project(
+                session.query(
+                    FeatureSet.project, func.count(distinct(FeatureSet.name))
+                ),
+                FeatureSet,
+                projects,
+            )
             .group_by(FeatureSet.project)
             .all()
         )
@@ -3256,9 +3341,16 @@ class SQLDB(DBInterface):
     @staticmethod
     def _calculate_artifact_counters_by_category(
         session: Session,
+        projects: typing.Optional[list[str]] = None,
     ) -> dict[str, dict[str, int]]:
-        query = session.query(
-            ArtifactV2.project, ArtifactV2.kind, func.count(distinct(ArtifactV2.key))
+        query = SQLDB._filter_query_by_resource_project(
+            session.query(
+                ArtifactV2.project,
+                ArtifactV2.kind,
+                func.count(distinct(ArtifactV2.key)),
+            ),
+            ArtifactV2,
+            projects,
         ).group_by(ArtifactV2.project, ArtifactV2.kind)
 
         category_to_project_artifact_count = {}
@@ -3273,13 +3365,21 @@ class SQLDB(DBInterface):
     @staticmethod
     def _calculate_runs_counters(
         session,
+        projects: typing.Optional[list[str]] = None,
     ) -> tuple[
         dict[str, int],
         dict[str, int],
         dict[str, int],
     ]:
+        def runs_count_query():
+            return SQLDB._filter_query_by_resource_project(
+                session.query(Run.project, func.count(distinct(Run.name))),
+                Run,
+                projects,
+            )
+
         running_runs_count_per_project = (
-            session.query(Run.project, func.count(distinct(Run.name)))
+            runs_count_query()
             .filter(
                 Run.state.in_(
                     mlrun.common.runtimes.constants.RunStates.non_terminal_states()
@@ -3294,7 +3394,7 @@ class SQLDB(DBInterface):
 
         one_day_ago = datetime.now() - timedelta(hours=24)
         recent_failed_runs_count_per_project = (
-            session.query(Run.project, func.count(distinct(Run.name)))
+            runs_count_query()
             .filter(
                 Run.state.in_(
                     [
@@ -3312,7 +3412,7 @@ class SQLDB(DBInterface):
         }
 
         recent_completed_runs_count_per_project = (
-            session.query(Run.project, func.count(distinct(Run.name)))
+            runs_count_query()
             .filter(
                 Run.state.in_(
                     [
@@ -885,6 +885,8 @@ with warnings.catch_warnings():
             String(255, collation=SQLTypesUtil.collation()), nullable=False
         )
         updated = Column(SQLTypesUtil.datetime())
+        # last time a mutation of the project resources was flushed, the summary is recomputed when changed > updated
+        changed = Column(SQLTypesUtil.datetime())
         summary = Column(JSON)
 
         def get_identifier_string(self) -> str:
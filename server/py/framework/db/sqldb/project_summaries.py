@@ -0,0 +1,69 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import itertools
+import threading
+
+import sqlalchemy.event
+from sqlalchemy.orm import Session
+
+from framework.db.sqldb.models import (
+    AlertActivation,
+    ArtifactV2,
+    FeatureSet,
+    Run,
+    Schedule,
+)
+
+
+class ProjectSummariesChangesTracker:
+    """
+    Collects the projects whose summary counters may have changed by mutations made in this process (runs, artifacts,
+    schedules, feature sets and alert activations), so the project summaries refresh only recomputes these projects.
+    The changes are buffered in memory and flushed to the DB in batches, see SQLDB.flush_project_summaries_changes.
+    """
+
+    tracked_models = (Run, ArtifactV2, Schedule, FeatureSet, AlertActivation)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._changed_projects: set[str] = set()
+
+    def mark_changed(self, *projects: str):
+        projects = {project for project in projects if project and project != "*"}
+        if not projects:
+            return
+        with self._lock:
+            self._changed_projects.update(projects)
+
+    def pop_changed_projects(self) -> set[str]:
+        with self._lock:
+            changed_projects, self._changed_projects = self._changed_projects, set()
+        return changed_projects
+
+    def track_flush(self, session: Session, flush_context):
+        # the session collections still hold the pre-flush state in the after_flush event
+        self.mark_changed(
+            *{
+                object_.project
+                for object_ in itertools.chain(
+                    session.new, session.dirty, session.deleted
+                )
+                if isinstance(object_, self.tracked_models)
+            }
+        )
+
+
+project_summaries_changes = ProjectSummariesChangesTracker()
+sqlalchemy.event.listen(Session, "after_flush", project_summaries_changes.track_flush)
@@ -0,0 +1,264 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import concurrent.futures
+import datetime
+import random
+import threading
+import typing
+
+import aiohttp
+
+import mlrun.common.schemas
+import mlrun.errors
+import mlrun.model
+import mlrun.utils.helpers
+import mlrun.utils.notifications.notification.base as base
+from mlrun import mlconf
+from mlrun.utils import logger
+from mlrun.utils.notifications.notification_pusher import (
+    NotificationPusher,
+    sanitize_notification,
+)
+
+
+class _TokenBucket:
+    """
+    Token bucket rate limiter, allowing bursts of up to `burst` pushes and `rate` pushes per second on average.
+    Used only from the dispatcher event loop.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = None
+
+    async def acquire(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            if self._updated is not None:
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated) * self._rate
+                )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class NotificationDispatcher:
+    """
+    Long-lived dispatcher of the run notifications pushed by the API. The notifications are pushed from a single event
+    loop thread with a shared pooled HTTP session, bounded concurrency, per destination rate limiting and retries with
+    jitter, and their statuses are written back to the DB in batches (per run), so when many runs complete at once the
+    notifications latency and the API threads usage remain bounded.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_pushes: typing.Optional[int] = None,
+        connections_limit: typing.Optional[int] = None,
+        destination_rate_limit: typing.Optional[float] = None,
+        destination_burst: typing.Optional[int] = None,
+        max_retries: typing.Optional[int] = None,
+        retry_backoff: typing.Optional[float] = None,
+    ):
+        dispatcher_config = mlconf.notifications.dispatcher
+        self._max_concurrent_pushes = int(
+            max_concurrent_pushes or dispatcher_config.max_concurrent_pushes
+        )
+        self._connections_limit = int(
+            connections_limit or dispatcher_config.connections_limit
+        )
+        self._destination_rate_limit = float(
+            destination_rate_limit or dispatcher_config.destination_rate_limit
+        )
+        self._destination_burst = int(
+            destination_burst or dispatcher_config.destination_burst
+        )
+        self._max_retries = int(
+            dispatcher_config.max_retries if max_retries is None else max_retries
+        )
+        self._retry_backoff = float(
+            dispatcher_config.retry_backoff if retry_backoff is None else retry_backoff
+        )
+
+        self._lock = threading.Lock()
+        self._loop: typing.Optional[asyncio.AbstractEventLoop] = None
+        self._thread: typing.Optional[threading.Thread] = None
+        self._session: typing.Optional[aiohttp.ClientSession] = None
+        self._semaphore: typing.Optional[asyncio.Semaphore] = None
+        self._buckets: dict[str, _TokenBucket] = {}
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever,
+                name="notification-dispatcher",
+                daemon=True,
+            )
+            self._thread.start()
+            asyncio.run_coroutine_threadsafe(self._initialize(), self._loop).result()
+
+    def stop(self):
+        with self._lock:
+            if self._thread is None:
+                return
+            asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = self._thread = self._session = self._semaphore = None
+            self._buckets = {}
+
+    def dispatch(self, pusher: NotificationPusher):
+        """
+        Push the async notifications of the given pusher and update their statuses, waiting for the pushes to
+        complete. Sync notifications are not pushed by the API.
+
+        :param pusher: The notification pusher holding the notifications to push.
+        """
+        future = self._submit(pusher)
+        if future is not None:
+            future.result()
+
+    async def dispatch_async(self, pusher: NotificationPusher):
+        """
+        Same as `dispatch`, for async callers - awaits the pushes without blocking the caller's event loop.
+
+        :param pusher: The notification pusher holding the notifications to push.
+        """
+        future = self._submit(pusher)
+        if future is not None:
+            await asyncio.wrap_future(future)
+
+    def _submit(
+        self, pusher: NotificationPusher
+    ) -> typing.Optional[concurrent.futures.Future]:
+        if not pusher._async_notifications:
+            return None
+        self.start()
+        logger.debug(
+            "Dispatching notifications",
+            notifications_amount=len(pusher._async_notifications),
+        )
+        return asyncio.run_coroutine_threadsafe(self._dispatch(pusher), self._loop)
+
+    async def _initialize(self):
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self._connections_limit)
+        )
+        self._semaphore = asyncio.Semaphore(self._max_concurrent_pushes)
+
+    async def _dispatch(self, pusher: NotificationPusher):
+        # the pushes tasks inherit the context, so they all use the shared session
+        base.set_shared_http_session(self._session)
+        statuses = await asyncio.gather(
+            *[
+                self._push(pusher, notification, run, notification_object)
+                for notification, run, notification_object in pusher._async_notifications
+            ]
+        )
+        await mlrun.utils.helpers.run_in_threadpool(
+            pusher._update_notifications_statuses, statuses
+        )
+
+    async def _push(
+        self,
+        pusher: NotificationPusher,
+        notification: base.NotificationBase,
+        run: mlrun.model.RunObject,
+        notification_object: mlrun.model.Notification,
+    ) -> dict:
+        """
+        Push the notification, retrying failed pushes with exponential backoff and jitter.
+
+        :return: The `_update_notification_status` keyword arguments of the notification.
+        """
+        status = {
+            "run_uid": run.metadata.uid,
+            "project": run.metadata.project,
+            "notification": notification_object,
+            "run_state": run.state(),
+            "status": mlrun.common.schemas.NotificationStatus.SENT,
+        }
+        bucket = self._get_bucket(notification.destination)
+        attempt = 0
+        while True:
+            try:
+                if not attempt:
+                    message, severity, runs = pusher._prepare_notification_args(
+                        run, notification_object
+                    )
+                # wait for the destination rate limit before taking a push slot, so a throttled destination doesn't
+                # hold the pushes to other destinations
+                if bucket is not None:
+                    await bucket.acquire()
+                async with self._semaphore:
+                    await notification.push(message, severity, runs)
+                status["sent_time"] = datetime.datetime.now(tz=datetime.timezone.utc)
+                return status
+            except Exception as exc:
+                if attempt >= self._max_retries or not self._is_retryable(exc):
+                    logger.warning(
+                        "Failed to push notification",
+                        notification=sanitize_notification(
+                            notification_object.to_dict()
+                        ),
+                        run_uid=run.metadata.uid,
+                        attempts=attempt + 1,
+                        exc=mlrun.errors.err_to_str(exc),
+                    )
+                    status["status"] = mlrun.common.schemas.NotificationStatus.ERROR
+                    status["reason"] = f"Exception error: {str(exc)}"
+                    return status
+            # full jitter, so retries of notifications which failed together are spread
+            await asyncio.sleep(random.uniform(0, self._retry_backoff * 2**attempt))
+            attempt += 1
+
+    def _get_bucket(
+        self, destination: typing.Optional[str]
+    ) -> typing.Optional[_TokenBucket]:
+        # notifications without a destination (e.g. the console) are not rate limited
+        if destination is None:
+            return None
+        if destination not in self._buckets:
+            self._buckets[destination] = _TokenBucket(
+                self._destination_rate_limit, self._destination_burst
+            )
+        return self._buckets[destination]
+
+    @staticmethod
+    def _is_retryable(exc: Exception) -> bool:
+        # client errors (except for rate limiting) will fail again
+        if isinstance(exc, aiohttp.ClientResponseError):
+            return exc.status == 429 or exc.status >= 500
+        return isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+_dispatcher: typing.Optional[NotificationDispatcher] = None
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = NotificationDispatcher()
+    return _dispatcher
@@ -22,6 +22,7 @@ from sqlalchemy.orm import Session
 import mlrun
 import mlrun.common.schemas
 from mlrun.datastore.datastore_profile import DatastoreProfile as DSProfile
+from mlrun.datastore.datastore_profile import invalidate_datastore_profile_cache
 
 import framework.api.deps
 import framework.utils.auth.verifier
@@ -97,6 +98,7 @@ async def store_datastore_profile(
         db_session,
         info,
     )
+    invalidate_datastore_profile_cache(info.name, project_name)
 
     return await run_in_threadpool(
         framework.utils.singletons.db.get_db().get_datastore_profile,
@@ -223,9 +225,11 @@ async def delete_datastore_profile(
         allow_internal_secrets=True,
     )
 
-    return await run_in_threadpool(
+    result = await run_in_threadpool(
         framework.utils.singletons.db.get_db().delete_datastore_profile,
         db_session,
         profile,
         project_name,
     )
+    invalidate_datastore_profile_cache(profile, project_name)
+    return result
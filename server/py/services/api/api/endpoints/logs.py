@@ -108,6 +108,48 @@ async def get_log(
     )
 
 
+@router.get("/projects/{project}/logs/{uid}/watch")
+async def watch_log(
+    project: str,
+    uid: str,
+    offset: int = 0,
+    auth_info: mlrun.common.schemas.AuthInfo = fastapi.Depends(
+        framework.api.deps.authenticate_request
+    ),
+    db_session: sqlalchemy.orm.Session = fastapi.Depends(
+        framework.api.deps.get_db_session
+    ),
+):
+    """
+    Stream the log of a run from the given offset, new logs are pushed as they are written until the run reaches a
+    terminal state or the streaming timeout (httpdb.logs.streaming.timeout) passes, the client should then resume
+    from its last offset.
+    """
+    if offset < 0:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            "Offset cannot be negative",
+        )
+    await (
+        framework.utils.auth.verifier.AuthVerifier().query_project_resource_permissions(
+            mlrun.common.schemas.AuthorizationResourceTypes.log,
+            project,
+            uid,
+            mlrun.common.schemas.AuthorizationAction.read,
+            auth_info,
+        )
+    )
+    # read the run before starting the stream, so a missing run fails the request
+    run = await services.api.crud.Logs().get_run_for_log(db_session, project, uid)
+    headers = {
+        "x-mlrun-run-state": run.get("status", {}).get("state", ""),
+    }
+    return fastapi.responses.StreamingResponse(
+        services.api.crud.Logs().watch_logs(project, uid, offset, run=run),
+        media_type="text/plain",
+        headers=headers,
+    )
+
+
 @router.get("/projects/{project}/logs/{uid}/size")
 async def get_log_size(
     project: str,
@@ -12,21 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import os
 import pathlib
 import shutil
+import time
 import typing
 from http import HTTPStatus
 
 from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+import mlrun.common.runtimes.constants
 import mlrun.common.schemas
 import mlrun.utils.singleton
 from mlrun.common.runtimes.constants import PodPhases
 from mlrun.utils import logger
 
 import framework.api.utils
+import framework.db.session
 import framework.utils.clients.log_collector as log_collector
 import framework.utils.singletons.k8s
 from framework.constants import LogSources
@@ -137,6 +141,7 @@ class Logs(
         size: int = -1,
         offset: int = 0,
         source: LogSources = LogSources.AUTO,
+        run: typing.Optional[dict] = None,
     ) -> tuple[str, typing.AsyncIterable[bytes]]:
         """
         Get logs
@@ -148,10 +153,11 @@ class Logs(
         :param source: log source (default auto) Relevant only for legacy log_collector mode
           if auto, it will use the mode configured in `mlrun.mlconf.log_collector.mode`
           if other than auto, it will fall back to legacy log_collector mode
+        :param run: the run, if already read from the db
         :return: run state and logs
         """
         project = project or mlrun.mlconf.default_project
-        run = await self._get_run_for_log(db_session, project, uid)
+        run = run or await self.get_run_for_log(db_session, project, uid)
         run_state = run.get("status", {}).get("state", "")
         log_stream = None
         if (
@@ -208,6 +214,63 @@ class Logs(
             )
         return run_state, log_stream
 
+    async def watch_logs(
+        self,
+        project: str,
+        uid: str,
+        offset: int = 0,
+        run: typing.Optional[dict] = None,
+    ) -> typing.AsyncIterable[bytes]:
+        """
+        Stream the logs of a run from the given offset, pushing new logs as they are written, until the run reaches a
+        terminal state and its whole log was sent, or until the streaming timeout passes (the client then resumes
+        from its last offset).
+        Each chunk is read only after the previous one was sent, so slow clients don't accumulate logs in memory.
+        :param project: project name
+        :param uid: run uid
+        :param offset: number of bytes to skip (default 0)
+        :param run: the run, if already read from the db
+        """
+        project = project or mlrun.mlconf.default_project
+        size = int(mlrun.mlconf.httpdb.logs.pull_logs_default_size_limit)
+        poll_interval = float(mlrun.mlconf.httpdb.logs.streaming.poll_interval)
+        # the run state is cached, and refreshed at the clients polling cadence
+        state_interval = float(mlrun.mlconf.httpdb.logs.pull_logs_default_interval)
+        deadline = time.monotonic() + float(mlrun.mlconf.httpdb.logs.streaming.timeout)
+        state_refresh_time = time.monotonic() + state_interval
+        while time.monotonic() < deadline:
+            if run is None or time.monotonic() >= state_refresh_time:
+                run = await self._read_run_for_watch(project, uid)
+                state_refresh_time = time.monotonic() + state_interval
+            # the run state is read before the logs, so logs written before the run finished are not missed
+            run_state, log_stream = await self.get_logs(
+                None, project, uid, size, offset, run=run
+            )
+            received = 0
+            async for log in log_stream:
+                if log:
+                    received += len(log)
+                    yield log
+            offset += received
+            if received:
+                # there may be more logs to read
+                continue
+
+            if (
+                run_state
+                not in mlrun.common.runtimes.constants.RunStates.non_terminal_states()
+            ):
+                return
+            await asyncio.sleep(poll_interval)
+
+    async def _read_run_for_watch(self, project: str, uid: str) -> dict:
+        # a session per read, so the open log streams don't hold db connections while they wait for logs
+        db_session = await run_in_threadpool(framework.db.session.create_session)
+        try:
+            return await self.get_run_for_log(db_session, project, uid)
+        finally:
+            await run_in_threadpool(framework.db.session.close_session, db_session)
+
     @staticmethod
     async def _get_logs_from_logs_collector(
         project: str,
@@ -300,7 +363,7 @@ class Logs(
         yield log_contents
 
     @staticmethod
-    async def _get_run_for_log(db_session: Session, project: str, uid: str) -> dict:
+    async def get_run_for_log(db_session: Session, project: str, uid: str) -> dict:
         run = await run_in_threadpool(get_db().read_run, db_session, uid, project)
         if not run:
             framework.api.utils.log_and_raise(
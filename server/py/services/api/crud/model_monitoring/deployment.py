@@ -333,6 +333,22 @@ class MonitoringDeployment:
 
         return function
 
+    @staticmethod
+    def _enable_stream_triggers_batching(
+        function: mlrun.runtimes.RemoteRuntime, batching_args: mlrun.config.Config
+    ) -> None:
+        """Have the stream triggers of the function deliver the events to the handler in batches (lists of events)"""
+        for key, trigger in function.spec.config.items():
+            if key.startswith("spec.triggers.") and trigger.get("kind") in (
+                "v3ioStream",
+                "kafka-cluster",
+            ):
+                trigger["batch"] = {
+                    "mode": "enable",
+                    "batchSize": batching_args.batch_size,
+                    "timeout": batching_args.timeout,
+                }
+
     def _apply_and_create_kafka_source(
         self,
         stream_path: str,
@@ -509,6 +525,10 @@ class MonitoringDeployment:
             function_name=mm_constants.MonitoringFunctionNames.APPLICATION_CONTROLLER,
             stream_args=config.model_endpoint_monitoring.controller_stream_args,
         )
+        self._enable_stream_triggers_batching(
+            function=function,
+            batching_args=config.model_endpoint_monitoring.controller_stream_args.batching,
+        )
 
         function = self._apply_access_key_and_mount_function(
             function=function,
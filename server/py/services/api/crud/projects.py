@@ -47,6 +47,9 @@ class Projects(
     project_follower.Member,
     metaclass=mlrun.utils.singleton.AbstractSingleton,
 ):
+    # the last time the summaries of all the projects were recalculated
+    _last_full_project_summaries_refresh: typing.Optional[datetime.datetime] = None
+
     def create_project(
         self, session: sqlalchemy.orm.Session, project: mlrun.common.schemas.Project
     ):
@@ -414,6 +417,35 @@ class Projects(
 
     async def refresh_project_resources_counters_cache(
         self, session: sqlalchemy.orm.Session
+    ):
+        """
+        Refresh the project summaries. Only the summaries of projects whose resources changed since their last
+        calculation are recalculated, the summaries of all the projects are recalculated every
+        monitoring.projects.summaries.full_refresh_interval to correct drift (e.g. of the time based counters).
+        """
+        db = framework.utils.singletons.db.get_db()
+        refresh_start = datetime.datetime.now(datetime.timezone.utc)
+        await fastapi.concurrency.run_in_threadpool(
+            db.flush_project_summaries_changes, session
+        )
+        if self._is_full_project_summaries_refresh_due(refresh_start):
+            await self._refresh_all_project_summaries(session, refresh_start)
+            self._last_full_project_summaries_refresh = refresh_start
+        else:
+            await self._refresh_changed_project_summaries(session, refresh_start)
+
+    def _is_full_project_summaries_refresh_due(self, now: datetime.datetime) -> bool:
+        if not self._last_full_project_summaries_refresh:
+            return True
+        full_refresh_interval = int(
+            mlrun.mlconf.monitoring.projects.summaries.full_refresh_interval
+        )
+        return now - self._last_full_project_summaries_refresh >= datetime.timedelta(
+            seconds=full_refresh_interval
+        )
+
+    async def _refresh_all_project_summaries(
+        self, session: sqlalchemy.orm.Session, updated: datetime.datetime
     ):
         projects_output = await fastapi.concurrency.run_in_threadpool(
             self.list_projects,
@@ -427,6 +459,85 @@ class Projects(
             ),
             self._calculate_pipelines_counters(),
         )
+
+        project_summaries = [
+            self._build_project_summary(
+                project_data[0], project_counters, pipeline_counters
+            )
+            for project_data in projects_output.projects
+        ]
+        await fastapi.concurrency.run_in_threadpool(
+            framework.utils.singletons.db.get_db().refresh_project_summaries,
+            session,
+            project_summaries,
+            updated,
+        )
+
+    async def _refresh_changed_project_summaries(
+        self, session: sqlalchemy.orm.Session, updated: datetime.datetime
+    ):
+        db = framework.utils.singletons.db.get_db()
+        # the pipelines are not stored in the db, so their counters are always recalculated (without loading the db)
+        pipelines_counters_task = asyncio.create_task(
+            self._calculate_pipelines_counters()
+        )
+        changed_projects = await fastapi.concurrency.run_in_threadpool(
+            db.list_changed_project_summaries, session
+        )
+        current_project_summaries = await fastapi.concurrency.run_in_threadpool(
+            db.list_project_summaries, session
+        )
+        project_counters = None
+        if changed_projects:
+            projects_output = await fastapi.concurrency.run_in_threadpool(
+                self.list_projects,
+                session,
+                format_=mlrun.common.formatters.ProjectFormat.name_and_creation_time,
+                names=changed_projects,
+            )
+            project_counters = await db.get_project_resources_counters(
+                projects_output.projects, filter_projects=True
+            )
+        pipeline_counters = await pipelines_counters_task
+
+        project_summaries = []
+        for current_project_summary in current_project_summaries:
+            project_name = current_project_summary.name
+            # the update time is kept outside the summary itself
+            current_project_summary.updated = None
+            if project_counters and project_name in changed_projects:
+                project_summary = self._build_project_summary(
+                    project_name, project_counters, pipeline_counters
+                )
+            else:
+                project_summary = current_project_summary.copy(
+                    update=self._get_pipelines_summary_fields(
+                        project_name, pipeline_counters
+                    )
+                )
+                if project_summary == current_project_summary:
+                    continue
+            project_summaries.append(project_summary)
+
+        if not project_summaries:
+            return
+        logger.debug(
+            "Refreshing changed project summaries",
+            projects_count=len(project_summaries),
+        )
+        await fastapi.concurrency.run_in_threadpool(
+            db.refresh_project_summaries,
+            session,
+            project_summaries,
+            updated,
+        )
+
+    def _build_project_summary(
+        self,
+        project_name: str,
+        project_counters: tuple,
+        pipeline_counters: tuple,
+    ) -> mlrun.common.schemas.ProjectSummary:
         (
             project_to_files_count,
             project_to_schedule_count,
@@ -441,66 +552,52 @@ class Projects(
             project_to_job_alerts_count,
             project_to_other_alerts_count,
         ) = project_counters
+        return mlrun.common.schemas.ProjectSummary(
+            name=project_name,
+            files_count=project_to_files_count.get(project_name, 0),
+            distinct_schedules_count=project_to_schedule_count.get(project_name, 0),
+            feature_sets_count=project_to_feature_set_count.get(project_name, 0),
+            models_count=project_to_models_count.get(project_name, 0),
+            runs_completed_recent_count=project_to_recent_completed_runs_count.get(
+                project_name, 0
+            ),
+            runs_failed_recent_count=project_to_recent_failed_runs_count.get(
+                project_name, 0
+            ),
+            runs_running_count=project_to_running_runs_count.get(project_name, 0),
+            # the following are defaultdict so it will return None if using dict.get()
+            # and the key wasn't set yet, so we need to use the [] operator to get the default value of the dict
+            distinct_scheduled_jobs_pending_count=project_to_schedule_pending_jobs_count[
+                project_name
+            ],
+            distinct_scheduled_pipelines_pending_count=project_to_schedule_pending_workflows_count[
+                project_name
+            ],
+            endpoint_alerts_count=project_to_endpoint_alerts_count.get(project_name, 0),
+            job_alerts_count=project_to_job_alerts_count.get(project_name, 0),
+            other_alerts_count=project_to_other_alerts_count.get(project_name, 0),
+            **self._get_pipelines_summary_fields(project_name, pipeline_counters),
+        )
+
+    @staticmethod
+    def _get_pipelines_summary_fields(
+        project_name: str, pipeline_counters: tuple
+    ) -> dict[str, typing.Optional[int]]:
         (
             project_to_recent_completed_pipelines_count,
             project_to_recent_failed_pipelines_count,
             project_to_running_pipelines_count,
         ) = pipeline_counters
-
-        project_summaries = []
-        for project_data in projects_output.projects:
-            project_name = project_data[0]
-            project_summaries.append(
-                mlrun.common.schemas.ProjectSummary(
-                    name=project_name,
-                    files_count=project_to_files_count.get(project_name, 0),
-                    distinct_schedules_count=project_to_schedule_count.get(
-                        project_name, 0
-                    ),
-                    feature_sets_count=project_to_feature_set_count.get(
-                        project_name, 0
-                    ),
-                    models_count=project_to_models_count.get(project_name, 0),
-                    runs_completed_recent_count=project_to_recent_completed_runs_count.get(
-                        project_name, 0
-                    ),
-                    runs_failed_recent_count=project_to_recent_failed_runs_count.get(
-                        project_name, 0
-                    ),
-                    runs_running_count=project_to_running_runs_count.get(
-                        project_name, 0
-                    ),
-                    # the following are defaultdict so it will return None if using dict.get()
-                    # and the key wasn't set yet, so we need to use the [] operator to get the default value of the dict
-                    pipelines_completed_recent_count=project_to_recent_completed_pipelines_count[
-                        project_name
-                    ],
-                    pipelines_failed_recent_count=project_to_recent_failed_pipelines_count[
-                        project_name
-                    ],
-                    pipelines_running_count=project_to_running_pipelines_count[
-                        project_name
-                    ],
-                    distinct_scheduled_jobs_pending_count=project_to_schedule_pending_jobs_count[
-                        project_name
-                    ],
-                    distinct_scheduled_pipelines_pending_count=project_to_schedule_pending_workflows_count[
-                        project_name
-                    ],
-                    endpoint_alerts_count=project_to_endpoint_alerts_count.get(
-                        project_name, 0
-                    ),
-                    job_alerts_count=project_to_job_alerts_count.get(project_name, 0),
-                    other_alerts_count=project_to_other_alerts_count.get(
-                        project_name, 0
-                    ),
-                )
-            )
-        await fastapi.concurrency.run_in_threadpool(
-            framework.utils.singletons.db.get_db().refresh_project_summaries,
-            session,
-            project_summaries,
-        )
+        # the pipeline counters are defaultdict, use the [] operator to get the default value of the dict
+        return {
+            "pipelines_completed_recent_count": project_to_recent_completed_pipelines_count[
+                project_name
+            ],
+            "pipelines_failed_recent_count": project_to_recent_failed_pipelines_count[
+                project_name
+            ],
+            "pipelines_running_count": project_to_running_pipelines_count[project_name],
+        }
 
     @staticmethod
     def _list_pipelines(
@@ -41,6 +41,7 @@ import framework.service
 import framework.utils.clients.chief
 import framework.utils.clients.log_collector
 import framework.utils.clients.messaging
+import framework.utils.notifications.dispatcher
 import framework.utils.notifications.notification_pusher
 import framework.utils.pagination_cache
 import framework.utils.time_window_tracker
@@ -161,6 +162,9 @@ class Service(framework.service.Service):
             get_project_member().shutdown()
         if get_scheduler():
             await get_scheduler().stop()
+        await fastapi.concurrency.run_in_threadpool(
+            framework.utils.notifications.dispatcher.get_notification_dispatcher().stop
+        )
 
     def _initialize_data(self):
         if (
@@ -191,6 +195,9 @@ class Service(framework.service.Service):
             == "enabled"
         ):
             self._start_periodic_project_summaries_calculation()
+        else:
+            # the project summaries are calculated by another replica, which needs the changes made by this replica
+            self._start_periodic_project_summaries_changes_flush()
         self._start_periodic_partition_management()
         self._start_periodic_refresh_smtp_configuration()
         if mlconf.httpdb.clusterization.chief.feature_gates.start_logs == "enabled":
@@ -574,6 +581,20 @@ class Service(framework.service.Service):
                 services.api.crud.projects.Projects().refresh_project_resources_counters_cache,
             )
 
+    def _start_periodic_project_summaries_changes_flush(self):
+        interval = int(mlconf.monitoring.projects.summaries.cache_interval)
+        if interval > 0:
+            self._logger.info(
+                "Starting periodic project summaries changes flush", interval=interval
+            )
+            run_function_periodically(
+                interval,
+                get_db().flush_project_summaries_changes.__name__,
+                False,
+                framework.db.session.run_function_with_new_db_session,
+                get_db().flush_project_summaries_changes,
+            )
+
     def _start_periodic_partition_management(self):
         for table_name, retention_days in mlconf.object_retentions.items():
             self._logger.info(
@@ -758,7 +779,7 @@ class Service(framework.service.Service):
         finally:
             close_session(db_session)
 
-    def _push_terminal_run_notifications(
+    async def _push_terminal_run_notifications(
         self,
         db_session,
         last_update_time: datetime.datetime,
@@ -768,7 +789,29 @@ class Service(framework.service.Service):
         Get all runs with notification configs which became terminal since the last call to the function
         and push their notifications if they haven't been pushed yet.
         """
+        # the DB reads and the pushes must not block the API event loop
+        unmasked_runs = await fastapi.concurrency.run_in_threadpool(
+            self._get_terminal_runs_with_notifications, db_session, last_update_time, db
+        )
+        if not unmasked_runs:
+            return
 
+        run_notification_pusher_class = (
+            framework.utils.notifications.notification_pusher.RunNotificationPusher
+        )
+        await framework.utils.notifications.dispatcher.get_notification_dispatcher().dispatch_async(
+            run_notification_pusher_class(
+                unmasked_runs,
+                run_notification_pusher_class.resolve_notifications_default_params(),
+            )
+        )
+
+    def _get_terminal_runs_with_notifications(
+        self,
+        db_session,
+        last_update_time: datetime.datetime,
+        db: framework.db.base.DBInterface,
+    ) -> list:
         # When pushing notifications, push notifications only for runs that entered a terminal state
         # since the last time we pushed notifications.
         # On the first time we push notifications, we'll push notifications for all runs that are in a terminal state
@@ -783,7 +826,7 @@ class Service(framework.service.Service):
         )
 
         if not len(runs):
-            return
+            return []
 
         # Unmasking the run parameters from secrets before handing them over to the notification handler
         # as importing the `Secrets` crud in the notification handler will cause a circular import
@@ -805,13 +848,7 @@ class Service(framework.service.Service):
         self._logger.debug(
             "Got terminal runs with configured notifications", runs_amount=len(runs)
         )
-        run_notification_pusher_class = (
-            framework.utils.notifications.notification_pusher.RunNotificationPusher
-        )
-        run_notification_pusher_class(
-            unmasked_runs,
-            run_notification_pusher_class.resolve_notifications_default_params(),
-        ).push()
+        return unmasked_runs
 
     async def _abort_stale_runs(self, stale_runs: list[dict]):
         semaphore = asyncio.Semaphore(
@@ -20,6 +20,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional, Union
 
 import humanfriendly
+import kubernetes.watch
 from kubernetes import client as k8s_client
 from kubernetes.client.rest import ApiException
 from sqlalchemy.orm import Session
@@ -46,6 +47,7 @@ import services.api.common.runtime_handlers
 import services.api.crud as crud
 from framework.constants import LogSources
 from framework.db.base import DBInterface
+from services.api.runtime_handlers.informer import RuntimeResourcesInformer
 
 
 class BaseRuntimeHandler(ABC):
@@ -53,6 +55,8 @@ class BaseRuntimeHandler(ABC):
     kind = "base"
     class_modes: dict[RuntimeClassMode, str] = {}
     wait_for_deletion_interval = 10
+    _runtime_resources_informer: Optional[RuntimeResourcesInformer] = None
+    _last_full_runs_monitoring: Optional[datetime] = None
 
     @abstractmethod
     def run(
@@ -188,6 +192,23 @@ class BaseRuntimeHandler(ABC):
         self.delete_resources(db, db_session, label_selector, force, grace_period)
 
     def monitor_runs(self, db: DBInterface, db_session: Session) -> list[dict]:
+        informer = self._get_runtime_resources_informer()
+        if (
+            informer
+            and informer.is_synced()
+            and not self._is_full_runs_monitoring_due()
+        ):
+            return self._monitor_changed_runtime_resources(db, db_session, informer)
+
+        if informer:
+            # the full monitoring below handles the current state of all resources, including the queued changes
+            informer.pop_changed_resources()
+        self._last_full_runs_monitoring = now_date()
+        return self._monitor_all_runtime_resources(db, db_session)
+
+    def _monitor_all_runtime_resources(
+        self, db: DBInterface, db_session: Session
+    ) -> list[dict]:
         namespace = framework.utils.singletons.k8s.get_k8s_helper().resolve_namespace()
         label_selector = self._get_default_label_selector()
         crd_group, crd_version, crd_plural = self._get_crd_info()
@@ -206,28 +227,18 @@ class BaseRuntimeHandler(ABC):
             project, uid, name = self._resolve_runtime_resource_run(runtime_resource)
             run_runtime_resources_map.setdefault(project, {})
             run_runtime_resources_map.get(project).update({uid: {"name": name}})
-            try:
-                self._monitor_runtime_resource(
-                    db,
-                    db_session,
-                    project_run_uid_map,
-                    runtime_resource,
-                    runtime_resource_is_crd,
-                    namespace,
-                    project,
-                    uid,
-                    name,
-                    stale_runs,
-                )
-            except Exception as exc:
-                logger.warning(
-                    "Failed monitoring runtime resource. Continuing",
-                    runtime_resource_name=runtime_resource["metadata"]["name"],
-                    project_name=project,
-                    namespace=namespace,
-                    exc=err_to_str(exc),
-                    traceback=traceback.format_exc(),
-                )
+            self._monitor_runtime_resource_and_continue_on_failure(
+                db,
+                db_session,
+                project_run_uid_map,
+                runtime_resource,
+                runtime_resource_is_crd,
+                namespace,
+                project,
+                uid,
+                name,
+                stale_runs,
+            )
 
         self._terminate_resourceless_runs(
             db, db_session, project_run_uid_map, run_runtime_resources_map
@@ -235,6 +246,159 @@ class BaseRuntimeHandler(ABC):
 
         return stale_runs
 
+    def _monitor_changed_runtime_resources(
+        self,
+        db: DBInterface,
+        db_session: Session,
+        informer: RuntimeResourcesInformer,
+    ) -> list[dict]:
+        """monitor only the runtime resources that changed since the previous monitoring cycle"""
+        runtime_resources = informer.pop_changed_resources()
+        if not runtime_resources:
+            return []
+
+        namespace = framework.utils.singletons.k8s.get_k8s_helper().resolve_namespace()
+        crd_group, crd_version, crd_plural = self._get_crd_info()
+        runtime_resource_is_crd = bool(crd_group and crd_version and crd_plural)
+        runtime_resources_runs = [
+            (runtime_resource, *self._resolve_runtime_resource_run(runtime_resource))
+            for runtime_resource in runtime_resources
+        ]
+        project_run_uid_map = self._list_runs_for_monitoring(
+            db,
+            db_session,
+            states=mlrun.common.runtimes.constants.RunStates.non_terminal_states(),
+            uids=[uid for _, _, uid, _ in runtime_resources_runs if uid],
+        )
+        stale_runs = []
+        for runtime_resource, project, uid, name in runtime_resources_runs:
+            self._monitor_runtime_resource_and_continue_on_failure(
+                db,
+                db_session,
+                project_run_uid_map,
+                runtime_resource,
+                runtime_resource_is_crd,
+                namespace,
+                project,
+                uid,
+                name,
+                stale_runs,
+            )
+        return stale_runs
+
+    def _monitor_runtime_resource_and_continue_on_failure(
+        self,
+        db: DBInterface,
+        db_session: Session,
+        project_run_uid_map: dict,
+        runtime_resource: dict,
+        runtime_resource_is_crd: bool,
+        namespace: str,
+        project: str,
+        uid: str,
+        name: str,
+        stale_runs: list[dict],
+    ):
+        try:
+            self._monitor_runtime_resource(
+                db,
+                db_session,
+                project_run_uid_map,
+                runtime_resource,
+                runtime_resource_is_crd,
+                namespace,
+                project,
+                uid,
+                name,
+                stale_runs,
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed monitoring runtime resource. Continuing",
+                runtime_resource_name=runtime_resource["metadata"]["name"],
+                project_name=project,
+                namespace=namespace,
+                exc=err_to_str(exc),
+                traceback=traceback.format_exc(),
+            )
+
+    def _get_runtime_resources_informer(
+        self,
+    ) -> Optional[RuntimeResourcesInformer]:
+        if not config.monitoring.runs.informer.enabled:
+            return None
+        if self._runtime_resources_informer is None:
+            self._runtime_resources_informer = RuntimeResourcesInformer(
+                self.kind,
+                self._list_runtime_resources_with_resource_version,
+                self._watch_runtime_resources,
+            )
+        self._runtime_resources_informer.start()
+        return self._runtime_resources_informer
+
+    def _is_full_runs_monitoring_due(self) -> bool:
+        if not self._last_full_runs_monitoring:
+            return True
+        resync_interval = int(config.monitoring.runs.informer.resync_interval)
+        return now_date() - self._last_full_runs_monitoring >= timedelta(
+            seconds=resync_interval
+        )
+
+    def _list_runtime_resources_with_resource_version(
+        self,
+    ) -> tuple[list[dict], str]:
+        """list all the runtime resources of the kind in a single snapshot, used to (re)fill the informer cache"""
+        k8s_helper = framework.utils.singletons.k8s.get_k8s_helper()
+        namespace = k8s_helper.resolve_namespace()
+        label_selector = self._get_default_label_selector()
+        crd_group, crd_version, crd_plural = self._get_crd_info()
+        if crd_group and crd_version and crd_plural:
+            crd_objects = k8s_helper.crdapi.list_namespaced_custom_object(
+                crd_group,
+                crd_version,
+                namespace,
+                crd_plural,
+                label_selector=label_selector,
+            )
+            return crd_objects["items"], crd_objects["metadata"]["resourceVersion"]
+
+        pods = k8s_helper.v1api.list_namespaced_pod(
+            namespace, label_selector=label_selector
+        )
+        return [pod.to_dict() for pod in pods.items], pods.metadata.resource_version
+
+    def _watch_runtime_resources(self, resource_version: str):
+        """stream the runtime resources watch events, objects are converted to dicts as in the listings"""
+        k8s_helper = framework.utils.singletons.k8s.get_k8s_helper()
+        namespace = k8s_helper.resolve_namespace()
+        watch_kwargs = {
+            "label_selector": self._get_default_label_selector(),
+            "resource_version": resource_version,
+            "timeout_seconds": int(config.monitoring.runs.informer.watch_timeout),
+            "allow_watch_bookmarks": True,
+        }
+        crd_group, crd_version, crd_plural = self._get_crd_info()
+        watch = kubernetes.watch.Watch()
+        if crd_group and crd_version and crd_plural:
+            yield from watch.stream(
+                k8s_helper.crdapi.list_namespaced_custom_object,
+                crd_group,
+                crd_version,
+                namespace,
+                crd_plural,
+                **watch_kwargs,
+            )
+            return
+
+        for event in watch.stream(
+            k8s_helper.v1api.list_namespaced_pod, namespace, **watch_kwargs
+        ):
+            pod = event["object"]
+            yield {
+                "type": event["type"],
+                "object": pod.to_dict() if hasattr(pod, "to_dict") else pod,
+            }
+
     def resolve_label_selector(
         self,
         project: str,
@@ -1246,8 +1410,14 @@ class BaseRuntimeHandler(ABC):
         return True, last_update
 
     def _list_runs_for_monitoring(
-        self, db: DBInterface, db_session: Session, states: Optional[list] = None
+        self,
+        db: DBInterface,
+        db_session: Session,
+        states: Optional[list] = None,
+        uids: Optional[list[str]] = None,
     ):
+        if uids is not None and not uids:
+            return {}
         last_update_time_from = None
         if config.monitoring.runs.list_runs_time_period_in_days:
             last_update_time_from = (
@@ -1260,6 +1430,7 @@ class BaseRuntimeHandler(ABC):
         runs = db.list_runs(
             db_session,
             project="*",
+            uid=uids,
             states=states,
             labels=f"{mlrun_constants.MLRunInternalLabels.kind}={self.kind}",
             last_update_time_from=last_update_time_from,
@@ -0,0 +1,209 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import collections
+import threading
+import traceback
+import typing
+
+from kubernetes.client.rest import ApiException
+
+from mlrun.errors import err_to_str
+from mlrun.utils import logger
+
+
+class ResourceVersionExpiredError(Exception):
+    """the watched resource version is too old (410 Gone), a full relist is required"""
+
+    pass
+
+
+class WatchEventTypes:
+    added = "ADDED"
+    modified = "MODIFIED"
+    deleted = "DELETED"
+    bookmark = "BOOKMARK"
+    error = "ERROR"
+
+
+class RuntimeResourcesInformer:
+    """
+    Informer style local cache of the runtime resources (pods or CRD objects) of a runtime kind.
+
+    The cache is filled by a full listing and then kept up to date by a resourceVersion based watch stream that runs
+    on a background thread. Every added, modified or deleted resource is pushed to a reconciliation queue
+    (deduplicated by resource name, keeping the latest state), which the runs monitoring drains on every cycle so only
+    resources that changed since the previous cycle are processed.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        list_resources: typing.Callable[[], tuple[list[dict], str]],
+        watch_resources: typing.Callable[[str], typing.Iterator[dict]],
+        retry_interval: float = 5,
+        missing_resource_retry_interval: float = 300,
+    ):
+        """
+        :param kind:            runtime kind, for logging
+        :param list_resources:  returns all the resources (as dicts) and the resource version of the listing
+        :param watch_resources: returns a stream of watch events ({"type": ..., "object": <dict>}) starting from the
+                                given resource version, the stream may end (e.g. on timeout) and will be resumed
+        :param retry_interval:  seconds to wait before relisting after an unexpected failure
+        :param missing_resource_retry_interval: seconds to wait before relisting when the resource is not defined in
+                                                the cluster (e.g. the CRD of the runtime is not installed)
+        """
+        self._kind = kind
+        self._list_resources = list_resources
+        self._watch_resources = watch_resources
+        self._retry_interval = retry_interval
+        self._missing_resource_retry_interval = missing_resource_retry_interval
+
+        self._lock = threading.Lock()
+        self._resources: dict[str, dict] = {}
+        self._reconciliation_queue: collections.OrderedDict[str, dict] = (
+            collections.OrderedDict()
+        )
+        self._resource_version: typing.Optional[str] = None
+        self._synced = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: typing.Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"{self._kind}-runtime-resources-informer"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def is_synced(self) -> bool:
+        """whether the cache reflects the cluster state (listed and watching)"""
+        return (
+            self._synced.is_set()
+            and self._thread is not None
+            and self._thread.is_alive()
+        )
+
+    def wait_for_sync(self, timeout: typing.Optional[float] = None) -> bool:
+        return self._synced.wait(timeout)
+
+    def list_resources(self) -> list[dict]:
+        with self._lock:
+            return list(self._resources.values())
+
+    def pop_changed_resources(self) -> list[dict]:
+        """drain the reconciliation queue, returns the latest state of every resource that changed"""
+        with self._lock:
+            resources = list(self._reconciliation_queue.values())
+            self._reconciliation_queue.clear()
+        return resources
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                if self._resource_version is None:
+                    self._relist()
+                for event in self._watch_resources(self._resource_version):
+                    if self._stop_event.is_set():
+                        return
+                    self._handle_event(event)
+            except ResourceVersionExpiredError:
+                logger.debug(
+                    "Watched resource version expired, relisting runtime resources",
+                    kind=self._kind,
+                )
+                self._resource_version = None
+            except ApiException as exc:
+                self._resource_version = None
+                if exc.status == 404:
+                    logger.debug(
+                        "Runtime resource is not defined, not watching",
+                        kind=self._kind,
+                    )
+                    self._synced.clear()
+                    self._stop_event.wait(self._missing_resource_retry_interval)
+                elif exc.status != 410:
+                    self._on_failure(exc)
+            except Exception as exc:
+                self._resource_version = None
+                self._on_failure(exc)
+
+    def _on_failure(self, exc: Exception):
+        self._synced.clear()
+        logger.warning(
+            "Failed watching runtime resources, relisting",
+            kind=self._kind,
+            exc=err_to_str(exc),
+            traceback=traceback.format_exc(),
+        )
+        self._stop_event.wait(self._retry_interval)
+
+    def _relist(self):
+        resources, resource_version = self._list_resources()
+        resources = {self._get_name(resource): resource for resource in resources}
+        with self._lock:
+            # resources that changed or were removed while we were not watching
+            for name, resource in resources.items():
+                cached_resource = self._resources.get(name)
+                if cached_resource is None or self._get_resource_version(
+                    cached_resource
+                ) != self._get_resource_version(resource):
+                    self._enqueue(name, resource)
+            for name, resource in self._resources.items():
+                if name not in resources:
+                    self._enqueue(name, resource)
+            self._resources = resources
+        self._resource_version = resource_version
+        self._synced.set()
+
+    def _handle_event(self, event: dict):
+        event_type = event["type"]
+        resource = event["object"]
+        if event_type == WatchEventTypes.error:
+            if isinstance(resource, dict) and resource.get("code") == 410:
+                raise ResourceVersionExpiredError()
+            raise RuntimeError(f"Watch error event: {resource}")
+
+        resource_version = self._get_resource_version(resource)
+        if event_type != WatchEventTypes.bookmark:
+            name = self._get_name(resource)
+            with self._lock:
+                if event_type == WatchEventTypes.deleted:
+                    self._resources.pop(name, None)
+                else:
+                    self._resources[name] = resource
+                # deleted resources are queued as well, their last state may be terminal
+                self._enqueue(name, resource)
+        if resource_version:
+            self._resource_version = resource_version
+
+    def _enqueue(self, name: str, resource: dict):
+        self._reconciliation_queue.pop(name, None)
+        self._reconciliation_queue[name] = resource
+
+    @staticmethod
+    def _get_name(resource: dict) -> str:
+        return resource["metadata"]["name"]
+
+    @staticmethod
+    def _get_resource_version(resource: dict) -> typing.Optional[str]:
+        # pods are converted to snake case dicts, custom objects are kept in camel case
+        metadata = resource.get("metadata", {})
+        return metadata.get("resource_version") or metadata.get("resourceVersion")
@@ -38,6 +38,24 @@ def monitoring_deployment() -> mm_dep.MonitoringDeployment:
     )
 
 
+def test_enable_stream_triggers_batching() -> None:
+    function = mlrun.new_function("controller", kind="nuclio")
+    function.add_v3io_stream_trigger(
+        stream_path="v3io:///projects/some-project/controller-stream",
+        name="monitoring_controller_trigger",
+    )
+    function.add_trigger("cron_interval", {"kind": "cron"})
+    mm_dep.MonitoringDeployment._enable_stream_triggers_batching(
+        function=function,
+        batching_args=mlrun.mlconf.model_endpoint_monitoring.controller_stream_args.batching,
+    )
+
+    assert function.spec.config["spec.triggers.monitoring_controller_trigger"][
+        "batch"
+    ] == {"mode": "enable", "batchSize": 32, "timeout": "1s"}
+    assert "batch" not in function.spec.config["spec.triggers.cron_interval"]
+
+
 class SecretTester(services.api.crud.secrets.Secrets):
     _secrets: dict[str, dict[str, str]] = {}
 
@@ -18,6 +18,7 @@ import fastapi.testclient
 import pytest
 import sqlalchemy.orm
 
+import mlrun.common.runtimes.constants
 import mlrun.common.schemas
 import mlrun.errors
 
@@ -78,3 +79,87 @@ class TestLogs:
         else:
             log_size = await services.api.crud.Logs().get_log_size(project, uid)
             assert return_value == log_size
+
+    @pytest.mark.asyncio
+    async def test_watch_logs(
+        self,
+        db: sqlalchemy.orm.Session,
+        client: fastapi.testclient.TestClient,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(
+            mlrun.mlconf.log_collector,
+            "mode",
+            mlrun.common.schemas.LogsCollectorMode.legacy,
+        )
+        monkeypatch.setattr(mlrun.mlconf.httpdb.logs.streaming, "poll_interval", 0.01)
+        monkeypatch.setattr(mlrun.mlconf.httpdb.logs.streaming, "timeout", 10)
+        monkeypatch.setattr(
+            mlrun.mlconf.httpdb.logs, "pull_logs_default_interval", 0.05
+        )
+        project = "project-name"
+        uid = "m33"
+        services.api.crud.Runs().store_run(
+            db,
+            {
+                "metadata": {"name": "run-name"},
+                "status": {"state": mlrun.common.runtimes.constants.RunStates.running},
+            },
+            uid,
+            project=project,
+        )
+        services.api.crud.Logs().store_log(b"first", project, uid)
+
+        logs = []
+        async for log in services.api.crud.Logs().watch_logs(project, uid, offset=2):
+            logs.append(log)
+            if len(logs) == 1:
+                # new logs are pushed as they are written, until the run finished
+                services.api.crud.Logs().store_log(b"second", project, uid)
+                services.api.crud.Runs().update_run(
+                    db,
+                    project,
+                    uid,
+                    0,
+                    data={
+                        "status.state": mlrun.common.runtimes.constants.RunStates.completed
+                    },
+                )
+        assert logs == [b"rst", b"second"]
+
+    @pytest.mark.asyncio
+    async def test_watch_logs_caches_the_run_state(
+        self,
+        db: sqlalchemy.orm.Session,
+        client: fastapi.testclient.TestClient,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(
+            mlrun.mlconf.log_collector,
+            "mode",
+            mlrun.common.schemas.LogsCollectorMode.legacy,
+        )
+        monkeypatch.setattr(mlrun.mlconf.httpdb.logs.streaming, "poll_interval", 0.01)
+        monkeypatch.setattr(mlrun.mlconf.httpdb.logs.streaming, "timeout", 0.3)
+        monkeypatch.setattr(mlrun.mlconf.httpdb.logs, "pull_logs_default_interval", 10)
+        project = "project-name"
+        uid = "m33"
+        services.api.crud.Runs().store_run(
+            db,
+            {
+                "metadata": {"name": "run-name"},
+                "status": {"state": mlrun.common.runtimes.constants.RunStates.running},
+            },
+            uid,
+            project=project,
+        )
+        services.api.crud.Logs().store_log(b"log", project, uid)
+        get_run_for_log = unittest.mock.AsyncMock(
+            wraps=services.api.crud.Logs.get_run_for_log
+        )
+        monkeypatch.setattr(services.api.crud.Logs, "get_run_for_log", get_run_for_log)
+
+        logs = [log async for log in services.api.crud.Logs().watch_logs(project, uid)]
+        assert logs == [b"log"]
+        # the run is read once per state interval, not on every poll
+        assert get_run_for_log.call_count == 1
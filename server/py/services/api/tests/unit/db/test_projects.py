@@ -19,11 +19,13 @@ import deepdiff
 import pytest
 
 import mlrun.common.formatters
+import mlrun.common.runtimes.constants
 import mlrun.common.schemas
 import mlrun.config
 import mlrun.errors
 
 from framework.db.sqldb.models import Project
+from framework.db.sqldb.project_summaries import project_summaries_changes
 from framework.tests.unit.db.common_fixtures import TestDatabaseBase
 
 
@@ -360,6 +362,45 @@ class TestProjects(TestDatabaseBase):
         deleted_summary = self._db_session.delete.call_args[0][0]
         assert deleted_summary.project == "project-summary-2"
 
+    def test_project_summaries_changes(self):
+        for project_name in ["project-1", "project-2"]:
+            self._db.create_project(
+                self._db_session, self._generate_project(project_name)
+            )
+        # flush the changes of previous tests
+        project_summaries_changes.pop_changed_projects()
+
+        run = {
+            "metadata": {"name": "run-name", "project": "project-1"},
+            "status": {"state": mlrun.common.runtimes.constants.RunStates.running},
+        }
+        self._db.store_run(self._db_session, run, "uid-1", "project-1")
+        assert project_summaries_changes.pop_changed_projects() == {"project-1"}
+        self._db.store_run(self._db_session, run, "uid-2", "project-1")
+
+        # the summaries are not changed until the changes are flushed
+        assert self._db.list_changed_project_summaries(self._db_session) == []
+        self._db.flush_project_summaries_changes(self._db_session)
+        assert self._db.list_changed_project_summaries(self._db_session) == [
+            "project-1"
+        ]
+
+        # the counters can be calculated for the changed projects only
+        _, _, running_runs_count = self._db._calculate_runs_counters(
+            self._db_session, ["project-1"]
+        )
+        assert running_runs_count == {"project-1": 1}
+
+        self._db.refresh_project_summaries(
+            self._db_session,
+            [mlrun.common.schemas.ProjectSummary(name="project-1")],
+        )
+        assert self._db.list_changed_project_summaries(self._db_session) == []
+
+        # bulk deletions are tracked as well
+        self._db._delete_project_runs(self._db_session, "project-1")
+        assert project_summaries_changes.pop_changed_projects() == {"project-1"}
+
     def test_projects_crud(self):
         project = mlrun.common.schemas.Project(
             metadata=mlrun.common.schemas.ProjectMetadata(name="p1"),
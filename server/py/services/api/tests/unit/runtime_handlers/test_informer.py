@@ -0,0 +1,147 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import queue
+import time
+
+import pytest
+
+from services.api.runtime_handlers.informer import RuntimeResourcesInformer
+
+
+class FakeK8sResources:
+    """fake k8s api, resources are listed from a dict and watch events are emitted from a queue"""
+
+    def __init__(self, resources: dict[str, dict]):
+        self.resources = resources
+        self.resource_version = 1
+        self.events = queue.Queue()
+        self.list_calls = 0
+        self.watched_resource_versions = []
+
+    def list_resources(self):
+        self.list_calls += 1
+        return list(self.resources.values()), str(self.resource_version)
+
+    def watch_resources(self, resource_version):
+        self.watched_resource_versions.append(resource_version)
+        while True:
+            try:
+                event = self.events.get(timeout=0.05)
+            except queue.Empty:
+                # simulate the server side watch timeout
+                return
+            yield event
+
+    def emit(self, event_type, name, state=None):
+        self.resource_version += 1
+        resource = _generate_resource(name, self.resource_version, state)
+        if event_type == "DELETED":
+            self.resources.pop(name, None)
+        else:
+            self.resources[name] = resource
+        self.events.put({"type": event_type, "object": resource})
+
+    def expire_resource_version(self):
+        self.events.put({"type": "ERROR", "object": {"code": 410, "reason": "Gone"}})
+
+
+def _generate_resource(name, resource_version, state=None):
+    return {
+        "metadata": {"name": name, "resource_version": str(resource_version)},
+        "status": {"phase": state},
+    }
+
+
+def _wait_for(condition, timeout=5):
+    start = time.monotonic()
+    while not condition():
+        if time.monotonic() - start > timeout:
+            pytest.fail("Timed out waiting for the informer")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def fake_k8s():
+    return FakeK8sResources(
+        {
+            "pod-a": _generate_resource("pod-a", 1, "Running"),
+            "pod-b": _generate_resource("pod-b", 1, "Pending"),
+        }
+    )
+
+
+@pytest.fixture
+def informer(fake_k8s):
+    informer = RuntimeResourcesInformer(
+        "job",
+        fake_k8s.list_resources,
+        fake_k8s.watch_resources,
+        retry_interval=0.01,
+    )
+    informer.start()
+    assert informer.wait_for_sync(timeout=5)
+    yield informer
+    informer.stop()
+
+
+def _changed_resources(informer):
+    return {
+        resource["metadata"]["name"]: resource["status"]["phase"]
+        for resource in informer.pop_changed_resources()
+    }
+
+
+def test_informer_queues_only_changed_resources(fake_k8s, informer):
+    # the initial listing queues all the resources
+    assert _changed_resources(informer) == {"pod-a": "Running", "pod-b": "Pending"}
+    assert informer.pop_changed_resources() == []
+
+    fake_k8s.emit("MODIFIED", "pod-b", "Running")
+    fake_k8s.emit("MODIFIED", "pod-b", "Succeeded")
+    fake_k8s.emit("ADDED", "pod-c", "Pending")
+    fake_k8s.emit("DELETED", "pod-a", "Failed")
+    _wait_for(lambda: fake_k8s.events.empty())
+    _wait_for(lambda: len(informer._reconciliation_queue) == 3)
+
+    # multiple changes of the same resource are deduplicated to the latest state, deleted resources are queued with
+    # their last state
+    assert _changed_resources(informer) == {
+        "pod-b": "Succeeded",
+        "pod-c": "Pending",
+        "pod-a": "Failed",
+    }
+    assert sorted(
+        resource["metadata"]["name"] for resource in informer.list_resources()
+    ) == ["pod-b", "pod-c"]
+    assert fake_k8s.list_calls == 1
+    # the watch is resumed from the last seen resource version
+    _wait_for(lambda: fake_k8s.watched_resource_versions[-1] == "5")
+
+
+def test_informer_relists_when_resource_version_expired(fake_k8s, informer):
+    informer.pop_changed_resources()
+
+    # changes that happened while the watch was broken are found by the relist
+    fake_k8s.resources["pod-b"] = _generate_resource("pod-b", 10, "Succeeded")
+    fake_k8s.resources.pop("pod-a")
+    fake_k8s.expire_resource_version()
+    _wait_for(lambda: fake_k8s.list_calls == 2)
+    _wait_for(lambda: len(informer._reconciliation_queue) == 2)
+
+    assert _changed_resources(informer) == {"pod-b": "Succeeded", "pod-a": "Running"}
+    assert [resource["metadata"]["name"] for resource in informer.list_resources()] == [
+        "pod-b"
+    ]
+    assert informer.is_synced()
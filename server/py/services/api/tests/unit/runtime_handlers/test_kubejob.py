@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import queue
+import time
 import unittest.mock
 from datetime import datetime, timedelta, timezone
 
@@ -32,6 +34,7 @@ import framework.utils.helpers
 import framework.utils.singletons.db
 import services.api.crud
 from framework.utils.singletons.db import get_db
+from framework.utils.singletons.k8s import get_k8s_helper
 from services.api.runtime_handlers import get_runtime_handler
 from services.api.tests.unit.runtime_handlers.base import TestRuntimeHandlerBase
 
@@ -767,6 +770,66 @@ class TestKubejobRuntimeHandler(TestRuntimeHandlerBase):
             db, self.project, self.run_uid, RunStates.completed
         )
 
+    @pytest.mark.asyncio
+    async def test_monitor_runs_with_informer(
+        self, db: Session, client: TestClient, monkeypatch
+    ):
+        monkeypatch.setattr(config.monitoring.runs.informer, "enabled", True)
+        monkeypatch.setattr(config.monitoring.runs, "list_runs_time_period_in_days", 7)
+        watch_events = queue.Queue()
+
+        class FakeWatch:
+            def stream(self, func, *args, **kwargs):
+                while True:
+                    try:
+                        yield watch_events.get(timeout=0.05)
+                    except queue.Empty:
+                        return
+
+        self.running_job_pod.metadata.resource_version = "1"
+        self.completed_job_pod.metadata.resource_version = "2"
+        get_k8s_helper().v1api.list_namespaced_pod = unittest.mock.Mock(
+            return_value=k8s_client.V1PodList(
+                items=[self.running_job_pod],
+                metadata=k8s_client.V1ListMeta(resource_version="1"),
+            )
+        )
+        self._mock_read_namespaced_pod_log()
+
+        try:
+            with unittest.mock.patch("kubernetes.watch.Watch", FakeWatch):
+                # first cycle is a full monitoring, the informer is not synced yet
+                self.runtime_handler.monitor_runs(get_db(), db)
+                informer = self.runtime_handler._runtime_resources_informer
+                assert informer.wait_for_sync(timeout=5)
+                self._assert_run_reached_state(
+                    db, self.project, self.run_uid, RunStates.running
+                )
+
+                watch_events.put({"type": "MODIFIED", "object": self.completed_job_pod})
+                start = time.monotonic()
+                while not any(
+                    resource["status"]["phase"] == PodPhases.succeeded
+                    for resource in informer._reconciliation_queue.values()
+                ):
+                    assert time.monotonic() - start < 5
+                    time.sleep(0.01)
+
+                # only the changed pod is monitored, without listing all the resources and runs
+                with unittest.mock.patch.object(
+                    self.runtime_handler, "_monitor_all_runtime_resources"
+                ) as monitor_all_runtime_resources:
+                    self.runtime_handler.monitor_runs(get_db(), db)
+                monitor_all_runtime_resources.assert_not_called()
+        finally:
+            self.runtime_handler._runtime_resources_informer.stop()
+            self.runtime_handler._runtime_resources_informer = None
+            self.runtime_handler._last_full_runs_monitoring = None
+
+        self._assert_run_reached_state(
+            db, self.project, self.run_uid, RunStates.completed
+        )
+
     @pytest.mark.asyncio
     async def test_monitor_run_debouncing_resource_not_found(
         self, db: Session, client: TestClient
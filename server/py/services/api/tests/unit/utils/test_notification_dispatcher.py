@@ -0,0 +1,289 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import time
+import typing
+import unittest.mock
+
+import aiohttp
+import pytest
+
+import mlrun.common.runtimes.constants as runtimes_constants
+import mlrun.common.schemas
+import mlrun.model
+from mlrun.utils.notifications.notification.console import ConsoleNotification
+from mlrun.utils.notifications.notification.mail import MailNotification
+from mlrun.utils.notifications.notification_pusher import NotificationPusher
+
+from framework.utils.notifications.dispatcher import NotificationDispatcher
+
+
+class FakeWebhooks:
+    """fake aiohttp post, failing the first pushes to each url with the given statuses"""
+
+    def __init__(
+        self,
+        failures: typing.Optional[dict[str, list[int]]] = None,
+        latency: float = 0.0,
+    ):
+        self.failures = failures or {}
+        self.latency = latency
+        self.calls = []
+        self.sessions = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def post(self, session, url, **kwargs):
+        self.calls.append((url, time.monotonic()))
+        self.sessions.add(id(session))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        response = unittest.mock.MagicMock()
+        failures = self.failures.get(url)
+        if failures:
+            status = failures.pop(0)
+            response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+                request_info=unittest.mock.MagicMock(), history=(), status=status
+            )
+        return response
+
+
+@pytest.fixture
+def webhooks(monkeypatch) -> FakeWebhooks:
+    webhooks = FakeWebhooks()
+
+    async def post(session, url, **kwargs):
+        return await webhooks.post(session, url, **kwargs)
+
+    monkeypatch.setattr(aiohttp.ClientSession, "post", post)
+    return webhooks
+
+
+@pytest.fixture
+def run_db(monkeypatch) -> unittest.mock.MagicMock:
+    run_db = unittest.mock.MagicMock()
+    monkeypatch.setattr(mlrun, "get_run_db", lambda *args, **kwargs: run_db)
+    return run_db
+
+
+@pytest.fixture
+def dispatcher():
+    dispatcher = NotificationDispatcher(retry_backoff=0.01)
+    yield dispatcher
+    dispatcher.stop()
+
+
+def _generate_run(
+    uid: str,
+    urls: list[str],
+    kind: str = mlrun.common.schemas.NotificationKind.webhook,
+    params: typing.Optional[dict] = None,
+) -> mlrun.model.RunObject:
+    return mlrun.model.RunObject.from_dict(
+        {
+            "metadata": {"uid": uid, "project": "test-project", "name": uid},
+            "spec": {
+                "notifications": [
+                    {
+                        "kind": kind,
+                        "name": f"{kind}-{index}",
+                        "when": [runtimes_constants.RunStates.error],
+                        "params": params or {"url": url},
+                    }
+                    for index, url in enumerate(urls)
+                ]
+            },
+            "status": {"state": runtimes_constants.RunStates.error},
+        }
+    )
+
+
+def _stored_statuses(run_db) -> dict[str, list[str]]:
+    return {
+        call.args[1]: [notification.status for notification in call.args[0]]
+        for call in run_db.store_run_notifications.call_args_list
+    }
+
+
+def test_dispatch_shares_the_session_and_batches_statuses(webhooks, run_db, dispatcher):
+    runs = [
+        _generate_run(f"run-{i}", [f"http://hook-{i}/a", f"http://hook-{i}/b"])
+        for i in range(10)
+    ]
+    dispatcher.dispatch(NotificationPusher(runs))
+    dispatcher.dispatch(NotificationPusher([_generate_run("run-10", ["http://x"])]))
+
+    assert len(webhooks.calls) == 21
+    assert len(webhooks.sessions) == 1
+    # a single status write per run
+    assert run_db.store_run_notifications.call_count == 11
+    assert _stored_statuses(run_db) == {
+        **{
+            f"run-{i}": [mlrun.common.schemas.NotificationStatus.SENT] * 2
+            for i in range(10)
+        },
+        "run-10": [mlrun.common.schemas.NotificationStatus.SENT],
+    }
+
+
+def test_dispatch_retries_failed_pushes(webhooks, run_db, dispatcher):
+    webhooks.failures = {
+        "http://unavailable": [503, 503],
+        "http://bad-request": [400, 400],
+    }
+    dispatcher.dispatch(
+        NotificationPusher(
+            [
+                _generate_run("run-1", ["http://unavailable"]),
+                _generate_run("run-2", ["http://bad-request"]),
+            ]
+        )
+    )
+
+    assert [url for url, _ in webhooks.calls].count("http://unavailable") == 3
+    assert [url for url, _ in webhooks.calls].count("http://bad-request") == 1
+    assert _stored_statuses(run_db) == {
+        "run-1": [mlrun.common.schemas.NotificationStatus.SENT],
+        "run-2": [mlrun.common.schemas.NotificationStatus.ERROR],
+    }
+
+
+def test_dispatch_rate_limits_per_destination(webhooks, run_db):
+    dispatcher = NotificationDispatcher(destination_rate_limit=20, destination_burst=1)
+    try:
+        dispatcher.dispatch(
+            NotificationPusher(
+                [_generate_run(f"run-{i}", ["http://limited"]) for i in range(5)]
+                + [_generate_run(f"other-{i}", [f"http://other-{i}"]) for i in range(5)]
+            )
+        )
+    finally:
+        dispatcher.stop()
+
+    limited_calls = [at for url, at in webhooks.calls if url == "http://limited"]
+    other_calls = [at for url, at in webhooks.calls if url != "http://limited"]
+    # 1 burst push and 4 more at 20 pushes per second
+    assert limited_calls[-1] - limited_calls[0] >= 0.15
+    assert other_calls[-1] - other_calls[0] < 0.1
+
+
+def test_dispatch_rate_limits_mails_per_recipients(run_db, monkeypatch):
+    sent = []
+
+    async def send_email(**params):
+        sent.append((params["email_addresses"], time.monotonic()))
+
+    monkeypatch.setattr(MailNotification, "_send_email", staticmethod(send_email))
+    mail_params = {
+        "server_host": "smtp.example.com",
+        "server_port": 587,
+        "sender_address": "mlrun@example.com",
+        "username": "user",
+        "password": "pass",
+        "use_tls": True,
+        "start_tls": False,
+        "validate_certs": True,
+    }
+    dispatcher = NotificationDispatcher(destination_rate_limit=20, destination_burst=1)
+    try:
+        dispatcher.dispatch(
+            NotificationPusher(
+                [
+                    _generate_run(
+                        f"run-{i}",
+                        [""],
+                        kind=mlrun.common.schemas.NotificationKind.mail,
+                        params={
+                            **mail_params,
+                            "email_addresses": f"user-{i}@example.com",
+                        },
+                    )
+                    for i in range(5)
+                ]
+                + [
+                    _generate_run(
+                        f"same-{i}",
+                        [""],
+                        kind=mlrun.common.schemas.NotificationKind.mail,
+                        params={**mail_params, "email_addresses": "same@example.com"},
+                    )
+                    for i in range(5)
+                ]
+            )
+        )
+    finally:
+        dispatcher.stop()
+
+    same_recipients = [at for to, at in sent if to == "same@example.com"]
+    other_recipients = [at for to, at in sent if to != "same@example.com"]
+    assert len(same_recipients) == len(other_recipients) == 5
+    # the mails of other recipients (and other projects) don't wait for the rate limit of one recipient
+    assert same_recipients[-1] - same_recipients[0] >= 0.15
+    assert other_recipients[-1] - other_recipients[0] < 0.1
+
+
+def test_notifications_without_destination_are_not_rate_limited():
+    dispatcher = NotificationDispatcher(destination_rate_limit=1, destination_burst=1)
+    try:
+        assert ConsoleNotification().destination is None
+        assert dispatcher._get_bucket(None) is None
+    finally:
+        dispatcher.stop()
+
+
+def test_dispatch_bounds_concurrency(webhooks, run_db):
+    webhooks.latency = 0.02
+    dispatcher = NotificationDispatcher(max_concurrent_pushes=3)
+    try:
+        dispatcher.dispatch(
+            NotificationPusher(
+                [_generate_run(f"run-{i}", [f"http://hook-{i}"]) for i in range(12)]
+            )
+        )
+    finally:
+        dispatcher.stop()
+
+    assert len(webhooks.calls) == 12
+    assert webhooks.max_in_flight == 3
+
+
+def test_dispatch_async_does_not_block_the_event_loop(webhooks, run_db, dispatcher):
+    webhooks.latency = 0.2
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def main():
+        ticker = asyncio.create_task(tick())
+        await dispatcher.dispatch_async(
+            NotificationPusher([_generate_run("run-1", ["http://slow"])])
+        )
+        ticker.cancel()
+
+    asyncio.run(main())
+
+    assert len(webhooks.calls) == 1
+    assert _stored_statuses(run_db) == {
+        "run-1": [mlrun.common.schemas.NotificationStatus.SENT]
+    }
+    # the caller loop kept running while the push was in flight
+    assert len(ticks) > 5
@@ -294,6 +294,11 @@ def test_log_artifact(
         "upload",
         lambda *args, **kwargs: unittest.mock.Mock(),
     )
+    monkeypatch.setattr(
+        mlrun.datastore.DataItem,
+        "upload_and_hash",
+        lambda self, src_path: mlrun.utils.calculate_local_file_hash(src_path),
+    )
     monkeypatch.setattr(
         mlrun.datastore.DataItem,
         "put",
@@ -619,6 +624,30 @@ def test_inline_body():
     assert artifact.metadata.key == "y"
 
 
+@pytest.mark.parametrize("max_files", [1, 4])
+def test_dir_artifact_upload(tmp_path, monkeypatch, max_files):
+    monkeypatch.setattr(mlrun.mlconf.storage.transfer, "max_files", max_files)
+    src_path = tmp_path / "src"
+    src_path.mkdir()
+    file_names = [f"shard-{i}.bin" for i in range(10)]
+    for file_name in file_names:
+        (src_path / file_name).write_bytes(os.urandom(1000))
+
+    artifact = mlrun.artifacts.DirArtifact(
+        "dir", src_path=str(src_path), target_path=str(tmp_path / "target")
+    )
+    artifact.upload()
+
+    assert sorted(artifact.spec.extra_data) == file_names
+    for file_name in file_names:
+        target_path = artifact.spec.extra_data[file_name]
+        assert target_path == str(tmp_path / "target" / file_name)
+        assert (
+            pathlib.Path(target_path).read_bytes()
+            == (src_path / file_name).read_bytes()
+        )
+
+
 def test_register_artifacts(rundb_mock):
     project_name = "my-projects"
     project = mlrun.new_project(project_name)
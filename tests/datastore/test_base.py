@@ -15,6 +15,8 @@
 import os
 import string
 import tempfile
+import threading
+import time
 from contextlib import nullcontext as does_not_raise
 from datetime import datetime
 from unittest.mock import Mock
@@ -36,6 +38,7 @@ from mlrun.datastore.filestore import FileStore
 from mlrun.datastore.google_cloud_storage import GoogleCloudStorageStore
 from mlrun.datastore.redis import RedisStore
 from mlrun.datastore.s3 import S3Store
+from mlrun.datastore.utils import read_files_concurrently
 from mlrun.datastore.v3io import V3ioStore
 
 
@@ -249,3 +252,52 @@ def test_as_df_time_filters(start_time_tz, end_time_tz, df_tz):
                 190 - (80 if start_time_tz else 0) - (90 if end_time_tz else 0)
             )
             assert len(resp) == num_row_expected
+
+
+@pytest.mark.parametrize("engine", [None, "pyarrow"])
+def test_as_df_csv_dir(tmp_path, engine):
+    dfs = [
+        pd.DataFrame({"id": list(range(i * 10, i * 10 + 10)), "value": [i] * 10})
+        for i in range(5)
+    ]
+    for i, df in enumerate(dfs):
+        df.to_csv(tmp_path / f"part-{i}.csv", index=False)
+    # empty files and non csv files are ignored
+    (tmp_path / "empty.csv").touch()
+    (tmp_path / "readme.txt").write_text("not a csv")
+
+    kwargs = {"engine": engine} if engine else {}
+    data_item = mlrun.datastore.store_manager.object(f"file://{tmp_path}")
+    resp = data_item.as_df(format="csv", **kwargs)
+    expected = pd.concat(dfs)
+    pd.testing.assert_frame_equal(
+        resp.sort_values("id").reset_index(drop=True),
+        expected.reset_index(drop=True),
+    )
+
+    resp = data_item.as_df(format="csv", chunksize=4, columns=["id"], **kwargs)
+    assert not isinstance(resp, pd.DataFrame)
+    chunks = list(resp)
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2] * 5
+    assert sorted(pd.concat(chunks)["id"]) == list(range(50))
+
+
+def test_read_files_concurrently_keeps_order():
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def read_file(path):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        # later files finish first
+        time.sleep(0.01 * (10 - path))
+        with lock:
+            in_flight -= 1
+        return path
+
+    results = list(read_files_concurrently(read_file, list(range(10)), max_workers=3))
+    assert results == list(range(10))
+    assert max_in_flight <= 3
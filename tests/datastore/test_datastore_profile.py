@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
+import threading
+import time
 from collections.abc import Iterator
 from unittest.mock import patch
 
@@ -28,6 +31,7 @@ from mlrun.datastore.datastore_profile import (
     DatastoreProfileV3io,
     TDEngineDatastoreProfile,
     datastore_profile_read,
+    invalidate_datastore_profile_cache,
     register_temporary_client_datastore_profile,
     remove_temporary_client_datastore_profile,
 )
@@ -146,6 +150,96 @@ class TestTDEngineProfile:
         assert profile_read.password == "1234", "Wrong password"
 
 
+class TestDatastoreProfilesCache:
+    profile_name = "test-profile"
+    project_name = "test-project"
+
+    @classmethod
+    @pytest.fixture
+    def public_profile(cls, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(
+            f"datastore-profiles.{cls.project_name}.{cls.profile_name}",
+            '{"password": "MTIzNA=="}',
+        )
+        return mlrun.common.schemas.DatastoreProfile(
+            name=cls.profile_name,
+            type="taosws",
+            object='{"type":"dGFvc3dz","name":"dGRlbmdpbmUx","user":"cm9vdA==","host":"MC4wLjAuMA==","port":"NjA0MQ=="}',
+            private=None,
+            project=cls.project_name,
+        )
+
+    def test_profile_is_cached_until_invalidated(self, public_profile) -> None:
+        url = f"ds://{self.profile_name}"
+        with patch(
+            "mlrun.db.nopdb.NopDB.get_datastore_profile", return_value=public_profile
+        ) as get_datastore_profile:
+            for _ in range(3):
+                profile = datastore_profile_read(url, self.project_name)
+                assert profile.password == "1234"
+            assert get_datastore_profile.call_count == 1
+
+            invalidate_datastore_profile_cache(self.profile_name, self.project_name)
+            datastore_profile_read(url, self.project_name)
+            assert get_datastore_profile.call_count == 2
+
+            # profiles are cached per project
+            with pytest.raises(mlrun.errors.MLRunNotFoundError):
+                datastore_profile_read(url, "other-project")
+            assert get_datastore_profile.call_count == 3
+
+    def test_missing_profile_is_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        url = f"ds://{self.profile_name}"
+        with patch(
+            "mlrun.db.nopdb.NopDB.get_datastore_profile",
+            side_effect=mlrun.errors.MLRunNotFoundError("not found"),
+        ) as get_datastore_profile:
+            for _ in range(2):
+                with pytest.raises(mlrun.errors.MLRunNotFoundError):
+                    datastore_profile_read(url, self.project_name)
+            assert get_datastore_profile.call_count == 1
+
+            # the negative caching is bounded by its own ttl
+            monkeypatch.setattr(
+                mlrun.mlconf.datastore_profiles.cache, "negative_ttl", 0
+            )
+            invalidate_datastore_profile_cache(self.profile_name, self.project_name)
+            for _ in range(2):
+                with pytest.raises(mlrun.errors.MLRunNotFoundError):
+                    datastore_profile_read(url, self.project_name)
+            assert get_datastore_profile.call_count == 3
+
+    def test_concurrent_resolvers_share_a_single_fetch(self, public_profile) -> None:
+        release_fetch = threading.Event()
+        fetches = []
+
+        def get_datastore_profile(*args, **kwargs):
+            fetches.append(args)
+            release_fetch.wait(5)
+            return public_profile
+
+        with patch(
+            "mlrun.db.nopdb.NopDB.get_datastore_profile",
+            side_effect=get_datastore_profile,
+        ):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(
+                        datastore_profile_read,
+                        f"ds://{self.profile_name}",
+                        self.project_name,
+                    )
+                    for _ in range(4)
+                ]
+                # let all the resolvers start before completing the fetch
+                time.sleep(0.2)
+                release_fetch.set()
+                profiles = [future.result() for future in futures]
+
+        assert len(fetches) == 1
+        assert all(profile.password == "1234" for profile in profiles)
+
+
 def test_datastore_type_map() -> None:
     assert set(_DATASTORE_TYPE_TO_PROFILE_CLASS.values()) == set(
         DatastoreProfile.__subclasses__()
@@ -337,6 +337,61 @@ def test_verify_data_stores_are_cached_when_not_api():
     assert store._stores["v3io://"]._secrets == {}
 
 
+def test_credentials_stores_are_cached_per_credentials(monkeypatch):
+    monkeypatch.setattr(mlrun.config, "_is_running_as_api", True)
+    user1_secrets = {"V3IO_ACCESS_KEY": "user1-access-key"}
+    user2_secrets = {"V3IO_ACCESS_KEY": "user2-access-key"}
+    store = mlrun.datastore.datastore.StoreManager()
+
+    obj1 = store.object(url="v3io://some-system/user1/a", secrets=user1_secrets)
+    obj2 = store.object(url="v3io://some-system/user2/a", secrets=user2_secrets)
+    assert obj1._store is not obj2._store
+    assert obj2._store._secrets == user2_secrets
+
+    # same schema, endpoint and credentials reuse the store
+    obj3 = store.object(url="v3io://some-system/user1/b", secrets=dict(user1_secrets))
+    assert obj3._store is obj1._store
+    assert store._stores == {}
+    assert store.credentials_stores_cache_stats() == {
+        "hits": 1,
+        "misses": 2,
+        "hit_rate": 1 / 3,
+        "live_stores": 2,
+    }
+
+    # updating the manager secrets drops the cached stores
+    store.set(secrets={"V3IO_API": "some-api"})
+    obj4 = store.object(url="v3io://some-system/user1/b", secrets=user1_secrets)
+    assert obj4._store is not obj1._store
+
+
+def test_credentials_stores_cache_eviction(monkeypatch):
+    monkeypatch.setattr(mlrun.config, "_is_running_as_api", True)
+    mlrun.mlconf.datastore.credentials_stores_cache.max_size = 2
+    store = mlrun.datastore.datastore.StoreManager()
+
+    def get_store(user):
+        return store.object(
+            url=f"v3io://some-system/{user}", secrets={"V3IO_ACCESS_KEY": user}
+        )._store
+
+    user1_store = get_store("user1")
+    get_store("user2")
+    # user1 is the most recently used, so user2 is evicted
+    assert get_store("user1") is user1_store
+    get_store("user3")
+    assert store.credentials_stores_cache_stats()["live_stores"] == 2
+    assert get_store("user1") is user1_store
+    misses = store.credentials_stores_cache_stats()["misses"]
+    get_store("user2")
+    assert store.credentials_stores_cache_stats()["misses"] == misses + 1
+
+    # idle stores are evicted
+    mlrun.mlconf.datastore.credentials_stores_cache.idle_timeout = 0
+    assert get_store("user1") is not user1_store
+    assert store.credentials_stores_cache_stats()["live_stores"] == 1
+
+
 def test_object_from_empty_url():
     user1_secrets = {"V3IO_ACCESS_KEY": "user1-access-key"}
     store = mlrun.datastore.datastore.StoreManager(
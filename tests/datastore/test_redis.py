@@ -0,0 +1,126 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import fnmatch
+import unittest.mock
+
+import pytest
+import redis
+import redis.cluster
+
+import mlrun
+import mlrun.datastore.redis
+from mlrun.datastore.redis import RedisStore
+
+
+class FakeRedis:
+    """minimal in memory redis client, counts the round trips to the server"""
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+        self.scan_counts = []
+
+    def _round_trip(self):
+        self.round_trips += 1
+
+    def set(self, key, value):
+        self._round_trip()
+        self.data[key] = value
+
+    def unlink(self, key):
+        self._round_trip()
+        self.data.pop(key, None)
+
+    def delete(self, key):
+        self.unlink(key)
+
+    def scan_iter(self, match=None, count=None):
+        self.scan_counts.append(count)
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+
+        return command
+
+    def execute(self):
+        self._client.round_trips += 1
+        results = []
+        round_trips = self._client.round_trips
+        for name, args, kwargs in self._commands:
+            results.append(getattr(self._client, name)(*args, **kwargs))
+        self._client.round_trips = round_trips
+        return results
+
+
+def _get_store(endpoint="localhost"):
+    return RedisStore(
+        mlrun.datastore.store_manager, "redis", "redis", endpoint, secrets={}
+    )
+
+
+@pytest.fixture
+def redis_store(monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.redis, "batch_size", 2)
+    monkeypatch.setattr(mlrun.mlconf.redis, "scan_count", 100)
+    store = _get_store()
+    store._redis = FakeRedis()
+    return store
+
+
+def test_listdir_and_recursive_rm(redis_store):
+    for key in [f"/dir/key{i}" for i in range(5)] + ["/other/key"]:
+        redis_store.put(key, "data")
+    redis_store.redis.data["_spark:{/dir/key0}"] = "data"
+
+    assert sorted(redis_store.listdir("/dir")) == [f"/dir/key{i}" for i in range(5)]
+    assert redis_store.redis.scan_counts == [100]
+
+    redis_store.redis.round_trips = 0
+    redis_store.rm("/dir", recursive=True)
+    assert list(redis_store.redis.data) == ["{/other/key}"]
+    # 5 keys in batches of 2 + the spark key
+    assert redis_store.redis.round_trips == 4
+
+
+def test_redis_client_is_shared():
+    url = "redis://shared-host:6379"
+    with unittest.mock.patch.object(
+        redis.cluster.RedisCluster,
+        "from_url",
+        side_effect=redis.cluster.RedisClusterException,
+    ) as cluster_from_url:
+        first = _get_store("shared-host").redis
+        second = _get_store("shared-host").redis
+    mlrun.datastore.redis._clients.pop(url)
+
+    assert first is second
+    assert cluster_from_url.call_count == 1
+    # the pool waits for a free connection instead of failing past max connections
+    pool = first.connection_pool
+    assert isinstance(pool, redis.BlockingConnectionPool)
+    assert pool.max_connections == mlrun.mlconf.redis.max_connections
+    assert pool.timeout == mlrun.mlconf.redis.pool_timeout
@@ -19,8 +19,10 @@ import pandas as pd
 import pytest
 
 import mlrun.config
+import mlrun.datastore.utils
 from mlrun import new_function
 from mlrun.datastore import CSVSource, KafkaSource, ParquetSource
+from mlrun.datastore.sources import SQLSource
 
 
 def test_kafka_source_with_old_nuclio():
@@ -143,3 +145,61 @@ def test_transform_list_filters_to_tuple(additional_filters, message):
             additional_filters=back_from_json_serialization,
         )
         assert parquet_source.additional_filters == additional_filters
+
+
+@pytest.fixture
+def sqlite_table(tmp_path) -> str:
+    import sqlalchemy
+
+    db_path = f"sqlite:///{tmp_path / 'source.db'}"
+    pd.DataFrame(
+        {
+            "id": range(10),
+            "value": [i * 1.5 for i in range(10)],
+            "label": [f"label-{i}" for i in range(10)],
+            "timestamp": pd.date_range("2024-01-01", periods=10, freq="h"),
+        }
+    ).to_sql("source_table", sqlalchemy.create_engine(db_path), index=False)
+    return db_path
+
+
+def test_sql_source_streams_chunks(sqlite_table):
+    source = SQLSource(
+        table_name="source_table",
+        db_url=sqlite_table,
+        chunksize=4,
+        time_field="timestamp",
+    )
+    assert source.is_iterator()
+    chunks = source.to_dataframe(
+        columns=["value"],
+        entities=["id"],
+        start_time=pd.Timestamp("2024-01-01 01:00:00"),
+        end_time=pd.Timestamp("2024-01-01 08:00:00"),
+    )
+    # the chunks are read lazily
+    assert not isinstance(chunks, pd.DataFrame)
+    chunks = list(chunks)
+
+    assert [len(chunk) for chunk in chunks] == [4, 3]
+    df = pd.concat(chunks)
+    # the projection and the time filter are applied by the database
+    assert list(df.columns) == ["id", "value"]
+    assert df["id"].tolist() == list(range(2, 9))
+
+    # the engine is shared between reads of the same database
+    engine = mlrun.datastore.utils._sql_engines[sqlite_table]
+    list(source.to_dataframe())
+    assert mlrun.datastore.utils._sql_engines[sqlite_table] is engine
+    mlrun.datastore.utils._sql_engines.pop(sqlite_table).dispose()
+
+
+def test_sql_source_to_dataframe(sqlite_table):
+    source = SQLSource(table_name="source_table", db_url=sqlite_table)
+    df = source.to_dataframe(time_field="timestamp")
+    assert len(df) == 10
+    assert pd.api.types.is_datetime64_any_dtype(df["timestamp"])
+
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        source.to_dataframe(columns=["missing"])
+    mlrun.datastore.utils._sql_engines.pop(sqlite_table).dispose()
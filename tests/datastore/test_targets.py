@@ -17,9 +17,15 @@ import os
 import pandas as pd
 import pytest
 
+import mlrun.datastore.utils
 import mlrun.errors
 from mlrun.datastore import StreamTarget
-from mlrun.datastore.targets import BaseStoreTarget, KafkaTarget, ParquetTarget
+from mlrun.datastore.targets import (
+    BaseStoreTarget,
+    KafkaTarget,
+    ParquetTarget,
+    SQLTarget,
+)
 from mlrun.feature_store import FeatureSet
 
 
@@ -129,3 +135,86 @@ def test_transform_list_filters_to_tuple():
         match="additional_filters does not support nested list inside filter tuples except in -in- logic.",
     ):
         parquet_target.as_df(additional_filters=back_from_json_serialization)
+
+
+@pytest.fixture
+def sqlite_db_url(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'target.db'}"
+    yield db_url
+    engine = mlrun.datastore.utils._sql_engines.pop(db_url, None)
+    if engine is not None:
+        engine.dispose()
+
+
+def _count_sql_inserts(engine) -> list[int]:
+    import sqlalchemy
+
+    inserts = []
+
+    @sqlalchemy.event.listens_for(engine, "before_cursor_execute")
+    def count_insert(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT"):
+            inserts.append(len(parameters) if executemany else 1)
+
+    return inserts
+
+
+def test_sql_target_bulk_write(sqlite_db_url):
+    target = SQLTarget(
+        table_name="target_table",
+        db_url=sqlite_db_url,
+        primary_key_column="id",
+        create_table=True,
+        schema={"id": int, "value": float},
+        chunksize=4,
+    )
+    inserts = _count_sql_inserts(mlrun.datastore.utils._get_sql_engine(sqlite_db_url))
+    df = pd.DataFrame({"id": range(10), "value": [i * 0.5 for i in range(10)]})
+    target.write_dataframe(df.set_index("id"))
+
+    # the rows are inserted in batches of chunksize rows
+    assert inserts == [4, 4, 2]
+    result = target.as_df()
+    assert result["value"].tolist() == df["value"].tolist()
+
+
+def test_sql_target_upsert(sqlite_db_url):
+    target = SQLTarget(
+        table_name="target_table",
+        db_url=sqlite_db_url,
+        primary_key_column="id",
+        create_table=True,
+        schema={"id": int, "value": float},
+        upsert=True,
+    )
+    target.write_dataframe(
+        pd.DataFrame({"id": [1, 2], "value": [1.0, 2.0]}).set_index("id")
+    )
+    target.write_dataframe(
+        pd.DataFrame({"id": [2, 3], "value": [20.0, None]}).set_index("id")
+    )
+
+    result = target.as_df().sort_index()
+    assert result.index.tolist() == [1, 2, 3]
+    assert result["value"].tolist()[:2] == [1.0, 20.0]
+    assert pd.isna(result["value"].tolist()[2])
+
+
+@pytest.mark.parametrize(
+    "columns, chunksize, expected",
+    [
+        (2, 10_000, 666),
+        (10, 10_000, 181),
+        (1, 10_000, 1000),
+        (2, 100, 100),
+        (3000, 10_000, 1),
+    ],
+)
+def test_sql_multi_insert_chunksize(columns, chunksize, expected):
+    df = pd.DataFrame({f"c{i}": [1] for i in range(columns)})
+    chunksize = mlrun.datastore.utils._get_sql_multi_insert_chunksize(
+        df, chunksize, index=True
+    )
+    assert chunksize == expected
+    # the index is a bound parameter as well
+    assert chunksize * (columns + 1) <= 2000 or chunksize == 1
@@ -14,12 +14,18 @@
 
 
 import json
+import os
 
 import pytest
 
 import mlrun.datastore
 import mlrun.datastore.wasbfs
-from mlrun.datastore.utils import transform_list_filters_to_tuple
+from mlrun.datastore.utils import (
+    HashingReader,
+    download_in_chunks,
+    transform_list_filters_to_tuple,
+)
+from mlrun.utils import calculate_local_file_hash
 
 
 @pytest.mark.parametrize(
@@ -64,3 +70,57 @@ def test_transform_list_filters_to_tuple(additional_filters, message):
         transform_list_filters_to_tuple(additional_filters)
         result = transform_list_filters_to_tuple(back_from_json_serialization)
         assert result == additional_filters
+
+
+@pytest.mark.parametrize(
+    "read_sizes, seek_back, expected_complete",
+    [
+        ([-1], None, True),
+        ([100, 1000, 5000], None, True),
+        # part of the file is read again (e.g. retry of a failed chunk)
+        ([3000, 3000], 1000, True),
+        ([3000, 3000], 5000, False),
+    ],
+)
+def test_hashing_reader(tmp_path, read_sizes, seek_back, expected_complete):
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(os.urandom(6000))
+
+    with open(file_path, "rb") as fp:
+        reader = HashingReader(fp)
+        reader.read(read_sizes[0])
+        if seek_back is not None:
+            reader.seek(seek_back)
+        for size in read_sizes[1:]:
+            reader.read(size)
+        reader.read()
+
+    if expected_complete:
+        assert reader.hexdigest() == calculate_local_file_hash(file_path)
+    else:
+        assert reader.hexdigest() is None
+
+
+def test_download_in_chunks(tmp_path):
+    data = os.urandom(10_000)
+    target_path = tmp_path / "target.bin"
+    download_in_chunks(
+        lambda offset, size: data[offset : offset + size],
+        len(data),
+        target_path,
+        chunk_size=1024,
+        max_concurrency=4,
+    )
+    assert target_path.read_bytes() == data
+
+
+def test_file_store_upload_and_hash(tmp_path):
+    src_path = tmp_path / "source.bin"
+    src_path.write_bytes(os.urandom(300_000))
+    data_item = mlrun.datastore.store_manager.object(
+        url=str(tmp_path / "dir" / "target.bin")
+    )
+    assert data_item.upload_and_hash(str(src_path)) == calculate_local_file_hash(
+        src_path
+    )
+    assert data_item.get() == src_path.read_bytes()
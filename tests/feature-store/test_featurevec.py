@@ -108,4 +108,6 @@ def test_get_offline_features(mock_get_offline_features):
         test_spark_service,
         test_timestamp_for_filtering,
         additional_filters,
+        False,
+        None,
     )
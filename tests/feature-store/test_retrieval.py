@@ -0,0 +1,227 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest.mock
+
+import pandas as pd
+import pyarrow
+import pytest
+
+import mlrun.errors
+import mlrun.feature_store as fstore
+from mlrun.datastore.targets import ParquetTarget
+from mlrun.feature_store.retrieval import ArrowFeatureMerger, get_merger
+
+quotes = pd.DataFrame(
+    {
+        "time": pd.to_datetime(
+            [
+                "2016-05-25 13:30:00.023",
+                "2016-05-25 13:30:00.023",
+                "2016-05-25 13:30:00.030",
+                "2016-05-25 13:30:00.041",
+                "2016-05-25 13:30:00.048",
+            ]
+        ),
+        "ticker": ["GOOG", "MSFT", "MSFT", "MSFT", "GOOG"],
+        "bid": [720.50, 51.95, 51.97, 51.99, 720.50],
+        "ask": [720.93, 51.96, 51.98, 52.00, 720.93],
+    }
+)
+
+trades = pd.DataFrame(
+    {
+        "time": pd.to_datetime(
+            [
+                "2016-05-25 13:30:00.023",
+                "2016-05-25 13:30:00.038",
+                "2016-05-25 13:30:00.048",
+                "2016-05-25 13:30:00.049",
+            ]
+        ),
+        "ticker": ["MSFT", "MSFT", "GOOG", "AAPL"],
+        "price": [51.95, 51.95, 720.77, 98.0],
+        "quantity": [75, 155, 100, 100],
+    }
+)
+
+stocks = pd.DataFrame(
+    {
+        "ticker": ["MSFT", "GOOG", "AAPL"],
+        "name": ["Microsoft Corporation", "Alphabet Inc", "Apple Inc"],
+        "exchange": ["NASDAQ", "NASDAQ", "NASDAQ"],
+    }
+)
+
+
+def _ingest(feature_set, df, path):
+    feature_set.reload = unittest.mock.Mock()
+    feature_set.save = unittest.mock.Mock()
+    feature_set.purge_targets = unittest.mock.Mock()
+    feature_set.ingest(df, targets=[ParquetTarget(path=path)])
+
+
+@pytest.fixture()
+def feature_sets(rundb_mock, tmp_path):
+    quotes_set = fstore.FeatureSet(
+        "quotes", entities=[fstore.Entity("ticker")], timestamp_key="time"
+    )
+    _ingest(quotes_set, quotes, f"{tmp_path}/quotes.parquet")
+    stocks_set = fstore.FeatureSet("stocks", entities=[fstore.Entity("ticker")])
+    _ingest(stocks_set, stocks, f"{tmp_path}/stocks.parquet")
+    return {"quotes": quotes_set, "stocks": stocks_set}
+
+
+def _get_offline_features(feature_sets, features, engine, **kwargs):
+    vector = fstore.FeatureVector("vector", features)
+    vector.feature_set_objects = feature_sets
+    vector.save = unittest.mock.Mock()
+    return fstore.get_offline_features(vector, engine=engine, **kwargs)
+
+
+def test_get_arrow_merger():
+    assert get_merger("arrow") is ArrowFeatureMerger
+
+
+def test_arrow_merger_requires_pyarrow_16(feature_sets, monkeypatch):
+    monkeypatch.setattr(pyarrow, "__version__", "15.0.2")
+    with pytest.raises(mlrun.errors.MLRunMissingDependencyError, match="pyarrow>=16"):
+        _get_offline_features(feature_sets, ["quotes.bid"], "arrow")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"entity_rows": trades, "entity_timestamp_column": "time"},
+        {
+            "entity_rows": trades,
+            "entity_timestamp_column": "time",
+            "with_indexes": True,
+        },
+        {
+            "entity_rows": trades,
+            "entity_timestamp_column": "time",
+            "query": "bid > 100",
+            "order_by": "price",
+        },
+        {"start_time": "2016-05-25 13:30:00.025", "end_time": "2016-05-25 13:31"},
+        {"with_indexes": True},
+    ],
+)
+def test_arrow_merger_matches_local_merger(feature_sets, kwargs):
+    features = ["quotes.bid", "quotes.ask as ask_price", "stocks.*"]
+    expected = _get_offline_features(
+        feature_sets, features, "local", **kwargs
+    ).to_dataframe()
+    result = _get_offline_features(
+        feature_sets, features, "arrow", **kwargs
+    ).to_dataframe()
+
+    assert result.index.names == expected.index.names
+    # equi-joins keep the entity rows order, pandas (<2.2) groups inner join results by key
+    result = result.reset_index()
+    expected = expected.reset_index()[result.columns]
+    pd.testing.assert_frame_equal(
+        result.sort_values(list(result.columns), ignore_index=True),
+        expected.sort_values(list(expected.columns), ignore_index=True),
+    )
+
+
+def test_arrow_merger_returns_table(feature_sets):
+    response = _get_offline_features(
+        feature_sets,
+        ["quotes.bid", "stocks.name"],
+        "arrow",
+        entity_rows=trades,
+        entity_timestamp_column="time",
+    )
+    table = response.to_dataframe(to_pandas=False)
+    assert isinstance(table, pyarrow.Table)
+    assert table.column_names == ["price", "quantity", "bid", "name"]
+    assert table["bid"].to_pylist() == [51.95, 51.97, 720.50, None]
+
+
+@pytest.mark.parametrize("engine", ["local", "arrow"])
+def test_incremental_materialization(feature_sets, tmp_path, engine):
+    vector = fstore.FeatureVector(
+        "vector", ["quotes.bid", "stocks.name"], with_indexes=True
+    )
+    vector.feature_set_objects = feature_sets
+    vector.save = unittest.mock.Mock()
+    target = ParquetTarget(path=f"{tmp_path}/vector/", partitioned=True)
+
+    vector.get_offline_features(
+        target=target,
+        engine=engine,
+        incremental=True,
+        end_time="2016-05-25 13:30:00.030",
+    )
+    assert vector.status.watermarks == {"quotes": "2016-05-25T13:30:00.030000"}
+
+    with unittest.mock.patch.object(
+        ParquetTarget,
+        "write_dataframe",
+        side_effect=ParquetTarget.write_dataframe,
+        autospec=True,
+    ) as write_dataframe:
+        vector.get_offline_features(
+            target=target,
+            engine=engine,
+            incremental=True,
+            end_time="2016-05-25 13:31:00",
+            lookback="1h",
+        )
+    # only the increment was computed and written
+    assert len(write_dataframe.call_args.args[1]) == 2
+    assert vector.status.watermarks == {"quotes": "2016-05-25T13:31:00"}
+
+    result = ParquetTarget(path=f"{tmp_path}/vector/", partitioned=True).as_df()
+    expected = _get_offline_features(
+        feature_sets, ["quotes.bid", "stocks.name"], "local", with_indexes=True
+    ).to_dataframe()
+    pd.testing.assert_frame_equal(
+        result.sort_values("time", ignore_index=True),
+        expected.reset_index().sort_values("time", ignore_index=True)[result.columns],
+        check_dtype=False,
+    )
+
+    with pytest.raises(
+        mlrun.errors.MLRunInvalidArgumentError, match="already materialized"
+    ):
+        vector.get_offline_features(
+            target=target, engine=engine, incremental=True, end_time="2016-05-25"
+        )
+
+
+def test_incremental_materialization_validation(feature_sets, tmp_path):
+    vector = fstore.FeatureVector(
+        "vector", ["quotes.bid", "stocks.name"], with_indexes=True
+    )
+    vector.feature_set_objects = feature_sets
+    vector.save = unittest.mock.Mock()
+
+    for target, engine, kwargs in [
+        (ParquetTarget(path=f"{tmp_path}/vector.parquet"), "local", {}),
+        (ParquetTarget(path=f"{tmp_path}/vector/", partitioned=False), "local", {}),
+        (
+            ParquetTarget(path=f"{tmp_path}/vector/", partitioned=True),
+            "local",
+            {"entity_rows": trades},
+        ),
+        (ParquetTarget(path=f"{tmp_path}/vector/", partitioned=True), "dask", {}),
+    ]:
+        with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+            vector.get_offline_features(
+                target=target, engine=engine, incremental=True, **kwargs
+            )
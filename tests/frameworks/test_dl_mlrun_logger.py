@@ -0,0 +1,185 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+
+import pytest
+
+from mlrun.frameworks._dl_common.loggers import MLRunLogger
+
+
+class FakeContext:
+    def __init__(self, upload_time: float = 0.0):
+        self.artifact_path = "memory://artifacts"
+        self.upload_time = upload_time
+        self.results = {}
+        self.results_updates = 0
+        self.artifacts = []
+        self.commits = 0
+        self.threads = set()
+
+    def log_results(self, results: dict):
+        self.threads.add(threading.current_thread().name)
+        self.results.update(results)
+        self.results_updates += 1
+
+    def log_artifact(self, artifact, **kwargs):
+        time.sleep(self.upload_time)
+        self.artifacts.append((artifact.key, len(artifact._figure.data[0].y)))
+
+    def commit(self, completed=False):
+        self.commits += 1
+
+
+class FakeModelHandler:
+    def __init__(self):
+        self.logged = None
+
+    def set_context(self, context):
+        pass
+
+    def log(self, **kwargs):
+        self.logged = kwargs
+
+
+def _train(mlrun_logger: MLRunLogger, epochs: int, iterations: int = 2):
+    for epoch in range(epochs):
+        mlrun_logger.log_epoch()
+        mlrun_logger.log_dynamic_hyperparameter("lr", 0.1 / (epoch + 1))
+        for iteration in range(iterations):
+            mlrun_logger.log_training_result("loss", epoch + iteration)
+            mlrun_logger.log_validation_result("loss", epoch + iteration)
+        mlrun_logger.log_training_summary("loss", epoch)
+        mlrun_logger.log_validation_summary("loss", epoch)
+        mlrun_logger.log_epoch_to_context(epoch=epoch)
+
+
+@pytest.mark.parametrize("asynchronous", [True, False])
+def test_epoch_results_are_logged_in_a_single_update(asynchronous):
+    context = FakeContext()
+    mlrun_logger = MLRunLogger(context=context, asynchronous=asynchronous)
+    mlrun_logger.log_static_hyperparameter("batch_size", 32)
+    _train(mlrun_logger, epochs=3)
+    mlrun_logger.flush()
+
+    assert context.results == {
+        "batch_size": 32,
+        "lr": 0.1 / 3,
+        "training_loss": 2,
+        "validation_loss": 2,
+    }
+    assert context.results_updates == 3
+    assert context.commits == 3
+    assert (
+        any(thread.startswith("mlrun-logger") for thread in context.threads)
+        == asynchronous
+    )
+    # the charts of every epoch hold all the iterations so far, in asynchronous mode charts of epochs that were not
+    # logged yet are replaced by the charts of the next epochs:
+    charts_lengths = [length for _, length in context.artifacts]
+    if asynchronous:
+        assert charts_lengths[-2:] == [6, 6]
+        assert charts_lengths == sorted(charts_lengths)
+    else:
+        assert charts_lengths == [2, 2, 4, 4, 6, 6]
+
+
+def test_charts_logging_frequency():
+    context = FakeContext()
+    mlrun_logger = MLRunLogger(
+        context=context, asynchronous=False, charts_logging_frequency=2
+    )
+    _train(mlrun_logger, epochs=5)
+    assert [length for _, length in context.artifacts] == [4, 4, 8, 8]
+    assert context.results_updates == 5
+
+    # the skipped charts of the last epoch are logged on flush:
+    mlrun_logger.flush()
+    assert [length for _, length in context.artifacts[4:]] == [10, 10]
+    mlrun_logger.flush()
+    assert len(context.artifacts) == 6
+
+
+def test_training_does_not_wait_for_uploads():
+    upload_time = 0.05
+    epochs = 5
+    context = FakeContext(upload_time=upload_time)
+    mlrun_logger = MLRunLogger(
+        context=context, asynchronous=True, max_pending_epochs=epochs
+    )
+
+    start = time.monotonic()
+    _train(mlrun_logger, epochs=epochs)
+    training_time = time.monotonic() - start
+    mlrun_logger.flush()
+
+    uploads_time = 2 * epochs * upload_time
+    assert training_time < uploads_time / 2
+    assert context.results_updates == epochs
+    # pending charts are drawn once for the latest results:
+    assert [length for _, length in context.artifacts][-2:] == [10, 10]
+    assert len(context.artifacts) <= 2 * epochs
+
+
+def test_log_run_flushes_the_epochs():
+    context = FakeContext(upload_time=0.01)
+    mlrun_logger = MLRunLogger(
+        context=context, asynchronous=True, charts_logging_frequency=10
+    )
+    _train(mlrun_logger, epochs=3)
+    model_handler = FakeModelHandler()
+    mlrun_logger.log_run(model_handler=model_handler)
+
+    assert context.results_updates == 3
+    assert model_handler.logged["metrics"] == {
+        "training_loss": 2,
+        "validation_loss": 2,
+    }
+    assert sorted(model_handler.logged["artifacts"]) == [
+        "loss_summary",
+        "lr_values",
+        "training_loss",
+        "validation_loss",
+    ]
+
+
+def test_logging_is_synchronous_by_default():
+    context = FakeContext()
+    mlrun_logger = MLRunLogger(context=context)
+    _train(mlrun_logger, epochs=1)
+    assert context.results_updates == 1
+    assert not any(thread.startswith("mlrun-logger") for thread in context.threads)
+
+
+def test_asynchronous_logging_failure_is_raised():
+    context = FakeContext()
+    failures = []
+
+    def commit(completed=False):
+        failures.append(None)
+        raise RuntimeError("run db is unavailable")
+
+    context.commit = commit
+    mlrun_logger = MLRunLogger(context=context, asynchronous=True)
+    _train(mlrun_logger, epochs=1)
+    with pytest.raises(RuntimeError, match="run db is unavailable"):
+        mlrun_logger.flush()
+
+    # the error is raised once, the next epochs are logged
+    context.commit = FakeContext.commit.__get__(context)
+    _train(mlrun_logger, epochs=1)
+    mlrun_logger.flush()
+    assert len(failures) == 1
+    assert context.commits == 1
@@ -0,0 +1,170 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import concurrent.futures
+import os
+
+import numpy as np
+import pytest
+
+onnx = pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+
+from mlrun.frameworks.onnx.model_server import ONNXModelServer  # noqa: E402
+from mlrun.serving import GraphContext  # noqa: E402
+
+features = 4
+classes = 3
+
+
+def _build_model(batch_size="batch") -> onnx.ModelProto:
+    """build a tiny linear model (y = x @ w + b) with the given batch dimension"""
+    weights = np.arange(features * classes, dtype=np.float32).reshape(features, classes)
+    bias = np.ones(classes, dtype=np.float32)
+    graph = onnx.helper.make_graph(
+        nodes=[
+            onnx.helper.make_node("MatMul", ["x", "w"], ["xw"]),
+            onnx.helper.make_node("Add", ["xw", "b"], ["y"]),
+        ],
+        name="linear",
+        inputs=[
+            onnx.helper.make_tensor_value_info(
+                "x", onnx.TensorProto.FLOAT, [batch_size, features]
+            )
+        ],
+        outputs=[
+            onnx.helper.make_tensor_value_info(
+                "y", onnx.TensorProto.FLOAT, [batch_size, classes]
+            )
+        ],
+        initializer=[
+            onnx.numpy_helper.from_array(weights, "w"),
+            onnx.numpy_helper.from_array(bias, "b"),
+        ],
+    )
+    model = onnx.helper.make_model(
+        graph, opset_imports=[onnx.helper.make_opsetid("", 13)]
+    )
+    model.ir_version = 8
+    return model
+
+
+def _expected(inputs: np.ndarray) -> np.ndarray:
+    weights = np.arange(features * classes, dtype=np.float32).reshape(features, classes)
+    return inputs @ weights + 1
+
+
+def _new_server(model: onnx.ModelProto, **kwargs) -> ONNXModelServer:
+    server = ONNXModelServer(
+        context=GraphContext(),
+        name="linear",
+        model=model,
+        model_name="linear",
+        execution_providers=["CPUExecutionProvider"],
+        **kwargs,
+    )
+    server.load()
+    return server
+
+
+def test_session_options(tmp_path):
+    cache_dir = str(tmp_path / "optimized")
+    server = _new_server(
+        _build_model(),
+        intra_op_num_threads=1,
+        inter_op_num_threads=1,
+        graph_optimization_level="extended",
+        execution_mode="sequential",
+        optimized_model_cache_dir=cache_dir,
+    )
+    session_options = server._inference_session.get_session_options()
+    assert session_options.intra_op_num_threads == 1
+
+    # the optimized model is cached and reused by the next loads:
+    (cached_model,) = os.listdir(cache_dir)
+    server = _new_server(
+        _build_model(),
+        graph_optimization_level="extended",
+        optimized_model_cache_dir=cache_dir,
+    )
+    assert os.listdir(cache_dir) == [cached_model]
+
+    inputs = np.random.rand(2, features).astype(np.float32)
+    (outputs,) = server.predict({"inputs": [inputs.tolist()]})
+    np.testing.assert_allclose(outputs, _expected(inputs), rtol=1e-5)
+
+
+def test_concurrent_loads_share_the_optimized_model(tmp_path):
+    cache_dir = str(tmp_path / "optimized")
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        servers = list(
+            executor.map(
+                lambda _: _new_server(
+                    _build_model(), optimized_model_cache_dir=cache_dir
+                ),
+                range(4),
+            )
+        )
+
+    # the optimized model is renamed into place once written, so no partial files are left or loaded:
+    (cached_model,) = os.listdir(cache_dir)
+    assert cached_model.endswith(".onnx")
+    inputs = np.random.rand(2, features).astype(np.float32)
+    for server in servers + [
+        _new_server(_build_model(), optimized_model_cache_dir=cache_dir)
+    ]:
+        (outputs,) = server.predict({"inputs": [inputs]})
+        np.testing.assert_allclose(outputs, _expected(inputs), rtol=1e-5)
+
+
+def test_invalid_session_option():
+    with pytest.raises(Exception, match="graph optimization level"):
+        _new_server(_build_model(), graph_optimization_level="maximal")
+
+
+def test_requests_batching():
+    server = _new_server(_build_model(), max_batch_size=64, batch_timeout=0.05)
+    requests = [
+        np.random.rand(batch_size, features).astype(np.float32)
+        for batch_size in [1, 2, 3, 1, 5, 2, 1, 4]
+    ]
+    with concurrent.futures.ThreadPoolExecutor(len(requests)) as executor:
+        results = list(
+            executor.map(lambda inputs: server.predict({"inputs": [inputs]}), requests)
+        )
+
+    for inputs, (outputs,) in zip(requests, results):
+        assert outputs.shape == (len(inputs), classes)
+        np.testing.assert_allclose(outputs, _expected(inputs), rtol=1e-5)
+
+
+def test_single_request_is_not_delayed():
+    # a request served alone (e.g. by a worker handling one event at a time) doesn't wait for the batch timeout
+    server = _new_server(_build_model(), max_batch_size=64, batch_timeout=10)
+    inputs = np.random.rand(2, features).astype(np.float32)
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        future = executor.submit(server.predict, {"inputs": [inputs]})
+        (outputs,) = future.result(timeout=5)
+    np.testing.assert_allclose(outputs, _expected(inputs), rtol=1e-5)
+
+
+def test_io_binding_with_fixed_shapes():
+    batch_size = 2
+    server = _new_server(_build_model(batch_size=batch_size), io_binding=True)
+    for _ in range(3):
+        inputs = np.random.rand(batch_size, features).astype(np.float32)
+        (outputs,) = server.predict({"inputs": [inputs]})
+        np.testing.assert_allclose(outputs, _expected(inputs), rtol=1e-5)
+    # the outputs are copied from the reused buffers:
+    assert outputs is not server._io_bindings.buffers[0]
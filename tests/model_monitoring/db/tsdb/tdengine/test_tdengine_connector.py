@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os
+import unittest.mock
 import uuid
 from collections.abc import Iterator
 from datetime import datetime, timezone
@@ -110,3 +111,77 @@ def test_write_application_event(
 
     # ML-8062
     connector.delete_tsdb_resources()
+
+
+class _FakeConnection:
+    """records the statements of every run call instead of executing them"""
+
+    def __init__(self):
+        self.runs = []
+
+    def run(self, statements=None, query=None, timeout=None, retries=None):
+        self.runs.append(statements)
+
+
+def _generate_result_event(endpoint_id: str, result_name: str, second: int) -> dict:
+    return {
+        "endpoint_id": endpoint_id,
+        "application_name": "my-app",
+        "result_name": result_name,
+        "result_kind": 0,
+        "start_infer_time": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "end_infer_time": datetime(2024, 1, 1, second=second, tzinfo=timezone.utc),
+        "result_status": 0,
+        "result_extra_data": "",
+        "result_value": second,
+    }
+
+
+def test_write_application_events_batches_by_subtable() -> None:
+    connector = TDEngineConnector(
+        project, connection_string="taosws://fake", database=database
+    )
+    connector._connection = _FakeConnection()
+
+    connector.write_application_events(
+        [
+            _generate_result_event("ep1", "res", 1),
+            _generate_result_event("ep1", "res", 2),
+            _generate_result_event("ep2", "res", 3),
+        ]
+    )
+    connector.write_application_events(
+        [
+            _generate_result_event("ep1", "res", 4),
+            _generate_result_event("ep3", "res", 5),
+        ]
+    )
+
+    first_run, second_run = connector._connection.runs
+    # one subtable creation statement and one multi-row insert per subtable
+    create_statements = [
+        statement for statement in first_run if isinstance(statement, str)
+    ]
+    assert len(create_statements) == 2
+    assert "`ep1_my_app_res`" in create_statements[0]
+    assert "`ep2_my_app_res`" in create_statements[1]
+    inserts = [statement for statement in first_run if not isinstance(statement, str)]
+    assert [(insert.subtable, len(insert.rows)) for insert in inserts] == [
+        ("`ep1_my_app_res`", 2),
+        ("`ep2_my_app_res`", 1),
+    ]
+
+    # already created subtables are not created again
+    create_statements = [
+        statement for statement in second_run if isinstance(statement, str)
+    ]
+    assert len(create_statements) == 1
+    assert "`ep3_my_app_res`" in create_statements[0]
+    assert len(second_run) == 3
+
+    # all the rows of a subtable are bound to a single prepared insert
+    taos_statement = unittest.mock.Mock()
+    inserts[0].prepare(taos_statement)
+    taos_statement.set_tbname.assert_called_once_with("`ep1_my_app_res`")
+    taos_statement.bind_param.assert_called_once()
+    taos_statement.add_batch.assert_called_once()
@@ -0,0 +1,190 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import datetime
+import json
+import threading
+import time
+from typing import Optional
+
+import pytest
+
+import mlrun.model_monitoring.controller
+from mlrun.common.schemas.model_monitoring.constants import (
+    ApplicationEvent,
+    ControllerEvent,
+)
+from mlrun.model_monitoring.controller import (
+    MonitoringApplicationController,
+    _EndpointEventsProcessor,
+    _Interval,
+)
+
+
+class _InMemoryStream:
+    def __init__(self, stream_uri: str) -> None:
+        self.stream_uri = stream_uri
+        self.pushes: list[list[dict]] = []
+
+    def push(self, data: list[dict], partition_key: Optional[str] = None) -> None:
+        self.pushes.append(data)
+
+
+@pytest.fixture
+def streams(monkeypatch) -> dict[str, list[_InMemoryStream]]:
+    streams = collections.defaultdict(list)
+
+    def get_stream_pusher(stream_uri: str, **kwargs) -> _InMemoryStream:
+        stream = _InMemoryStream(stream_uri)
+        streams[stream_uri].append(stream)
+        return stream
+
+    monkeypatch.setattr(mlrun.model_monitoring.controller, "_stream_pushers", {})
+    monkeypatch.setattr(
+        mlrun.model_monitoring.controller, "get_stream_pusher", get_stream_pusher
+    )
+    monkeypatch.setattr(
+        mlrun.model_monitoring.controller,
+        "get_stream_path",
+        lambda project, function_name: f"memory://{project}/{function_name}",
+    )
+    return streams
+
+
+def test_application_windows_are_pushed_once_per_stream(
+    streams: dict[str, list[_InMemoryStream]],
+) -> None:
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    windows = [
+        (
+            _Interval(
+                start + datetime.timedelta(minutes=10 * i),
+                start + datetime.timedelta(minutes=10 * (i + 1)),
+            ),
+            f"memory://snapshots/{i}.parquet",
+        )
+        for i in range(3)
+    ]
+    for endpoint_id in ["ep-1", "ep-2"]:
+        MonitoringApplicationController._push_to_applications(
+            windows=windows,
+            endpoint_id=endpoint_id,
+            endpoint_name=endpoint_id,
+            project="some-project",
+            applications_names=["app-1", "app-2"],
+            model_monitoring_access_key="some-key",
+        )
+
+    # a single pusher per stream, and a single push per stream and endpoint
+    assert sorted(streams) == [
+        "memory://some-project/app-1",
+        "memory://some-project/app-2",
+    ]
+    for stream_uri, (stream,) in streams.items():
+        assert len(stream.pushes) == 2
+        for push in stream.pushes:
+            assert [record[ApplicationEvent.SAMPLE_DATA_URI] for record in push] == [
+                sample_data_uri for _, sample_data_uri in windows
+            ]
+            assert {record[ApplicationEvent.APPLICATION_NAME] for record in push} == {
+                stream_uri.rsplit("/", 1)[-1]
+            }
+
+
+def test_endpoints_are_processed_concurrently_and_in_order() -> None:
+    processing_time = 0.05
+    endpoints = [f"ep-{i}" for i in range(8)]
+    events = [
+        {ControllerEvent.ENDPOINT_ID: endpoint_id, "sequence": sequence}
+        for sequence in range(3)
+        for endpoint_id in endpoints
+    ]
+    processed = collections.defaultdict(list)
+    lock = threading.Lock()
+
+    def process_event(event: dict) -> None:
+        time.sleep(processing_time)
+        with lock:
+            processed[event[ControllerEvent.ENDPOINT_ID]].append(event["sequence"])
+
+    start = time.monotonic()
+    _EndpointEventsProcessor(process_event, max_workers=8).process(events)
+    wall_time = time.monotonic() - start
+
+    assert processed == {endpoint_id: [0, 1, 2] for endpoint_id in endpoints}
+    sequential_time = len(events) * processing_time
+    assert wall_time < sequential_time / 2
+
+
+def test_endpoints_processing_is_sequential_with_a_single_worker() -> None:
+    active = []
+    max_active = []
+
+    def process_event(event: dict) -> None:
+        active.append(event)
+        max_active.append(len(active))
+        time.sleep(0.01)
+        active.remove(event)
+
+    _EndpointEventsProcessor(process_event, max_workers=1).process(
+        [{ControllerEvent.ENDPOINT_ID: f"ep-{i}"} for i in range(5)]
+    )
+    assert max(max_active) == 1
+
+
+class _NuclioTrigger:
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+
+
+class _NuclioEvent:
+    def __init__(self, body: dict, trigger_kind: str = "v3ioStream") -> None:
+        self.body = json.dumps(body).encode("utf-8")
+        self.trigger = _NuclioTrigger(trigger_kind)
+
+
+def test_handler_processes_a_batch_of_events_on_the_shared_pool(monkeypatch) -> None:
+    processed = collections.defaultdict(list)
+    threads = set()
+    lock = threading.Lock()
+
+    def model_endpoint_process(self, event: dict) -> None:
+        time.sleep(0.05)
+        with lock:
+            processed[event[ControllerEvent.ENDPOINT_ID]].append(event["sequence"])
+            threads.add(threading.current_thread())
+
+    monkeypatch.setattr(MonitoringApplicationController, "__init__", lambda self: None)
+    monkeypatch.setattr(
+        MonitoringApplicationController,
+        "model_endpoint_process",
+        model_endpoint_process,
+    )
+    endpoints = [f"ep-{i}" for i in range(8)]
+    batch = [
+        _NuclioEvent({ControllerEvent.ENDPOINT_ID: endpoint_id, "sequence": sequence})
+        for sequence in range(2)
+        for endpoint_id in endpoints
+    ]
+
+    start = time.monotonic()
+    mlrun.model_monitoring.controller.handler(context=None, event=batch)
+    wall_time = time.monotonic() - start
+    mlrun.model_monitoring.controller.handler(context=None, event=batch)
+
+    assert processed == {endpoint_id: [0, 1, 0, 1] for endpoint_id in endpoints}
+    assert wall_time < len(batch) * 0.05 / 2
+    # the invocations share the bounded pool of the process
+    assert len(threads) <= mlrun.mlconf.model_endpoint_monitoring.controller_max_workers
@@ -15,8 +15,9 @@
 import datetime
 from collections.abc import Iterator
 from typing import NamedTuple
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
+import fsspec
 import nuclio
 import numpy as np
 import pandas as pd
@@ -31,12 +32,17 @@ from mlrun.common.model_monitoring.helpers import (
     pad_hist,
 )
 from mlrun.common.schemas import EndpointType, ModelEndpoint
-from mlrun.common.schemas.model_monitoring.constants import EventFieldType
+from mlrun.common.schemas.model_monitoring.constants import (
+    ApplicationEvent,
+    EventFieldType,
+)
 from mlrun.db.nopdb import NopDB
+from mlrun.model_monitoring.applications.context import MonitoringApplicationContext
 from mlrun.model_monitoring.controller import (
     _BatchWindow,
     _BatchWindowGenerator,
     _Interval,
+    _WindowSnapshots,
 )
 from mlrun.model_monitoring.db._schedules import ModelMonitoringSchedulesFile
 from mlrun.model_monitoring.helpers import (
@@ -378,6 +384,151 @@ class TestBatchWindowGenerator:
         ), "The last updated time should be before the last request"
 
 
+class TestWindowSnapshots:
+    @staticmethod
+    @pytest.fixture
+    def intervals() -> list[_Interval]:
+        start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        return [
+            _Interval(start, start + datetime.timedelta(minutes=10)),
+            _Interval(
+                start + datetime.timedelta(minutes=10),
+                start + datetime.timedelta(minutes=20),
+            ),
+        ]
+
+    @staticmethod
+    @pytest.fixture
+    def feature_set(intervals: list[_Interval]) -> Mock:
+        windows = {
+            intervals[0].start: pd.DataFrame(
+                {"f1": [1.0, 2.0], "timestamp": [intervals[0].start] * 2},
+                index=pd.Index(["ep-1", "ep-1"], name="endpoint_id"),
+            ),
+            intervals[1].start: pd.DataFrame(),
+        }
+        feature_set = Mock()
+        feature_set.to_dataframe.side_effect = lambda start_time, **kwargs: windows[
+            start_time
+        ]
+        return feature_set
+
+    @staticmethod
+    def test_windows_are_read_once(
+        tmp_path, feature_set: Mock, intervals: list[_Interval]
+    ) -> None:
+        window_snapshots = _WindowSnapshots(
+            feature_set=feature_set, snapshots_path=str(tmp_path)
+        )
+        # several applications analyze the same windows
+        for _ in range(3):
+            has_data, snapshot_uri = window_snapshots.get_window(intervals[0])
+            assert has_data
+            assert window_snapshots.get_window(intervals[1]) == (False, None)
+        assert feature_set.to_dataframe.call_count == 2
+
+        # the snapshot is content-addressed and holds the window data
+        assert [path.name for path in tmp_path.iterdir()] == [
+            snapshot_uri.rsplit("/", 1)[-1]
+        ]
+        assert snapshot_uri.endswith(".parquet")
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(snapshot_uri),
+            feature_set.to_dataframe(start_time=intervals[0].start),
+        )
+
+        # the same window content of another controller cycle is stored in the same file
+        assert (
+            _WindowSnapshots(
+                feature_set=feature_set, snapshots_path=str(tmp_path)
+            ).get_window(intervals[0])[1]
+            == snapshot_uri
+        )
+
+    @staticmethod
+    def test_snapshots_use_the_storage_options(
+        tmp_path, feature_set: Mock, intervals: list[_Interval]
+    ) -> None:
+        storage_options = {"auto_mkdir": True}
+        window_snapshots = _WindowSnapshots(
+            feature_set=feature_set,
+            snapshots_path=str(tmp_path / "ep-1"),
+            storage_options=storage_options,
+        )
+        with patch("fsspec.core.url_to_fs", wraps=fsspec.core.url_to_fs) as url_to_fs:
+            has_data, snapshot_uri = window_snapshots.get_window(intervals[0])
+        assert has_data and snapshot_uri
+        url_to_fs.assert_called_once_with(str(tmp_path / "ep-1"), **storage_options)
+        assert feature_set.to_dataframe.call_args.kwargs["storage_options"] == (
+            storage_options
+        )
+
+    @staticmethod
+    def test_expired_snapshots_are_deleted(
+        tmp_path, feature_set: Mock, intervals: list[_Interval]
+    ) -> None:
+        recent_snapshot = tmp_path / f"{int(datetime_now().timestamp())}-a.parquet"
+        recent_snapshot.write_bytes(b"")
+        other_file = tmp_path / "other.parquet"
+        other_file.write_bytes(b"")
+        window_snapshots = _WindowSnapshots(
+            feature_set=feature_set, snapshots_path=str(tmp_path)
+        )
+        # nothing was written yet
+        window_snapshots.cleanup(retention_secs=0)
+        assert len(list(tmp_path.iterdir())) == 2
+
+        _, snapshot_uri = window_snapshots.get_window(intervals[0])
+        assert snapshot_uri.rsplit("/", 1)[-1].startswith(
+            f"{int(intervals[0].end.timestamp())}-"
+        )
+        window_snapshots.cleanup(
+            retention_secs=datetime.timedelta(days=1).total_seconds()
+        )
+        # the snapshot of the old window is deleted
+        assert sorted(tmp_path.iterdir()) == sorted([recent_snapshot, other_file])
+
+    @staticmethod
+    def test_windows_without_snapshots(
+        feature_set: Mock, intervals: list[_Interval]
+    ) -> None:
+        window_snapshots = _WindowSnapshots(feature_set=feature_set)
+        assert window_snapshots.get_window(intervals[0]) == (True, None)
+        assert window_snapshots.get_window(intervals[1]) == (False, None)
+
+    @staticmethod
+    def test_application_context_loads_the_snapshot(
+        tmp_path, feature_set: Mock, intervals: list[_Interval]
+    ) -> None:
+        _, snapshot_uri = _WindowSnapshots(
+            feature_set=feature_set, snapshots_path=str(tmp_path)
+        ).get_window(intervals[0])
+        project = Mock()
+        project.name = "some-project"
+        context = MonitoringApplicationContext(
+            application_name="some-app",
+            event={
+                ApplicationEvent.START_INFER_TIME: str(intervals[0].start),
+                ApplicationEvent.END_INFER_TIME: str(intervals[0].end),
+                ApplicationEvent.ENDPOINT_ID: "ep-1",
+                ApplicationEvent.SAMPLE_DATA_URI: snapshot_uri,
+            },
+            project=project,
+            artifacts_logger=project,
+            logger=mlrun.utils.logger,
+            nuclio_logger=Mock(),
+        )
+        with patch("mlrun.feature_store.get_feature_set") as get_feature_set:
+            sample_df = context.sample_df
+        get_feature_set.assert_not_called()
+        pd.testing.assert_frame_equal(
+            sample_df,
+            feature_set.to_dataframe(start_time=intervals[0].start).reset_index(
+                drop=True
+            ),
+        )
+
+
 class TestBumpModelEndpointLastRequest:
     @staticmethod
     @pytest.fixture
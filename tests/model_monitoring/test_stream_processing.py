@@ -12,17 +12,43 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
+import copy
+import datetime
+import os
+import pathlib
+import threading
+import time
+import timeit
+import typing
+import unittest.mock
+
 import pytest
+import storey
 
 import mlrun
 import mlrun.model_monitoring
+import mlrun.model_monitoring.stream_processing
+from mlrun.common.schemas.model_monitoring.constants import (
+    ControllerEvent,
+    ControllerEventKind,
+    EventFieldType,
+)
 from mlrun.datastore.datastore_profile import (
     DatastoreProfile,
     DatastoreProfileKafkaSource,
     DatastoreProfileV3io,
     TDEngineDatastoreProfile,
 )
-from mlrun.model_monitoring.stream_processing import EventStreamProcessor
+from mlrun.model_monitoring.stream_processing import (
+    EndpointsMetadataCache,
+    EventStreamProcessor,
+    MapFeatureNames,
+    MapFeatureNamesBatch,
+    ProcessBeforeParquet,
+    ProcessBeforeParquetBatch,
+    get_endpoints_metadata_cache,
+)
 
 
 @pytest.mark.parametrize(
@@ -73,3 +99,347 @@ def test_plot_monitoring_serving_graph(
     print("Feed this to graphviz, or to https://dreampuf.github.io/GraphvizOnline")
     print()
     print(graph)
+
+
+def _generate_endpoint(uid: str, **attributes) -> unittest.mock.Mock:
+    endpoint = unittest.mock.Mock()
+    endpoint.metadata.uid = uid
+    endpoint.flat_dict.side_effect = lambda: {
+        EventFieldType.UID: uid,
+        EventFieldType.ENDPOINT_TYPE: 1,
+        **attributes,
+    }
+    return endpoint
+
+
+@pytest.fixture
+def run_db(monkeypatch) -> typing.Iterator[unittest.mock.Mock]:
+    run_db = unittest.mock.Mock()
+    run_db.list_model_endpoints.return_value.endpoints = [
+        _generate_endpoint("ep-1", feature_names=["a", "b"], label_names=["p"]),
+        _generate_endpoint("ep-2"),
+    ]
+    run_db.get_model_endpoint.side_effect = (
+        lambda project, endpoint_id, name: _generate_endpoint(endpoint_id)
+    )
+    monkeypatch.setattr(mlrun.db, "get_run_db", lambda *args, **kwargs: run_db)
+    monkeypatch.setattr(
+        mlrun.model_monitoring.stream_processing, "_endpoints_metadata_caches", {}
+    )
+    yield run_db
+    mlrun.model_monitoring.stream_processing.close_endpoints_metadata_caches()
+
+
+class TestEndpointsMetadataCache:
+    @staticmethod
+    def test_prefetched_endpoints_are_not_fetched(run_db: unittest.mock.Mock) -> None:
+        cache = EndpointsMetadataCache(project="some-project", max_size=10, ttl=60)
+        cache.prefetch()
+        assert cache.get("ep-1", "ep-1")["feature_names"] == ["a", "b"]
+        assert cache.get("ep-2", "ep-2")[EventFieldType.UID] == "ep-2"
+        run_db.list_model_endpoints.assert_called_once()
+        run_db.get_model_endpoint.assert_not_called()
+
+        # a new endpoint is fetched once
+        for _ in range(3):
+            assert cache.get("ep-3", "ep-3")[EventFieldType.UID] == "ep-3"
+        assert run_db.get_model_endpoint.call_count == 1
+
+    @staticmethod
+    def test_stale_records_are_refreshed_in_the_background(
+        run_db: unittest.mock.Mock,
+    ) -> None:
+        cache = EndpointsMetadataCache(project="some-project", max_size=10, ttl=0)
+        cache.prefetch()
+        # the stale record is served while it is refreshed
+        assert cache.get("ep-1", "ep-1")["feature_names"] == ["a", "b"]
+        start = time.monotonic()
+        while "feature_names" in cache.get("ep-1", "ep-1"):
+            assert time.monotonic() - start < 5, "The record was not refreshed"
+            time.sleep(0.01)
+        assert run_db.get_model_endpoint.call_count >= 1
+
+    @staticmethod
+    def test_cache_is_bounded(run_db: unittest.mock.Mock) -> None:
+        cache = EndpointsMetadataCache(project="some-project", max_size=2, ttl=60)
+        cache.prefetch()
+        cache.get("ep-1", "ep-1")
+        cache.get("ep-3", "ep-3")
+        # ep-2 is the least recently used
+        run_db.get_model_endpoint.reset_mock()
+        cache.get("ep-1", "ep-1")
+        run_db.get_model_endpoint.assert_not_called()
+        cache.get("ep-2", "ep-2")
+        run_db.get_model_endpoint.assert_called_once()
+
+    @staticmethod
+    def test_update_and_invalidate(run_db: unittest.mock.Mock) -> None:
+        cache = EndpointsMetadataCache(project="some-project", max_size=10, ttl=60)
+        cache.prefetch()
+        cache.update("ep-2", {"feature_names": ["f0"]})
+        assert cache.get("ep-2", "ep-2")["feature_names"] == ["f0"]
+        cache.invalidate("ep-2")
+        assert "feature_names" not in cache.get("ep-2", "ep-2")
+        run_db.get_model_endpoint.assert_called_once()
+
+    @staticmethod
+    def test_stream_steps_share_the_project_cache(run_db: unittest.mock.Mock) -> None:
+        map_feature_names = MapFeatureNames(project="some-project")
+        event = map_feature_names.do(
+            {
+                EventFieldType.ENDPOINT_ID: "ep-1",
+                EventFieldType.ENDPOINT_NAME: "ep-1",
+                EventFieldType.FEATURES: [1, 2],
+                EventFieldType.PREDICTION: [0.5],
+                EventFieldType.FIRST_REQUEST: "2024-01-01 00:00:00",
+            }
+        )
+        assert event[EventFieldType.NAMED_FEATURES] == {"a": 1.0, "b": 2.0}
+        assert event[EventFieldType.NAMED_PREDICTIONS] == {"p": 0.5}
+        MapFeatureNames(project="some-project")
+        run_db.list_model_endpoints.assert_called_once()
+        run_db.get_model_endpoint.assert_not_called()
+
+    @staticmethod
+    def test_prefetch_does_not_block_other_projects(
+        run_db: unittest.mock.Mock,
+    ) -> None:
+        prefetching = threading.Event()
+        release = threading.Event()
+
+        def list_model_endpoints(project):
+            if project == "slow-project":
+                prefetching.set()
+                assert release.wait(5)
+            return unittest.mock.Mock(endpoints=[_generate_endpoint(project)])
+
+        run_db.list_model_endpoints.side_effect = list_model_endpoints
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            slow_caches = [
+                executor.submit(get_endpoints_metadata_cache, "slow-project")
+                for _ in range(2)
+            ]
+            assert prefetching.wait(5)
+            # another project is not blocked by the slow prefetch
+            cache = get_endpoints_metadata_cache("other-project")
+            assert cache.get("other-project", "")[EventFieldType.UID] == (
+                "other-project"
+            )
+            release.set()
+            # the project is prefetched once, and its steps get the prefetched cache
+            slow_cache, other_slow_cache = (
+                future.result(timeout=5) for future in slow_caches
+            )
+        assert slow_cache is other_slow_cache
+        assert run_db.list_model_endpoints.call_count == 2
+        assert slow_cache.get("slow-project", "")[EventFieldType.UID] == "slow-project"
+        run_db.get_model_endpoint.assert_not_called()
+
+    @staticmethod
+    def test_closed_cache_is_not_refreshed(run_db: unittest.mock.Mock) -> None:
+        cache = EndpointsMetadataCache(project="some-project", max_size=10, ttl=0)
+        cache.prefetch()
+        cache.close()
+        assert cache.get("ep-1", "ep-1")["feature_names"] == ["a", "b"]
+        run_db.get_model_endpoint.assert_not_called()
+
+    @staticmethod
+    def test_stream_graph_termination_closes_the_caches(
+        run_db: unittest.mock.Mock,
+    ) -> None:
+        fn = mlrun.new_function("stream", kind="serving")
+        graph = fn.set_topology("flow", engine="async")
+        graph.to(
+            "mlrun.model_monitoring.stream_processing.MapFeatureNames",
+            name="MapFeatureNames",
+            project="some-project",
+        ).respond()
+        server = fn.to_mock_server()
+        cache = get_endpoints_metadata_cache("some-project")
+        assert not cache._closed
+
+        server.wait_for_completion()
+        assert cache._closed
+        assert mlrun.model_monitoring.stream_processing._endpoints_metadata_caches == {}
+
+
+def _generate_inference_events(
+    endpoint_id: str, count: int, features: int = 2
+) -> list[dict]:
+    return [
+        {
+            EventFieldType.ENDPOINT_ID: endpoint_id,
+            EventFieldType.ENDPOINT_NAME: endpoint_id,
+            EventFieldType.TIMESTAMP: datetime.datetime(2024, 1, 1),
+            EventFieldType.FEATURES: [i + j for j in range(features)],
+            EventFieldType.PREDICTION: [i % 2],
+            EventFieldType.FIRST_REQUEST: "2024-01-01 00:00:00",
+            EventFieldType.LABELS: {},
+            EventFieldType.METRICS: {},
+            EventFieldType.ENTITIES: {},
+        }
+        for i in range(count)
+    ]
+
+
+class TestStreamBatching:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "features",
+        [
+            [[1, 2.5], [3, 4]],
+            [[True, 0], [1, False]],
+            [[1, "a"], [2, "b"]],
+            [[1, None], [2, 3]],
+            [[1, 2], [3]],
+            [[[1, 2]], [[3, 4]]],
+            [[], []],
+        ],
+    )
+    def test_coerce_features_matrix(features: list[list]) -> None:
+        expected = copy.deepcopy(features)
+        for feature_values in expected:
+            mlrun.model_monitoring.stream_processing._coerce_feature_values(
+                feature_values
+            )
+        coerced = MapFeatureNamesBatch._coerce_features_matrix(features)
+        assert coerced == expected
+        assert [list(map(type, values)) for values in coerced] == [
+            list(map(type, values)) for values in expected
+        ]
+
+    @staticmethod
+    @pytest.mark.parametrize("endpoint_id", ["ep-1", "ep-2"])
+    def test_batch_mapping_is_equal_to_event_mapping(
+        run_db: unittest.mock.Mock,
+        monkeypatch: pytest.MonkeyPatch,
+        endpoint_id: str,
+    ) -> None:
+        # ep-2 has no feature names, which are generated and added to its monitoring feature set
+        monkeypatch.setattr(
+            mlrun.model_monitoring.stream_processing,
+            "update_monitoring_feature_set",
+            unittest.mock.Mock(),
+        )
+        events = _generate_inference_events(endpoint_id, 5)
+        map_feature_names = MapFeatureNames(
+            project="some-project", infer_columns_from_data=True
+        )
+        expected = [map_feature_names.do(event) for event in copy.deepcopy(events)]
+
+        mapped = MapFeatureNamesBatch(
+            project="some-project", infer_columns_from_data=True
+        ).do(storey.Event(body=events))
+        assert mapped.key == endpoint_id
+        assert mapped.body == expected
+        assert [list(event) for event in mapped.body] == [
+            list(event) for event in expected
+        ]
+
+        parquet_events = ProcessBeforeParquetBatch().do(
+            [*mapped.body, {"kind": "nop_event", EventFieldType.ENDPOINT_ID: "ep-3"}]
+        )
+        assert parquet_events == [
+            ProcessBeforeParquet._filter_event(event)
+            for event in copy.deepcopy(expected)
+        ]
+
+    @staticmethod
+    def test_batches_are_flattened_with_their_endpoint_key(
+        run_db: unittest.mock.Mock,
+    ) -> None:
+        events = [
+            *_generate_inference_events("ep-1", 4),
+            # a nop event of the endpoint, batched with its inference events
+            {
+                ControllerEvent.KIND: ControllerEventKind.NOP_EVENT,
+                ControllerEvent.ENDPOINT_ID: "ep-1",
+            },
+            *_generate_inference_events("ep-2", 3),
+            {
+                ControllerEvent.KIND: ControllerEventKind.NOP_EVENT,
+                ControllerEvent.ENDPOINT_ID: "ep-2",
+            },
+        ]
+        flow = storey.build_flow(
+            [
+                storey.SyncEmitSource(),
+                storey.Batch(max_events=2, key_field="$key"),
+                MapFeatureNamesBatch(
+                    project="some-project",
+                    infer_columns_from_data=True,
+                    full_event=True,
+                ),
+                storey.FlatMap(lambda event: event),
+                storey.Reduce(
+                    [],
+                    lambda acc, event: acc + [(event.key, event.body)],
+                    full_event=True,
+                ),
+            ]
+        ).run()
+        for event in events:
+            flow.emit(event, key=event[EventFieldType.ENDPOINT_ID])
+        flow.terminate()
+        result = flow.await_termination()
+
+        assert len(result) == len(events)
+        for key, event in result:
+            assert key == event[EventFieldType.ENDPOINT_ID]
+            if event.get(ControllerEvent.KIND) != ControllerEventKind.NOP_EVENT:
+                assert EventFieldType.NAMED_FEATURES in event
+
+    @staticmethod
+    def test_graph_with_batching(
+        monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+    ) -> None:
+        monkeypatch.setattr(
+            mlrun.mlconf.model_endpoint_monitoring.stream_batching, "enabled", True
+        )
+        project = mlrun.get_or_create_project(
+            "test-stream-batching", context=str(tmp_path), save=False
+        )
+        fn = project.set_function(kind="serving", name="my-fn")
+        EventStreamProcessor(
+            "test-stream-batching", 1000, 10, "mytarget"
+        ).apply_monitoring_serving_graph(
+            fn,
+            mlrun.model_monitoring.get_tsdb_connector(
+                project="test-stream-batching",
+                profile=TDEngineDatastoreProfile(
+                    name="tdengine-test", user="root", host="localhost", port=6041
+                ),
+            ),
+            "kafka://localhost:9092/some-topic",
+        )
+        steps = fn.spec.graph.steps
+        assert steps["batch_events"].after == ["flatten_events"]
+        assert steps["MapFeatureNames"].class_name == "MapFeatureNamesBatch"
+        assert steps["FilterNOP"].after == ["flatten_mapped_events"]
+        assert steps["ProcessBeforeParquet"].after == ["MapFeatureNames"]
+        assert steps["ParquetTarget"].after == ["flatten_parquet_events"]
+
+    @staticmethod
+    @pytest.mark.skipif(
+        not os.environ.get("MLRUN_RUN_BENCHMARKS"),
+        reason="A benchmark, set MLRUN_RUN_BENCHMARKS to run it",
+    )
+    def test_batch_mapping_benchmark(run_db: unittest.mock.Mock) -> None:
+        events = _generate_inference_events("ep-1", 1000, features=20)
+        map_feature_names = MapFeatureNames(project="some-project")
+        map_feature_names_batch = MapFeatureNamesBatch(project="some-project")
+
+        def map_events():
+            for event in copy.deepcopy(events):
+                map_feature_names.do(event)
+
+        def map_batch():
+            map_feature_names_batch.do(storey.Event(body=copy.deepcopy(events)))
+
+        events_time = min(timeit.repeat(map_events, number=1, repeat=3))
+        batch_time = min(timeit.repeat(map_batch, number=1, repeat=3))
+        print(
+            f"Mapped {len(events)} events: {len(events) / events_time:,.0f} events/s per event, "
+            f"{len(events) / batch_time:,.0f} events/s per batch"
+        )
+        assert batch_time < events_time
@@ -15,8 +15,9 @@
 import datetime
 import json
 import os
+import time
 from collections.abc import Iterator
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 import semver
@@ -32,8 +33,10 @@ from mlrun.model_monitoring.writer import (
     ModelMonitoringWriter,
     ResultData,
     WriterEvent,
+    WriterEventKind,
     _AppResultEvent,
     _RawEvent,
+    _TSDBEventsBuffer,
     _WriterEventTypeError,
     _WriterEventValueError,
 )
@@ -121,6 +124,127 @@ def test_reconstruct_event_error(event: _RawEvent, exception: type[Exception]) -
         ModelMonitoringWriter._reconstruct_event(event)
 
 
+class TestTSDBEventsBuffer:
+    @staticmethod
+    @pytest.fixture
+    def tsdb_connector() -> Mock:
+        return Mock(spec=mlrun.model_monitoring.db.tsdb.v3io.V3IOTSDBConnector)
+
+    @staticmethod
+    def test_flush_on_max_events(tsdb_connector: Mock) -> None:
+        buffer = _TSDBEventsBuffer(
+            tsdb_connector, max_events=3, timeout_secs=60, max_buffered_events=100
+        )
+        buffer.add({"id": 1}, WriterEventKind.RESULT)
+        buffer.add({"id": 2}, WriterEventKind.METRIC)
+        tsdb_connector.write_application_events.assert_not_called()
+
+        buffer.add({"id": 3}, WriterEventKind.RESULT)
+        # a single write per event kind
+        assert tsdb_connector.write_application_events.call_args_list == [
+            call(events=[{"id": 1}, {"id": 3}], kind=WriterEventKind.RESULT),
+            call(events=[{"id": 2}], kind=WriterEventKind.METRIC),
+        ]
+        tsdb_connector.write_application_event.assert_not_called()
+
+    @staticmethod
+    def test_flush_on_timeout(tsdb_connector: Mock) -> None:
+        buffer = _TSDBEventsBuffer(
+            tsdb_connector, max_events=100, timeout_secs=0.1, max_buffered_events=100
+        )
+        buffer.add({"id": 1}, WriterEventKind.RESULT)
+        deadline = time.monotonic() + 5
+        while (
+            not tsdb_connector.write_application_events.called
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        tsdb_connector.write_application_events.assert_called_once_with(
+            events=[{"id": 1}], kind=WriterEventKind.RESULT
+        )
+
+    @staticmethod
+    def test_failed_flush_keeps_the_events(tsdb_connector: Mock) -> None:
+        written = []
+
+        def write_application_events(events, kind):
+            if not written:
+                written.append(None)
+                raise ConnectionError("TSDB is unavailable")
+            written.append((kind, events))
+
+        tsdb_connector.write_application_events.side_effect = write_application_events
+        buffer = _TSDBEventsBuffer(
+            tsdb_connector, max_events=3, timeout_secs=60, max_buffered_events=100
+        )
+        buffer.add({"id": 1}, WriterEventKind.RESULT)
+        buffer.add({"id": 2}, WriterEventKind.METRIC)
+        # the size triggered flush fails, and no event is lost
+        buffer.add({"id": 3}, WriterEventKind.RESULT)
+        buffer.add({"id": 4}, WriterEventKind.METRIC)
+
+        buffer.flush()
+        assert written[1:] == [
+            (WriterEventKind.RESULT, [{"id": 1}, {"id": 3}]),
+            (WriterEventKind.METRIC, [{"id": 2}, {"id": 4}]),
+        ]
+
+    @staticmethod
+    def test_failed_flush_backs_off(tsdb_connector: Mock) -> None:
+        tsdb_connector.write_application_events.side_effect = ConnectionError(
+            "TSDB is unavailable"
+        )
+        buffer = _TSDBEventsBuffer(
+            tsdb_connector, max_events=2, timeout_secs=60, max_buffered_events=100
+        )
+        for i in range(10):
+            buffer.add({"id": i}, WriterEventKind.RESULT)
+        # only the first size triggered flush writes, the next adds don't retry before the timeout
+        assert tsdb_connector.write_application_events.call_count == 1
+
+    @staticmethod
+    def test_failed_flushes_drop_the_oldest_events(tsdb_connector: Mock) -> None:
+        tsdb_connector.write_application_events.side_effect = ConnectionError(
+            "TSDB is unavailable"
+        )
+        buffer = _TSDBEventsBuffer(
+            tsdb_connector, max_events=2, timeout_secs=60, max_buffered_events=5
+        )
+        for i in range(10):
+            buffer.add({"id": i}, WriterEventKind.RESULT)
+
+        tsdb_connector.write_application_events.side_effect = None
+        tsdb_connector.write_application_events.reset_mock()
+        buffer.flush()
+        tsdb_connector.write_application_events.assert_called_once_with(
+            events=[{"id": i} for i in range(5, 10)], kind=WriterEventKind.RESULT
+        )
+
+    @staticmethod
+    def test_close_flushes_the_events(tsdb_connector: Mock) -> None:
+        buffer = _TSDBEventsBuffer(
+            tsdb_connector, max_events=100, timeout_secs=60, max_buffered_events=100
+        )
+        buffer.close()
+        tsdb_connector.write_application_events.assert_not_called()
+
+        buffer.add({"id": 1}, WriterEventKind.RESULT)
+        buffer.close()
+        tsdb_connector.write_application_events.assert_called_once_with(
+            events=[{"id": 1}], kind=WriterEventKind.RESULT
+        )
+
+    @staticmethod
+    def test_batching_disabled(tsdb_connector: Mock) -> None:
+        buffer = _TSDBEventsBuffer(
+            tsdb_connector, max_events=1, timeout_secs=60, max_buffered_events=100
+        )
+        buffer.add({"id": 1}, WriterEventKind.RESULT)
+        tsdb_connector.write_application_event.assert_called_once_with(
+            event={"id": 1}, kind=WriterEventKind.RESULT
+        )
+
+
 class TestHistogramGeneralDriftResultEvent:
     @staticmethod
     @pytest.fixture
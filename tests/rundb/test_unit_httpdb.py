@@ -255,6 +255,125 @@ def test_retriable_post_requests(path, call_amount):
     requests.Session.request = original_request
 
 
+def test_watch_logs_stream():
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    db.server_version = "1.8.0"
+    run_uid = "some-uid"
+    project = "some-project"
+    log_contents = b"FirstrowSecondrowThirdrow"
+    adapter = requests_mock.Adapter()
+    streams = [log_contents[:8], log_contents[8:17]]
+
+    def stream_callback(request, context):
+        # every stream resumes from the offset the client reached
+        offset = int(request.qs["offset"][0])
+        assert offset == len(b"".join(streams[: adapter.call_count // 2]))
+        context.headers["x-mlrun-run-state"] = "running"
+        return streams[adapter.call_count // 2]
+
+    def get_log_callback(request, context):
+        offset = int(request.qs["offset"][0])
+        if offset == len(log_contents):
+            context.headers["x-mlrun-run-state"] = "completed"
+            return b""
+        context.headers["x-mlrun-run-state"] = "running"
+        return b""
+
+    adapter.register_uri(
+        "GET",
+        f"https://wherever.com/api/v1/projects/{project}/logs/{run_uid}/watch",
+        content=stream_callback,
+    )
+    adapter.register_uri(
+        "GET",
+        f"https://wherever.com/api/v1/projects/{project}/logs/{run_uid}",
+        content=get_log_callback,
+    )
+    db.session = db._init_session()
+    db.session.mount("https://", adapter)
+    streams.append(log_contents[17:])
+    state, offset = db.watch_log(run_uid, project=project)
+
+    assert state == "completed"
+    assert offset == len(log_contents)
+    # a single request per stream and a single request to check the run state when each stream ends
+    assert adapter.call_count == 6
+
+
+def test_watch_logs_stream_split_characters(capsys):
+    mlrun.mlconf.httpdb.logs.decode.errors = "strict"
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    db.server_version = "1.8.0"
+    run_uid = "some-uid"
+    project = "some-project"
+    log_text = "Smiley\U0001f606 caf\u00e9"
+    log_contents = log_text.encode()
+    adapter = requests_mock.Adapter()
+    # the streams split the multi-byte characters
+    streams = [log_contents[:8], log_contents[8:15], log_contents[15:]]
+
+    def stream_callback(request, context):
+        offset = int(request.qs["offset"][0])
+        context.headers["x-mlrun-run-state"] = "running"
+        for stream in streams:
+            if offset == 0:
+                return stream
+            offset -= len(stream)
+        return b""
+
+    def get_log_callback(request, context):
+        offset = int(request.qs["offset"][0])
+        if offset == len(log_contents):
+            context.headers["x-mlrun-run-state"] = "completed"
+        else:
+            context.headers["x-mlrun-run-state"] = "running"
+        return b""
+
+    adapter.register_uri(
+        "GET",
+        f"https://wherever.com/api/v1/projects/{project}/logs/{run_uid}/watch",
+        content=stream_callback,
+    )
+    adapter.register_uri(
+        "GET",
+        f"https://wherever.com/api/v1/projects/{project}/logs/{run_uid}",
+        content=get_log_callback,
+    )
+    db.session = db._init_session()
+    db.session.mount("https://", adapter)
+    state, offset = db.watch_log(run_uid, project=project)
+
+    assert state == "completed"
+    assert offset == len(log_contents)
+    assert capsys.readouterr().out == log_text
+
+
+def test_watch_logs_stream_not_supported():
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    db.server_version = "1.7.0"
+    run_uid = "some-uid"
+    project = "some-project"
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        "GET",
+        f"https://wherever.com/api/v1/projects/{project}/logs/{run_uid}/watch",
+        status_code=404,
+    )
+    adapter.register_uri(
+        "GET",
+        f"https://wherever.com/api/v1/projects/{project}/logs/{run_uid}",
+        content=lambda request, context: b"log"[int(request.qs["offset"][0]) :],
+        headers={"x-mlrun-run-state": "completed"},
+    )
+    db.session = db._init_session()
+    db.session.mount("https://", adapter)
+    with unittest.mock.patch("time.sleep"):
+        state, offset = db.watch_log(run_uid, project=project)
+    # falls back to polling
+    assert state == "completed"
+    assert offset == 3
+
+
 def test_watch_logs_continue():
     mlrun.mlconf.httpdb.logs.decode.errors = "replace"
 
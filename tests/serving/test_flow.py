@@ -50,6 +50,19 @@ class Mul(storey.MapClass):
         return event * 2
 
 
+class Terminating:
+    terminated = []
+
+    def __init__(self, name=None, **kwargs):
+        self.name = name
+
+    def do(self, event):
+        return event
+
+    def terminate(self):
+        self.terminated.append(self.name)
+
+
 class ModelTestingClass(V2ModelServer):
     def load(self):
         print("loading")
@@ -429,3 +442,15 @@ def test_set_flow():
     server = fn.to_mock_server()
     resp = server.test(body=5)
     assert resp == "15"
+
+
+def test_terminate_steps_classes():
+    function = mlrun.new_function("test", kind="serving")
+    flow = function.set_topology("flow", engine="async")
+    flow.to("Terminating", name="s1").to("Terminating", name="s2").respond()
+
+    server = function.to_mock_server()
+    assert server.test(body={"x": 5}) == {"x": 5}
+    assert Terminating.terminated == []
+    server.wait_for_completion()
+    assert sorted(Terminating.terminated) == ["s1", "s2"]
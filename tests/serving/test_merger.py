@@ -13,12 +13,16 @@
 # limitations under the License.
 #
 import asyncio
+import concurrent.futures
+import time
 
 import pytest
 import storey
 
 import mlrun
+import mlrun.serving.states
 from mlrun.serving.merger import Merge
+from mlrun.serving.states import GraphError
 
 
 async def double(event):
@@ -145,3 +149,173 @@ def test_delayed():
     mylist = [sorted(item) for item in server.context.mylist]
     assert len(mylist) == 3, "expected 3 results in total (2 were dropped due to delay)"
     assert mylist == [[16, 17], [18, 19], [20, 21]]
+
+
+class Sleeper:
+    def __init__(self, key, wait=0.2, fail=False):
+        self.key = key
+        self.wait = wait
+        self.fail = fail
+
+    def do(self, event):
+        time.sleep(self.wait)
+        if self.fail:
+            raise ValueError(f"{self.key} failed")
+        return {**event, self.key: event["x"] + 1}
+
+
+def handle_error(event):
+    return {"errors": list(event.error.values())}
+
+
+def _sync_branches_graph(fn, waits, merge):
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="start", handler="(event)")
+    for key, wait in waits.items():
+        graph.add_step("Sleeper", name=key, key=key, wait=wait, after="start")
+    graph.add_step(merge, name="merge", after=list(waits))
+    return graph
+
+
+def test_sync_branches_run_in_parallel():
+    fn = mlrun.new_function("x", kind="serving")
+    waits = {"a": 0.3, "b": 0.3, "c": 0.3}
+    graph = _sync_branches_graph(fn, waits, Merge(combine="update"))
+    graph.add_step(name="total", handler="(sum(event.values()))", after="merge")
+
+    server = fn.to_mock_server()
+    start = time.monotonic()
+    resp = server.test(body={"x": 1})
+    latency = time.monotonic() - start
+    assert resp == 1 + 2 * 3
+    assert latency < sum(waits.values()) * 0.8
+    server.wait_for_completion()
+
+
+@pytest.mark.parametrize(
+    "combine, expected",
+    [
+        # the merged bodies are ordered as the merge step after list
+        (None, [{"x": 1, "b": 2}, {"x": 1, "a": 2}]),
+        ("update", {"x": 1, "a": 2, "b": 2}),
+        ("(len(event))", 2),
+    ],
+)
+def test_sync_branches_combine(combine, expected):
+    fn = mlrun.new_function("x", kind="serving")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="start", handler="(event)")
+    graph.add_step("Sleeper", name="a", key="a", wait=0.1, after="start")
+    graph.add_step("Sleeper", name="b", key="b", wait=0, after="start")
+    graph.add_step(Merge(combine=combine), name="merge", after=["b", "a"])
+
+    server = fn.to_mock_server()
+    assert server.test(body={"x": 1}) == expected
+
+
+def test_sync_nested_branches():
+    fn = mlrun.new_function("x", kind="serving")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="start", handler="(event)")
+    graph.add_step("Sleeper", name="a", key="a", wait=0.1, after="start")
+    graph.add_step("Sleeper", name="b1", key="b1", wait=0.1, after="start")
+    graph.add_step("Sleeper", name="b2", key="b2", wait=0.1, after="b1")
+    graph.add_step("Sleeper", name="b3", key="b3", wait=0.1, after="b1")
+    graph.add_step(Merge(combine="update"), name="merge_b", after=["b2", "b3"])
+    graph.add_step(Merge(combine="update"), name="merge", after=["a", "merge_b"])
+
+    server = fn.to_mock_server()
+    assert server.test(body={"x": 1}) == {"x": 1, "a": 2, "b1": 2, "b2": 2, "b3": 2}
+
+
+def test_sync_nested_branches_with_a_small_pool(monkeypatch):
+    # a branch which waits for its nested branches on a worker of the pool mustn't deadlock a small pool
+    monkeypatch.setattr(mlrun.serving.states, "_sync_flow_executor", None)
+    monkeypatch.setattr(mlrun.mlconf.serving, "sync_flow_max_workers", 2)
+    fn = mlrun.new_function("x", kind="serving")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="start", handler="(event)")
+    for branch in ["a", "b"]:
+        graph.add_step("Sleeper", name=branch, key=branch, wait=0, after="start")
+        for nested in ["1", "2"]:
+            graph.add_step(
+                "Sleeper",
+                name=branch + nested,
+                key=branch + nested,
+                wait=0.05,
+                after=branch,
+            )
+        graph.add_step(
+            Merge(combine="update"),
+            name=f"merge_{branch}",
+            after=[f"{branch}1", f"{branch}2"],
+        )
+    graph.add_step(
+        Merge(combine="update", timeout=5), name="merge", after=["merge_a", "merge_b"]
+    )
+
+    server = fn.to_mock_server()
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as requests:
+            responses = list(
+                requests.map(lambda x: server.test(body={"x": x}), range(8))
+            )
+    finally:
+        mlrun.serving.states._sync_flow_executor.shutdown()
+    assert responses == [
+        {"x": x, **{key: x + 1 for key in ["a", "a1", "a2", "b", "b1", "b2"]}}
+        for x in range(8)
+    ]
+
+
+@pytest.mark.parametrize("with_error_handler", [False, True])
+def test_sync_branch_timeout(with_error_handler):
+    fn = mlrun.new_function("x", kind="serving")
+    graph = _sync_branches_graph(
+        fn,
+        {"a": 0.05, "b": 1},
+        Merge(combine="update", timeout=5, branch_timeouts={"b": 0.2}),
+    )
+    if with_error_handler:
+        graph.error_handler(name="catch", handler="handle_error", full_event=True)
+
+    server = fn.to_mock_server()
+    start = time.monotonic()
+    if with_error_handler:
+        assert server.test(body={"x": 1}) == {
+            "errors": ["branch b of step merge did not complete within 0.2 seconds"]
+        }
+    else:
+        with pytest.raises(
+            RuntimeError, match="branch b of step merge did not complete"
+        ):
+            server.test(body={"x": 1})
+    assert time.monotonic() - start < 1
+
+
+def test_sync_branch_error_handlers():
+    fn = mlrun.new_function("x", kind="serving")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="start", handler="(event)")
+    graph.add_step("Sleeper", name="a", key="a", wait=0, after="start")
+    graph.add_step("Sleeper", name="b", key="b", wait=0, fail=True, after="start")
+    graph.add_step(Merge(combine="update"), name="merge", after=["a", "b"])
+
+    # flow error handler, the flow completes after the error handler
+    graph.error_handler(name="catch", handler="handle_error", full_event=True)
+    server = fn.to_mock_server()
+    assert server.test(body={"x": 1}) == {"errors": ["b failed"]}
+
+
+def test_sync_branches_must_be_merged():
+    fn = mlrun.new_function("x", kind="serving")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="start", handler="(event)")
+    graph.add_step("Sleeper", name="a", key="a", after="start")
+    graph.add_step("Sleeper", name="b", key="b", after="start")
+    with pytest.raises(GraphError, match="must be joined by a single Merge step"):
+        fn.to_mock_server()
+
+    graph.add_step(name="join", handler="(event)", after=["a", "b"])
+    with pytest.raises(GraphError, match="can only join branches with a Merge step"):
+        fn.to_mock_server()
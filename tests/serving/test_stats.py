@@ -0,0 +1,169 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import random
+import time
+
+import pytest
+
+import mlrun
+from mlrun.serving.merger import Merge
+from mlrun.serving.stats import LatencyHistogram, stats_path
+
+steps_count = 10
+
+
+@pytest.fixture
+def enable_stats(monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.serving.stats, "enabled", True)
+
+
+def _new_server(engine="sync", steps=3):
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine=engine)
+    step = graph
+    for index in range(steps):
+        step = step.to(name=f"s{index}", handler="(event + 1)")
+    if engine == "async":
+        step.respond()
+    return fn.to_mock_server()
+
+
+def test_histogram_percentiles():
+    values = [random.randint(1, 1_000_000) for _ in range(10_000)]
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    values.sort()
+    for percentile in [50, 90, 99]:
+        expected = values[int(len(values) * percentile / 100) - 1]
+        assert histogram.percentile(percentile) == pytest.approx(expected, rel=0.04)
+    result = histogram.to_dict()
+    assert result["count"] == len(values)
+    assert result["min_us"] == values[0]
+    assert result["max_us"] == values[-1]
+
+
+def test_histogram_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for value in [0, 1, 2, 3, 63]:
+        histogram.record(value)
+    assert histogram.percentile(50) == 2
+    assert histogram.percentile(100) == 63
+
+
+def test_stats_disabled_by_default():
+    server = _new_server()
+    assert server.context.stats is None
+    assert server.test(body=1) == 4
+
+
+@pytest.mark.parametrize("engine", ["sync", "async"])
+def test_step_stats(enable_stats, engine):
+    server = _new_server(engine)
+    for _ in range(5):
+        assert server.test(body=1) == 4
+    if engine == "async":
+        server.wait_for_completion()
+
+    stats = server.context.stats.to_dict()
+    assert stats["graph"]["count"] == 5
+    assert sorted(stats["steps"]) == ["s0", "s1", "s2"]
+    for step_stats in stats["steps"].values():
+        assert step_stats["latency"]["count"] == 5
+        assert step_stats["errors"] == 0
+    assert stats["traces"] == []
+
+
+def test_stats_path(enable_stats):
+    server = _new_server()
+    server.test(body=1)
+    stats = server.test(path=stats_path)
+    assert stats["graph"]["count"] == 1
+    assert stats["steps"]["s0"]["latency"]["count"] == 1
+
+    # the stats request itself is not recorded
+    assert server.context.stats.to_dict()["graph"]["count"] == 1
+
+
+def test_step_errors(enable_stats):
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="s0", handler="(event + 1)").to(name="s1", handler="(event / 0)")
+    server = fn.to_mock_server()
+    server.test(body=1, silent=True)
+
+    steps = server.context.stats.to_dict()["steps"]
+    assert steps["s0"]["errors"] == 0
+    assert steps["s1"]["errors"] == 1
+
+
+def test_sampled_traces(enable_stats, monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.serving.stats, "trace_sample_rate", 1.0)
+    monkeypatch.setattr(mlrun.mlconf.serving.stats, "max_traces", 2)
+    server = _new_server()
+    for _ in range(3):
+        server.test(body=1)
+
+    traces = server.context.stats.to_dict()["traces"]
+    assert len(traces) == 2
+    for trace in traces:
+        assert [step["step"] for step in trace["steps"]] == ["s0", "s1", "s2"]
+        starts = [step["start_us"] for step in trace["steps"]]
+        assert starts == sorted(starts)
+        assert trace["latency_us"] >= sum(step["latency_us"] for step in trace["steps"])
+
+
+def test_sync_branches_queue_wait(enable_stats):
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="s0", handler="(event + 1)")
+    graph.add_step(name="b1", handler="(event * 2)", after="s0")
+    graph.add_step(name="b2", handler="(event * 3)", after="s0")
+    graph.add_step(Merge(), name="merge", after=["b1", "b2"])
+    server = fn.to_mock_server()
+    assert server.test(body=1) == [4, 6]
+
+    steps = server.context.stats.to_dict()["steps"]
+    for branch in ["b1", "b2"]:
+        assert steps[branch]["queue_wait"]["count"] == 1
+    assert "queue_wait" not in steps["s0"]
+
+
+def _run_events(server, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        server.test(body=1)
+    return time.perf_counter() - start
+
+
+@pytest.mark.skipif(
+    not os.environ.get("MLRUN_RUN_BENCHMARKS"),
+    reason="A benchmark, set MLRUN_RUN_BENCHMARKS to run it",
+)
+def test_stats_overhead_benchmark(monkeypatch):
+    events = 2000
+    server = _new_server(steps=steps_count)
+    _run_events(server, 100)
+    without_stats = min(_run_events(server, events) for _ in range(3))
+
+    monkeypatch.setattr(mlrun.mlconf.serving.stats, "enabled", True)
+    server = _new_server(steps=steps_count)
+    _run_events(server, 100)
+    with_stats = min(_run_events(server, events) for _ in range(3))
+
+    overhead_us = (with_stats - without_stats) * 1e6 / (events * steps_count)
+    assert overhead_us < 20
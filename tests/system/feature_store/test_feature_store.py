@@ -341,7 +341,7 @@ class TestFeatureStore(TestMLRunSystem):
 
     @TestMLRunSystem.skip_test_if_env_not_configured
     @pytest.mark.parametrize("entity_timestamp_column", [None, "time"])
-    @pytest.mark.parametrize("engine", ["local", "dask"])
+    @pytest.mark.parametrize("engine", ["local", "dask", "arrow"])
     @pytest.mark.parametrize("with_graph", [True, False])
     def test_ingest_and_query(self, engine, entity_timestamp_column, with_graph):
         self._logger.debug("Creating stocks feature set")
@@ -713,6 +713,67 @@ def test_set_and_load_default_config():
         del os.environ["MLRUN_KFP_TTL"]
 
 
+def test_config_snapshot_is_invalidated_on_change():
+    snapshot = mlrun.mlconf.snapshot()
+    assert mlrun.mlconf.snapshot() is snapshot
+    assert (
+        snapshot.model_endpoint_monitoring.store_prefixes.default
+        == mlrun.mlconf.model_endpoint_monitoring.store_prefixes.default
+    )
+    with pytest.raises(AttributeError):
+        snapshot.httpdb.logs.decode.errors = "ignore"
+
+    default_errors = mlrun.mlconf.httpdb.logs.decode.errors
+    assert mlrun.mlconf.get_cached("httpdb.logs.decode.errors") == default_errors
+    assert mlrun.mlconf.get_cached("httpdb.not_exists", None) is None
+    with pytest.raises(AttributeError):
+        mlrun.mlconf.get_cached("httpdb.not_exists")
+
+    # nested set
+    mlrun.mlconf.httpdb.logs.decode.errors = "ignore"
+    assert mlrun.mlconf.snapshot() is not snapshot
+    assert mlrun.mlconf.snapshot().httpdb.logs.decode.errors == "ignore"
+    assert mlrun.mlconf.get_cached("httpdb.logs.decode.errors") == "ignore"
+
+    # update (nested updates are kept by reload, so restore the default)
+    mlrun.mlconf.update({"httpdb": {"logs": {"decode": {"errors": "strict"}}}})
+    assert mlrun.mlconf.get_cached("httpdb.logs.decode.errors") == "strict"
+    mlrun.mlconf.update({"httpdb": {"logs": {"decode": {"errors": default_errors}}}})
+
+    # reload
+    snapshot = mlrun.mlconf.snapshot()
+    mlrun.mlconf.reload()
+    assert mlrun.mlconf.snapshot() is not snapshot
+
+
+def test_config_get_cached_is_memoized():
+    key = "model_endpoint_monitoring.store_prefixes"
+    store_prefixes = mlrun.mlconf.get_cached(key)
+    # the resolved value is memoized, and reused by the next reads
+    assert mlrun.mlconf.get_cached(key) is store_prefixes
+    assert mlrun.mlconf.snapshot().model_endpoint_monitoring.store_prefixes is (
+        store_prefixes
+    )
+    assert store_prefixes.default == (
+        mlrun.mlconf.model_endpoint_monitoring.store_prefixes.default
+    )
+
+    # set
+    default = mlrun.mlconf.model_endpoint_monitoring.store_prefixes.default
+    mlrun.mlconf.model_endpoint_monitoring.store_prefixes.default = "v3io:///{project}"
+    try:
+        assert mlrun.mlconf.get_cached(key) is not store_prefixes
+        assert mlrun.mlconf.get_cached(f"{key}.default") == "v3io:///{project}"
+    finally:
+        mlrun.mlconf.model_endpoint_monitoring.store_prefixes.default = default
+
+    # reload
+    store_prefixes = mlrun.mlconf.get_cached(key)
+    mlrun.mlconf.reload()
+    assert mlrun.mlconf.get_cached(key) is not store_prefixes
+    assert mlrun.mlconf.get_cached(f"{key}.default") == default
+
+
 def _exec_mlrun(cmd, cwd=None):
     cmd = [sys.executable, "-m", "mlrun"] + cmd.split()
     out = subprocess.run(cmd, capture_output=True, cwd=cwd)
@@ -0,0 +1,121 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import subprocess
+import sys
+
+import pytest
+
+import mlrun
+
+# the import time budget (in seconds), well above the expected import time so the test isn't flaky on slow machines,
+# and well below the import time when the heavy subpackages are imported eagerly
+import_time_budget = 2.0
+
+# modules which must be imported only when they are used
+heavy_modules = [
+    "mlrun.datastore",
+    "mlrun.db",
+    "mlrun.feature_store",
+    "mlrun.frameworks",
+    "mlrun.projects",
+    "mlrun.runtimes",
+    "mlrun.serving",
+    "IPython",
+    "kubernetes",
+    "nuclio",
+    "pandas",
+]
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    """run python with the given args in a clean interpreter"""
+    # when a DB path is configured mlrun connects to the DB on import, which imports the DB client
+    env = {key: value for key, value in os.environ.items() if key != "MLRUN_DBPATH"}
+    result = subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env
+    )
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+def _import_time(*args: str) -> tuple[float, set[str]]:
+    """run python with the given args and return its import time (in seconds) and the imported modules"""
+    result = _run_python("-X", "importtime", *args)
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, module = line[len("import time:") :].split("|")
+        # skip the header line
+        if not self_us.strip().isdigit():
+            continue
+        total_us += int(self_us)
+        modules.add(module.strip())
+    return total_us / 1e6, modules
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("-c", "import mlrun"),
+        ("-m", "mlrun", "--help"),
+    ],
+)
+def test_import_time(args):
+    import_time, modules = _import_time(*args)
+    assert not modules.intersection(heavy_modules)
+    # take the best of a few runs, so a busy machine doesn't fail the test
+    for _ in range(2):
+        import_time = min(import_time, _import_time(*args)[0])
+    assert import_time < import_time_budget
+
+
+@pytest.mark.parametrize(
+    "module",
+    sorted(f"mlrun.{name}" for name in mlrun._lazy_submodules)
+    + [
+        # the handler which the serving functions are deployed with
+        "mlrun.serving.serving_wrapper",
+        "mlrun.frameworks.sklearn",
+        "mlrun.launcher.factory",
+    ],
+)
+def test_import_first(module):
+    # the lazy subpackages mustn't depend on being imported by `import mlrun` (in a specific order), so each is
+    # imported first in a clean interpreter
+    _run_python("-c", f"import {module}")
+
+
+@pytest.mark.parametrize(
+    "attribute",
+    # an attribute of each of the lazily imported modules
+    sorted({module: name for name, module in mlrun._lazy_attributes.items()}.values()),
+)
+def test_lazy_attribute_first(attribute):
+    _run_python("-c", f"import mlrun; mlrun.{attribute}")
+
+
+def test_lazy_attributes():
+    import mlrun.projects
+    import mlrun.runtimes.mounts
+
+    assert mlrun.new_project is mlrun.projects.new_project
+    assert mlrun.VolumeMount is mlrun.runtimes.mounts.VolumeMount
+    assert "new_project" in dir(mlrun)
+    assert set(mlrun.__all__).issubset(dir(mlrun))
+    with pytest.raises(AttributeError):
+        mlrun.not_an_attribute
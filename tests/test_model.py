@@ -12,12 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import copy
+import inspect
 import json
+import unittest.mock
 
 import deepdiff
+import pandas as pd
 import pytest
 
+import mlrun.artifacts
 import mlrun.common.schemas
+import mlrun.feature_store
+import mlrun.model
 import mlrun.runtimes
 
 
@@ -94,3 +101,155 @@ def test_runobject_to_json_with_exclude_params(
     if not is_empty:
         for notification in run_object_to_test.spec.notifications:
             assert notification.params
+
+
+def _legacy_to_dict(self, fields=None, exclude=None, strip=False):
+    # the original field resolution of ModelObj.to_dict, the reference for the cached fields plan serialization
+    struct = {}
+    fields = (
+        fields
+        or self._dict_fields
+        or list(inspect.signature(self.__init__).parameters.keys())
+    )
+    fields_to_exclude = list(exclude or [])
+    if strip:
+        fields_to_exclude += self._default_fields_to_strip
+    fields_to_save = (
+        set(fields)
+        - set(fields_to_exclude)
+        - set(self._fields_to_serialize)
+        - set(self._fields_to_enrich)
+    )
+    for field_name in fields_to_save:
+        field_value = getattr(self, field_name, None)
+        if self._is_valid_field_value_for_serialization(field_name, field_value, strip):
+            if hasattr(field_value, "to_dict"):
+                field_value = field_value.to_dict(strip=strip)
+                if self._is_valid_field_value_for_serialization(
+                    field_name, field_value, strip
+                ):
+                    struct[field_name] = field_value
+            else:
+                struct[field_name] = field_value
+    self._resolve_field_value_by_method(
+        struct,
+        self._serialize_field,
+        list(set(self._fields_to_serialize) - set(fields_to_exclude)),
+        strip,
+    )
+    self._resolve_field_value_by_method(
+        struct,
+        self._enrich_field,
+        list(set(self._fields_to_enrich) - set(fields_to_exclude)),
+        strip,
+    )
+    self._apply_enrichment_before_to_dict_completion(struct, strip=strip)
+    return struct
+
+
+def _model_objects_zoo():
+    run = mlrun.new_task(
+        "run-name",
+        project="some-project",
+        params={"p1": 1, "p2": [1, 2]},
+        inputs={"input": "store://artifacts/some-project/input"},
+        handler="handler",
+    ).set_label("label", "value")
+    run.spec.notifications = [
+        mlrun.model.Notification(
+            kind="webhook", name="notification", params={"url": "some-url"}
+        )
+    ]
+    run_object = mlrun.run.RunObject.from_dict(run.to_dict())
+    run_object.status.state = "completed"
+    run_object.status.results = {"accuracy": 0.9}
+    run_object.status.artifact_uris = {"model": "store://models/some-project/model"}
+
+    serving_function = mlrun.new_function("serving", kind="serving", image="mlrun")
+    graph = serving_function.set_topology("flow", engine="async")
+    graph.to(name="s1", handler="json.dumps").to(name="s2", handler="json.dumps")
+    router_function = mlrun.new_function("router", kind="serving", image="mlrun")
+    router_function.add_model("m1", model_path="some-path", class_name="MyModel")
+
+    model = mlrun.artifacts.ModelArtifact(
+        "model",
+        body=b"some-model",
+        model_file="model.pkl",
+        metrics={"accuracy": 0.9},
+        parameters={"p1": 1},
+    )
+    model.metadata.labels = {"framework": "sklearn"}
+    dataset = mlrun.artifacts.DatasetArtifact(
+        "dataset", df=pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}), format="csv"
+    )
+    feature_set = mlrun.feature_store.FeatureSet(
+        "feature-set", entities=["id"], description="some feature set"
+    )
+    return [
+        run,
+        run_object,
+        mlrun.new_function("job", kind="job", image="mlrun/mlrun", command="x.py"),
+        mlrun.new_function("nuclio", kind="nuclio", image="mlrun/mlrun"),
+        mlrun.new_function("dask", kind="dask", image="mlrun/mlrun"),
+        serving_function,
+        router_function,
+        mlrun.artifacts.Artifact("artifact", body="some-body", format="txt"),
+        model,
+        dataset,
+        feature_set,
+        mlrun.new_project("some-project", save=False),
+    ]
+
+
+@pytest.mark.parametrize("strip", [False, True])
+def test_to_dict_is_equivalent_to_legacy_serialization(strip):
+    for model_object in _model_objects_zoo():
+        exclude = ["status"] if hasattr(model_object, "status") else None
+        struct = model_object.to_dict(strip=strip)
+        excluded_struct = model_object.to_dict(exclude=exclude, strip=strip)
+        fields_struct = model_object.to_dict(fields=["kind", "metadata"])
+        with unittest.mock.patch.object(
+            mlrun.model.ModelObj, "to_dict", _legacy_to_dict
+        ):
+            legacy_struct = model_object.to_dict(strip=strip)
+            legacy_excluded_struct = model_object.to_dict(exclude=exclude, strip=strip)
+            legacy_fields_struct = model_object.to_dict(fields=["kind", "metadata"])
+
+        object_type = type(model_object).__name__
+        assert deepdiff.DeepDiff(legacy_struct, struct) == {}, object_type
+        assert (
+            deepdiff.DeepDiff(legacy_excluded_struct, excluded_struct) == {}
+        ), object_type
+        assert deepdiff.DeepDiff(legacy_fields_struct, fields_struct) == {}, object_type
+
+
+def test_copy_is_equivalent_to_deepcopy():
+    for model_object in _model_objects_zoo():
+        copied = model_object.copy()
+        object_type = type(model_object).__name__
+        assert type(copied) is type(model_object)
+        assert (
+            deepdiff.DeepDiff(copy.deepcopy(model_object).to_dict(), copied.to_dict())
+            == {}
+        ), object_type
+
+    # the copy is independent of the original and shared references are kept shared
+    run = mlrun.new_task("run-name", params={"p1": [1, 2]})
+    run.spec.hyper_params = {"p2": run.spec.parameters["p1"]}
+    copied = run.copy()
+    copied.spec.parameters["p1"].append(3)
+    copied.metadata.labels["label"] = "value"
+    assert run.spec.parameters["p1"] == [1, 2]
+    assert "label" not in run.metadata.labels
+    assert copied.spec.hyper_params["p2"] is copied.spec.parameters["p1"]
+
+
+def test_fields_plan_is_refreshed_when_fields_change(monkeypatch):
+    target = mlrun.model.DataTarget(kind="parquet", name="target", path="some-path")
+    assert target.to_dict()["path"] == "some-path"
+    monkeypatch.setattr(
+        mlrun.model.DataTarget,
+        "_dict_fields",
+        [field for field in mlrun.model.DataTarget._dict_fields if field != "path"],
+    )
+    assert "path" not in target.to_dict()